@@ -0,0 +1,47 @@
+# backend/app/api/v1/endpoints/cache.py
+"""
+Cache administration API endpoints.
+
+This module provides admin endpoints for inspecting the application cache:
+- Entry counts, approximate memory, hit rates and evictions per backend
+- The same figures per key prefix, estimated from sampled keys
+- Sampled hot keys and hit rates of cached functions
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import get_admin_user
+from app.core.cache.service import CacheService, get_cache_service
+from app.domains.users.models import User
+
+router = APIRouter()
+
+
+@router.get("/stats")
+async def read_cache_stats(
+    current_user: Annotated[User, Depends(get_admin_user)],
+    cache_service: Annotated[CacheService, Depends(get_cache_service)],
+    sample_size: Optional[int] = Query(
+        None, ge=1, le=10000, description="Keys sampled per backend"
+    ),
+    top: Optional[int] = Query(
+        None, ge=1, le=100, description="Hot keys listed per backend"
+    ),
+) -> Dict[str, Any]:
+    """
+    Get cache statistics.
+
+    Args:
+        current_user: Current authenticated admin user
+        cache_service: Cache service
+        sample_size: Keys sampled per backend (default: CACHE_STATS_SAMPLE_SIZE)
+        top: Hot keys listed per backend (default: CACHE_STATS_TOP_KEYS)
+
+    Returns:
+        Dict[str, Any]: Statistics per backend, key prefix and cached function
+    """
+    return await cache_service.get_stats(sample_size, top)
@@ -12,7 +12,15 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, fitments, media, products, search, users
+from app.api.v1.endpoints import (
+    auth,
+    cache,
+    fitments,
+    media,
+    products,
+    search,
+    users,
+)
 
 # Create the main API router
 api_router = APIRouter()
@@ -29,3 +37,5 @@ api_router.include_router(media.router, prefix="/media", tags=["Media"])
 api_router.include_router(users.router, prefix="/users", tags=["Users"])
 
 api_router.include_router(search.router, prefix="/search", tags=["Search"])
+
+api_router.include_router(cache.router, prefix="/cache", tags=["Cache"])
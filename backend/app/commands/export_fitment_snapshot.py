@@ -0,0 +1,61 @@
+# backend/app/commands/export_fitment_snapshot.py
+"""
+Command to export VCDB and PCDB data into a fitment snapshot.
+
+The snapshot is a SQLite file that the fitment module can read instead of
+the MS Access databases (see FITMENT_SNAPSHOT_PATH). Run this command on a
+host with the Access ODBC driver whenever VCDB or PCDB is updated.
+"""
+
+import sys
+from typing import Optional
+
+import typer
+
+from app.core.config import settings
+
+app = typer.Typer()
+
+
+@app.command()
+def export_fitment_snapshot(
+    output: str = typer.Option(
+        "data/fitment_snapshot.sqlite", "--output", "-o", help="Snapshot file to write"
+    ),
+    vcdb_path: Optional[str] = typer.Option(
+        None, "--vcdb", help="VCDB Access database (defaults to VCDB_PATH)"
+    ),
+    pcdb_path: Optional[str] = typer.Option(
+        None, "--pcdb", help="PCDB Access database (defaults to PCDB_PATH)"
+    ),
+    batch_size: int = typer.Option(
+        5000, "--batch-size", "-b", help="Rows copied per batch"
+    ),
+):
+    """Export VCDB and PCDB tables into a SQLite fitment snapshot."""
+    from app.fitment.db import AccessDBClient
+    from app.fitment.snapshot import export_snapshot
+
+    vcdb_client = AccessDBClient(vcdb_path or settings.VCDB_PATH)
+    pcdb_client = AccessDBClient(pcdb_path or settings.PCDB_PATH)
+
+    typer.echo(f"Exporting fitment snapshot to {output}...")
+    try:
+        stats = export_snapshot(vcdb_client, pcdb_client, output, batch_size)
+    except Exception as e:
+        typer.echo(f"Failed to export fitment snapshot: {str(e)}", err=True)
+        sys.exit(1)
+    finally:
+        vcdb_client.close()
+        pcdb_client.close()
+
+    for table, count in stats["tables"].items():
+        typer.echo(f"  {table}: {count} rows")
+    typer.echo(
+        f"Wrote {stats['size_bytes']} bytes in {stats['seconds']:.1f}s. "
+        f"Set FITMENT_SNAPSHOT_PATH={output} to use it."
+    )
+
+
+if __name__ == "__main__":
+    app()
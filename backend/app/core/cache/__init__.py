@@ -16,6 +16,7 @@ from app.core.cache.exceptions import (
     CacheConfigurationException,
 )
 from app.core.cache.keys import (
+    CacheKeyBuilder,
     generate_cache_key,
     generate_list_key,
     generate_model_key,
@@ -34,6 +35,7 @@ __all__ = [
     "CacheConnectionException",
     "CacheOperationException",
     "CacheConfigurationException",
+    "CacheKeyBuilder",
     "generate_cache_key",
     "generate_list_key",
     "generate_model_key",
@@ -5,14 +5,22 @@ from typing import Dict, Any
 from app.core.cache.backends.memory import MemoryCacheBackend
 from app.core.cache.backends.null import NullCacheBackend
 from app.core.cache.backends.redis import RedisCacheBackend
+from app.core.cache.backends.tiered import TieredCacheBackend
 
 # Export backend classes
-__all__ = ["MemoryCacheBackend", "RedisCacheBackend", "NullCacheBackend", "get_backend"]
+__all__ = [
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "TieredCacheBackend",
+    "NullCacheBackend",
+    "get_backend",
+]
 
 # Backend registry
 _backends: Dict[str, Any] = {
     "memory": MemoryCacheBackend,
     "redis": RedisCacheBackend,
+    "tiered": TieredCacheBackend,
     "null": NullCacheBackend,
 }
 
@@ -2,40 +2,222 @@
 from __future__ import annotations
 
 import fnmatch
+import heapq
+import re
 import time
 from collections import OrderedDict
-from threading import RLock
-from typing import Any, Dict, List, Optional, TypeVar
+from itertools import islice
+from sys import getsizeof
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from app.core.cache.base import CacheBackend
+from app.core.cache.stats import hit_rate
+from app.core.config import settings
 from app.logging import get_logger
 
 T = TypeVar("T")
 
 logger = get_logger("app.core.cache.memory")
 
+# Container items sampled, and nesting levels followed, when estimating size
+_SIZE_SAMPLE = 16
+_SIZE_DEPTH = 3
+
+_ATOMIC_TYPES = frozenset({str, bytes, bytearray, int, float, bool, type(None)})
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def estimate_size(value: Any, depth: int = 0) -> int:
+    """Estimate the memory used by a value in bytes.
+
+    Nested containers are followed a few levels deep and large containers
+    are sampled, so the cost stays small for any value.
+
+    Args:
+        value: Value to measure
+        depth: Current nesting level
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    size = getsizeof(value)
+    if type(value) in _ATOMIC_TYPES or depth >= _SIZE_DEPTH:
+        return size
+
+    if isinstance(value, dict):
+        items = list(islice(value.items(), _SIZE_SAMPLE))
+        sample = [part for item in items for part in item]
+        count = len(value) * 2
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        sample = list(islice(value, _SIZE_SAMPLE))
+        count = len(value)
+    elif hasattr(value, "__dict__"):
+        return size + estimate_size(vars(value), depth + 1)
+    else:
+        return size
+
+    if not sample:
+        return size
+    sampled = sum(
+        getsizeof(item)
+        if type(item) in _ATOMIC_TYPES
+        else estimate_size(item, depth + 1)
+        for item in sample
+    )
+    return size + sampled * count // len(sample)
+
+
+class _Entry:
+    """A cached value with its expiry, estimated size and index node."""
+
+    __slots__ = ("value", "expires_at", "size", "node")
+
+    def __init__(
+        self, value: Any, expires_at: Optional[float], size: int, node: _TrieNode
+    ) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.node = node
+
+
+class _TrieNode:
+    """Node of a trie over the ':'-separated namespace segments of keys."""
+
+    __slots__ = ("children", "keys")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        self.keys: Set[str] = set()
+
+
+class _KeyTrie:
+    """Prefix index of cache keys.
+
+    Keys are split at ':'; every segment but the last is a trie node, and
+    each key is kept in the set of the node for its namespace, so keys that
+    share a namespace (e.g. "vehicle:makes:<hash>") share all their nodes.
+    Nodes are also looked up by namespace directly, so adding and removing
+    a key usually takes no walk.
+    """
+
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+        self._namespaces: Dict[str, _TrieNode] = {}
+
+    def add(self, key: str) -> _TrieNode:
+        """Index a key.
+
+        Returns:
+            _TrieNode: The node holding the key
+        """
+        namespace, sep, _ = key.rpartition(":")
+        node = self._namespaces.get(namespace) if sep else self.root
+        if node is None:
+            node = self.root
+            for segment in namespace.split(":"):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _TrieNode()
+                node = child
+            self._namespaces[namespace] = node
+        node.keys.add(key)
+        return node
+
+    def remove(self, key: str, node: _TrieNode) -> None:
+        """Remove a key from the index, pruning nodes left empty.
+
+        Args:
+            key: The key
+            node: The node returned when the key was added
+        """
+        node.keys.discard(key)
+        if node.keys or node.children or node is self.root:
+            return
+
+        segments = key.split(":")[:-1]
+        path: List[Tuple[_TrieNode, str]] = []
+        parent = self.root
+        for segment in segments:
+            path.append((parent, segment))
+            parent = parent.children[segment]
+
+        for depth in range(len(path) - 1, -1, -1):
+            parent, segment = path[depth]
+            child = parent.children[segment]
+            if child.keys or child.children:
+                break
+            del parent.children[segment]
+            self._namespaces.pop(":".join(segments[: depth + 1]), None)
+
+    def with_prefix(self, prefix: str) -> List[str]:
+        """Get all indexed keys starting with prefix."""
+        *segments, partial = prefix.split(":")
+        node = self.root
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return []
+
+        keys = [key for key in node.keys if key.startswith(prefix)]
+        for segment, child in node.children.items():
+            if segment.startswith(partial):
+                keys.extend(self._walk(child))
+        return keys
+
+    @staticmethod
+    def _walk(node: _TrieNode) -> Iterator[str]:
+        """Yield every key in a subtree."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield from node.keys
+            stack.extend(node.children.values())
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        self.root = _TrieNode()
+        self._namespaces = {}
+
 
 class MemoryCacheBackend(CacheBackend[T]):
     """In-memory cache backend implementation.
 
     This backend stores cached values in memory, with optional TTL expiration.
-    It's suitable for development and testing environments, or for small-scale
-    production use where persistence is not required.
+    It's suitable for development and testing environments, for small-scale
+    production use where persistence is not required, and as the near-cache
+    tier in front of Redis.
+
+    Entries are kept in least-recently-used order and evicted once either
+    the item count or their estimated total size exceeds its cap. Expiry is
+    driven by a min-heap of expiry times, so only expired entries are
+    visited. A trie over key segments serves ``prefix*`` invalidations.
+    All operations are synchronous internally and take no locks; the
+    backend is meant to be used from a single event loop.
     """
 
-    def __init__(self, max_size: int = 1000, clean_interval: int = 60) -> None:
+    def __init__(self, max_size: int = 1000, max_bytes: Optional[int] = None) -> None:
         """Initialize the memory cache backend.
 
         Args:
             max_size: Maximum number of items to store in the cache
-            clean_interval: Interval between cleanup runs in seconds
+            max_bytes: Maximum estimated size of stored values in bytes
+                (defaults to CACHE_MEMORY_MAX_BYTES)
         """
-        self.cache: Dict[str, Any] = OrderedDict()
-        self.expiry: Dict[str, float] = {}
+        self.cache: OrderedDict[str, _Entry] = OrderedDict()
         self.max_size = max_size
-        self.clean_interval = clean_interval
-        self.lock = RLock()
-        self.last_cleanup = time.time()
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else settings.CACHE_MEMORY_MAX_BYTES
+        )
+        self.bytes = 0
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._keys = _KeyTrie()
 
     async def initialize(self) -> None:
         """Initialize the memory cache backend.
@@ -51,9 +233,7 @@ class MemoryCacheBackend(CacheBackend[T]):
 
         Clears all cached data and performs cleanup.
         """
-        with self.lock:
-            self.cache.clear()
-            self.expiry.clear()
+        self._clear()
         logger.info("Memory cache backend shut down")
         return None
 
@@ -66,26 +246,7 @@ class MemoryCacheBackend(CacheBackend[T]):
         Returns:
             Optional[T]: Cached value or None if not found or expired
         """
-        with self.lock:
-            # Check if key exists
-            if key not in self.cache:
-                return None
-
-            # Check if key has expired
-            if key in self.expiry and self.expiry[key] < time.time():
-                # Remove expired key
-                del self.cache[key]
-                del self.expiry[key]
-                return None
-
-            # Move key to end of OrderedDict to mark as recently used
-            value = self.cache.pop(key)
-            self.cache[key] = value
-
-            # Clean cache if needed
-            await self._clean_if_needed()
-
-            return value
+        return self._get(key)
 
     async def set(self, key: str, value: T, ttl: Optional[int] = None) -> bool:
         """Set a value in the cache.
@@ -96,31 +257,9 @@ class MemoryCacheBackend(CacheBackend[T]):
             ttl: Time-to-live in seconds
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if successful, False if the value exceeds the size cap
         """
-        with self.lock:
-            # Check cache size and evict oldest item if necessary
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                # Remove oldest item (first item in OrderedDict)
-                oldest_key, _ = next(iter(self.cache.items()))
-                del self.cache[oldest_key]
-                if oldest_key in self.expiry:
-                    del self.expiry[oldest_key]
-
-            # Store value
-            self.cache[key] = value
-
-            # Set expiry if TTL provided
-            if ttl is not None:
-                self.expiry[key] = time.time() + ttl
-            elif key in self.expiry:
-                # Remove expiry if TTL is None but key previously had expiry
-                del self.expiry[key]
-
-            # Clean cache if needed
-            await self._clean_if_needed()
-
-            return True
+        return self._set(key, value, ttl)
 
     async def delete(self, key: str) -> bool:
         """Delete a value from the cache.
@@ -131,16 +270,7 @@ class MemoryCacheBackend(CacheBackend[T]):
         Returns:
             bool: True if key was deleted, False if key wasn't found
         """
-        with self.lock:
-            if key not in self.cache:
-                return False
-
-            # Remove key
-            del self.cache[key]
-            if key in self.expiry:
-                del self.expiry[key]
-
-            return True
+        return self._remove(key)
 
     async def exists(self, key: str) -> bool:
         """Check if a key exists in the cache.
@@ -151,44 +281,39 @@ class MemoryCacheBackend(CacheBackend[T]):
         Returns:
             bool: True if key exists and hasn't expired, False otherwise
         """
-        with self.lock:
-            # Check if key exists
-            if key not in self.cache:
-                return False
-
-            # Check if key has expired
-            if key in self.expiry and self.expiry[key] < time.time():
-                # Remove expired key
-                del self.cache[key]
-                del self.expiry[key]
-                return False
-
-            return True
+        entry = self.cache.get(key)
+        if entry is None:
+            return False
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            return False
+        return True
 
     async def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all keys matching a pattern.
 
+        Patterns of the form ``prefix*`` are served from the key trie;
+        other glob patterns are matched against every key.
+
         Args:
             pattern: Key pattern to match (glob pattern)
 
         Returns:
             int: Number of keys invalidated
         """
-        count = 0
-        with self.lock:
-            # Find keys matching pattern
-            keys_to_delete = [
-                key for key in self.cache.keys() if fnmatch.fnmatch(key, pattern)
-            ]
-
-            # Delete matching keys
-            for key in keys_to_delete:
-                del self.cache[key]
-                if key in self.expiry:
-                    del self.expiry[key]
-                count += 1
-
-        return count
+        head, star, tail = pattern.partition("*")
+        if not _GLOB_CHARS.search(pattern):
+            keys = [pattern] if pattern in self.cache else []
+        elif star and not tail and not _GLOB_CHARS.search(head):
+            keys = self._keys.with_prefix(head)
+        else:
+            regex = re.compile(fnmatch.translate(pattern))
+            keys = [key for key in self.cache if regex.match(key)]
+
+        for key in keys:
+            self._remove(key)
+        return len(keys)
 
     async def clear(self) -> bool:
         """Clear all cached values.
@@ -196,10 +321,8 @@ class MemoryCacheBackend(CacheBackend[T]):
         Returns:
             bool: True if successful, False otherwise
         """
-        with self.lock:
-            self.cache.clear()
-            self.expiry.clear()
-            return True
+        self._clear()
+        return True
 
     async def get_many(self, keys: List[str]) -> Dict[str, Optional[T]]:
         """Get multiple values from the cache.
@@ -210,12 +333,7 @@ class MemoryCacheBackend(CacheBackend[T]):
         Returns:
             Dict[str, Optional[T]]: Dictionary of key-value pairs
         """
-        result = {}
-        with self.lock:
-            for key in keys:
-                result[key] = await self.get(key)
-
-        return result
+        return {key: self._get(key) for key in keys}
 
     async def set_many(self, mapping: Dict[str, T], ttl: Optional[int] = None) -> bool:
         """Set multiple values in the cache.
@@ -227,10 +345,8 @@ class MemoryCacheBackend(CacheBackend[T]):
         Returns:
             bool: True if successful, False otherwise
         """
-        with self.lock:
-            for key, value in mapping.items():
-                await self.set(key, value, ttl)
-
+        for key, value in mapping.items():
+            self._set(key, value, ttl)
         return True
 
     async def delete_many(self, keys: List[str]) -> int:
@@ -242,13 +358,7 @@ class MemoryCacheBackend(CacheBackend[T]):
         Returns:
             int: Number of keys deleted
         """
-        count = 0
-        with self.lock:
-            for key in keys:
-                if await self.delete(key):
-                    count += 1
-
-        return count
+        return sum(1 for key in keys if self._remove(key))
 
     async def incr(
         self, key: str, amount: int = 1, default: int = 0, ttl: Optional[int] = None
@@ -264,28 +374,27 @@ class MemoryCacheBackend(CacheBackend[T]):
         Returns:
             int: New counter value
         """
-        with self.lock:
-            # Get current value
-            value = await self.get(key)
-
-            # Initialize with default if not found
-            if value is None:
+        # Get current value
+        value = self._get(key)
+
+        # Initialize with default if not found
+        if value is None:
+            value = default
+        elif not isinstance(value, int):
+            # If value is not an integer, convert it
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                # If conversion fails, use default
                 value = default
-            elif not isinstance(value, int):
-                # If value is not an integer, convert it
-                try:
-                    value = int(value)
-                except (ValueError, TypeError):
-                    # If conversion fails, use default
-                    value = default
 
-            # Increment value
-            value += amount
+        # Increment value
+        value += amount
 
-            # Store updated value
-            await self.set(key, value, ttl)
+        # Store updated value
+        self._set(key, value, ttl)
 
-            return value
+        return value
 
     async def decr(
         self, key: str, amount: int = 1, default: int = 0, ttl: Optional[int] = None
@@ -303,24 +412,139 @@ class MemoryCacheBackend(CacheBackend[T]):
         """
         return await self.incr(key, -amount, default, ttl)
 
-    async def _clean_if_needed(self) -> None:
-        """Clean expired keys if cleanup interval has passed."""
-        current_time = time.time()
-        if current_time - self.last_cleanup < self.clean_interval:
-            return
+    def get_stats(self) -> Dict[str, Any]:
+        """Get item count, estimated size and hit, eviction and expiry counts.
 
-        # Set last cleanup time
-        self.last_cleanup = current_time
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        return {
+            **self.stats,
+            "items": len(self.cache),
+            "bytes": self.bytes,
+            "max_size": self.max_size,
+            "max_bytes": self.max_bytes,
+        }
+
+    async def sample_stats(self, sample_size: int) -> Dict[str, Any]:
+        """Get cache statistics with entry counts and sizes per key prefix.
+
+        Prefixes are the namespaces of the key index, so their entry counts
+        are exact; their sizes are extrapolated from a few entries of each,
+        taking sample_size entries in total.
+
+        Args:
+            sample_size: Number of entries to size
 
-        # Find expired keys
-        expired_keys = [
-            key for key, expiry in self.expiry.items() if expiry < current_time
-        ]
+        Returns:
+            Dict[str, Any]: Cache statistics with a "prefixes" breakdown
+        """
+        namespaces = [("", self._keys.root), *self._keys._namespaces.items()]
+        per_prefix = max(1, sample_size // len(namespaces))
+        prefixes: Dict[str, Dict[str, int]] = {}
+        for namespace, node in namespaces:
+            if not node.keys:
+                continue
+            sizes = [
+                self.cache[key].size
+                for key in islice(node.keys, per_prefix)
+                if key in self.cache
+            ]
+            mean_size = sum(sizes) / len(sizes) if sizes else 0
+            prefixes[namespace] = {
+                "items": len(node.keys),
+                "bytes": round(mean_size * len(node.keys)),
+            }
+
+        return {
+            "type": "memory",
+            **self.get_stats(),
+            "hit_rate": hit_rate(self.stats["hits"], self.stats["misses"]),
+            "prefixes": dict(
+                sorted(prefixes.items(), key=lambda item: -item[1]["items"])
+            ),
+        }
+
+    def _get(self, key: str) -> Optional[T]:
+        """Get a live value and mark it as recently used."""
+        entry = self.cache.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        self.cache.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry.value
+
+    def _set(self, key: str, value: T, ttl: Optional[int]) -> bool:
+        """Store a value, then expire and evict entries to fit the caps."""
+        now = time.monotonic()
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(f"Not caching key {key}: {size} bytes exceeds cache size")
+            self._remove(key)
+            return False
+
+        expires_at = now + ttl if ttl is not None else None
+        previous = self.cache.get(key)
+        if previous is not None:
+            self.bytes -= previous.size
+            self.cache.move_to_end(key)
+            node = previous.node
+        else:
+            node = self._keys.add(key)
+        self.cache[key] = _Entry(value, expires_at, size, node)
+        self.bytes += size
+
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+
+        self._expire(now)
+        while len(self.cache) > self.max_size or self.bytes > self.max_bytes:
+            oldest_key, oldest = self.cache.popitem(last=False)
+            self.bytes -= oldest.size
+            self._keys.remove(oldest_key, oldest.node)
+            self.stats["evictions"] += 1
+        return True
 
-        # Remove expired keys
-        for key in expired_keys:
-            if key in self.cache:
-                del self.cache[key]
-            del self.expiry[key]
+    def _remove(self, key: str) -> bool:
+        """Remove a key; its heap entry is discarded lazily."""
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return False
+        self.bytes -= entry.size
+        self._keys.remove(key, entry.node)
+        return True
 
-        logger.debug(f"Cleaned {len(expired_keys)} expired keys from memory cache")
+    def _expire(self, now: float) -> None:
+        """Remove entries whose expiry time has passed."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Skip heap entries left behind by overwritten or removed keys
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                self.stats["expirations"] += 1
+
+        # Rebuild the heap once stale entries outnumber live ones
+        if len(heap) > 2 * len(self.cache) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, key)
+                for key, entry in self.cache.items()
+                if entry.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _clear(self) -> None:
+        """Remove all entries and reset the indexes."""
+        self.cache.clear()
+        self._expiry_heap = []
+        self._keys.clear()
+        self.bytes = 0
@@ -1,20 +1,60 @@
 # app/core/cache/backends/redis.py
 from __future__ import annotations
 
-import json
-import pickle
-from typing import Any, Dict, List, Optional, TypeVar, cast
+from typing import Any, Dict, List, Optional, Set, TypeVar, cast
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
 from app.core.cache.base import CacheBackend
+from app.core.cache.codecs import CacheCodec
+from app.core.cache.exceptions import CacheOperationException
+from app.core.cache.stats import hit_rate, summarize_sample
 from app.core.config import settings
 from app.logging import get_logger
 
 T = TypeVar("T")
 logger = get_logger("app.core.cache.redis")
 
+# Deletes a lock only if it still holds the caller's token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Adds a key to a tag set and keeps the set alive as long as its longest-lived
+# member: ARGV[2] is the member's TTL in seconds, or -1 if it never expires
+_ADD_TAG_SCRIPT = """
+local current = redis.call("ttl", KEYS[1])
+redis.call("sadd", KEYS[1], ARGV[1])
+local ttl = tonumber(ARGV[2])
+if ttl < 0 then
+    redis.call("persist", KEYS[1])
+elseif current == -2 or (current >= 0 and current < ttl) then
+    redis.call("expire", KEYS[1], ttl)
+end
+return 1
+"""
+
+# Increments a counter, or initializes a missing one to ARGV[2], and
+# refreshes its TTL (ARGV[3], or -1 to leave it) in one round trip
+_INCR_SCRIPT = """
+local value
+if redis.call("exists", KEYS[1]) == 0 then
+    redis.call("set", KEYS[1], ARGV[2])
+    value = tonumber(ARGV[2])
+else
+    value = redis.call("incrby", KEYS[1], ARGV[1])
+end
+local ttl = tonumber(ARGV[3])
+if ttl >= 0 then
+    redis.call("expire", KEYS[1], ttl)
+end
+return value
+"""
+
 
 class RedisCacheBackend(CacheBackend[T]):
     """Redis implementation of the cache backend.
@@ -25,23 +65,35 @@ class RedisCacheBackend(CacheBackend[T]):
     def __init__(
         self,
         redis_url: Optional[str] = None,
-        serializer: str = "pickle",
+        serializer: Optional[str] = None,
         prefix: str = "cache:",
+        compression: Optional[str] = None,
         **redis_options: Any,
     ) -> None:
         """Initialize the Redis cache backend.
 
         Args:
             redis_url: Redis connection URL
-            serializer: Serialization format (pickle or json)
+            serializer: Serialization format (pickle, json, orjson or msgpack;
+                defaults to CACHE_SERIALIZER)
             prefix: Cache key prefix
+            compression: Compression for large values (zlib, zstd, lz4 or
+                none; defaults to CACHE_COMPRESSION)
             **redis_options: Additional Redis client options
         """
         self.redis_url = redis_url or settings.REDIS_URI
-        self.serializer = serializer
+        self.serializer = serializer or settings.CACHE_SERIALIZER
+        self.codec = CacheCodec(
+            self.serializer,
+            compression or settings.CACHE_COMPRESSION,
+            settings.CACHE_COMPRESSION_THRESHOLD,
+        )
         self.prefix = prefix
         self.redis_options = redis_options
+        self.scan_count = settings.CACHE_SCAN_COUNT
+        self.unlink_batch_size = settings.CACHE_UNLINK_BATCH_SIZE
         self.client: Optional[Redis] = None
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
         logger.debug(f"Initialized Redis cache backend with prefix: {prefix}")
 
     async def initialize(self) -> None:
@@ -99,7 +151,9 @@ class RedisCacheBackend(CacheBackend[T]):
         try:
             value = await client.get(prefixed_key)
             if value is None:
+                self.stats["misses"] += 1
                 return None
+            self.stats["hits"] += 1
             return self._deserialize(value)
         except Exception as e:
             logger.error(f"Error getting key {key} from Redis: {str(e)}")
@@ -129,6 +183,35 @@ class RedisCacheBackend(CacheBackend[T]):
             logger.error(f"Error setting key {key} in Redis: {str(e)}")
             return False
 
+    async def set_with_tags(
+        self, key: str, value: T, ttl: Optional[int], tags: List[str]
+    ) -> bool:
+        """Set a value and record it under tags in one transaction.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds
+            tags: Tags to record the key under
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not tags:
+            return await self.set(key, value, ttl)
+        client = await self._get_client()
+        prefixed_key = f"{self.prefix}{key}"
+        try:
+            serialized = self._serialize(value)
+            pipeline = client.pipeline(transaction=True)
+            pipeline.set(prefixed_key, serialized, ex=ttl)
+            self._queue_tags(pipeline, key, tags, ttl)
+            await pipeline.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error setting tagged key {key} in Redis: {str(e)}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete a value from the cache.
 
@@ -167,6 +250,9 @@ class RedisCacheBackend(CacheBackend[T]):
     async def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate keys matching a pattern.
 
+        Keys are found with cursor-based SCAN and removed with UNLINK in
+        batches, so Redis is never blocked walking the whole keyspace.
+
         Args:
             pattern: Key pattern to invalidate
 
@@ -176,10 +262,9 @@ class RedisCacheBackend(CacheBackend[T]):
         client = await self._get_client()
         prefixed_pattern = f"{self.prefix}{pattern}"
         try:
-            keys = await client.keys(prefixed_pattern)
-            if not keys:
-                return 0
-            return await client.delete(*keys)
+            count = await self._unlink_matching(client, prefixed_pattern)
+            logger.debug(f"Invalidated {count} keys matching pattern {pattern}")
+            return count
         except Exception as e:
             logger.error(f"Error invalidating pattern {pattern} in Redis: {str(e)}")
             return 0
@@ -193,10 +278,8 @@ class RedisCacheBackend(CacheBackend[T]):
         client = await self._get_client()
         pattern = f"{self.prefix}*"
         try:
-            keys = await client.keys(pattern)
-            if not keys:
-                return True
-            await client.delete(*keys)
+            count = await self._unlink_matching(client, pattern)
+            logger.info(f"Cleared {count} keys from Redis cache")
             return True
         except Exception as e:
             logger.error(f"Error clearing Redis cache: {str(e)}")
@@ -217,6 +300,9 @@ class RedisCacheBackend(CacheBackend[T]):
         prefixed_keys = [f"{self.prefix}{key}" for key in keys]
         try:
             values = await client.mget(prefixed_keys)
+            misses = values.count(None)
+            self.stats["hits"] += len(values) - misses
+            self.stats["misses"] += misses
             result: Dict[str, Optional[T]] = {}
             for i, key in enumerate(keys):
                 value = values[i]
@@ -269,7 +355,7 @@ class RedisCacheBackend(CacheBackend[T]):
         client = await self._get_client()
         prefixed_keys = [f"{self.prefix}{key}" for key in keys]
         try:
-            return await client.delete(*prefixed_keys)
+            return await self._unlink(client, prefixed_keys)
         except Exception as e:
             logger.error(f"Error deleting multiple keys from Redis: {str(e)}")
             return 0
@@ -291,17 +377,15 @@ class RedisCacheBackend(CacheBackend[T]):
         client = await self._get_client()
         prefixed_key = f"{self.prefix}{key}"
         try:
-            exists = await client.exists(prefixed_key)
-            if not exists:
-                await client.set(prefixed_key, default)
-                if ttl is not None:
-                    await client.expire(prefixed_key, ttl)
-                value = default
-            else:
-                value = await client.incrby(prefixed_key, amount)
-                if ttl is not None:
-                    await client.expire(prefixed_key, ttl)
-            return value
+            value = await client.eval(
+                _INCR_SCRIPT,
+                1,
+                prefixed_key,
+                amount,
+                default,
+                ttl if ttl is not None else -1,
+            )
+            return int(value)
         except Exception as e:
             logger.error(f"Error incrementing key {key} in Redis: {str(e)}")
             return default
@@ -322,6 +406,42 @@ class RedisCacheBackend(CacheBackend[T]):
         """
         return await self.incr(key, -amount, default, ttl)
 
+    async def _unlink(self, client: Redis, keys: List[Any]) -> int:
+        """Unlink keys in batches sent in a single pipeline.
+
+        Args:
+            client: Redis client
+            keys: Full (prefixed) keys to remove
+
+        Returns:
+            Number of keys removed
+        """
+        if not keys:
+            return 0
+        pipeline = client.pipeline(transaction=False)
+        for start in range(0, len(keys), self.unlink_batch_size):
+            pipeline.unlink(*keys[start : start + self.unlink_batch_size])
+        return sum(await pipeline.execute())
+
+    async def _unlink_matching(self, client: Redis, match: str) -> int:
+        """Unlink every key matching a glob pattern using SCAN.
+
+        Args:
+            client: Redis client
+            match: Full (prefixed) glob pattern
+
+        Returns:
+            Number of keys removed
+        """
+        count = 0
+        batch: List[Any] = []
+        async for key in client.scan_iter(match=match, count=self.scan_count):
+            batch.append(key)
+            if len(batch) >= self.scan_count:
+                count += await self._unlink(client, batch)
+                batch = []
+        return count + await self._unlink(client, batch)
+
     def _serialize(self, value: T) -> bytes:
         """Serialize a value for storage.
 
@@ -331,10 +451,7 @@ class RedisCacheBackend(CacheBackend[T]):
         Returns:
             Serialized value
         """
-        if self.serializer == "json":
-            return json.dumps(value).encode("utf-8")
-        else:
-            return pickle.dumps(value)
+        return self.codec.encode(value)
 
     def _deserialize(self, value: bytes) -> T:
         """Deserialize a value from storage.
@@ -347,10 +464,59 @@ class RedisCacheBackend(CacheBackend[T]):
         """
         if value is None:
             return cast(T, None)
-        if self.serializer == "json":
-            return cast(T, json.loads(value.decode("utf-8")))
-        else:
-            return cast(T, pickle.loads(value))
+        return cast(T, self.codec.decode(value))
+
+    async def sample_stats(self, sample_size: int) -> Dict[str, Any]:
+        """Get cache statistics with entry counts and sizes per key prefix.
+
+        Draws sample_size random keys with RANDOMKEY and sizes them with
+        MEMORY USAGE, in two pipelined round trips, and scales the counts by
+        DBSIZE. Hits and misses are those of this process; evictions and
+        memory are server-wide.
+
+        Args:
+            sample_size: Number of keys to draw
+
+        Returns:
+            Dict[str, Any]: Cache statistics with a "prefixes" breakdown
+        """
+        client = await self._get_client()
+        pipe = client.pipeline(transaction=False)
+        pipe.dbsize()
+        pipe.info("memory")
+        pipe.info("stats")
+        for _ in range(sample_size):
+            pipe.randomkey()
+        server_items, memory, server_stats, *drawn = await pipe.execute()
+
+        prefix = self.prefix.encode("utf-8")
+        sampled = [key for key in drawn if key is not None and key.startswith(prefix)]
+        unique = list(dict.fromkeys(sampled))
+        pipe = client.pipeline(transaction=False)
+        for key in unique:
+            pipe.memory_usage(key)
+        sizes = dict(zip(unique, await pipe.execute()))
+
+        draws = len([key for key in drawn if key is not None])
+        prefixes = summarize_sample(
+            (
+                (key[len(prefix) :].decode("utf-8", "replace"), sizes[key] or 0)
+                for key in sampled
+            ),
+            server_items,
+            draws,
+        )
+        return {
+            "type": "redis",
+            "items": sum(stats["items"] for stats in prefixes.values()),
+            "bytes": sum(stats["bytes"] for stats in prefixes.values()),
+            **self.stats,
+            "hit_rate": hit_rate(self.stats["hits"], self.stats["misses"]),
+            "evictions": server_stats.get("evicted_keys", 0),
+            "server_items": server_items,
+            "server_bytes": memory.get("used_memory", 0),
+            "prefixes": prefixes,
+        }
 
     # Additional Redis-specific methods
 
@@ -443,3 +609,146 @@ class RedisCacheBackend(CacheBackend[T]):
         except Exception as e:
             logger.error(f"Error removing from set {key} in Redis: {str(e)}")
             return False
+
+    async def add_tags(
+        self, key: str, tags: List[str], ttl: Optional[int] = None
+    ) -> bool:
+        """Record a cache key under tags so it can be invalidated by tag.
+
+        Each tag is a set of cache keys that expires with its longest-lived
+        member.
+
+        Args:
+            key: Cache key
+            tags: Tags to record the key under
+            ttl: Time-to-live of the cached value in seconds
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not tags:
+            return True
+        client = await self._get_client()
+        try:
+            pipeline = client.pipeline(transaction=False)
+            self._queue_tags(pipeline, key, tags, ttl)
+            await pipeline.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error tagging key {key} in Redis: {str(e)}")
+            return False
+
+    async def pop_tagged_keys(self, tags: List[str]) -> List[str]:
+        """Get the cache keys recorded under tags and remove the tags.
+
+        Reading and removing the tag sets happens in one transaction, so a
+        key tagged concurrently is either returned or kept for later.
+
+        Args:
+            tags: Tags to remove
+
+        Returns:
+            Cache keys recorded under any of the tags
+        """
+        if not tags:
+            return []
+        client = await self._get_client()
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        try:
+            pipeline = client.pipeline(transaction=True)
+            for tag_key in tag_keys:
+                pipeline.smembers(tag_key)
+            pipeline.unlink(*tag_keys)
+            results = await pipeline.execute()
+        except Exception as e:
+            logger.error(f"Error reading tags {tags} from Redis: {str(e)}")
+            return []
+
+        keys: Set[str] = set()
+        for members in results[:-1]:
+            keys.update(
+                member.decode("utf-8") if isinstance(member, bytes) else member
+                for member in members
+            )
+        return list(keys)
+
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """Invalidate every cache key recorded under any of the tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of invalidated keys
+        """
+        keys = await self.pop_tagged_keys(tags)
+        count = await self.delete_many(keys)
+        logger.debug(f"Invalidated {count} keys tagged {tags}")
+        return count
+
+    def _queue_tags(
+        self, pipeline: Any, key: str, tags: List[str], ttl: Optional[int]
+    ) -> None:
+        """Queue the commands recording key under tags on a pipeline."""
+        for tag in tags:
+            pipeline.eval(
+                _ADD_TAG_SCRIPT,
+                1,
+                self._tag_key(tag),
+                key,
+                ttl if ttl is not None else -1,
+            )
+
+    def _tag_key(self, tag: str) -> str:
+        """Get the key of the set holding the cache keys recorded under tag."""
+        return f"{self.prefix}tag:{tag}"
+
+    async def acquire_lock(self, name: str, token: str, timeout: float) -> bool:
+        """Acquire a short-lived lock, held until released or timeout passes.
+
+        Args:
+            name: Lock name
+            token: Unique token identifying the holder
+            timeout: Seconds after which the lock expires
+
+        Returns:
+            True if the lock was acquired, False if another holder has it
+
+        Raises:
+            CacheOperationException: If Redis can't be reached, so callers
+                don't mistake an outage for a lock held elsewhere
+        """
+        client = await self._get_client()
+        lock_key = f"{self.prefix}lock:{name}"
+        try:
+            return bool(
+                await client.set(
+                    lock_key, token, nx=True, px=max(1, int(timeout * 1000))
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error acquiring lock {name} in Redis: {str(e)}")
+            raise CacheOperationException(
+                f"Error acquiring lock {name} in Redis",
+                operation="acquire_lock",
+                key=name,
+                original_exception=e,
+            ) from e
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        """Release a lock if it is still held with token.
+
+        Args:
+            name: Lock name
+            token: Token the lock was acquired with
+
+        Returns:
+            True if the lock was released, False otherwise
+        """
+        client = await self._get_client()
+        lock_key = f"{self.prefix}lock:{name}"
+        try:
+            return bool(await client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token))
+        except Exception as e:
+            logger.error(f"Error releasing lock {name} in Redis: {str(e)}")
+            return False
@@ -0,0 +1,511 @@
+# /backend/app/core/cache/backends/tiered.py
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, Dict, List, Optional, TypeVar
+
+from app.core.cache.backends.memory import MemoryCacheBackend
+from app.core.cache.backends.redis import RedisCacheBackend
+from app.core.cache.base import CacheBackend
+from app.core.config import settings
+from app.logging import get_logger
+
+T = TypeVar("T")
+logger = get_logger("app.core.cache.tiered")
+
+# Try to import metrics, but don't fail if not available
+try:
+    from app.core.metrics import track_cache_operation
+
+    HAS_METRICS = True
+except ImportError:
+    HAS_METRICS = False
+
+
+class TieredCacheBackend(CacheBackend[T]):
+    """Two-tier cache with an in-process memory L1 in front of Redis (L2).
+
+    Reads try L1 first and fall back to L2, promoting L2 hits into L1.
+    Writes go to L2 and then L1. L1 entries live at most ``l1_ttl`` seconds
+    and are dropped in every worker when another worker changes the key,
+    through invalidation messages published on a Redis pub/sub channel.
+    """
+
+    def __init__(
+        self,
+        l1: Optional[MemoryCacheBackend] = None,
+        l2: Optional[RedisCacheBackend] = None,
+        l1_ttl: Optional[int] = None,
+        channel: Optional[str] = None,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        """Initialize the tiered cache backend.
+
+        Args:
+            l1: In-process cache backend; created if not provided
+            l2: Shared Redis cache backend; created if not provided
+            l1_ttl: Maximum time-to-live of L1 entries in seconds
+            channel: Redis pub/sub channel for invalidation messages
+            reconnect_delay: Seconds to wait before resubscribing after an error
+        """
+        self.l1 = l1 or MemoryCacheBackend(max_size=settings.CACHE_L1_MAX_SIZE)
+        self.l2 = l2 or RedisCacheBackend()
+        self._owns_l2 = l2 is None
+        self.l1_ttl = l1_ttl if l1_ttl is not None else settings.CACHE_L1_TTL
+        self.channel = channel or settings.CACHE_INVALIDATION_CHANNEL
+        self.reconnect_delay = reconnect_delay
+        self.instance_id = uuid.uuid4().hex
+        self.stats: Dict[str, int] = {
+            "l1_hits": 0,
+            "l1_misses": 0,
+            "l2_hits": 0,
+            "l2_misses": 0,
+            "invalidations_received": 0,
+        }
+        # Bumped on every invalidation, so read-through promotion can tell
+        # whether the key may have changed while L2 was being read
+        self._generation = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Initialize both tiers and subscribe to invalidation messages."""
+        await self.l1.initialize()
+        if self._owns_l2:
+            await self.l2.initialize()
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+        logger.info(f"Tiered cache backend initialized (L1 TTL {self.l1_ttl}s)")
+
+    async def shutdown(self) -> None:
+        """Stop the invalidation listener and shut down the owned tiers."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self.l1.shutdown()
+        if self._owns_l2:
+            await self.l2.shutdown()
+        logger.info("Tiered cache backend shut down")
+
+    async def get(self, key: str) -> Optional[T]:
+        """Get a value from L1, falling back to L2.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found
+        """
+        start_time = time.monotonic()
+        value = await self.l1.get(key)
+        if value is not None:
+            self._track("l1", True, time.monotonic() - start_time)
+            return value
+        self._track("l1", False, time.monotonic() - start_time)
+
+        start_time = time.monotonic()
+        generation = self._generation
+        value = await self.l2.get(key)
+        self._track("l2", value is not None, time.monotonic() - start_time)
+
+        if value is not None and generation == self._generation:
+            await self.l1.set(key, value, self.l1_ttl)
+        return value
+
+    async def set(self, key: str, value: T, ttl: Optional[int] = None) -> bool:
+        """Set a value in L2 and L1 and invalidate it in other workers.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds
+
+        Returns:
+            True if the L2 write succeeded, False otherwise
+        """
+        return await self.set_with_tags(key, value, ttl, [])
+
+    async def set_with_tags(
+        self, key: str, value: T, ttl: Optional[int], tags: List[str]
+    ) -> bool:
+        """Set a value and its tags in L2, then in L1, and invalidate it elsewhere.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds
+            tags: Tags to record the key under
+
+        Returns:
+            True if the L2 write succeeded, False otherwise
+        """
+        self._generation += 1
+        if tags:
+            result = await self.l2.set_with_tags(key, value, ttl, tags)
+        else:
+            result = await self.l2.set(key, value, ttl)
+        if result:
+            await self.l1.set(key, value, self._l1_ttl(ttl))
+        else:
+            await self.l1.delete(key)
+        await self._publish("delete", [key])
+        return result
+
+    async def delete(self, key: str) -> bool:
+        """Delete a value from both tiers and from other workers' L1.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key was deleted from L2, False otherwise
+        """
+        self._generation += 1
+        await self.l1.delete(key)
+        result = await self.l2.delete(key)
+        await self._publish("delete", [key])
+        return result
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists in either tier.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        return await self.l1.exists(key) or await self.l2.exists(key)
+
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """Invalidate keys matching a pattern in both tiers and other workers.
+
+        Args:
+            pattern: Key pattern to invalidate
+
+        Returns:
+            Number of keys invalidated in L2
+        """
+        self._generation += 1
+        await self.l1.invalidate_pattern(pattern)
+        count = await self.l2.invalidate_pattern(pattern)
+        await self._publish("pattern", [pattern])
+        return count
+
+    async def clear(self) -> bool:
+        """Clear both tiers and every other worker's L1.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._generation += 1
+        await self.l1.clear()
+        result = await self.l2.clear()
+        await self._publish("clear", [])
+        return result
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Optional[T]]:
+        """Get multiple values, reading from L2 only the keys missing in L1.
+
+        Args:
+            keys: List of cache keys
+
+        Returns:
+            Dictionary mapping keys to values
+        """
+        start_time = time.monotonic()
+        result = await self.l1.get_many(keys)
+        missing = [key for key in keys if result.get(key) is None]
+        self._track_many("l1", len(keys) - len(missing), len(missing), start_time)
+        if not missing:
+            return result
+
+        start_time = time.monotonic()
+        generation = self._generation
+        found = await self.l2.get_many(missing)
+        promote = {key: value for key, value in found.items() if value is not None}
+        self._track_many("l2", len(promote), len(missing) - len(promote), start_time)
+
+        if promote and generation == self._generation:
+            await self.l1.set_many(promote, self.l1_ttl)
+        result.update(found)
+        return result
+
+    async def set_many(self, mapping: Dict[str, T], ttl: Optional[int] = None) -> bool:
+        """Set multiple values in L2 and L1 and invalidate them elsewhere.
+
+        Args:
+            mapping: Dictionary mapping keys to values
+            ttl: Time-to-live in seconds
+
+        Returns:
+            True if the L2 write succeeded, False otherwise
+        """
+        if not mapping:
+            return True
+        self._generation += 1
+        result = await self.l2.set_many(mapping, ttl)
+        if result:
+            await self.l1.set_many(mapping, self._l1_ttl(ttl))
+        else:
+            await self.l1.delete_many(list(mapping))
+        await self._publish("delete", list(mapping))
+        return result
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete multiple values from both tiers and other workers' L1.
+
+        Args:
+            keys: List of cache keys
+
+        Returns:
+            Number of keys deleted from L2
+        """
+        if not keys:
+            return 0
+        self._generation += 1
+        await self.l1.delete_many(keys)
+        count = await self.l2.delete_many(keys)
+        await self._publish("delete", keys)
+        return count
+
+    async def incr(
+        self, key: str, amount: int = 1, default: int = 0, ttl: Optional[int] = None
+    ) -> int:
+        """Increment a counter in L2; counters are never served from L1.
+
+        Args:
+            key: Cache key
+            amount: Amount to increment by
+            default: Default value if key doesn't exist
+            ttl: Time-to-live in seconds
+
+        Returns:
+            New counter value
+        """
+        self._generation += 1
+        value = await self.l2.incr(key, amount, default, ttl)
+        await self.l1.delete(key)
+        await self._publish("delete", [key])
+        return value
+
+    async def decr(
+        self, key: str, amount: int = 1, default: int = 0, ttl: Optional[int] = None
+    ) -> int:
+        """Decrement a counter in L2.
+
+        Args:
+            key: Cache key
+            amount: Amount to decrement by
+            default: Default value if key doesn't exist
+            ttl: Time-to-live in seconds
+
+        Returns:
+            New counter value
+        """
+        return await self.incr(key, -amount, default, ttl)
+
+    async def add_tags(
+        self, key: str, tags: List[str], ttl: Optional[int] = None
+    ) -> bool:
+        """Record a cache key under tags in L2.
+
+        Args:
+            key: Cache key
+            tags: Tags to record the key under
+            ttl: Time-to-live of the cached value in seconds
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self.l2.add_tags(key, tags, ttl)
+
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """Invalidate tagged keys in both tiers and other workers' L1.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of keys invalidated in L2
+        """
+        keys = await self.l2.pop_tagged_keys(tags)
+        if not keys:
+            return 0
+        return await self.delete_many(keys)
+
+    async def acquire_lock(self, name: str, token: str, timeout: float) -> bool:
+        """Acquire a short-lived lock in L2.
+
+        Args:
+            name: Lock name
+            token: Unique token identifying the holder
+            timeout: Seconds after which the lock expires
+
+        Returns:
+            True if the lock was acquired, False if another holder has it
+
+        Raises:
+            CacheOperationException: If L2 can't be reached
+        """
+        return await self.l2.acquire_lock(name, token, timeout)
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        """Release a lock in L2 if it is still held with token.
+
+        Args:
+            name: Lock name
+            token: Token the lock was acquired with
+
+        Returns:
+            True if the lock was released, False otherwise
+        """
+        return await self.l2.release_lock(name, token)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit counts and hit rates per tier.
+
+        Returns:
+            Dictionary of counters plus ``l1_hit_rate``, ``l2_hit_rate``
+            (of L1 misses) and the combined ``hit_rate``
+        """
+        stats: Dict[str, Any] = dict(self.stats)
+        l1_total = self.stats["l1_hits"] + self.stats["l1_misses"]
+        l2_total = self.stats["l2_hits"] + self.stats["l2_misses"]
+        hits = self.stats["l1_hits"] + self.stats["l2_hits"]
+        stats["l1_hit_rate"] = self.stats["l1_hits"] / l1_total if l1_total else 0.0
+        stats["l2_hit_rate"] = self.stats["l2_hits"] / l2_total if l2_total else 0.0
+        stats["hit_rate"] = hits / l1_total if l1_total else 0.0
+        return stats
+
+    async def sample_stats(self, sample_size: int) -> Dict[str, Any]:
+        """Get per-tier hit rates and the statistics of L1.
+
+        L2 statistics are included only for an L2 this backend created;
+        a shared L2 reports them under its own backend name.
+
+        Args:
+            sample_size: Number of entries to sample per tier
+
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        stats: Dict[str, Any] = {
+            "type": "tiered",
+            **self.get_stats(),
+            "l1": await self.l1.sample_stats(sample_size),
+        }
+        if self._owns_l2:
+            stats["l2"] = await self.l2.sample_stats(sample_size)
+        return stats
+
+    def _l1_ttl(self, ttl: Optional[int]) -> int:
+        """Get the L1 time-to-live for an entry written with ttl."""
+        return min(ttl, self.l1_ttl) if ttl is not None else self.l1_ttl
+
+    def _track(self, tier: str, hit: bool, duration: float) -> None:
+        """Count a lookup in a tier and report it to the metrics service."""
+        self.stats[f"{tier}_hits" if hit else f"{tier}_misses"] += 1
+        if not HAS_METRICS:
+            return
+        try:
+            track_cache_operation(
+                operation="get",
+                backend=f"tiered_{tier}",
+                hit=hit,
+                duration=duration,
+                component="tiered_cache",
+            )
+        except Exception as e:
+            logger.debug(f"Could not record tiered cache metrics: {str(e)}")
+
+    def _track_many(self, tier: str, hits: int, misses: int, start: float) -> None:
+        """Count a batch lookup in a tier and report it to the metrics service."""
+        self.stats[f"{tier}_hits"] += hits
+        self.stats[f"{tier}_misses"] += misses
+        if not HAS_METRICS:
+            return
+        try:
+            track_cache_operation(
+                operation="get_many",
+                backend=f"tiered_{tier}",
+                hit=hits > misses,
+                duration=time.monotonic() - start,
+                component="tiered_cache",
+            )
+        except Exception as e:
+            logger.debug(f"Could not record tiered cache metrics: {str(e)}")
+
+    async def _publish(self, operation: str, keys: List[str]) -> None:
+        """Publish an invalidation message for other workers.
+
+        Args:
+            operation: One of "delete", "pattern" or "clear"
+            keys: Keys (or patterns) the operation applies to
+        """
+        message = json.dumps(
+            {"origin": self.instance_id, "op": operation, "keys": keys}
+        )
+        try:
+            client = await self.l2._get_client()
+            await client.publish(self.channel, message)
+        except Exception as e:
+            logger.warning(f"Error publishing cache invalidation: {str(e)}")
+
+    async def _listen(self) -> None:
+        """Apply invalidation messages from other workers to L1 until cancelled."""
+        while True:
+            pubsub = None
+            try:
+                client = await self.l2._get_client()
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                logger.debug(f"Subscribed to cache invalidations on {self.channel}")
+                async for message in pubsub.listen():
+                    await self.handle_invalidation(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Messages may have been missed while disconnected
+                logger.warning(f"Cache invalidation listener error: {str(e)}")
+                self._generation += 1
+                await self.l1.clear()
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.reset()
+                    except Exception:
+                        pass
+
+    async def handle_invalidation(self, data: Any) -> None:
+        """Apply an invalidation message published by another worker to L1.
+
+        Args:
+            data: Raw message payload
+        """
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation: {data!r}")
+            return
+        if message.get("origin") == self.instance_id:
+            return
+
+        self._generation += 1
+        self.stats["invalidations_received"] += 1
+        operation = message.get("op")
+        keys = message.get("keys") or []
+        if operation == "delete":
+            await self.l1.delete_many(keys)
+        elif operation == "pattern":
+            for pattern in keys:
+                await self.l1.invalidate_pattern(pattern)
+        elif operation == "clear":
+            await self.l1.clear()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+"""
+Request-scoped batching of cache reads.
+
+While a batch is active, cache reads issued in the same event loop
+iteration (for example by handlers gathering several cached lookups) are
+collected and sent to each backend as a single ``get_many`` call, which
+Redis serves with one MGET.
+"""
+
+import asyncio
+import contextlib
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.core.cache.base import CacheBackend
+from app.core.config import settings
+from app.logging import get_logger
+
+logger = get_logger("app.core.cache.batching")
+
+_current_batch: ContextVar[Optional[CacheReadBatch]] = ContextVar(
+    "cache_read_batch", default=None
+)
+
+
+class CacheReadBatch:
+    """Collects cache reads and loads them with one get_many per backend."""
+
+    def __init__(self, max_keys: Optional[int] = None) -> None:
+        """Initialize the batch.
+
+        Args:
+            max_keys: Maximum keys per get_many call (defaults to
+                CACHE_BATCH_MAX_KEYS)
+        """
+        self.max_keys = max_keys or settings.CACHE_BATCH_MAX_KEYS
+        self.round_trips = 0
+        self.keys_loaded = 0
+        self._pending: Dict[
+            int, Tuple[CacheBackend, Dict[str, List[asyncio.Future]]]
+        ] = {}
+        self._scheduled = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, backend: CacheBackend, key: str) -> Any:
+        """Get a value, loading it together with other reads in this iteration.
+
+        Args:
+            backend: Backend to read from
+            key: Cache key
+
+        Returns:
+            The cached value, or None if not found
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        _, waiters = self._pending.setdefault(id(backend), (backend, {}))
+        waiters.setdefault(key, []).append(future)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        """Start loading every pending read."""
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        for backend, waiters in pending.values():
+            keys = list(waiters)
+            for start in range(0, len(keys), self.max_keys):
+                chunk = {
+                    key: waiters[key] for key in keys[start : start + self.max_keys]
+                }
+                task = asyncio.ensure_future(self._load(backend, chunk))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _load(
+        self, backend: CacheBackend, waiters: Dict[str, List[asyncio.Future]]
+    ) -> None:
+        """Load keys with one get_many call and resolve their waiters."""
+        self.round_trips += 1
+        self.keys_loaded += len(waiters)
+        try:
+            values = await backend.get_many(list(waiters))
+        except Exception as e:
+            logger.error(f"Error loading batched cache keys: {str(e)}")
+            values = {}
+
+        for key, futures in waiters.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(values.get(key))
+
+
+def current_batch() -> Optional[CacheReadBatch]:
+    """Get the read batch active in this context, if any."""
+    return _current_batch.get()
+
+
+@contextlib.asynccontextmanager
+async def batch_cache_reads(
+    max_keys: Optional[int] = None,
+) -> AsyncIterator[CacheReadBatch]:
+    """Batch the cache reads made through the cache manager in this context.
+
+    Args:
+        max_keys: Maximum keys per get_many call
+
+    Yields:
+        CacheReadBatch: The active batch
+    """
+    existing = _current_batch.get()
+    if existing is not None:
+        yield existing
+        return
+
+    batch = CacheReadBatch(max_keys)
+    token = _current_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _current_batch.reset(token)
+        if batch.round_trips:
+            logger.debug(
+                f"Batched {batch.keys_loaded} cache reads into "
+                f"{batch.round_trips} round trips"
+            )
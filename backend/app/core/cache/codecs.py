@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+"""
+Serialization and compression of cached values.
+
+Encoded values start with a one-byte header naming the serializer and
+compression used, so values written with any codec can be read back
+whatever codec the reader is configured to write with. Values written
+before headers were introduced (plain pickle or JSON) are still read.
+
+Header byte layout: ``0b11CCCSSS``, where ``CCC`` is the compression id
+and ``SSS`` the serializer id. Plain pickle data starts with ``0x80`` and
+JSON with an ASCII character, so headers never collide with either.
+
+Serializers limited to plain data (json, orjson and msgpack) can't store the
+wrappers the cache decorators put around values, so ``CacheEntry`` and
+``NEGATIVE_RESULT`` are written as single-key tagged dicts and restored when
+read back.
+"""
+
+import json
+import pickle
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.cache.exceptions import CacheConfigurationException
+from app.core.cache.negative import NEGATIVE_RESULT
+from app.core.cache.stampede import CacheEntry
+
+_HEADER_TAG = 0xC0
+_PICKLE_OPCODE = 0x80
+_ENTRY_TAG = "__cache_entry__"
+_NEGATIVE_TAG = "__cache_negative__"
+
+
+@dataclass(frozen=True)
+class Codec:
+    """A named, reversible transformation with a header id."""
+
+    name: str
+    id: int
+    encode: Optional[Callable[[Any], bytes]]
+    decode: Optional[Callable[[bytes], Any]]
+    plain_data: bool = False
+
+    @property
+    def available(self) -> bool:
+        """Whether the library implementing the codec is installed."""
+        return self.encode is not None
+
+
+def _to_plain_data(value: Any) -> Any:
+    """Replace the cache wrappers around a value with tagged dicts."""
+    if isinstance(value, CacheEntry):
+        return {
+            _ENTRY_TAG: [_to_plain_data(value.value), value.delta, value.expires_at]
+        }
+    if value is NEGATIVE_RESULT:
+        return {_NEGATIVE_TAG: True}
+    return value
+
+
+def _from_plain_data(value: Any) -> Any:
+    """Restore the cache wrappers written by _to_plain_data."""
+    if isinstance(value, dict) and len(value) == 1:
+        if _ENTRY_TAG in value:
+            cached, delta, expires_at = value[_ENTRY_TAG]
+            return CacheEntry(_from_plain_data(cached), delta, expires_at)
+        if _NEGATIVE_TAG in value:
+            return NEGATIVE_RESULT
+    return value
+
+
+def _pickle_dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    return json.loads(data.decode("utf-8"))
+
+
+try:
+    import orjson
+
+    _orjson_dumps: Optional[Callable[[Any], bytes]] = orjson.dumps
+    _orjson_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _orjson_dumps = None
+    # orjson output is plain JSON, so it can still be read without orjson
+    _orjson_loads = _json_loads
+
+try:
+    import msgpack
+
+    def _msgpack_dumps(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def _msgpack_loads(data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+except ImportError:
+    _msgpack_dumps = _msgpack_loads = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+    _zstd_compress: Optional[Callable[[bytes], bytes]] = _zstd_compressor.compress
+    _zstd_decompress: Optional[Callable[[bytes], bytes]] = _zstd_decompressor.decompress
+except ImportError:
+    _zstd_compress = _zstd_decompress = None
+
+try:
+    import lz4.frame
+
+    _lz4_compress: Optional[Callable[[bytes], bytes]] = lz4.frame.compress
+    _lz4_decompress: Optional[Callable[[bytes], bytes]] = lz4.frame.decompress
+except ImportError:
+    _lz4_compress = _lz4_decompress = None
+
+
+def _zlib_compress(data: bytes) -> bytes:
+    return zlib.compress(data, 1)
+
+
+# Ids are stored in every encoded value: never reuse or renumber them
+SERIALIZERS: Dict[str, Codec] = {
+    codec.name: codec
+    for codec in (
+        Codec("pickle", 1, _pickle_dumps, pickle.loads),
+        Codec("json", 2, _json_dumps, _json_loads, plain_data=True),
+        Codec("orjson", 3, _orjson_dumps, _orjson_loads, plain_data=True),
+        Codec("msgpack", 4, _msgpack_dumps, _msgpack_loads, plain_data=True),
+    )
+}
+
+COMPRESSORS: Dict[str, Codec] = {
+    codec.name: codec
+    for codec in (
+        Codec("none", 0, bytes, bytes),
+        Codec("zlib", 1, _zlib_compress, zlib.decompress),
+        Codec("zstd", 2, _zstd_compress, _zstd_decompress),
+        Codec("lz4", 3, _lz4_compress, _lz4_decompress),
+    )
+}
+
+_SERIALIZERS_BY_ID = {codec.id: codec for codec in SERIALIZERS.values()}
+_COMPRESSORS_BY_ID = {codec.id: codec for codec in COMPRESSORS.values()}
+
+
+def available_codecs() -> Dict[str, List[str]]:
+    """Get the names of the serializers and compressors that can be used.
+
+    Returns:
+        Dict[str, List[str]]: Available names under "serializers" and
+        "compressors"
+    """
+    return {
+        "serializers": [c.name for c in SERIALIZERS.values() if c.available],
+        "compressors": [c.name for c in COMPRESSORS.values() if c.available],
+    }
+
+
+def _lookup(registry: Dict[str, Codec], kind: str, name: str) -> Codec:
+    """Get a codec by name, checking that it can be used."""
+    codec = registry.get(name)
+    if codec is None:
+        raise CacheConfigurationException(
+            f"Unknown cache {kind}: {name}",
+            details={kind: name, "known": list(registry)},
+        )
+    if not codec.available:
+        raise CacheConfigurationException(
+            f"Cache {kind} {name} is not installed",
+            details={kind: name},
+        )
+    return codec
+
+
+class CacheCodec:
+    """Encodes cached values with a serializer and optional compression.
+
+    Values whose serialized size reaches ``threshold`` bytes are
+    compressed; smaller values are stored as serialized, since compressing
+    them costs more time than it saves.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "pickle",
+        compression: Optional[str] = None,
+        threshold: int = 1024,
+    ) -> None:
+        """Initialize the codec.
+
+        Args:
+            serializer: Serializer name (pickle, json, orjson or msgpack)
+            compression: Compressor name (zlib, zstd or lz4), or None
+            threshold: Minimum serialized size in bytes to compress
+
+        Raises:
+            CacheConfigurationException: If a codec is unknown or not installed
+        """
+        self.serializer = _lookup(SERIALIZERS, "serializer", serializer)
+        self.compressor = _lookup(COMPRESSORS, "compression", compression or "none")
+        self.threshold = threshold
+        self._plain_header = bytes([_HEADER_TAG | self.serializer.id])
+        self._compressed_header = bytes(
+            [_HEADER_TAG | self.compressor.id << 3 | self.serializer.id]
+        )
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize and, if large enough, compress a value.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            bytes: Header byte followed by the payload
+        """
+        if self.serializer.plain_data:
+            value = _to_plain_data(value)
+        payload = self.serializer.encode(value)
+        if self.compressor.id and len(payload) >= self.threshold:
+            return self._compressed_header + self.compressor.encode(payload)
+        return self._plain_header + payload
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a value written by any codec, or by the legacy format.
+
+        Args:
+            data: Encoded value
+
+        Returns:
+            Any: The decoded value
+
+        Raises:
+            ValueError: If the value names a codec that is not installed
+        """
+        header = data[0]
+        if header & _HEADER_TAG != _HEADER_TAG:
+            # Written before codec headers: pickle or JSON without a header
+            if header == _PICKLE_OPCODE:
+                return pickle.loads(data)
+            return _json_loads(data)
+
+        serializer = _SERIALIZERS_BY_ID.get(header & 0x07)
+        compressor = _COMPRESSORS_BY_ID.get(header >> 3 & 0x07)
+        if (
+            serializer is None
+            or compressor is None
+            or serializer.decode is None
+            or compressor.decode is None
+        ):
+            raise ValueError(f"Cannot decode cached value with header {header:#x}")
+
+        payload = data[1:]
+        if compressor.id:
+            payload = compressor.decode(payload)
+        value = serializer.decode(payload)
+        if serializer.plain_data:
+            return _from_plain_data(value)
+        return value
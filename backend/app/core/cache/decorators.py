@@ -10,10 +10,22 @@ including automatic cache key generation and invalidation.
 import asyncio
 import functools
 import time
-from typing import Any, Callable, List, Optional, TypeVar, cast, Dict
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar, cast, Dict
 
-from app.core.cache.keys import generate_cache_key
+from app.core.cache.exceptions import CacheException
+from app.core.cache.keys import CacheKeyBuilder
 from app.core.cache.manager import cache_manager
+from app.core.cache.negative import NEGATIVE_RESULT, is_negative
+from app.core.cache.stampede import (
+    CacheEntry,
+    SingleFlight,
+    make_entry,
+    should_refresh_early,
+    unwrap_entry,
+)
+from app.core.cache.stats import HIT, MISS, NEGATIVE_HIT, record_function_result
 from app.logging import get_logger
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -28,6 +40,152 @@ try:
 except ImportError:
     HAS_METRICS = False
 
+# Concurrent misses for the same key share one computation per process
+_single_flight = SingleFlight()
+
+# Seconds between cache checks while another process holds a key's lock
+_LOCK_POLL_INTERVAL = 0.05
+
+
+@dataclass(frozen=True)
+class _CachePolicy:
+    """How a decorated function caches its results."""
+
+    ttl: Optional[int]
+    backend: Optional[str]
+    tags: Optional[List[str]]
+    coalesce: bool
+    lock_timeout: Optional[float]
+    early_refresh_beta: float
+    negative_ttl: Optional[int] = None
+    negative_only: bool = False
+
+
+async def _compute(
+    key: str, compute: Callable[[], Awaitable[Any]], policy: _CachePolicy
+) -> Any:
+    """Run the wrapped function and cache its result with its tags.
+
+    None results are cached as NEGATIVE_RESULT when the policy has a
+    negative TTL, and not cached otherwise.
+    """
+    start_time = time.monotonic()
+    result = await compute()
+    if result is None:
+        if policy.negative_ttl:
+            await cache_manager.set(
+                key, NEGATIVE_RESULT, policy.negative_ttl, policy.backend, policy.tags
+            )
+        return result
+    if policy.negative_only:
+        return result
+
+    stored = result
+    if policy.early_refresh_beta > 0 and policy.ttl:
+        stored = make_entry(result, time.monotonic() - start_time, policy.ttl)
+    await cache_manager.set(key, stored, policy.ttl, policy.backend, policy.tags)
+
+    return result
+
+
+async def _load(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    policy: _CachePolicy,
+    refreshing: bool = False,
+) -> Any:
+    """Compute a value, at most once across processes when locking is enabled.
+
+    Args:
+        key: The cache key.
+        compute: Zero-argument coroutine function computing the value.
+        policy: Caching policy of the decorated function.
+        refreshing: Whether a cached value exists and is being refreshed early.
+
+    Returns:
+        The value, or None when refreshing and another process holds the lock.
+    """
+    lock_backend = None
+    if policy.lock_timeout:
+        redis_backend = cache_manager.backends.get("redis")
+        if hasattr(redis_backend, "acquire_lock"):
+            lock_backend = redis_backend
+    if lock_backend is None:
+        return await _compute(key, compute, policy)
+
+    token = uuid.uuid4().hex
+    try:
+        acquired = await lock_backend.acquire_lock(key, token, policy.lock_timeout)
+    except CacheException as e:
+        # Nothing can fill the cache while it is unreachable; don't wait for it
+        logger.warning(f"Cache lock unavailable for key {key}: {str(e)}")
+        return await _compute(key, compute, policy)
+    if acquired:
+        try:
+            return await _compute(key, compute, policy)
+        finally:
+            await lock_backend.release_lock(key, token)
+
+    if refreshing:
+        # Another process is refreshing; keep serving the cached value
+        return None
+
+    # Wait for the lock holder to fill the cache
+    deadline = time.monotonic() + policy.lock_timeout
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_LOCK_POLL_INTERVAL)
+        cached_value = await cache_manager.get(key, backend=policy.backend)
+        if cached_value is not None:
+            return unwrap_entry(cached_value)
+
+    logger.debug(f"Timed out waiting for cache lock on key: {key}")
+    return await _compute(key, compute, policy)
+
+
+async def _get_or_compute(
+    key: str, compute: Callable[[], Awaitable[Any]], policy: _CachePolicy
+) -> Tuple[Any, str]:
+    """Get a value from the cache, computing it on a miss.
+
+    Misses are coalesced so concurrent callers share one computation, and
+    hits close to expiry may be refreshed early by a single caller.
+
+    Args:
+        key: The cache key.
+        compute: Zero-argument coroutine function computing the value.
+        policy: Caching policy of the decorated function.
+
+    Returns:
+        Tuple of (value, outcome), the outcome being "hit", "negative_hit"
+        or "miss".
+    """
+    cached_value = await cache_manager.get(key, backend=policy.backend)
+    if is_negative(cached_value):
+        logger.debug(f"Negative cache hit for key: {key}")
+        return None, NEGATIVE_HIT
+    if cached_value is not None:
+        logger.debug(f"Cache hit for key: {key}")
+        if (
+            isinstance(cached_value, CacheEntry)
+            and not _single_flight.in_flight(key)
+            and should_refresh_early(cached_value, policy.early_refresh_beta)
+        ):
+            logger.debug(f"Refreshing cache key early: {key}")
+            try:
+                refreshed = await _single_flight.do(
+                    key, lambda: _load(key, compute, policy, refreshing=True)
+                )
+                if refreshed is not None:
+                    return refreshed, HIT
+            except Exception as e:
+                logger.warning(f"Early refresh failed for key {key}: {str(e)}")
+        return unwrap_entry(cached_value), HIT
+
+    logger.debug(f"Cache miss for key: {key}")
+    if policy.coalesce:
+        return await _single_flight.do(key, lambda: _load(key, compute, policy)), MISS
+    return await _load(key, compute, policy), MISS
+
 
 def cached(
     ttl: Optional[int] = 300,
@@ -36,6 +194,11 @@ def cached(
     skip_args: Optional[List[int]] = None,
     skip_kwargs: Optional[List[str]] = None,
     tags: Optional[List[str]] = None,
+    coalesce: bool = True,
+    lock_timeout: Optional[float] = None,
+    early_refresh_beta: float = 1.0,
+    negative_ttl: Optional[int] = None,
+    negative_only: bool = False,
 ) -> Callable[[F], F]:
     """Cache the result of a function.
 
@@ -46,13 +209,35 @@ def cached(
         skip_args: Argument indexes to skip when generating the cache key.
         skip_kwargs: Keyword argument names to skip when generating the cache key.
         tags: Optional tags for cache invalidation.
+        coalesce: Share one call among concurrent misses for a key in this
+            process (default: True).
+        lock_timeout: If set, take a Redis lock on a miss so one process
+            computes the value while others wait up to this many seconds.
+        early_refresh_beta: Eagerness of probabilistic refresh before expiry;
+            0 disables it (default: 1.0).
+        negative_ttl: If set, cache None results for this many seconds, so
+            repeated lookups of missing data skip the function too.
+        negative_only: Cache only None results, for functions whose values
+            can't be cached (e.g. ORM instances bound to a session).
 
     Returns:
         Decorated function.
     """
+    policy = _CachePolicy(
+        ttl,
+        backend,
+        tags,
+        coalesce,
+        lock_timeout,
+        early_refresh_beta,
+        negative_ttl,
+        negative_only,
+    )
 
     def decorator(func: F) -> F:
         is_coroutine = asyncio.iscoroutinefunction(func)
+        function = f"{func.__module__}.{func.__qualname__}"
+        build_key = CacheKeyBuilder(prefix, func, skip_args, skip_kwargs)
 
         if is_coroutine:
 
@@ -61,6 +246,7 @@ def cached(
                 metrics_service = None
                 start_time = time.monotonic()
                 cache_hit = False
+                computing = False
                 error = None
                 backend_type = backend or "default"
 
@@ -71,32 +257,19 @@ def cached(
                         except Exception as e:
                             logger.debug(f"Could not get metrics service: {str(e)}")
 
-                    key = generate_cache_key(
-                        prefix, func, args, kwargs, skip_args, skip_kwargs
+                    key = build_key(args, kwargs)
+                    computing = True
+                    result, outcome = await _get_or_compute(
+                        key, lambda: func(*args, **kwargs), policy
                     )
-                    cached_value = await cache_manager.get(key, backend=backend)
-
-                    if cached_value is not None:
-                        cache_hit = True
-                        logger.debug(f"Cache hit for key: {key}")
-                        return cached_value
-
-                    logger.debug(f"Cache miss for key: {key}")
-                    result = await func(*args, **kwargs)
-
-                    if result is not None:
-                        await cache_manager.set(key, result, ttl, backend)
-
-                        if tags and "redis" in cache_manager.backends:
-                            for tag in tags:
-                                tag_key = f"cache:tag:{tag}"
-                                redis_backend = cache_manager.backends["redis"]
-                                if hasattr(redis_backend, "add_to_set"):
-                                    await redis_backend.add_to_set(tag_key, key)
-
+                    cache_hit = outcome != MISS
+                    record_function_result(function, outcome)
                     return result
 
                 except Exception as e:
+                    if computing:
+                        # The function itself failed; don't run it again
+                        raise
                     error = str(e)
                     logger.error(
                         f"Error in cached decorator for {func.__name__}: {error}",
@@ -141,9 +314,7 @@ def cached(
                             logger.debug(f"Could not get metrics service: {str(e)}")
 
                     # Generate cache key
-                    key = generate_cache_key(
-                        prefix, func, args, kwargs, skip_args, skip_kwargs
-                    )
+                    key = build_key(args, kwargs)
 
                     # Try to get event loop
                     try:
@@ -160,7 +331,11 @@ def cached(
                         if cached_value is not None:
                             cache_hit = True
                             logger.debug(f"Cache hit for key: {key}")
-                            return cached_value
+                            record_function_result(
+                                function,
+                                NEGATIVE_HIT if is_negative(cached_value) else HIT,
+                            )
+                            return unwrap_entry(cached_value)
                     except Exception as cache_err:
                         logger.warning(f"Error getting from cache: {str(cache_err)}")
                         # Continue without using cache
@@ -169,25 +344,21 @@ def cached(
 
                     # Execute function
                     result = func(*args, **kwargs)
+                    record_function_result(function, MISS)
 
                     # Cache result
-                    if result is not None:
-                        try:
-                            loop.run_until_complete(
-                                cache_manager.set(key, result, ttl, backend)
-                            )
-
-                            # Handle tags
-                            if tags and "redis" in cache_manager.backends:
-                                redis_backend = cache_manager.backends["redis"]
-                                if hasattr(redis_backend, "add_to_set"):
-                                    for tag in tags:
-                                        tag_key = f"cache:tag:{tag}"
-                                        loop.run_until_complete(
-                                            redis_backend.add_to_set(tag_key, key)
-                                        )
-                        except Exception as cache_err:
-                            logger.warning(f"Error setting cache: {str(cache_err)}")
+                    if result is None and negative_ttl:
+                        stored, stored_ttl = NEGATIVE_RESULT, negative_ttl
+                    elif result is not None and not negative_only:
+                        stored, stored_ttl = result, ttl
+                    else:
+                        return result
+                    try:
+                        loop.run_until_complete(
+                            cache_manager.set(key, stored, stored_ttl, backend, tags)
+                        )
+                    except Exception as cache_err:
+                        logger.warning(f"Error setting cache: {str(cache_err)}")
 
                     return result
 
@@ -257,24 +428,12 @@ def invalidate_cache(
                         f"Invalidated {count} cache entries matching pattern: {pattern_key}"
                     )
 
-                    # Handle tag-based invalidation if Redis is available
-                    if tags and "redis" in cache_manager.backends:
-                        redis_backend = cache_manager.backends["redis"]
-                        if hasattr(redis_backend, "get_set_members"):
-                            for tag in tags:
-                                try:
-                                    tag_key = f"cache:tag:{tag}"
-                                    keys = await redis_backend.get_set_members(tag_key)
-                                    if keys:
-                                        await cache_manager.delete_many(keys)
-                                        await redis_backend.delete(tag_key)
-                                        logger.debug(
-                                            f"Invalidated tag: {tag} with {len(keys)} keys"
-                                        )
-                                except Exception as tag_err:
-                                    logger.warning(
-                                        f"Error invalidating tag {tag}: {str(tag_err)}"
-                                    )
+                    # Handle tag-based invalidation
+                    if tags:
+                        count = await cache_manager.invalidate_tags(tags, backend)
+                        logger.debug(
+                            f"Invalidated {count} cache entries tagged: {tags}"
+                        )
                 except Exception as e:
                     logger.warning(f"Error invalidating cache: {str(e)}", exc_info=True)
 
@@ -307,30 +466,14 @@ def invalidate_cache(
                         f"Invalidated {count} cache entries matching pattern: {pattern_key}"
                     )
 
-                    # Handle tag-based invalidation if Redis is available
-                    if tags and "redis" in cache_manager.backends:
-                        redis_backend = cache_manager.backends["redis"]
-                        if hasattr(redis_backend, "get_set_members"):
-                            for tag in tags:
-                                try:
-                                    tag_key = f"cache:tag:{tag}"
-                                    keys = loop.run_until_complete(
-                                        redis_backend.get_set_members(tag_key)
-                                    )
-                                    if keys:
-                                        loop.run_until_complete(
-                                            cache_manager.delete_many(keys)
-                                        )
-                                        loop.run_until_complete(
-                                            redis_backend.delete(tag_key)
-                                        )
-                                        logger.debug(
-                                            f"Invalidated tag: {tag} with {len(keys)} keys"
-                                        )
-                                except Exception as tag_err:
-                                    logger.warning(
-                                        f"Error invalidating tag {tag}: {str(tag_err)}"
-                                    )
+                    # Handle tag-based invalidation
+                    if tags:
+                        count = loop.run_until_complete(
+                            cache_manager.invalidate_tags(tags, backend)
+                        )
+                        logger.debug(
+                            f"Invalidated {count} cache entries tagged: {tags}"
+                        )
                 except Exception as e:
                     logger.warning(f"Error invalidating cache: {str(e)}", exc_info=True)
 
@@ -346,6 +489,11 @@ def cache_aside(
     ttl: Optional[int] = 300,
     backend: Optional[str] = None,
     tags: Optional[List[str]] = None,
+    coalesce: bool = True,
+    lock_timeout: Optional[float] = None,
+    early_refresh_beta: float = 1.0,
+    negative_ttl: Optional[int] = None,
+    negative_only: bool = False,
 ) -> Callable[[F], F]:
     """Implement the cache-aside pattern with a custom key function.
 
@@ -354,13 +502,34 @@ def cache_aside(
         ttl: Time-to-live in seconds (default: 300).
         backend: Cache backend to use (default: None, uses default backend).
         tags: Optional tags for cache invalidation.
+        coalesce: Share one call among concurrent misses for a key in this
+            process (default: True).
+        lock_timeout: If set, take a Redis lock on a miss so one process
+            computes the value while others wait up to this many seconds.
+        early_refresh_beta: Eagerness of probabilistic refresh before expiry;
+            0 disables it (default: 1.0).
+        negative_ttl: If set, cache None results for this many seconds, so
+            repeated lookups of missing data skip the function too.
+        negative_only: Cache only None results, for functions whose values
+            can't be cached (e.g. ORM instances bound to a session).
 
     Returns:
         Decorated function.
     """
+    policy = _CachePolicy(
+        ttl,
+        backend,
+        tags,
+        coalesce,
+        lock_timeout,
+        early_refresh_beta,
+        negative_ttl,
+        negative_only,
+    )
 
     def decorator(func: F) -> F:
         is_coroutine = asyncio.iscoroutinefunction(func)
+        function = f"{func.__module__}.{func.__qualname__}"
 
         if is_coroutine:
 
@@ -369,6 +538,7 @@ def cache_aside(
                 metrics_service = None
                 start_time = time.monotonic()
                 cache_hit = False
+                computing = False
                 error = None
                 backend_type = backend or "default"
 
@@ -382,33 +552,18 @@ def cache_aside(
                     # Generate key using the provided function
                     key = key_func(*args, **kwargs)
 
-                    # Try to get from cache
-                    cached_value = await cache_manager.get(key, backend=backend)
-                    if cached_value is not None:
-                        cache_hit = True
-                        logger.debug(f"Cache hit for key: {key}")
-                        return cached_value
-
-                    logger.debug(f"Cache miss for key: {key}")
-
-                    # Execute function
-                    result = await func(*args, **kwargs)
-
-                    # Cache result
-                    if result is not None:
-                        await cache_manager.set(key, result, ttl, backend)
-
-                        # Handle tags
-                        if tags and "redis" in cache_manager.backends:
-                            redis_backend = cache_manager.backends["redis"]
-                            if hasattr(redis_backend, "add_to_set"):
-                                for tag in tags:
-                                    tag_key = f"cache:tag:{tag}"
-                                    await redis_backend.add_to_set(tag_key, key)
-
+                    computing = True
+                    result, outcome = await _get_or_compute(
+                        key, lambda: func(*args, **kwargs), policy
+                    )
+                    cache_hit = outcome != MISS
+                    record_function_result(function, outcome)
                     return result
 
                 except Exception as e:
+                    if computing:
+                        # The function itself failed; don't run it again
+                        raise
                     error = str(e)
                     logger.error(
                         f"Error in cache_aside decorator for {func.__name__}: {error}",
@@ -470,7 +625,11 @@ def cache_aside(
                         if cached_value is not None:
                             cache_hit = True
                             logger.debug(f"Cache hit for key: {key}")
-                            return cached_value
+                            record_function_result(
+                                function,
+                                NEGATIVE_HIT if is_negative(cached_value) else HIT,
+                            )
+                            return unwrap_entry(cached_value)
                     except Exception as cache_err:
                         logger.warning(f"Error getting from cache: {str(cache_err)}")
 
@@ -478,25 +637,21 @@ def cache_aside(
 
                     # Execute function
                     result = func(*args, **kwargs)
+                    record_function_result(function, MISS)
 
                     # Cache result
-                    if result is not None:
-                        try:
-                            loop.run_until_complete(
-                                cache_manager.set(key, result, ttl, backend)
-                            )
-
-                            # Handle tags
-                            if tags and "redis" in cache_manager.backends:
-                                redis_backend = cache_manager.backends["redis"]
-                                if hasattr(redis_backend, "add_to_set"):
-                                    for tag in tags:
-                                        tag_key = f"cache:tag:{tag}"
-                                        loop.run_until_complete(
-                                            redis_backend.add_to_set(tag_key, key)
-                                        )
-                        except Exception as cache_err:
-                            logger.warning(f"Error setting cache: {str(cache_err)}")
+                    if result is None and negative_ttl:
+                        stored, stored_ttl = NEGATIVE_RESULT, negative_ttl
+                    elif result is not None and not negative_only:
+                        stored, stored_ttl = result, ttl
+                    else:
+                        return result
+                    try:
+                        loop.run_until_complete(
+                            cache_manager.set(key, stored, stored_ttl, backend, tags)
+                        )
+                    except Exception as cache_err:
+                        logger.warning(f"Error setting cache: {str(cache_err)}")
 
                     return result
 
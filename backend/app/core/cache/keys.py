@@ -5,9 +5,115 @@ import hashlib
 import inspect
 import json
 import re
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
+try:
+    import xxhash
+
+    def _digest(data: str) -> str:
+        """Hash key data with xxHash (XXH3, 128-bit)."""
+        return xxhash.xxh3_128_hexdigest(data.encode("utf-8"))
+
+except ImportError:
+
+    def _digest(data: str) -> str:
+        """Hash key data with BLAKE2b (128-bit)."""
+        return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Argument types whose repr is stable and unambiguous
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Separates encoded arguments; repr and JSON both escape it inside values
+_SEPARATOR = "\x1f"
+
+
+def _encode(value: Any) -> str:
+    """Encode an argument value for a cache key."""
+    if type(value) in _SCALAR_TYPES:
+        return repr(value)
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class CacheKeyBuilder:
+    """Cache key builder compiled once per decorated function.
+
+    The function's name and parameters are inspected once, at decoration
+    time. For methods the bound instance (``self`` or ``cls``) is left out of
+    the key, so keys repeat across instances; an instance whose results
+    depend on its state can provide a ``cache_identity()`` method whose
+    return value is included instead.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        func: Callable,
+        skip_args: Optional[List[int]] = None,
+        skip_kwargs: Optional[List[str]] = None,
+    ) -> None:
+        """Initialize the key builder.
+
+        Args:
+            prefix: Key prefix
+            func: Function whose calls are cached
+            skip_args: Indices of positional arguments to skip
+            skip_kwargs: Names of keyword arguments to skip
+        """
+        self.base = f"{prefix}:{func.__module__}.{func.__qualname__}"
+        self.skip_args = frozenset(skip_args or ())
+        self.skip_kwargs = frozenset(skip_kwargs or ())
+
+        try:
+            params = list(inspect.signature(func).parameters)
+        except (TypeError, ValueError):
+            params = []
+        self.is_method = bool(params) and params[0] in ("self", "cls")
+
+    def __call__(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        """Build the cache key for a call.
+
+        Args:
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            str: Cache key
+        """
+        parts: List[str] = []
+        start = 0
+        if self.is_method and args:
+            identity = getattr(args[0], "cache_identity", None)
+            if identity is not None:
+                parts.append(_encode(identity()))
+            start = 1
+
+        skip_args = self.skip_args
+        for i in range(start, len(args)):
+            if i not in skip_args:
+                parts.append(_encode(args[i]))
+
+        if kwargs:
+            for name in sorted(kwargs):
+                if name not in self.skip_kwargs:
+                    parts.append(f"{name}={_encode(kwargs[name])}")
+
+        return f"{self.base}:{_digest(_SEPARATOR.join(parts))}"
+
+
+@lru_cache(maxsize=1024)
+def _key_builder(
+    prefix: str,
+    func: Callable,
+    skip_args: Tuple[int, ...],
+    skip_kwargs: Tuple[str, ...],
+) -> CacheKeyBuilder:
+    """Get the shared key builder for a function."""
+    return CacheKeyBuilder(prefix, func, list(skip_args), list(skip_kwargs))
+
+
 def generate_cache_key(
     prefix: str,
     func: Callable,
@@ -19,8 +125,8 @@ def generate_cache_key(
     """Generate a cache key for a function call.
 
     This function creates a deterministic key based on the function name,
-    argument values, and keyword argument values. It's used by cache
-    decorators to create unique keys for caching function results.
+    argument values, and keyword argument values. Decorators should build a
+    CacheKeyBuilder once instead; this produces the same keys.
 
     Args:
         prefix: Key prefix
@@ -33,36 +139,10 @@ def generate_cache_key(
     Returns:
         str: Cache key
     """
-    # Normalize skip_args and skip_kwargs
-    skip_args = skip_args or []
-    skip_kwargs = skip_kwargs or []
-
-    # Get function name and module
-    func_name = f"{func.__module__}.{func.__qualname__}"
-
-    # Get signature
-    sig = inspect.signature(func)
-
-    # Filter args
-    filtered_args = [arg for i, arg in enumerate(args) if i not in skip_args]
-
-    # Filter kwargs
-    filtered_kwargs = {
-        key: value for key, value in kwargs.items() if key not in skip_kwargs
-    }
-
-    # Convert args and kwargs to strings
-    args_str = json.dumps(filtered_args, sort_keys=True, default=str)
-    kwargs_str = json.dumps(filtered_kwargs, sort_keys=True, default=str)
-
-    # Generate hash
-    key_parts = [prefix, func_name, args_str, kwargs_str]
-    key_hash = hashlib.md5(
-        json.dumps(key_parts, default=str).encode("utf-8")
-    ).hexdigest()
-
-    # Create key
-    return f"{prefix}:{func_name}:{key_hash}"
+    builder = _key_builder(
+        prefix, func, tuple(skip_args or ()), tuple(skip_kwargs or ())
+    )
+    return builder(args, kwargs)
 
 
 def generate_model_key(
@@ -8,10 +8,12 @@ handling initialization, configuration, and access to backends.
 """
 
 import time
-from typing import Dict, Optional, Any, TypeVar, List, Union, cast
+from typing import Dict, Optional, Any, Sequence, TypeVar, List, Union, cast
 
 from app.core.cache.backends import get_backend
+from app.core.cache.batching import current_batch
 from app.core.cache.base import CacheBackend
+from app.core.cache.stats import HotKeySampler, get_function_stats
 from app.core.config import settings
 from app.logging import get_logger
 
@@ -32,6 +34,7 @@ class CacheManager:
     def __init__(self):
         self._initialized = False
         self.backends: Dict[str, CacheBackend] = {}
+        self.hot_keys: Dict[str, HotKeySampler] = {}
 
     def get_backend(self, name: Optional[str] = None) -> CacheBackend:
         """Get a cache backend by name.
@@ -87,6 +90,19 @@ class CacheManager:
             logger.info("Redis host not configured, using memory cache as fallback")
             self.backends["redis"] = memory_backend
 
+        # Near cache in front of Redis; without Redis it is plain memory
+        redis_backend = self.backends["redis"]
+        if settings.CACHE_TIERED_ENABLED and redis_backend is not memory_backend:
+            try:
+                tiered_backend = get_backend("tiered")(l2=redis_backend)
+                await tiered_backend.initialize()
+                self.backends["tiered"] = tiered_backend
+            except Exception as e:
+                logger.warning(f"Failed to initialize tiered cache: {e}", exc_info=True)
+                self.backends["tiered"] = redis_backend
+        else:
+            self.backends["tiered"] = redis_backend
+
         self.backends["null"] = get_backend("null")()
 
         # Register metrics
@@ -128,7 +144,8 @@ class CacheManager:
 
     async def shutdown(self) -> None:
         """Shutdown all cache backends."""
-        for name, backend in self.backends.items():
+        # Reverse order, so layered backends stop before the tiers they use
+        for name, backend in reversed(list(self.backends.items())):
             try:
                 if hasattr(backend, "shutdown"):
                     await backend.shutdown()
@@ -147,6 +164,9 @@ class CacheManager:
     ) -> Optional[T]:
         """Get a value from the cache.
 
+        Inside batch_cache_reads(), concurrent gets are sent together as one
+        get_many call per backend.
+
         Args:
             key: The cache key.
             default: Default value if key doesn't exist.
@@ -169,7 +189,12 @@ class CacheManager:
                 except Exception as e:
                     logger.debug(f"Could not get metrics service: {str(e)}")
 
-            value = await cache_backend.get(key)
+            self._sample_reads(backend_name, (key,))
+            batch = current_batch()
+            if batch is not None:
+                value = await batch.get(cache_backend, key)
+            else:
+                value = await cache_backend.get(key)
             hit = value is not None
             return value if hit else default
 
@@ -200,6 +225,7 @@ class CacheManager:
         value: Any,
         ttl: Optional[int] = None,
         backend: Optional[str] = None,
+        tags: Optional[List[str]] = None,
     ) -> bool:
         """Set a value in the cache.
 
@@ -208,6 +234,8 @@ class CacheManager:
             value: The value to cache.
             ttl: Optional time-to-live in seconds.
             backend: Optional backend name.
+            tags: Optional tags to record the key under, written together
+                with the value by backends with a tag index.
 
         Returns:
             True if successful, False otherwise.
@@ -225,7 +253,10 @@ class CacheManager:
                 except Exception as e:
                     logger.debug(f"Could not get metrics service: {str(e)}")
 
-            result = await cache_backend.set(key, value, ttl)
+            if tags and hasattr(cache_backend, "set_with_tags"):
+                result = await cache_backend.set_with_tags(key, value, ttl, tags)
+            else:
+                result = await cache_backend.set(key, value, ttl)
             return result
 
         except Exception as e:
@@ -445,6 +476,88 @@ class CacheManager:
                         f"Failed to record cache metrics: {str(metrics_err)}"
                     )
 
+    async def add_tags(
+        self,
+        key: str,
+        tags: List[str],
+        ttl: Optional[int] = None,
+        backend: Optional[str] = None,
+    ) -> bool:
+        """Record a cache key under tags for later invalidation.
+
+        Backends without a tag index ignore tags.
+
+        Args:
+            key: The cache key.
+            tags: Tags to record the key under.
+            ttl: Optional time-to-live of the cached value in seconds.
+            backend: Optional backend name.
+
+        Returns:
+            True if the key was tagged, False otherwise.
+        """
+        cache_backend = self.get_backend(backend or settings.CACHE_DEFAULT_BACKEND)
+        if not tags or not hasattr(cache_backend, "add_tags"):
+            return False
+
+        try:
+            return await cache_backend.add_tags(key, tags, ttl)
+        except Exception as e:
+            logger.error(f"Error tagging cache key {key}: {str(e)}", exc_info=True)
+            return False
+
+    async def invalidate_tags(
+        self, tags: List[str], backend: Optional[str] = None
+    ) -> int:
+        """Invalidate cache keys recorded under any of the tags.
+
+        Args:
+            tags: Tags to invalidate.
+            backend: Optional backend name.
+
+        Returns:
+            Number of invalidated keys.
+        """
+        metrics_service = None
+        start_time = time.monotonic()
+        backend_name = backend or settings.CACHE_DEFAULT_BACKEND
+        cache_backend = self.get_backend(backend_name)
+        if not tags or not hasattr(cache_backend, "invalidate_tags"):
+            return 0
+
+        try:
+            if HAS_METRICS:
+                try:
+                    metrics_service = get_dependency("metrics_service")
+                except Exception as e:
+                    logger.debug(f"Could not get metrics service: {str(e)}")
+
+            count = await cache_backend.invalidate_tags(tags)
+            logger.debug(f"Invalidated {count} cache entries tagged: {tags}")
+            return count
+
+        except Exception as e:
+            logger.error(
+                f"Error invalidating cache tags {tags}: {str(e)}", exc_info=True
+            )
+            return 0
+
+        finally:
+            if metrics_service and HAS_METRICS:
+                try:
+                    duration = time.monotonic() - start_time
+                    metrics_service.track_cache_operation(
+                        operation="invalidate_tags",
+                        backend=backend_name,
+                        hit=True,  # For invalidate operations, we consider them "hits"
+                        duration=duration,
+                        component="cache_manager",
+                    )
+                except Exception as metrics_err:
+                    logger.warning(
+                        f"Failed to record cache metrics: {str(metrics_err)}"
+                    )
+
     async def get_many(
         self, keys: List[str], backend: Optional[str] = None
     ) -> Dict[str, Optional[T]]:
@@ -471,6 +584,7 @@ class CacheManager:
                 except Exception as e:
                     logger.debug(f"Could not get metrics service: {str(e)}")
 
+            self._sample_reads(backend_name, keys)
             result = await cache_backend.get_many(keys)
 
             # Count hits for metrics
@@ -720,6 +834,55 @@ class CacheManager:
                         f"Failed to record cache metrics: {str(metrics_err)}"
                     )
 
+    async def get_stats(
+        self, sample_size: Optional[int] = None, top: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get statistics of every backend, cached function and hot key.
+
+        Backends report entry counts, sizes, hit rates and evictions, broken
+        down by key prefix from a sample of their keys rather than a scan.
+        Backend names that share a backend point to the first name.
+
+        Args:
+            sample_size: Keys sampled per backend (defaults to
+                CACHE_STATS_SAMPLE_SIZE)
+            top: Number of hot keys per backend (defaults to
+                CACHE_STATS_TOP_KEYS)
+
+        Returns:
+            Dict with "backends" and "functions" statistics.
+        """
+        sample_size = sample_size or settings.CACHE_STATS_SAMPLE_SIZE
+        top = top or settings.CACHE_STATS_TOP_KEYS
+        backends: Dict[str, Dict[str, Any]] = {}
+        names: Dict[int, str] = {}
+        for name, cache_backend in self.backends.items():
+            if id(cache_backend) in names:
+                backends[name] = {"alias_of": names[id(cache_backend)]}
+                continue
+            names[id(cache_backend)] = name
+            if not hasattr(cache_backend, "sample_stats"):
+                backends[name] = {}
+                continue
+            try:
+                backends[name] = await cache_backend.sample_stats(sample_size)
+            except Exception as e:
+                logger.error(f"Error getting {name} cache stats: {str(e)}")
+                backends[name] = {"error": str(e)}
+
+        for name, sampler in self.hot_keys.items():
+            backends.setdefault(name, {})["hot_keys"] = sampler.top(top)
+
+        return {"backends": backends, "functions": get_function_stats()}
+
+    def _sample_reads(self, backend_name: str, keys: Sequence[str]) -> None:
+        """Count sampled reads of keys towards the backend's hot keys."""
+        sampler = self.hot_keys.get(backend_name)
+        if sampler is None:
+            sampler = self.hot_keys[backend_name] = HotKeySampler()
+        for key in keys:
+            sampler.record(key)
+
 
 cache_manager = CacheManager()
 
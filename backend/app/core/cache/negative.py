@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+"""
+Negative result caching.
+
+Cached functions store ``None`` results as the ``NEGATIVE_RESULT`` sentinel
+so that lookups for things that don't exist can be cached too. Backends
+treat ``None`` as a miss, so the sentinel is what tells "cached as not
+found" apart from "not cached". It pickles by reference, so it is still
+the same object after a round trip through Redis; codecs limited to plain
+data (json, orjson, msgpack) store it as a tagged dict and restore it.
+"""
+
+from typing import Any
+
+
+class _NegativeResult:
+    """Type of the NEGATIVE_RESULT singleton."""
+
+    _instance: _NegativeResult | None = None
+
+    def __new__(cls) -> _NegativeResult:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __reduce__(self) -> str:
+        return "NEGATIVE_RESULT"
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "NEGATIVE_RESULT"
+
+
+NEGATIVE_RESULT = _NegativeResult()
+
+
+def is_negative(value: Any) -> bool:
+    """Check whether a cached value records a None result."""
+    return value is NEGATIVE_RESULT
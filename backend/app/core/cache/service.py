@@ -124,6 +124,20 @@ class CacheService:
         """
         return await cache_manager.invalidate_pattern(pattern, backend)
 
+    async def get_stats(
+        self, sample_size: Optional[int] = None, top: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get statistics of every backend, cached function and hot key.
+
+        Args:
+            sample_size: Keys sampled per backend.
+            top: Number of hot keys per backend.
+
+        Returns:
+            Dict with "backends" and "functions" statistics.
+        """
+        return await cache_manager.get_stats(sample_size, top)
+
     async def get_many(
         self, keys: List[str], backend: Optional[str] = None
     ) -> Dict[str, Optional[T]]:
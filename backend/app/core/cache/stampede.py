@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+"""
+Cache stampede protection.
+
+This module provides the building blocks the cache decorators use to keep a
+popular key from being recomputed by every concurrent caller: in-process
+request coalescing (single flight) and probabilistic early refresh of
+entries shortly before they expire (XFetch).
+"""
+
+import asyncio
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, TypeVar
+
+from app.core.cache.negative import NEGATIVE_RESULT
+from app.logging import get_logger
+
+logger = get_logger("app.core.cache.stampede")
+
+T = TypeVar("T")
+
+
+class CacheEntry(NamedTuple):
+    """A cached value with the data needed to refresh it early.
+
+    Attributes:
+        value: The cached value.
+        delta: Seconds it took to compute the value.
+        expires_at: Unix timestamp at which the entry expires.
+    """
+
+    value: Any
+    delta: float
+    expires_at: float
+
+
+def make_entry(value: Any, delta: float, ttl: int) -> CacheEntry:
+    """Wrap a computed value for storage.
+
+    Args:
+        value: The computed value.
+        delta: Seconds it took to compute the value.
+        ttl: Time-to-live of the entry in seconds.
+
+    Returns:
+        The cache entry.
+    """
+    return CacheEntry(value, delta, time.time() + ttl)
+
+
+def unwrap_entry(cached: Any) -> Any:
+    """Get the value of a cached entry, accepting plain (legacy) values.
+
+    Negative entries unwrap to None.
+    """
+    value = cached.value if isinstance(cached, CacheEntry) else cached
+    return None if value is NEGATIVE_RESULT else value
+
+
+def should_refresh_early(
+    entry: CacheEntry, beta: float = 1.0, now: Optional[float] = None
+) -> bool:
+    """Decide whether to recompute an entry before it expires.
+
+    Each reader refreshes with a probability that rises sharply as the entry
+    approaches expiry, and earlier for values that are slow to compute, so
+    one caller usually refreshes a hot key before the rest see it expire.
+
+    Args:
+        entry: The cached entry.
+        beta: Eagerness of the refresh; values above 1.0 refresh earlier,
+            0 disables early refresh.
+        now: Current Unix timestamp (defaults to time.time()).
+
+    Returns:
+        True if this caller should recompute the value.
+    """
+    if beta <= 0 or entry.delta <= 0:
+        return False
+    now = time.time() if now is None else now
+    # 1 - random() lies in (0, 1], so the logarithm is defined
+    return now - entry.delta * beta * math.log(1.0 - random.random()) >= (
+        entry.expires_at
+    )
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait for and share its result (or exception). If the running call is
+    cancelled, a waiting caller takes over and runs the function itself.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a call for a key is running in this event loop."""
+        future = self._calls.get(key)
+        return (
+            future is not None
+            and not future.done()
+            and future.get_loop() is asyncio.get_running_loop()
+        )
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run func for key unless a call for key is already running.
+
+        Args:
+            key: Key identifying the call.
+            func: Zero-argument coroutine function to run.
+
+        Returns:
+            The result of func, from this call or the one already running.
+        """
+        while self.in_flight(key):
+            future = self._calls[key]
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The running call was cancelled; try again
+
+        future = asyncio.get_running_loop().create_future()
+        # Followers may all be gone; don't warn about unretrieved exceptions
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+"""
+Cache statistics.
+
+The cache decorators record the outcome of every call of a cached
+function here: a hit, a negative hit (a cached "not found") or a miss.
+Counts are kept in process for the cache admin views and exported as the
+``cache_function_results_total`` counter, labelled by function and
+outcome, so call sites that never hit can be spotted.
+
+This module also provides the sampled hot key tracking and the key
+prefix grouping used by the cache manager's statistics.
+"""
+
+import random
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.logging import get_logger
+
+logger = get_logger("app.core.cache.stats")
+
+# Try to import metrics, but don't fail if not available
+try:
+    from app.core.metrics import create_counter, increment_counter
+
+    HAS_METRICS = True
+except ImportError:
+    HAS_METRICS = False
+
+HIT = "hit"
+NEGATIVE_HIT = "negative_hit"
+MISS = "miss"
+OUTCOMES = (HIT, NEGATIVE_HIT, MISS)
+
+_lock = threading.Lock()
+_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(OUTCOMES, 0))
+_metrics_registered = False
+
+
+def _register_metrics() -> bool:
+    """Register the function results counter on first use."""
+    global _metrics_registered
+    if not _metrics_registered:
+        try:
+            create_counter(
+                "cache_function_results_total",
+                "Number of calls of cached functions by outcome",
+                ["function", "outcome"],
+            )
+            _metrics_registered = True
+        except Exception as e:
+            logger.debug(f"Could not register cache function metrics: {str(e)}")
+    return _metrics_registered
+
+
+def record_function_result(function: str, outcome: str) -> None:
+    """Record the outcome of a call of a cached function.
+
+    Args:
+        function: Qualified name of the function
+        outcome: One of "hit", "negative_hit" or "miss"
+    """
+    with _lock:
+        _counts[function][outcome] += 1
+
+    if HAS_METRICS and _register_metrics():
+        try:
+            increment_counter(
+                "cache_function_results_total",
+                labels={"function": function, "outcome": outcome},
+            )
+        except Exception as e:
+            logger.debug(f"Could not record cache function metrics: {str(e)}")
+
+
+def get_function_stats() -> Dict[str, Dict[str, float]]:
+    """Get the outcome counts and hit ratio of each cached function.
+
+    Returns:
+        Dict mapping function names to their counts and hit_rate, where
+        negative hits count as hits
+    """
+    with _lock:
+        counts = {function: dict(outcomes) for function, outcomes in _counts.items()}
+
+    stats: Dict[str, Dict[str, float]] = {}
+    for function, outcomes in counts.items():
+        hits = outcomes[HIT] + outcomes[NEGATIVE_HIT]
+        stats[function] = {**outcomes, "hit_rate": hit_rate(hits, outcomes[MISS])}
+    return stats
+
+
+def reset_function_stats() -> None:
+    """Clear the in-process counts."""
+    with _lock:
+        _counts.clear()
+
+
+def key_prefix(key: str) -> str:
+    """Get the prefix a key is grouped under: all but its last segment."""
+    return key.rpartition(":")[0]
+
+
+def hit_rate(hits: int, misses: int) -> float:
+    """Get the share of lookups that were hits."""
+    total = hits + misses
+    return hits / total if total else 0.0
+
+
+def summarize_sample(
+    sample: Iterable[Tuple[str, int]], total_items: int, sample_count: int
+) -> Dict[str, Dict[str, int]]:
+    """Estimate the entry count and size of each key prefix from a sample.
+
+    Args:
+        sample: (key, size in bytes) of each sampled entry, possibly
+            repeated when keys are sampled with replacement
+        total_items: Number of entries the sample was drawn from
+        sample_count: Number of draws, including draws outside the cache
+
+    Returns:
+        Dict mapping prefixes to their estimated items and bytes
+    """
+    draws: Dict[str, int] = defaultdict(int)
+    sizes: Dict[str, Dict[str, int]] = defaultdict(dict)
+    for key, size in sample:
+        prefix = key_prefix(key)
+        draws[prefix] += 1
+        sizes[prefix][key] = size
+
+    prefixes: Dict[str, Dict[str, int]] = {}
+    for prefix, count in sorted(draws.items(), key=lambda item: -item[1]):
+        items = round(total_items * count / sample_count) if sample_count else 0
+        mean_size = sum(sizes[prefix].values()) / len(sizes[prefix])
+        prefixes[prefix] = {"items": items, "bytes": round(mean_size * items)}
+    return prefixes
+
+
+class HotKeySampler:
+    """Finds frequently read keys from a random sample of reads.
+
+    Sampled reads are counted with the Space-Saving algorithm, which keeps
+    at most ``capacity`` counters: an unseen key replaces the least counted
+    one and inherits its count. Keys read far more often than the rest are
+    reliably found, with their counts overestimated by at most the count
+    they inherited. Meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self, sample_rate: Optional[float] = None, capacity: Optional[int] = None
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            sample_rate: Share of reads counted (defaults to
+                CACHE_HOT_KEY_SAMPLE_RATE)
+            capacity: Maximum keys tracked (defaults to CACHE_HOT_KEY_CAPACITY)
+        """
+        self.sample_rate = (
+            sample_rate
+            if sample_rate is not None
+            else settings.CACHE_HOT_KEY_SAMPLE_RATE
+        )
+        self.capacity = capacity or settings.CACHE_HOT_KEY_CAPACITY
+        self.counts: Dict[str, int] = {}
+
+    def record(self, key: str) -> None:
+        """Count a read of key if it is sampled."""
+        if random.random() >= self.sample_rate:
+            return
+        counts = self.counts
+        if key in counts:
+            counts[key] += 1
+        elif len(counts) < self.capacity:
+            counts[key] = 1
+        else:
+            coldest = min(counts, key=counts.__getitem__)
+            counts[key] = counts.pop(coldest) + 1
+
+    def top(self, count: int) -> List[Dict[str, object]]:
+        """Get the most read keys with their estimated read counts.
+
+        Args:
+            count: Number of keys to return
+
+        Returns:
+            List of {"key", "reads"} dicts, most read first
+        """
+        hottest = sorted(self.counts.items(), key=lambda item: -item[1])[:count]
+        return [
+            {"key": key, "reads": round(sampled / self.sample_rate)}
+            for key, sampled in hottest
+        ]
+
+    def reset(self) -> None:
+        """Forget all counts."""
+        self.counts.clear()
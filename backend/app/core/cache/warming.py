@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+"""
+Cache warming.
+
+This module provides a registry of warmup jobs that fill caches before
+users need them, after startup or after reference data is updated. A job
+pairs a warm function (usually calling a cached service method) with an
+optional generator of the arguments to warm it for, and a concurrency
+limit. Jobs run in registration order, so later jobs can build on values
+warmed by earlier ones, and every run is bounded by a time budget.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from app.core.config import settings
+from app.logging import get_logger
+
+logger = get_logger("app.core.cache.warming")
+
+# Try to import metrics, but don't fail if not available
+try:
+    from app.core.metrics import (
+        create_counter,
+        create_histogram,
+        increment_counter,
+        observe_histogram,
+    )
+
+    HAS_METRICS = True
+except ImportError:
+    HAS_METRICS = False
+
+ArgsGenerator = Callable[[], AsyncIterator[Tuple[Any, ...]]]
+
+
+@dataclass(frozen=True)
+class WarmupJob:
+    """A cache warmup job.
+
+    Attributes:
+        name: Unique job name
+        warm: Coroutine function filling the cache for one set of arguments
+        args: Async generator of argument tuples; None calls warm once
+        concurrency: Maximum concurrent warm calls
+        triggers: Events (e.g. "startup") the job runs on
+    """
+
+    name: str
+    warm: Callable[..., Awaitable[Any]]
+    args: Optional[ArgsGenerator] = None
+    concurrency: int = 1
+    triggers: FrozenSet[str] = frozenset({"startup"})
+
+
+@dataclass
+class JobProgress:
+    """Progress of one job within a warmup run."""
+
+    warmed: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    completed: bool = False
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of a warmup run."""
+
+    trigger: str
+    jobs: Dict[str, JobProgress] = field(default_factory=dict)
+    seconds: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def warmed(self) -> int:
+        """Total number of entries warmed."""
+        return sum(progress.warmed for progress in self.jobs.values())
+
+
+class CacheWarmer:
+    """Registry and runner of cache warmup jobs."""
+
+    def __init__(self) -> None:
+        self.jobs: Dict[str, WarmupJob] = {}
+        self.last_report: Optional[WarmupReport] = None
+        self._lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self._metrics_registered = False
+
+    def register(self, job: WarmupJob) -> WarmupJob:
+        """Register a job, replacing any job with the same name.
+
+        Args:
+            job: The job
+
+        Returns:
+            WarmupJob: The registered job
+        """
+        self.jobs[job.name] = job
+        logger.debug(f"Registered cache warmup job {job.name}")
+        return job
+
+    def job(
+        self,
+        name: str,
+        args: Optional[ArgsGenerator] = None,
+        concurrency: Optional[int] = None,
+        triggers: Iterable[str] = ("startup",),
+    ) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+        """Register the decorated coroutine function as a warmup job.
+
+        Args:
+            name: Unique job name
+            args: Async generator of argument tuples to warm
+            concurrency: Maximum concurrent calls (defaults to
+                CACHE_WARMUP_CONCURRENCY)
+            triggers: Events the job runs on
+
+        Returns:
+            Decorator returning the function unchanged
+        """
+
+        def decorator(
+            func: Callable[..., Awaitable[Any]],
+        ) -> Callable[..., Awaitable[Any]]:
+            self.register(
+                WarmupJob(
+                    name=name,
+                    warm=func,
+                    args=args,
+                    concurrency=concurrency or settings.CACHE_WARMUP_CONCURRENCY,
+                    triggers=frozenset(triggers),
+                )
+            )
+            return func
+
+        return decorator
+
+    async def run(self, trigger: str, timeout: Optional[float] = None) -> WarmupReport:
+        """Run every job registered for a trigger, one job after another.
+
+        Runs do not overlap; a run waits for the previous one to finish.
+
+        Args:
+            trigger: The event that caused the run
+            timeout: Seconds after which the run is stopped (defaults to
+                CACHE_WARMUP_TIMEOUT)
+
+        Returns:
+            WarmupReport: Progress of each job
+        """
+        timeout = timeout if timeout is not None else settings.CACHE_WARMUP_TIMEOUT
+        report = WarmupReport(trigger=trigger)
+        jobs = [job for job in self.jobs.values() if trigger in job.triggers]
+        if not jobs:
+            return report
+
+        self._register_metrics()
+        async with self._lock:
+            start_time = time.monotonic()
+            logger.info(f"Warming caches for {trigger}: {len(jobs)} jobs")
+            try:
+                await asyncio.wait_for(self._run_jobs(jobs, report), timeout)
+            except asyncio.TimeoutError:
+                report.timed_out = True
+                logger.warning(
+                    f"Cache warmup for {trigger} stopped after {timeout}s",
+                    jobs={
+                        name: progress.completed
+                        for name, progress in report.jobs.items()
+                    },
+                )
+            report.seconds = time.monotonic() - start_time
+            self.last_report = report
+
+        logger.info(
+            f"Cache warmup for {trigger} warmed {report.warmed} entries "
+            f"in {report.seconds:.2f}s"
+        )
+        return report
+
+    async def start(self, trigger: str, wait: float = 0.0) -> Optional[WarmupReport]:
+        """Start a run in the background, waiting at most wait seconds for it.
+
+        Args:
+            trigger: The event that caused the run
+            wait: Seconds to wait for the run before returning
+
+        Returns:
+            Optional[WarmupReport]: The report if the run finished in time,
+            None if it continues in the background
+        """
+        task = asyncio.create_task(self.run(trigger))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if wait <= 0:
+            return None
+
+        done, _ = await asyncio.wait({task}, timeout=wait)
+        if task in done:
+            return task.result()
+        logger.info(f"Cache warmup for {trigger} continues in the background")
+        return None
+
+    async def shutdown(self) -> None:
+        """Cancel runs still in progress."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_jobs(self, jobs: List[WarmupJob], report: WarmupReport) -> None:
+        """Run jobs in order, recording their progress in report."""
+        for job in jobs:
+            progress = report.jobs[job.name] = JobProgress()
+            start_time = time.monotonic()
+            try:
+                await self._run_job(job, progress)
+                progress.completed = True
+            except Exception as e:
+                logger.error(f"Cache warmup job {job.name} failed: {str(e)}")
+            finally:
+                progress.seconds = time.monotonic() - start_time
+                self._observe(job.name, progress.seconds)
+            logger.debug(
+                f"Cache warmup job {job.name} warmed {progress.warmed} entries "
+                f"({progress.failed} failed) in {progress.seconds:.2f}s"
+            )
+
+    async def _run_job(self, job: WarmupJob, progress: JobProgress) -> None:
+        """Call a job's warm function for each of its argument tuples."""
+        if job.args is None:
+            await self._warm_one(job, (), progress)
+            return
+
+        semaphore = asyncio.Semaphore(job.concurrency)
+        tasks: Set[asyncio.Task] = set()
+
+        async def warm(args: Tuple[Any, ...]) -> None:
+            try:
+                await self._warm_one(job, args, progress)
+            finally:
+                semaphore.release()
+
+        try:
+            async for args in job.args():
+                await semaphore.acquire()
+                task = asyncio.create_task(warm(args))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _warm_one(
+        self, job: WarmupJob, args: Tuple[Any, ...], progress: JobProgress
+    ) -> None:
+        """Warm one entry, counting rather than raising failures."""
+        try:
+            await job.warm(*args)
+            progress.warmed += 1
+            self._count(job.name, "warmed")
+        except Exception as e:
+            progress.failed += 1
+            self._count(job.name, "failed")
+            logger.debug(f"Cache warmup job {job.name} failed for {args}: {str(e)}")
+
+    def _register_metrics(self) -> None:
+        """Register warmup metrics on first use."""
+        if not HAS_METRICS or self._metrics_registered:
+            return
+        try:
+            create_counter(
+                "cache_warmup_entries_total",
+                "Number of cache entries warmed",
+                ["job", "outcome"],
+            )
+            create_histogram(
+                "cache_warmup_job_duration_seconds",
+                "Duration of cache warmup jobs in seconds",
+                ["job"],
+            )
+            self._metrics_registered = True
+        except Exception as e:
+            logger.debug(f"Could not register cache warmup metrics: {str(e)}")
+
+    def _count(self, job: str, outcome: str) -> None:
+        """Count a warmed or failed entry."""
+        if self._metrics_registered:
+            try:
+                increment_counter(
+                    "cache_warmup_entries_total",
+                    labels={"job": job, "outcome": outcome},
+                )
+            except Exception as e:
+                logger.debug(f"Could not record cache warmup metrics: {str(e)}")
+
+    def _observe(self, job: str, seconds: float) -> None:
+        """Record the duration of a job."""
+        if self._metrics_registered:
+            try:
+                observe_histogram(
+                    "cache_warmup_job_duration_seconds", seconds, {"job": job}
+                )
+            except Exception as e:
+                logger.debug(f"Could not record cache warmup metrics: {str(e)}")
+
+
+cache_warmer = CacheWarmer()
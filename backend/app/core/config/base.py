@@ -9,6 +9,7 @@ This module defines fundamental settings for the application including
 environment, logging configuration, and basic application information.
 """
 
+import re
 from enum import Enum
 from pathlib import Path
 from typing import Any, List, Union
@@ -16,6 +17,9 @@ from typing import Any, List, Union
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Plain column names, safe to put into SQL built from settings or arguments
+SQL_IDENTIFIER = re.compile(r"^[A-Za-z_#@$][A-Za-z0-9_#@$]*$")
+
 
 class Environment(str, Enum):
     """Application environment enumeration."""
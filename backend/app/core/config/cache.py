@@ -0,0 +1,71 @@
+# app/core/config/cache.py
+
+from __future__ import annotations
+
+"""
+Cache configuration settings.
+
+This module defines settings for the application cache, including the
+default backend and the in-process near cache layered in front of Redis.
+"""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    """Cache backend settings."""
+
+    # Backend used when a cache call does not name one
+    CACHE_DEFAULT_BACKEND: str = "redis"
+
+    # Approximate cap on the size of values held by each memory backend
+    CACHE_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Redis value encoding: serializer (pickle, json, orjson, msgpack) and
+    # compression (none, zlib, zstd, lz4) of values at least the threshold
+    # in bytes. json, orjson and msgpack only suit JSON-like values.
+    CACHE_SERIALIZER: str = "pickle"
+    CACHE_COMPRESSION: str = "zlib"
+    CACHE_COMPRESSION_THRESHOLD: int = 1024
+
+    # Keys requested per SCAN call, and removed per UNLINK, when invalidating
+    CACHE_SCAN_COUNT: int = 1000
+    CACHE_UNLINK_BATCH_SIZE: int = 500
+
+    # Batch concurrent cache reads within each HTTP request into one MGET
+    CACHE_REQUEST_BATCHING: bool = True
+    CACHE_BATCH_MAX_KEYS: int = 500
+
+    # Tiered backend: in-process memory (L1) in front of Redis (L2). Hot
+    # reference lookups cache, and are invalidated, under "tiered", which is
+    # plain Redis when disabled
+    CACHE_TIERED_ENABLED: bool = True
+    CACHE_L1_TTL: int = 30
+    CACHE_L1_MAX_SIZE: int = 10000
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+
+    # Cache warming after startup and reference data updates. Startup waits
+    # at most CACHE_WARMUP_STARTUP_BUDGET seconds before serving; the rest
+    # of the run continues in the background until CACHE_WARMUP_TIMEOUT.
+    CACHE_WARMUP_ENABLED: bool = True
+    CACHE_WARMUP_STARTUP_BUDGET: float = 10.0
+    CACHE_WARMUP_TIMEOUT: float = 300.0
+    CACHE_WARMUP_CONCURRENCY: int = 4
+    CACHE_WARMUP_VCDB_YEARS: int = 25
+
+    # Seconds to cache "not found" results of lookups that opt in
+    CACHE_NEGATIVE_TTL: int = 60
+
+    # Cache statistics: keys sampled per backend to size key prefixes, and
+    # share of reads sampled (and keys tracked) to find hot keys
+    CACHE_STATS_SAMPLE_SIZE: int = 500
+    CACHE_STATS_TOP_KEYS: int = 20
+    CACHE_HOT_KEY_SAMPLE_RATE: float = 0.01
+    CACHE_HOT_KEY_CAPACITY: int = 256
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",  # Allow extra fields in env file
+    )
@@ -25,11 +25,24 @@ class FitmentSettings(BaseSettings):
     VCDB_PATH: str = "data/vcdb.accdb"
     PCDB_PATH: str = "data/pcdb.accdb"
     MODEL_MAPPINGS_PATH: Optional[str] = None
+    # SQLite snapshot of VCDB/PCDB used instead of the Access files when set
+    FITMENT_SNAPSHOT_PATH: Optional[str] = None
 
     # Database and performance settings
     FITMENT_DB_URL: Optional[str] = None
     FITMENT_LOG_LEVEL: str = "INFO"
     FITMENT_CACHE_SIZE: int = 100
+    FITMENT_VEHICLE_INDEX_ENABLED: bool = False
+
+    # Pooled MS Access connections for VCDB/PCDB; at most this many are open
+    FITMENT_ACCESS_POOL_SIZE: int = 4
+    FITMENT_ACCESS_MAX_IDLE_SECONDS: int = 300
+    FITMENT_ACCESS_FETCH_SIZE: int = 1000
+
+    # Parallel batch processing (0 workers uses the CPU count)
+    FITMENT_PARALLEL_WORKERS: int = 0
+    FITMENT_PARALLEL_CHUNK_SIZE: int = 200
+    FITMENT_PARALLEL_MIN_BATCH: int = 500
 
     # Environment (used for validation logic)
     ENVIRONMENT: Environment = Environment.DEVELOPMENT
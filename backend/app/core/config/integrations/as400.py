@@ -16,6 +16,8 @@ from typing import Any, Dict, List, Optional, Union
 from pydantic import SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.core.config.base import SQL_IDENTIFIER
+
 # Use standard Python logging for module initialization
 _logger = logging.getLogger("app.core.config.as400")
 
@@ -51,7 +53,21 @@ class AS400Settings(BaseSettings):
     AS400_SYNC_INTERVAL: int = 86400
     AS400_SYNC_TABLES: Dict[str, str] = {}
     AS400_BATCH_SIZE: int = 1000
+    # Chunks that may wait between pipeline stages (extract, process, import)
+    AS400_QUEUE_SIZE: int = 2
     AS400_MAX_WORKERS: int = 4
+    # Rows upserted per transaction by the bulk importers
+    AS400_UPSERT_CHUNK_SIZE: int = 5000
+    # Chunks of at least this many rows are loaded with COPY into a staging table
+    AS400_COPY_THRESHOLD: int = 1000
+    # Incremental syncs extract and import only rows changed since the last sync
+    AS400_INCREMENTAL_SYNC: bool = True
+    # Seconds after which the next sync is a full sync, as a fallback
+    AS400_FULL_SYNC_INTERVAL: int = 604800
+    # Change timestamp column by entity type, e.g. {"stock": "CHGTS"}; entity
+    # types without one are compared row by row on a content hash. Columns
+    # must be plain names, and may contain words such as UPDATE
+    AS400_CHANGE_COLUMNS: Dict[str, str] = {}
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -63,6 +79,7 @@ class AS400Settings(BaseSettings):
             "AS400_ALLOWED_TABLES": {"env_mode": "str"},
             "AS400_ALLOWED_SCHEMAS": {"env_mode": "str"},
             "AS400_SYNC_TABLES": {"env_mode": "str"},
+            "AS400_CHANGE_COLUMNS": {"env_mode": "str"},
         },
     )
 
@@ -114,7 +131,7 @@ class AS400Settings(BaseSettings):
             return 300
         return v
 
-    @field_validator("AS400_SYNC_TABLES", mode="before")
+    @field_validator("AS400_SYNC_TABLES", "AS400_CHANGE_COLUMNS", mode="before")
     @classmethod
     def parse_sync_tables(cls, v: Union[str, Dict[str, str]]) -> Dict[str, str]:
         """Parse sync tables from string if necessary."""
@@ -139,8 +156,23 @@ class AS400Settings(BaseSettings):
                 raise ValueError(f"Invalid format in AS400_SYNC_TABLES: {e}")
         return v
 
+    @field_validator("AS400_CHANGE_COLUMNS")
+    @classmethod
+    def validate_change_columns(cls, v: Dict[str, str]) -> Dict[str, str]:
+        """Validate change timestamp columns are plain column names."""
+        for entity_type, column in v.items():
+            if not SQL_IDENTIFIER.match(column):
+                raise ValueError(
+                    f"Invalid change timestamp column for {entity_type}: {column}"
+                )
+        return v
+
     @field_validator(
-        "AS400_SSL", "AS400_ENCRYPT_CONNECTION", "AS400_SYNC_ENABLED", mode="before"
+        "AS400_SSL",
+        "AS400_ENCRYPT_CONNECTION",
+        "AS400_SYNC_ENABLED",
+        "AS400_INCREMENTAL_SYNC",
+        mode="before",
     )
     @classmethod
     def parse_boolean(cls, v: Any) -> bool:
@@ -16,6 +16,7 @@ from pydantic import model_validator
 from pydantic_settings import SettingsConfigDict
 
 from app.core.config.base import BaseAppSettings
+from app.core.config.cache import CacheSettings
 from app.core.config.celery import CelerySettings
 from app.core.config.currency import CurrencySettings
 from app.core.config.database import DatabaseSettings
@@ -27,6 +28,7 @@ from app.core.config.security import SecuritySettings
 class Settings(
     BaseAppSettings,
     DatabaseSettings,
+    CacheSettings,
     SecuritySettings,
     MediaSettings,
     FitmentSettings,
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+"""
+Cache warmup startup module.
+
+This module registers the cache warmup jobs and runs them during
+application startup, waiting no longer than the configured budget before
+letting the application serve requests.
+"""
+
+from app.core.cache.warming import cache_warmer
+from app.core.config import settings
+from app.logging import get_logger
+
+logger = get_logger("app.core.startup.cache_warmup")
+
+
+def register_warmup_jobs() -> None:
+    """Import the modules that register cache warmup jobs."""
+    import app.domains.autocare.vcdb.warmup  # noqa: F401
+
+
+async def initialize_cache_warmup() -> None:
+    """
+    Register warmup jobs and warm caches for startup.
+
+    Waits at most CACHE_WARMUP_STARTUP_BUDGET seconds; a run that takes
+    longer continues in the background.
+    """
+    if not settings.CACHE_WARMUP_ENABLED:
+        logger.info("Cache warmup is disabled in configuration")
+        return
+
+    try:
+        register_warmup_jobs()
+        report = await cache_warmer.start(
+            "startup", wait=settings.CACHE_WARMUP_STARTUP_BUDGET
+        )
+        if report is not None:
+            logger.info(
+                f"Startup cache warmup finished: {report.warmed} entries "
+                f"in {report.seconds:.2f}s"
+            )
+    except Exception as e:
+        logger.error(f"Failed to start cache warmup: {str(e)}")
+        # Don't raise - a cold cache must not prevent startup
+
+
+async def shutdown_cache_warmup() -> None:
+    """Stop cache warmup runs still in progress."""
+    await cache_warmer.shutdown()
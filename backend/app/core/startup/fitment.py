@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+"""
+Fitment startup module.
+
+This module configures the fitment mapping engine during application
+startup, loading its model mappings and, if enabled, the VCDB vehicle index,
+and releases its worker processes and connections at shutdown.
+"""
+
+from app.logging import get_logger
+
+logger = get_logger("app.core.startup.fitment")
+
+
+async def initialize_fitment() -> None:
+    """
+    Initialize the fitment mapping engine.
+
+    This function should be called during application startup.
+    """
+    from app.fitment.dependencies import initialize_mapping_engine
+
+    logger.info("Initializing fitment mapping engine")
+
+    try:
+        await initialize_mapping_engine()
+        logger.info("Fitment mapping engine initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize fitment mapping engine: {str(e)}")
+        # Don't raise - the engine is configured on first use instead
+
+
+async def shutdown_fitment() -> None:
+    """
+    Shut down the fitment mapping engine.
+
+    Stops its worker processes and closes its pooled database connections.
+    """
+    from app.fitment.dependencies import shutdown_mapping_engine
+
+    try:
+        shutdown_mapping_engine()
+        logger.info("Fitment mapping engine shut down")
+    except Exception as e:
+        logger.error(f"Error shutting down fitment mapping engine: {str(e)}")
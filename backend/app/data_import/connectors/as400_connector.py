@@ -7,8 +7,11 @@ This module provides a secure connector for extracting data from AS400/iSeries
 databases while implementing strict security measures to protect sensitive data.
 """
 
+import asyncio
 import os
-from typing import Any, Dict, List, Optional, Set
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, NoReturn, Optional, Set, Tuple
 import pyodbc
 from pydantic import BaseModel, Field, SecretStr, validator
 from cryptography.fernet import Fernet
@@ -21,6 +24,12 @@ from app.logging import get_logger
 
 logger = get_logger("app.data_import.connectors.as400_connector")
 
+# Statements a query may not contain, as whole words so that column names
+# such as LAST_UPDATED or IS_DELETED are still allowed
+_WRITE_OPERATIONS = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|CREATE|DROP|ALTER|TRUNCATE|GRANT|REVOKE|RENAME)\b"
+)
+
 
 class AS400ConnectionConfig(BaseModel):
     """Configuration for connecting to AS400/iSeries databases securely."""
@@ -187,7 +196,7 @@ class AS400Connector:
             await self.connect()
 
         # Validate and sanitize query before execution
-        table_name = self._validate_and_prepare_query(query, limit)
+        query, table_name = self._validate_and_prepare_query(query, limit)
 
         try:
             cursor = self.connection.cursor()
@@ -222,24 +231,117 @@ class AS400Connector:
             return results
 
         except pyodbc.Error as e:
-            error_msg = str(e)
-            sanitized_error = self._sanitize_error_message(error_msg)
-            logger.error(f"Error extracting data from AS400: {sanitized_error}")
+            self._raise_extract_error(e)
+
+    async def extract_batches(
+        self,
+        query: str,
+        batch_size: int = 1000,
+        limit: Optional[int] = None,
+        **params: Any,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Securely extract data from AS400 in batches.
 
-            # Classify error
-            if (
-                "permission" in error_msg.lower()
-                or "access denied" in error_msg.lower()
-            ):
-                raise SecurityException(
-                    message=f"Security error accessing AS400 data: {sanitized_error}",
-                    original_exception=e,
+        Rows are fetched with ``fetchmany`` on a dedicated worker thread, so
+        only one batch is held at a time and the event loop keeps running
+        while the AS400 responds. The next batch is fetched only when the
+        consumer asks for it.
+
+        Args:
+            query: SQL query or table name
+            batch_size: Number of rows per batch
+            limit: Maximum number of records to return
+            **params: Query parameters
+
+        Yields:
+            Lists of up to batch_size dictionaries containing query results
+
+        Raises:
+            SecurityException: If the query attempts to access unauthorized tables
+            DatabaseException: If the query fails to execute
+        """
+        if not self.connection:
+            await self.connect()
+
+        # Validate and sanitize query before execution
+        query, table_name = self._validate_and_prepare_query(query, limit)
+
+        loop = asyncio.get_running_loop()
+        # One thread, so the cursor is only ever used from the same thread
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="as400-extract")
+        cursor = None
+        total = 0
+        try:
+            cursor = self.connection.cursor()
+
+            sanitized_query = self._sanitize_sql_for_logging(query)
+            logger.debug(f"Executing AS400 query in batches: {sanitized_query}")
+
+            if params:
+                await loop.run_in_executor(
+                    executor, cursor.execute, query, tuple(params.values())
                 )
             else:
-                raise DatabaseException(
-                    message=f"Failed to extract data from AS400: {sanitized_error}",
-                    original_exception=e,
+                await loop.run_in_executor(executor, cursor.execute, query)
+
+            # Record table access for auditing
+            if table_name:
+                self._accessed_tables.add(table_name.upper())
+
+            columns = [column[0] for column in cursor.description]
+            while True:
+                rows = await loop.run_in_executor(
+                    executor, cursor.fetchmany, batch_size
                 )
+                if not rows:
+                    break
+                total += len(rows)
+                yield [
+                    self._convert_as400_types(dict(zip(columns, row))) for row in rows
+                ]
+
+            logger.info(
+                f"Successfully extracted {total} records from AS400 "
+                f"{'table: ' + table_name if table_name else 'query'} in batches"
+            )
+
+        except pyodbc.Error as e:
+            self._raise_extract_error(e)
+
+        finally:
+            if cursor is not None:
+                try:
+                    await loop.run_in_executor(executor, cursor.close)
+                except pyodbc.Error as e:
+                    logger.debug(f"Error closing AS400 cursor: {str(e)}")
+            executor.shutdown(wait=False)
+
+    def _raise_extract_error(self, error: pyodbc.Error) -> NoReturn:
+        """
+        Log an extraction error and raise it as an application exception.
+
+        Args:
+            error: The driver error
+
+        Raises:
+            SecurityException: If access was denied
+            DatabaseException: For any other error
+        """
+        error_msg = str(error)
+        sanitized_error = self._sanitize_error_message(error_msg)
+        logger.error(f"Error extracting data from AS400: {sanitized_error}")
+
+        # Classify error
+        if "permission" in error_msg.lower() or "access denied" in error_msg.lower():
+            raise SecurityException(
+                message=f"Security error accessing AS400 data: {sanitized_error}",
+                original_exception=error,
+            )
+        raise DatabaseException(
+            message=f"Failed to extract data from AS400: {sanitized_error}",
+            original_exception=error,
+        )
 
     async def close(self) -> None:
         """
@@ -310,7 +412,7 @@ class AS400Connector:
 
     def _validate_and_prepare_query(
         self, query: str, limit: Optional[int]
-    ) -> Optional[str]:
+    ) -> Tuple[str, Optional[str]]:
         """
         Validate query for security and prepare for execution.
 
@@ -319,7 +421,8 @@ class AS400Connector:
             limit: Maximum records to return
 
         Returns:
-            Table name if a table-only query, None otherwise
+            The query to execute, and the table name if a table-only query
+            or None otherwise
 
         Raises:
             SecurityException: If the query is attempting to perform unauthorized operations
@@ -340,27 +443,13 @@ class AS400Connector:
                 f" FETCH FIRST {limit} ROWS ONLY" if limit is not None else ""
             )
             query = f'SELECT * FROM "{table_name}"{limit_clause}'
-            return table_name
+            return query, table_name
         else:
             # For SQL queries, perform security checks
             query_upper = query.upper()
 
             # Ensure query is read-only
-            if any(
-                write_op in query_upper
-                for write_op in [
-                    "INSERT",
-                    "UPDATE",
-                    "DELETE",
-                    "CREATE",
-                    "DROP",
-                    "ALTER",
-                    "TRUNCATE",
-                    "GRANT",
-                    "REVOKE",
-                    "RENAME",
-                ]
-            ):
+            if _WRITE_OPERATIONS.search(query_upper):
                 raise SecurityException(
                     message="Write operations are not allowed on AS400 connection"
                 )
@@ -375,7 +464,7 @@ class AS400Connector:
                     query = query.rstrip(";")
                 query = f"{query} FETCH FIRST {limit} ROWS ONLY"
 
-            return None
+            return query, None
 
     def _convert_as400_types(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """
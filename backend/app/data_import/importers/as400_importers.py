@@ -7,16 +7,19 @@ This module provides data importers for AS400 synchronization operations,
 implementing the logic to create or update records in the application database.
 """
 
+import uuid
 from datetime import datetime
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import DatabaseException
 from app.logging import get_logger
 from app.domains.products.models import (
     Product,
+    ProductDescription,
+    ProductMarketing,
     ProductMeasurement,
     ProductPricing,
     ProductStock,
@@ -31,20 +34,37 @@ from app.domains.products.schemas import (
     ProductStock as ProductStockSchema,
 )
 from app.data_import.importers.base import Importer
+from app.data_import.importers.bulk import BulkUpserter, UpsertResult
+from app.data_import.importers.digests import DigestIndex
 
 logger = get_logger("app.data_import.importers.as400_importers")
 
 # Type variable for schema types
 T = TypeVar("T")
 
+# Stored records read per round trip when loading digests
+DIGEST_LOAD_BATCH_SIZE = 10000
+
 
 class AS400BaseImporter(Importer[T]):
     """
     Base class for AS400 data importers.
 
     Provides common functionality for AS400 data import operations.
+
+    Importers that set ``model``, ``key_fields`` and ``compared_fields``
+    skip records identical to the stored ones: the digests of all stored
+    records are loaded on the first import, and records whose digest
+    matches are reported as unchanged instead of being written.
     """
 
+    # Model of the stored records, for unchanged record detection
+    model: Any = None
+    # Fields identifying a record, named alike on the schema and the model
+    key_fields: Tuple[str, ...] = ()
+    # Fields written by an update, named alike on the schema and the model
+    compared_fields: Tuple[str, ...] = ()
+
     def __init__(self, db: AsyncSession) -> None:
         """
         Initialize the importer with a database session.
@@ -53,6 +73,7 @@ class AS400BaseImporter(Importer[T]):
             db: SQLAlchemy async session
         """
         self.db = db
+        self._digests: Optional[DigestIndex] = None
         logger.debug(f"Initialized {self.__class__.__name__}")
 
     async def get_existing_entities(
@@ -87,8 +108,183 @@ class AS400BaseImporter(Importer[T]):
                 original_exception=e,
             ) from e
 
+    async def get_existing_ids(self, model: Any, id_values: List[Any]) -> Set[Any]:
+        """
+        Get which of the given IDs belong to existing entities.
+
+        Args:
+            model: SQLAlchemy model class
+            id_values: List of ID values to look up
+
+        Returns:
+            Set of the IDs that exist
+        """
+        if not id_values:
+            return set()
+
+        try:
+            query = select(model.id).where(
+                model.id.in_(set(id_values)), model.is_deleted == False
+            )
+            result = await self.db.execute(query)
+            return set(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Error fetching existing {model.__name__} IDs: {str(e)}")
+            raise DatabaseException(
+                message=f"Failed to fetch existing {model.__name__} IDs: {str(e)}",
+                original_exception=e,
+            ) from e
+
+    def bulk_upserter(
+        self,
+        model: Any,
+        key_columns: List[str],
+        update_columns: List[str],
+        **kwargs: Any,
+    ) -> BulkUpserter:
+        """
+        Create a bulk upserter sized by the AS400 upsert settings.
+
+        Args:
+            model: SQLAlchemy model class
+            key_columns: Columns of the unique index rows conflict on
+            update_columns: Columns overwritten when a row already exists
+            **kwargs: Further BulkUpserter arguments
+
+        Returns:
+            BulkUpserter: The upserter
+        """
+        # Imported here so the importers load without AS400 credentials set
+        from app.core.config.integrations.as400 import as400_settings
+
+        return BulkUpserter(
+            self.db,
+            model,
+            key_columns,
+            update_columns,
+            chunk_size=as400_settings.AS400_UPSERT_CHUNK_SIZE,
+            copy_threshold=as400_settings.AS400_COPY_THRESHOLD,
+            **kwargs,
+        )
+
+    async def bulk_result(
+        self,
+        entity_type: str,
+        result: UpsertResult,
+        error_details: List[Dict[str, Any]],
+        total: int,
+        unchanged: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Track a bulk upsert and build the import results.
+
+        Args:
+            entity_type: Type of entity being synced
+            result: Outcome of the upsert
+            error_details: Errors of rows rejected before the upsert
+            total: Number of rows received
+            unchanged: Number of rows skipped as identical to the stored ones
+
+        Returns:
+            Dictionary with import results
+        """
+        error_details = error_details + result.error_details
+        await self.track_sync(
+            entity_type=entity_type,
+            created=result.created,
+            updated=result.updated,
+            errors=len(error_details),
+            unchanged=unchanged,
+        )
+        return {
+            "success": not error_details,
+            "created": result.created,
+            "updated": result.updated,
+            "unchanged": unchanged,
+            "errors": len(error_details),
+            "error_details": error_details,
+            "total": total,
+        }
+
+    async def drop_unchanged(self, data: List[T]) -> Tuple[List[T], int]:
+        """
+        Drop the records identical to the stored ones.
+
+        Records kept are forgotten by the digest index, as they are about to
+        be rewritten.
+
+        Args:
+            data: Records to import
+
+        Returns:
+            The records to write, and the number of unchanged records
+        """
+        if self.model is None:
+            return data, 0
+        if self._digests is None:
+            self._digests = await self.load_digests()
+
+        changed = []
+        for record in data:
+            key = [getattr(record, name) for name in self.key_fields]
+            values = [getattr(record, name) for name in self.compared_fields]
+            if self.is_comparable(record) and self._digests.is_unchanged(key, values):
+                continue
+            self._digests.discard(key)
+            changed.append(record)
+        return changed, len(data) - len(changed)
+
+    def is_comparable(self, record: T) -> bool:
+        """
+        Check whether a record can be skipped when its compared fields are
+        unchanged.
+
+        Args:
+            record: Record to import
+
+        Returns:
+            True unless the record writes more than its compared fields
+        """
+        return True
+
+    async def load_digests(self) -> DigestIndex:
+        """
+        Load the digests of the stored records.
+
+        Returns:
+            DigestIndex: Digests by business key
+        """
+        index = DigestIndex()
+        key_count = len(self.key_fields)
+        columns = [
+            getattr(self.model, name) for name in self.key_fields + self.compared_fields
+        ]
+        query = (
+            select(*columns)
+            .where(self.model.is_deleted == False)
+            .execution_options(yield_per=DIGEST_LOAD_BATCH_SIZE)
+        )
+        try:
+            result = await self.db.stream(query)
+            async for row in result:
+                index.add(row[:key_count], row[key_count:])
+        except Exception as e:
+            logger.error(f"Error loading {self.model.__name__} digests: {str(e)}")
+            raise DatabaseException(
+                message=f"Failed to load {self.model.__name__} digests: {str(e)}",
+                original_exception=e,
+            ) from e
+
+        logger.debug(f"Loaded {len(index)} {self.model.__name__} digests")
+        return index
+
     async def track_sync(
-        self, entity_type: str, created: int, updated: int, errors: int
+        self,
+        entity_type: str,
+        created: int,
+        updated: int,
+        errors: int,
+        unchanged: int = 0,
     ) -> None:
         """
         Track synchronization statistics.
@@ -98,16 +294,34 @@ class AS400BaseImporter(Importer[T]):
             created: Number of created entities
             updated: Number of updated entities
             errors: Number of errors
+            unchanged: Number of entities skipped as unchanged
         """
         # This could write to a sync_log table or other persistent storage
         logger.info(
             f"AS400 Sync: {entity_type} - "
-            f"created={created}, updated={updated}, errors={errors}"
+            f"created={created}, updated={updated}, unchanged={unchanged}, "
+            f"errors={errors}"
         )
 
 
 class ProductAS400Importer(AS400BaseImporter[ProductCreate]):
-    """Importer for product data from AS400."""
+    """Importer for product data from AS400.
+
+    Products are upserted in bulk on their part number. Descriptions and
+    marketing content, when given, replace the product's existing ones in
+    the same transaction.
+    """
+
+    model = Product
+    key_fields = ("part_number",)
+    compared_fields = (
+        "application",
+        "vintage",
+        "late_model",
+        "soft",
+        "universal",
+        "is_active",
+    )
 
     async def import_data(self, data: List[ProductCreate]) -> Dict[str, Any]:
         """
@@ -129,59 +343,49 @@ class ProductAS400Importer(AS400BaseImporter[ProductCreate]):
             }
 
         try:
-            # Get part numbers for all products to import
-            part_numbers = [p.part_number for p in data]
-
-            # Get existing products
-            existing_products = await self.get_existing_entities(
-                id_field="part_number", id_values=part_numbers, model=Product
-            )
-
-            # Import stats
-            stats = {"created": 0, "updated": 0, "errors": 0, "error_details": []}
-
-            # Process each product
-            for product_data in data:
-                try:
-                    # Check if product exists
-                    existing_product = existing_products.get(product_data.part_number)
-                    if existing_product:
-                        # Update existing product
-                        await self._update_product(existing_product, product_data)
-                        stats["updated"] += 1
-                    else:
-                        # Create new product
-                        await self._create_product(product_data)
-                        stats["created"] += 1
-                except Exception as e:
-                    logger.error(
-                        f"Error importing product {product_data.part_number}: {str(e)}"
-                    )
-                    stats["errors"] += 1
-                    stats["error_details"].append(
-                        {"part_number": product_data.part_number, "error": str(e)}
-                    )
+            changed, unchanged = await self.drop_unchanged(data)
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "part_number": product_data.part_number,
+                    "part_number_stripped": product_data.part_number_stripped,
+                    "application": product_data.application,
+                    "vintage": product_data.vintage,
+                    "late_model": product_data.late_model,
+                    "soft": product_data.soft,
+                    "universal": product_data.universal,
+                    "is_active": product_data.is_active,
+                    "is_deleted": False,
+                }
+                for product_data in changed
+            ]
+            content = {
+                (product_data.part_number,): product_data
+                for product_data in changed
+                if not self.is_comparable(product_data)
+            }
 
-            # Commit changes
-            await self.db.commit()
+            async def replace_content(product_ids: Dict[Tuple[Any, ...], Any]) -> None:
+                await self._replace_content(
+                    {
+                        product_ids[key]: product_data
+                        for key, product_data in content.items()
+                        if key in product_ids
+                    }
+                )
 
-            # Track sync
-            await self.track_sync(
-                entity_type="Product",
-                created=stats["created"],
-                updated=stats["updated"],
-                errors=stats["errors"],
+            upserter = self.bulk_upserter(
+                Product,
+                key_columns=list(self.key_fields),
+                update_columns=list(self.compared_fields),
+            )
+            result = await upserter.upsert(
+                rows, after_upsert=replace_content if content else None
             )
 
-            # Return results
-            return {
-                "success": stats["errors"] == 0,
-                "created": stats["created"],
-                "updated": stats["updated"],
-                "errors": stats["errors"],
-                "error_details": stats["error_details"] if stats["errors"] > 0 else [],
-                "total": len(data),
-            }
+            return await self.bulk_result(
+                "Product", result, [], len(data), unchanged=unchanged
+            )
         except Exception as e:
             # Roll back on error
             await self.db.rollback()
@@ -191,134 +395,81 @@ class ProductAS400Importer(AS400BaseImporter[ProductCreate]):
                 original_exception=e,
             ) from e
 
-    async def _create_product(self, product_data: ProductCreate) -> Product:
-        """
-        Create a new product.
-
-        Args:
-            product_data: Product data to create
-
-        Returns:
-            Created product
-        """
-        # Create product
-        product = Product(
-            part_number=product_data.part_number,
-            part_number_stripped=product_data.part_number_stripped,
-            application=product_data.application,
-            vintage=product_data.vintage,
-            late_model=product_data.late_model,
-            soft=product_data.soft,
-            universal=product_data.universal,
-            is_active=product_data.is_active,
-        )
-        self.db.add(product)
-        await self.db.flush()
-
-        # Process descriptions
-        if hasattr(product_data, "descriptions") and product_data.descriptions:
-            for desc_data in product_data.descriptions:
-                from app.domains.products.models import ProductDescription
-
-                description = ProductDescription(
-                    product_id=product.id,
-                    description_type=desc_data.description_type,
-                    description=desc_data.description,
-                )
-                self.db.add(description)
-
-        # Process marketing content
-        if hasattr(product_data, "marketing") and product_data.marketing:
-            for mkt_data in product_data.marketing:
-                from app.domains.products.models import ProductMarketing
-
-                marketing = ProductMarketing(
-                    product_id=product.id,
-                    marketing_type=mkt_data.marketing_type,
-                    content=mkt_data.content,
-                    position=mkt_data.position,
-                )
-                self.db.add(marketing)
-
-        await self.db.flush()
-        await self.db.refresh(product)
+    def is_comparable(self, record: ProductCreate) -> bool:
+        """Products with descriptions or marketing content are always written."""
+        return not (record.descriptions or record.marketing)
 
-        logger.debug(f"Created new product: {product.part_number}")
-        return product
-
-    async def _update_product(
-        self, existing_product: Product, product_data: ProductCreate
-    ) -> Product:
+    async def _replace_content(self, products: Dict[Any, ProductCreate]) -> None:
         """
-        Update an existing product.
+        Replace the descriptions and marketing content of upserted products.
 
         Args:
-            existing_product: Existing product to update
-            product_data: New product data
-
-        Returns:
-            Updated product
+            products: Product data with descriptions or marketing by product ID
         """
-        # Update basic fields
-        existing_product.application = product_data.application
-        existing_product.vintage = product_data.vintage
-        existing_product.late_model = product_data.late_model
-        existing_product.soft = product_data.soft
-        existing_product.universal = product_data.universal
-        existing_product.is_active = product_data.is_active
-        self.db.add(existing_product)
-
-        # Update descriptions if present
-        if hasattr(product_data, "descriptions") and product_data.descriptions:
-            # Delete existing descriptions
-            from app.domains.products.models import ProductDescription
-
+        described = {
+            product_id: product_data.descriptions
+            for product_id, product_data in products.items()
+            if product_data.descriptions
+        }
+        if described:
             await self.db.execute(
                 delete(ProductDescription).where(
-                    ProductDescription.product_id == existing_product.id
+                    ProductDescription.product_id.in_(described)
                 )
             )
+            await self.db.execute(
+                insert(ProductDescription),
+                [
+                    {
+                        "product_id": product_id,
+                        "description_type": desc_data.description_type,
+                        "description": desc_data.description,
+                    }
+                    for product_id, descriptions in described.items()
+                    for desc_data in descriptions
+                ],
+            )
 
-            # Add new descriptions
-            for desc_data in product_data.descriptions:
-                description = ProductDescription(
-                    product_id=existing_product.id,
-                    description_type=desc_data.description_type,
-                    description=desc_data.description,
-                )
-                self.db.add(description)
-
-        # Update marketing content if present
-        if hasattr(product_data, "marketing") and product_data.marketing:
-            # Delete existing marketing content
-            from app.domains.products.models import ProductMarketing
-
+        marketed = {
+            product_id: product_data.marketing
+            for product_id, product_data in products.items()
+            if product_data.marketing
+        }
+        if marketed:
             await self.db.execute(
                 delete(ProductMarketing).where(
-                    ProductMarketing.product_id == existing_product.id
+                    ProductMarketing.product_id.in_(marketed)
                 )
             )
-
-            # Add new marketing content
-            for mkt_data in product_data.marketing:
-                marketing = ProductMarketing(
-                    product_id=existing_product.id,
-                    marketing_type=mkt_data.marketing_type,
-                    content=mkt_data.content,
-                    position=mkt_data.position,
-                )
-                self.db.add(marketing)
-
-        await self.db.flush()
-        await self.db.refresh(existing_product)
-
-        logger.debug(f"Updated product: {existing_product.part_number}")
-        return existing_product
+            await self.db.execute(
+                insert(ProductMarketing),
+                [
+                    {
+                        "product_id": product_id,
+                        "marketing_type": mkt_data.marketing_type,
+                        "content": mkt_data.content,
+                        "position": mkt_data.position,
+                    }
+                    for product_id, marketing in marketed.items()
+                    for mkt_data in marketing
+                ],
+            )
 
 
 class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
     """Importer for product measurement data from AS400."""
 
+    model = ProductMeasurement
+    key_fields = ("product_id", "manufacturer_id")
+    compared_fields = (
+        "length",
+        "width",
+        "height",
+        "weight",
+        "volume",
+        "dimensional_weight",
+    )
+
     async def import_data(self, data: List[ProductMeasurementCreate]) -> Dict[str, Any]:
         """
         Import product measurement data.
@@ -339,8 +490,10 @@ class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
             }
 
         try:
+            changed, unchanged = await self.drop_unchanged(data)
+
             # Get product IDs for all measurements
-            product_ids = [m.product_id for m in data]
+            product_ids = [m.product_id for m in changed]
 
             # Ensure products exist
             existing_products = await self.get_existing_entities(
@@ -349,7 +502,7 @@ class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
 
             # Get manufacturer IDs
             manufacturer_ids = [
-                m.manufacturer_id for m in data if m.manufacturer_id is not None
+                m.manufacturer_id for m in changed if m.manufacturer_id is not None
             ]
             existing_manufacturers = {}
             if manufacturer_ids:
@@ -357,11 +510,16 @@ class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
                     id_field="id", id_values=manufacturer_ids, model=Manufacturer
                 )
 
+            # Get existing measurements of those products in one query
+            existing_measurements = await self._get_existing_measurements(
+                list(existing_products)
+            )
+
             # Import stats
             stats = {"created": 0, "updated": 0, "errors": 0, "error_details": []}
 
             # Process each measurement
-            for measurement_data in data:
+            for measurement_data in changed:
                 try:
                     # Skip if product doesn't exist
                     if measurement_data.product_id not in existing_products:
@@ -392,15 +550,11 @@ class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
                         )
                         continue
 
-                    # Find existing measurement
-                    query = select(ProductMeasurement).where(
-                        ProductMeasurement.product_id == measurement_data.product_id,
-                        ProductMeasurement.manufacturer_id
-                        == measurement_data.manufacturer_id,
-                        ProductMeasurement.is_deleted == False,
+                    key = (
+                        measurement_data.product_id,
+                        measurement_data.manufacturer_id,
                     )
-                    result = await self.db.execute(query)
-                    existing_measurement = result.scalars().first()
+                    existing_measurement = existing_measurements.get(key)
 
                     if existing_measurement:
                         # Update existing measurement
@@ -429,6 +583,7 @@ class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
                             effective_date=datetime.now(),
                         )
                         self.db.add(new_measurement)
+                        existing_measurements[key] = new_measurement
                         stats["created"] += 1
                 except Exception as e:
                     logger.error(
@@ -453,6 +608,7 @@ class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
                 created=stats["created"],
                 updated=stats["updated"],
                 errors=stats["errors"],
+                unchanged=unchanged,
             )
 
             # Return results
@@ -460,6 +616,7 @@ class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
                 "success": stats["errors"] == 0,
                 "created": stats["created"],
                 "updated": stats["updated"],
+                "unchanged": unchanged,
                 "errors": stats["errors"],
                 "error_details": stats["error_details"] if stats["errors"] > 0 else [],
                 "total": len(data),
@@ -473,9 +630,42 @@ class ProductMeasurementImporter(AS400BaseImporter[ProductMeasurementCreate]):
                 original_exception=e,
             ) from e
 
+    async def _get_existing_measurements(
+        self, product_ids: List[Any]
+    ) -> Dict[Tuple[Any, Any], ProductMeasurement]:
+        """
+        Get the measurements of products.
+
+        Args:
+            product_ids: IDs of the products
+
+        Returns:
+            Dictionary mapping (product_id, manufacturer_id) to measurements
+        """
+        if not product_ids:
+            return {}
+
+        query = select(ProductMeasurement).where(
+            ProductMeasurement.product_id.in_(product_ids),
+            ProductMeasurement.is_deleted == False,
+        )
+        result = await self.db.execute(query)
+        measurements: Dict[Tuple[Any, Any], ProductMeasurement] = {}
+        for measurement in result.scalars().all():
+            key = (measurement.product_id, measurement.manufacturer_id)
+            measurements.setdefault(key, measurement)
+        return measurements
+
 
 class ProductStockImporter(AS400BaseImporter[ProductStockSchema]):
-    """Importer for product stock/inventory data from AS400."""
+    """Importer for product stock/inventory data from AS400.
+
+    Stock levels are upserted in bulk on their product and warehouse.
+    """
+
+    model = ProductStock
+    key_fields = ("product_id", "warehouse_id")
+    compared_fields = ("quantity",)
 
     async def import_data(self, data: List[ProductStockSchema]) -> Dict[str, Any]:
         """
@@ -497,105 +687,57 @@ class ProductStockImporter(AS400BaseImporter[ProductStockSchema]):
             }
 
         try:
-            # Get product IDs
-            product_ids = [s.product_id for s in data]
+            changed, unchanged = await self.drop_unchanged(data)
 
-            # Ensure products exist
-            existing_products = await self.get_existing_entities(
-                id_field="id", id_values=product_ids, model=Product
+            # Ensure products and warehouses exist
+            existing_products = await self.get_existing_ids(
+                Product, [s.product_id for s in changed]
             )
-
-            # Get warehouse IDs
-            warehouse_ids = [s.warehouse_id for s in data]
-            existing_warehouses = await self.get_existing_entities(
-                id_field="id", id_values=warehouse_ids, model=Warehouse
+            existing_warehouses = await self.get_existing_ids(
+                Warehouse, [s.warehouse_id for s in changed]
             )
 
-            # Import stats
-            stats = {"created": 0, "updated": 0, "errors": 0, "error_details": []}
-
-            # Process each stock record
-            for stock_data in data:
-                try:
-                    # Skip if product doesn't exist
-                    if stock_data.product_id not in existing_products:
-                        stats["errors"] += 1
-                        stats["error_details"].append(
-                            {
-                                "product_id": str(stock_data.product_id),
-                                "error": "Product does not exist",
-                            }
-                        )
-                        continue
-
-                    # Skip if warehouse doesn't exist
-                    if stock_data.warehouse_id not in existing_warehouses:
-                        stats["errors"] += 1
-                        stats["error_details"].append(
-                            {
-                                "product_id": str(stock_data.product_id),
-                                "warehouse_id": str(stock_data.warehouse_id),
-                                "error": "Warehouse does not exist",
-                            }
-                        )
-                        continue
-
-                    # Find existing stock record
-                    query = select(ProductStock).where(
-                        ProductStock.product_id == stock_data.product_id,
-                        ProductStock.warehouse_id == stock_data.warehouse_id,
-                        ProductStock.is_deleted == False,
+            rows: List[Dict[str, Any]] = []
+            error_details: List[Dict[str, Any]] = []
+            for stock_data in changed:
+                if stock_data.product_id not in existing_products:
+                    error_details.append(
+                        {
+                            "product_id": str(stock_data.product_id),
+                            "error": "Product does not exist",
+                        }
                     )
-                    result = await self.db.execute(query)
-                    existing_stock = result.scalars().first()
-
-                    if existing_stock:
-                        # Update existing stock
-                        existing_stock.quantity = stock_data.quantity
-                        existing_stock.last_updated = datetime.now()
-                        self.db.add(existing_stock)
-                        stats["updated"] += 1
-                    else:
-                        # Create new stock record
-                        new_stock = ProductStock(
-                            product_id=stock_data.product_id,
-                            warehouse_id=stock_data.warehouse_id,
-                            quantity=stock_data.quantity,
-                            last_updated=datetime.now(),
-                        )
-                        self.db.add(new_stock)
-                        stats["created"] += 1
-                except Exception as e:
-                    logger.error(
-                        f"Error importing stock for product "
-                        f"{stock_data.product_id}: {str(e)}"
+                elif stock_data.warehouse_id not in existing_warehouses:
+                    error_details.append(
+                        {
+                            "product_id": str(stock_data.product_id),
+                            "warehouse_id": str(stock_data.warehouse_id),
+                            "error": "Warehouse does not exist",
+                        }
                     )
-                    stats["errors"] += 1
-                    stats["error_details"].append(
-                        {"product_id": str(stock_data.product_id), "error": str(e)}
+                else:
+                    rows.append(
+                        {
+                            "id": uuid.uuid4(),
+                            "product_id": stock_data.product_id,
+                            "warehouse_id": stock_data.warehouse_id,
+                            "quantity": stock_data.quantity,
+                            "is_deleted": False,
+                        }
                     )
 
-            # Commit changes
-            await self.db.flush()
-            await self.db.commit()
-
-            # Track sync
-            await self.track_sync(
-                entity_type="ProductStock",
-                created=stats["created"],
-                updated=stats["updated"],
-                errors=stats["errors"],
+            upserter = self.bulk_upserter(
+                ProductStock,
+                key_columns=list(self.key_fields),
+                update_columns=list(self.compared_fields),
+                touch_columns=["last_updated", "updated_at"],
+                index_where=text("NOT is_deleted"),
             )
+            result = await upserter.upsert(rows)
 
-            # Return results
-            return {
-                "success": stats["errors"] == 0,
-                "created": stats["created"],
-                "updated": stats["updated"],
-                "errors": stats["errors"],
-                "error_details": stats["error_details"] if stats["errors"] > 0 else [],
-                "total": len(data),
-            }
+            return await self.bulk_result(
+                "ProductStock", result, error_details, len(data), unchanged=unchanged
+            )
         except Exception as e:
             # Roll back on error
             await self.db.rollback()
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+"""
+Set-based bulk upserts.
+
+This module provides the bulk write path of the importers. Rows are written
+with PostgreSQL ``INSERT ... ON CONFLICT DO UPDATE`` one chunk per
+transaction, and ``RETURNING (xmax = 0)`` tells created rows apart from
+updated ones. Chunks of at least ``copy_threshold`` rows are first loaded
+with ``COPY`` into a temporary staging table and upserted from there in a
+single statement. When a chunk's statement fails, the chunk is retried a
+row at a time in savepoints, so only the rows at fault are reported.
+"""
+
+import uuid
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy import Boolean, column, false, func, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.logging import get_logger
+
+logger = get_logger("app.data_import.importers.bulk")
+
+# PostgreSQL accepts at most 32767 bind parameters per statement
+MAX_BIND_PARAMS = 32767
+
+Row = Dict[str, Any]
+Key = Tuple[Any, ...]
+AfterUpsert = Callable[[Dict[Key, uuid.UUID]], Awaitable[None]]
+
+
+@dataclass
+class UpsertResult:
+    """Outcome of a bulk upsert.
+
+    Attributes:
+        created: Number of inserted rows
+        updated: Number of updated rows
+        error_details: One dict per failed row, with the row's key fields
+            and the error
+    """
+
+    created: int = 0
+    updated: int = 0
+    error_details: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def errors(self) -> int:
+        """Number of failed rows."""
+        return len(self.error_details)
+
+
+class BulkUpserter:
+    """Upserts rows into a table in chunked transactions.
+
+    Rows are dicts of column values and must include the primary key, as
+    Python-side column defaults are not applied. Rows sharing a key are
+    collapsed to the last one, since a single ``ON CONFLICT DO UPDATE``
+    statement can't update a row twice. Rows conflicting with a soft
+    deleted row are neither inserted nor updated and are reported as errors.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        model: Any,
+        key_columns: Sequence[str],
+        update_columns: Sequence[str],
+        touch_columns: Sequence[str] = ("updated_at",),
+        index_where: Optional[Any] = None,
+        chunk_size: int = 5000,
+        copy_threshold: int = 1000,
+    ) -> None:
+        """
+        Initialize the upserter.
+
+        Args:
+            db: SQLAlchemy async session
+            model: SQLAlchemy model class of the target table
+            key_columns: Columns of the unique index rows conflict on
+            update_columns: Columns overwritten when a row already exists
+            touch_columns: Columns set to now() when a row is updated
+            index_where: Predicate of the unique index if it is partial
+            chunk_size: Rows upserted per transaction
+            copy_threshold: Minimum chunk size loaded with COPY
+        """
+        self.db = db
+        self.table = model.__table__
+        self.key_columns = list(key_columns)
+        self.update_columns = list(update_columns)
+        self.touch_columns = list(touch_columns)
+        self.index_where = index_where
+        self.chunk_size = max(1, chunk_size)
+        self.copy_threshold = copy_threshold
+
+    async def upsert(
+        self, rows: List[Row], after_upsert: Optional[AfterUpsert] = None
+    ) -> UpsertResult:
+        """
+        Upsert rows, committing after each chunk.
+
+        Args:
+            rows: Column values of each row
+            after_upsert: Coroutine called in each chunk's transaction with
+                the key and id of every upserted row, to write dependent rows
+
+        Returns:
+            UpsertResult: Created and updated counts and per-row errors
+        """
+        result = UpsertResult()
+        unique = list({self._key(row): row for row in rows}.values())
+        if len(unique) < len(rows):
+            logger.debug(
+                f"Collapsed {len(rows) - len(unique)} rows with duplicate keys "
+                f"for {self.table.name}"
+            )
+
+        for start in range(0, len(unique), self.chunk_size):
+            chunk = unique[start : start + self.chunk_size]
+            failed: Dict[Key, Dict[str, Any]] = {}
+            try:
+                returned = await self._upsert_chunk(chunk)
+                if after_upsert is not None:
+                    await after_upsert(
+                        {key: row_id for key, (row_id, _) in returned.items()}
+                    )
+                await self.db.commit()
+            except Exception as e:
+                await self.db.rollback()
+                logger.warning(
+                    f"Bulk upsert of {len(chunk)} {self.table.name} rows failed, "
+                    f"retrying row by row: {str(e)}"
+                )
+                returned, failed = await self._upsert_rows(chunk, after_upsert)
+                result.error_details.extend(failed.values())
+                await self.db.commit()
+            self._count(chunk, returned, failed, result)
+
+        return result
+
+    async def _upsert_chunk(self, chunk: List[Row]) -> Dict[Key, Tuple[Any, bool]]:
+        """Upsert a chunk in the current transaction."""
+        columns = list(chunk[0])
+        if len(chunk) >= self.copy_threshold:
+            staging = await self._copy_to_staging(chunk, columns)
+            if staging is not None:
+                source = select(*[staging.c[name] for name in columns])
+                return await self._execute(
+                    insert(self.table).from_select(columns, source)
+                )
+
+        returned: Dict[Key, Tuple[Any, bool]] = {}
+        rows_per_statement = max(1, MAX_BIND_PARAMS // len(columns))
+        for start in range(0, len(chunk), rows_per_statement):
+            values = chunk[start : start + rows_per_statement]
+            returned.update(await self._execute(insert(self.table).values(values)))
+        return returned
+
+    async def _upsert_rows(
+        self, chunk: List[Row], after_upsert: Optional[AfterUpsert]
+    ) -> Tuple[Dict[Key, Tuple[Any, bool]], Dict[Key, Dict[str, Any]]]:
+        """Upsert a chunk one row per savepoint.
+
+        Returns:
+            The upserted rows, and the error details of failed rows by key
+        """
+        returned: Dict[Key, Tuple[Any, bool]] = {}
+        failed: Dict[Key, Dict[str, Any]] = {}
+        for row in chunk:
+            try:
+                async with self.db.begin_nested():
+                    upserted = await self._execute(insert(self.table).values(row))
+                    if after_upsert is not None and upserted:
+                        await after_upsert(
+                            {key: row_id for key, (row_id, _) in upserted.items()}
+                        )
+                returned.update(upserted)
+            except Exception as e:
+                failed[self._key(row)] = {**self._describe(row), "error": str(e)}
+        return returned, failed
+
+    async def _execute(self, statement: Any) -> Dict[Key, Tuple[Any, bool]]:
+        """Run an insert as an upsert.
+
+        Returns:
+            Dict mapping the key of each upserted row to its id and whether
+            it was created
+        """
+        excluded = statement.excluded
+        values = {name: excluded[name] for name in self.update_columns}
+        values.update({name: func.now() for name in self.touch_columns})
+        statement = statement.on_conflict_do_update(
+            index_elements=self.key_columns,
+            index_where=self.index_where,
+            set_=values,
+            where=self.table.c.is_deleted == false(),
+        ).returning(
+            self.table.c.id,
+            *[self.table.c[name] for name in self.key_columns],
+            literal_column("xmax = 0", Boolean).label("created"),
+        )
+        result = await self.db.execute(statement)
+        return {tuple(row[1:-1]): (row.id, row.created) for row in result.all()}
+
+    async def _copy_to_staging(self, chunk: List[Row], columns: List[str]) -> Any:
+        """COPY a chunk into a temporary table dropped on commit.
+
+        Returns:
+            The staging table, or None if the driver doesn't support COPY
+        """
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if not hasattr(driver_connection, "copy_records_to_table"):
+            return None
+
+        staging_name = f"{self.table.name}_staging"
+        await self.db.execute(
+            text(
+                f"CREATE TEMPORARY TABLE {staging_name} ON COMMIT DROP AS "
+                f"SELECT {', '.join(columns)} FROM {self.table.name} WITH NO DATA"
+            )
+        )
+        await driver_connection.copy_records_to_table(
+            staging_name,
+            records=[tuple(row[name] for name in columns) for row in chunk],
+            columns=columns,
+        )
+        return table(staging_name, *[column(name) for name in columns])
+
+    def _count(
+        self,
+        chunk: List[Row],
+        returned: Dict[Key, Tuple[Any, bool]],
+        failed: Dict[Key, Dict[str, Any]],
+        result: UpsertResult,
+    ) -> None:
+        """Count created and updated rows of a chunk.
+
+        Rows neither upserted nor failed conflicted with a soft deleted row
+        and are reported as errors.
+        """
+        for _, created in returned.values():
+            if created:
+                result.created += 1
+            else:
+                result.updated += 1
+
+        for row in chunk:
+            key = self._key(row)
+            if key not in returned and key not in failed:
+                result.error_details.append(
+                    {**self._describe(row), "error": "Conflicts with a deleted row"}
+                )
+
+    def _key(self, row: Row) -> Key:
+        """Get the conflict key of a row."""
+        return tuple(row.get(name) for name in self.key_columns)
+
+    def _describe(self, row: Row) -> Dict[str, Any]:
+        """Get the key fields of a row for error details."""
+        return {name: str(row[name]) for name in self.key_columns}
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+"""
+Record digests.
+
+Importers keep a 64-bit digest of the compared fields of every stored
+record, keyed by a 64-bit digest of its business key, so that records
+that would not change anything are skipped without a database round trip.
+Values are normalized first, so a record read back from the database and
+the same record as imported have the same digest.
+"""
+
+import hashlib
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable
+
+
+def _normalize(value: Any) -> str:
+    """Get the text a value is hashed as."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (float, Decimal)):
+        return repr(float(value))
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return value.hex
+    return str(value).strip()
+
+
+def digest(values: Iterable[Any]) -> int:
+    """
+    Get a 64-bit digest of normalized values.
+
+    Args:
+        values: Values in a fixed order
+
+    Returns:
+        Signed 64-bit digest, stable across processes
+    """
+    payload = "\x1f".join(_normalize(value) for value in values)
+    hashed = hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(hashed, "big", signed=True)
+
+
+class DigestIndex:
+    """Digests of stored records by business key."""
+
+    def __init__(self) -> None:
+        self._digests: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def add(self, key: Iterable[Any], values: Iterable[Any]) -> None:
+        """
+        Record the compared values of a stored record.
+
+        Args:
+            key: Business key of the record
+            values: Compared field values
+        """
+        self._digests[digest(key)] = digest(values)
+
+    def is_unchanged(self, key: Iterable[Any], values: Iterable[Any]) -> bool:
+        """
+        Check whether a record matches the stored one.
+
+        Args:
+            key: Business key of the record
+            values: Compared field values
+
+        Returns:
+            True if a record with the key is stored with the same values
+        """
+        return self._digests.get(digest(key)) == digest(values)
+
+    def discard(self, key: Iterable[Any]) -> None:
+        """Forget the stored record with a key, e.g. when it is rewritten."""
+        self._digests.pop(digest(key), None)
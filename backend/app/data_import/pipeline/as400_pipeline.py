@@ -8,29 +8,180 @@ process between AS400 and the application database.
 """
 
 import asyncio
+import contextlib
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from pydantic import BaseModel
 
-from app.core.exceptions import AppException
+from app.core.config.base import SQL_IDENTIFIER
+from app.core.exceptions import AppException, SecurityException
 from app.logging import get_logger
 from app.data_import.connectors.as400_connector import AS400Connector
 from app.data_import.importers.base import Importer
+from app.data_import.pipeline.change_tracking import ChangeTracker
 from app.data_import.processors.as400_processor import AS400BaseProcessor
 
 logger = get_logger("app.data_import.pipeline.as400_pipeline")
 
+# Try to import metrics, but don't fail if not available
+try:
+    from app.core.metrics import (
+        create_counter,
+        create_gauge,
+        create_histogram,
+        increment_counter,
+        observe_histogram,
+        set_gauge,
+    )
+
+    HAS_METRICS = True
+except ImportError:
+    HAS_METRICS = False
+
 # Type variable for schema models
 T = TypeVar("T", bound=BaseModel)
 
+STAGES = ("extract", "process", "validate", "import")
+
+# Marks the end of the chunks passed between stages
+_END = object()
+
+# A connector and the query and parameters it extracts
+_Source = Tuple[AS400Connector, str, Dict[str, Any]]
+
+_metrics_registered = False
+
+
+@dataclass
+class StageStats:
+    """Work done by one pipeline stage.
+
+    Attributes:
+        records: Records the stage produced
+        batches: Chunks the stage handled
+        seconds: Time spent working, excluding waits on other stages
+    """
+
+    records: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Get the stats with the stage's throughput."""
+        return {
+            "records": self.records,
+            "batches": self.batches,
+            "seconds": self.seconds,
+            "records_per_second": (
+                self.records / self.seconds if self.seconds else 0.0
+            ),
+        }
+
+
+@dataclass
+class _RunState:
+    """Counts shared by the stages of one pipeline run."""
+
+    stages: Dict[str, StageStats] = field(
+        default_factory=lambda: {stage: StageStats() for stage in STAGES}
+    )
+    max_queue_depth: Dict[str, int] = field(
+        default_factory=lambda: {"extracted": 0, "validated": 0}
+    )
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: int = 0
+    error_details: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _range_predicates(
+    key_column: str, bounds: List[Any]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Get the predicates of the key ranges between bounds.
+
+    The ranges don't overlap and together cover every row: the first also
+    takes rows with a NULL key.
+
+    Args:
+        key_column: Column the ranges are of
+        bounds: Ascending key values ending every range but the last
+
+    Returns:
+        List of (predicate, parameters) pairs, one per range
+    """
+    if not bounds:
+        return [("1 = 1", {})]
+
+    predicates = [
+        (
+            f"({key_column} <= ? OR {key_column} IS NULL)",
+            {"range_upper": bounds[0]},
+        )
+    ]
+    for lower, upper in zip(bounds, bounds[1:]):
+        predicates.append(
+            (
+                f"{key_column} > ? AND {key_column} <= ?",
+                {"range_lower": lower, "range_upper": upper},
+            )
+        )
+    predicates.append((f"{key_column} > ?", {"range_lower": bounds[-1]}))
+    return predicates
+
+
+def _register_metrics() -> bool:
+    """Register the pipeline metrics on first use."""
+    global _metrics_registered
+    if HAS_METRICS and not _metrics_registered:
+        try:
+            create_counter(
+                "as400_pipeline_records_total",
+                "Number of records handled by each AS400 pipeline stage",
+                ["stage"],
+            )
+            create_histogram(
+                "as400_pipeline_stage_seconds",
+                "Time each AS400 pipeline stage spends on a chunk in seconds",
+                ["stage"],
+            )
+            create_gauge(
+                "as400_pipeline_queue_depth",
+                "Chunks waiting between AS400 pipeline stages",
+                ["queue"],
+            )
+            _metrics_registered = True
+        except Exception as e:
+            logger.debug(f"Could not register AS400 pipeline metrics: {str(e)}")
+    return _metrics_registered
+
 
 class AS400Pipeline(Generic[T]):
     """
     Pipeline for synchronizing data from AS400 to the application database.
 
     Orchestrates the extract, transform, load (ETL) process for AS400 data.
+    Extraction, processing/validation and import run as concurrent stages
+    joined by bounded queues: rows are fetched in chunks while earlier
+    chunks are still being validated and imported, and at most a few
+    chunks are held in memory at a time.
+
+    With a change tracker, rows unchanged since the last sync are dropped
+    before processing.
     """
 
     def __init__(
@@ -40,6 +191,8 @@ class AS400Pipeline(Generic[T]):
         importer: Importer[T],
         dry_run: bool = False,
         chunk_size: int = 1000,
+        queue_size: int = 2,
+        change_tracker: Optional[ChangeTracker] = None,
     ) -> None:
         """
         Initialize the AS400 pipeline.
@@ -50,16 +203,20 @@ class AS400Pipeline(Generic[T]):
             importer: Importer for loading data
             dry_run: If True, don't actually import data
             chunk_size: Number of records to process at once
+            queue_size: Number of chunks that may wait between two stages
+            change_tracker: Tracker limiting the run to changed rows
         """
         self.connector = connector
         self.processor = processor
         self.importer = importer
         self.dry_run = dry_run
         self.chunk_size = chunk_size
+        self.queue_size = queue_size
+        self.change_tracker = change_tracker
 
         logger.debug(
             f"Initialized AS400Pipeline with {processor.__class__.__name__}, "
-            f"dry_run={dry_run}, chunk_size={chunk_size}"
+            f"dry_run={dry_run}, chunk_size={chunk_size}, queue_size={queue_size}"
         )
 
     async def run(
@@ -76,197 +233,469 @@ class AS400Pipeline(Generic[T]):
         Returns:
             Dictionary with sync results
         """
-        start_time = time.time()
+        query, params = self._changed_rows_query(query, params)
+        logger.info(
+            f"Starting data extraction with query: {query} "
+            f"{f'(limited to {limit} records)' if limit else ''}"
+        )
 
-        try:
-            # Step 1: Extract data from AS400
-            logger.info(
-                f"Starting data extraction with query: {query} "
-                f"{f'(limited to {limit} records)' if limit else ''}"
-            )
+        async def sources() -> List[_Source]:
+            return [(self.connector, query, params)]
 
-            extract_start = time.time()
-            await self.connector.connect()
-            raw_data = await self.connector.extract(query, limit=limit, **params)
-            extract_time = time.time() - extract_start
-
-            if not raw_data:
-                logger.warning("No data extracted from AS400")
-                await self.connector.close()
-                return {
-                    "success": True,
-                    "message": "No data extracted from AS400",
-                    "records_extracted": 0,
-                    "records_processed": 0,
-                    "records_validated": 0,
-                    "records_imported": 0,
-                    "extract_time": extract_time,
-                    "process_time": 0,
-                    "validate_time": 0,
-                    "import_time": 0,
-                    "total_time": time.time() - start_time,
-                }
+        return await self._execute(sources, limit)
 
-            logger.info(
-                f"Extracted {len(raw_data)} records in {extract_time:.2f} seconds"
-            )
+    async def run_partitioned(
+        self,
+        query: str,
+        key_column: str,
+        partitions: int,
+        max_workers: int = 4,
+        **params: Any,
+    ) -> Dict[str, Any]:
+        """
+        Run the sync pipeline over a query split into ranges of a key column.
+
+        Range bounds are the key values splitting the query's rows into
+        ``partitions`` equal parts. Each range is extracted on its own
+        connection, with its query going through the connector's checks,
+        and all ranges feed the same process and import stages.
+
+        Args:
+            query: SQL query or table name
+            key_column: Column whose ranges split the query's rows
+            partitions: Number of ranges
+            max_workers: Maximum number of ranges extracted at once
+            **params: Additional parameters for query
+
+        Returns:
+            Dictionary with the combined results of all ranges
+
+        Raises:
+            SecurityException: If the key column isn't a plain column name
+            ValueError: If partitions is less than 1
+        """
+        if not SQL_IDENTIFIER.match(key_column):
+            raise SecurityException(message=f"Invalid key column: {key_column}")
+        if partitions < 1:
+            raise ValueError(f"Partitions must be at least 1, got {partitions}")
+        if " " not in query:
+            # Table names go through the connector's allowed tables check
+            # before they are wrapped in range queries
+            query, _ = self.connector._validate_and_prepare_query(query, None)
+        query, params = self._changed_rows_query(query, params)
+        logger.info(
+            f"Starting partitioned data extraction with query: {query} "
+            f"({partitions} ranges of {key_column})"
+        )
 
-            # Process data in chunks if necessary
-            total_processed = 0
-            total_validated = 0
-            total_created = 0
-            total_updated = 0
-            total_errors = 0
-            error_details = []
-
-            process_start = time.time()
-            validate_time = 0
-            import_time = 0
-
-            # Calculate number of chunks
-            num_chunks = (len(raw_data) + self.chunk_size - 1) // self.chunk_size
-
-            for chunk_index in range(num_chunks):
-                # Get chunk of data
-                start_idx = chunk_index * self.chunk_size
-                end_idx = min(start_idx + self.chunk_size, len(raw_data))
-                chunk = raw_data[start_idx:end_idx]
-
-                logger.debug(
-                    f"Processing chunk {chunk_index + 1}/{num_chunks} "
-                    f"({len(chunk)} records)"
+        async def sources() -> List[_Source]:
+            bounds = await self._partition_bounds(query, key_column, partitions, params)
+            return [
+                (
+                    AS400Connector(self.connector.config),
+                    f"SELECT * FROM ({query}) AS RANGE_SOURCE WHERE {predicate}",
+                    {**params, **range_params},
                 )
+                for predicate, range_params in _range_predicates(key_column, bounds)
+            ]
 
-                # Step 2: Process chunk data
-                try:
-                    processed_data = await self.processor.process(chunk)
-                    total_processed += len(processed_data)
-
-                    # Step 3: Validate processed data
-                    validate_start = time.time()
-                    validated_data = await self.processor.validate(processed_data)
-                    validate_time += time.time() - validate_start
-                    total_validated += len(validated_data)
-
-                    # Step 4: Import validated data
-                    if not self.dry_run and validated_data:
-                        import_start = time.time()
-                        import_result = await self.importer.import_data(validated_data)
-                        import_time += time.time() - import_start
-
-                        total_created += import_result.get("created", 0)
-                        total_updated += import_result.get("updated", 0)
-                        total_errors += import_result.get("errors", 0)
-
-                        if (
-                            "error_details" in import_result
-                            and import_result["error_details"]
-                        ):
-                            # Adjust indices for chunk position
-                            for error in import_result["error_details"]:
-                                if "index" in error:
-                                    error["index"] += start_idx
-                            error_details.extend(import_result["error_details"])
-
-                except Exception as e:
-                    logger.error(f"Error processing chunk {chunk_index + 1}: {str(e)}")
-                    error_details.append(
-                        {
-                            "chunk": chunk_index + 1,
-                            "error": str(e),
-                        }
-                    )
-                    total_errors += 1
+        return await self._execute(sources, None, max_workers)
 
-            process_time = time.time() - process_start - validate_time - import_time
+    async def _execute(
+        self,
+        make_sources: Callable[[], Awaitable[List[_Source]]],
+        limit: Optional[int],
+        max_workers: int = 1,
+    ) -> Dict[str, Any]:
+        """Run the stages over the queries of make_sources and build the result."""
+        start_time = time.time()
+        state = _RunState()
+        sources: List[_Source] = []
 
-            # Close connection
-            await self.connector.close()
+        try:
+            await self.connector.connect()
+            sources = await make_sources()
+            _register_metrics()
+            await self._run_stages(sources, limit, state, max_workers)
 
-            # Calculate total time
-            total_time = time.time() - start_time
+            await self._close(sources)
+            result = self._result(state, time.time() - start_time)
+            if len(sources) > 1:
+                result["partitions"] = len(sources)
+            return result
 
-            # Prepare result
-            if self.dry_run:
-                # Dry run result
-                import_result = {
-                    "success": True,
-                    "created": 0,
-                    "updated": 0,
-                    "errors": 0,
-                    "total": total_validated,
-                    "message": "Dry run, no data imported",
-                }
-            else:
-                # Actual import result
-                import_result = {
-                    "success": total_errors == 0,
-                    "created": total_created,
-                    "updated": total_updated,
-                    "errors": total_errors,
-                    "total": total_validated,
-                    "message": "Import completed",
-                }
+        except AppException as e:
+            logger.error(f"Pipeline error: {str(e)}")
+            await self._close(sources)
+            raise
 
-            logger.info(
-                f"AS400 sync completed: "
-                f"extracted={len(raw_data)}, "
-                f"processed={total_processed}, "
-                f"validated={total_validated}, "
-                f"created={total_created}, "
-                f"updated={total_updated}, "
-                f"errors={total_errors}, "
-                f"time={total_time:.2f}s"
-            )
+        except Exception as e:
+            logger.error(f"Unexpected error in pipeline: {str(e)}", exc_info=True)
+            await self._close(sources)
 
+            total_time = time.time() - start_time
             return {
-                "success": import_result.get("success", False),
-                "message": import_result.get("message", "Import completed"),
-                "records_extracted": len(raw_data),
-                "records_processed": total_processed,
-                "records_validated": total_validated,
-                "records_imported": total_created + total_updated,
-                "records_created": total_created,
-                "records_updated": total_updated,
-                "records_with_errors": total_errors,
-                "error_details": error_details,
-                "extract_time": extract_time,
-                "process_time": process_time,
-                "validate_time": validate_time,
-                "import_time": import_time,
+                "success": False,
+                "message": f"Pipeline failed: {str(e)}",
+                "records_extracted": state.stages["extract"].records,
+                "records_processed": state.stages["process"].records,
+                "records_validated": state.stages["validate"].records,
+                "records_imported": state.created + state.updated,
                 "total_time": total_time,
-                "dry_run": self.dry_run,
+                "error": str(e),
                 "sync_timestamp": datetime.now().isoformat(),
             }
 
-        except AppException as e:
-            logger.error(f"Pipeline error: {str(e)}")
+    async def _run_stages(
+        self,
+        sources: List[_Source],
+        limit: Optional[int],
+        state: _RunState,
+        max_workers: int,
+    ) -> None:
+        """Run an extract stage per source, at most max_workers at a time,
+        feeding the shared process and import stages."""
+        extracted: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        validated: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def extract(connector: AS400Connector, query: str, params: Any) -> None:
+            async with semaphore:
+                try:
+                    await self._extract_stage(
+                        connector, query, limit, params, extracted, state
+                    )
+                finally:
+                    if connector is not self.connector:
+                        await connector.close()
+
+        async def extract_all() -> None:
+            extracts = [asyncio.create_task(extract(*source)) for source in sources]
+            try:
+                await asyncio.gather(*extracts)
+            finally:
+                for task in extracts:
+                    task.cancel()
+                await asyncio.gather(*extracts, return_exceptions=True)
+
+            stats = state.stages["extract"]
+            logger.info(
+                f"Extracted {stats.records} records in {stats.seconds:.2f} seconds"
+            )
+            await self._put(extracted, "extracted", _END, state)
+
+        tasks = [
+            asyncio.create_task(extract_all()),
+            asyncio.create_task(self._process_stage(extracted, validated, state)),
+            asyncio.create_task(self._import_stage(validated, state)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _extract_stage(
+        self,
+        connector: AS400Connector,
+        query: str,
+        limit: Optional[int],
+        params: Dict[str, Any],
+        sink: asyncio.Queue,
+        state: _RunState,
+    ) -> None:
+        """Fetch chunks of a query and queue them with their row offsets."""
+        stats = state.stages["extract"]
+        batches = connector.extract_batches(
+            query, batch_size=self.chunk_size, limit=limit, **params
+        )
+        async with contextlib.aclosing(batches):
+            while True:
+                fetch_start = time.time()
+                try:
+                    chunk = await batches.__anext__()
+                except StopAsyncIteration:
+                    break
+                offset = stats.records
+                self._record_stage(stats, "extract", len(chunk), fetch_start)
+                await self._put(sink, "extracted", (offset, chunk), state)
+
+    async def _partition_bounds(
+        self,
+        query: str,
+        key_column: str,
+        partitions: int,
+        params: Dict[str, Any],
+    ) -> List[Any]:
+        """Get the key values splitting a query's rows into equal ranges."""
+        bounds_query = (
+            f"SELECT MAX(PARTITION_KEY) AS UPPER_BOUND FROM ("
+            f"SELECT {key_column} AS PARTITION_KEY, "
+            f"NTILE({int(partitions)}) OVER (ORDER BY {key_column}) AS TILE "
+            f"FROM ({query}) AS PARTITION_SOURCE "
+            f"WHERE {key_column} IS NOT NULL"
+            f") AS TILES GROUP BY TILE ORDER BY UPPER_BOUND"
+        )
+        rows = await self.connector.extract(bounds_query, **params)
+        upper_bounds = [row["UPPER_BOUND"] for row in rows]
+
+        # Every range but the last ends at a bound; equal bounds would make
+        # empty ranges
+        bounds: List[Any] = []
+        for bound in upper_bounds[:-1]:
+            if not bounds or bound != bounds[-1]:
+                bounds.append(bound)
+        logger.debug(f"Split {key_column} into {len(bounds) + 1} ranges")
+        return bounds
+
+    def _changed_rows_query(
+        self, query: str, params: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Limit a query to changed rows if the pipeline tracks changes."""
+        if self.change_tracker is None or not self.change_tracker.limits_source:
+            return query, params
+        if " " not in query:
+            # Table names go through the connector's allowed tables check
+            # before they are wrapped in the changed rows query
+            query, _ = self.connector._validate_and_prepare_query(query, None)
+        query, changed_params = self.change_tracker.source_query(query)
+        return query, {**params, **changed_params}
+
+    async def _close(self, sources: List[_Source]) -> None:
+        """Close the pipeline's connector and those of its sources."""
+        connectors = [self.connector] + [
+            connector for connector, _, _ in sources if connector is not self.connector
+        ]
+        for connector in connectors:
             try:
-                await self.connector.close()
+                await connector.close()
             except Exception as close_error:
                 logger.error(f"Error closing connector: {str(close_error)}")
-            raise
 
+    async def _process_stage(
+        self, source: asyncio.Queue, sink: asyncio.Queue, state: _RunState
+    ) -> None:
+        """Process and validate chunks, queueing the valid records."""
+        chunk_index = 0
+        while True:
+            item = await source.get()
+            self._record_queue_depth(source, "extracted")
+            if item is _END:
+                await self._put(sink, "validated", _END, state)
+                return
+
+            offset, chunk = item
+            chunk_index += 1
+            logger.debug(f"Processing chunk {chunk_index} ({len(chunk)} records)")
+            earliest = (
+                self.change_tracker.earliest_timestamp(chunk)
+                if self.change_tracker is not None
+                else None
+            )
+            try:
+                digests: Dict[str, int] = {}
+                if self.change_tracker is not None:
+                    extracted_count = len(chunk)
+                    chunk, digests = await self.change_tracker.filter(chunk)
+                    state.unchanged += extracted_count - len(chunk)
+                    if not chunk:
+                        continue
+
+                process_start = time.time()
+                processed_data = await self.processor.process(chunk)
+                self._record_stage(
+                    state.stages["process"],
+                    "process",
+                    len(processed_data),
+                    process_start,
+                )
+
+                validate_start = time.time()
+                validated_data = await self.processor.validate(processed_data)
+                self._record_stage(
+                    state.stages["validate"],
+                    "validate",
+                    len(validated_data),
+                    validate_start,
+                )
+            except Exception as e:
+                logger.error(f"Error processing chunk {chunk_index}: {str(e)}")
+                state.error_details.append({"chunk": chunk_index, "error": str(e)})
+                state.errors += 1
+                self._hold_changes(earliest)
+                continue
+
+            # Rows dropped by processing or validation must not be recorded
+            # as imported, so their chunk's hashes are only kept if none were
+            # and the high-water mark stays before the chunk
+            if len(validated_data) != len(chunk):
+                digests = {}
+                self._hold_changes(earliest)
+
+            if not self.dry_run and validated_data:
+                await self._put(
+                    sink,
+                    "validated",
+                    (chunk_index, offset, validated_data, digests, earliest),
+                    state,
+                )
+
+    async def _import_stage(self, source: asyncio.Queue, state: _RunState) -> None:
+        """Import chunks of valid records one after another."""
+        while True:
+            item = await source.get()
+            self._record_queue_depth(source, "validated")
+            if item is _END:
+                return
+
+            chunk_index, offset, validated_data, digests, earliest = item
+            try:
+                import_start = time.time()
+                import_result = await self.importer.import_data(validated_data)
+                self._record_stage(
+                    state.stages["import"], "import", len(validated_data), import_start
+                )
+            except Exception as e:
+                logger.error(f"Error importing chunk {chunk_index}: {str(e)}")
+                state.error_details.append({"chunk": chunk_index, "error": str(e)})
+                state.errors += 1
+                self._hold_changes(earliest)
+                continue
+
+            state.created += import_result.get("created", 0)
+            state.updated += import_result.get("updated", 0)
+            state.unchanged += import_result.get("unchanged", 0)
+            state.errors += import_result.get("errors", 0)
+            if import_result.get("errors"):
+                self._hold_changes(earliest)
+            elif digests:
+                await self._accept_changes(chunk_index, digests)
+            for error in import_result.get("error_details") or []:
+                # Adjust indices for chunk position
+                if "index" in error:
+                    error["index"] += offset
+                state.error_details.append(error)
+
+    async def _accept_changes(self, chunk_index: int, digests: Dict[str, int]) -> None:
+        """Record the rows of an imported chunk as synced.
+
+        A failure here only means the rows are imported again next time.
+        """
+        try:
+            await self.change_tracker.accept(digests)
         except Exception as e:
-            logger.error(f"Unexpected error in pipeline: {str(e)}", exc_info=True)
+            logger.warning(
+                f"Could not store row hashes of chunk {chunk_index}: {str(e)}"
+            )
+
+    def _hold_changes(self, earliest: Any) -> None:
+        """Keep the high-water mark before a chunk that wasn't fully imported."""
+        if self.change_tracker is not None:
+            self.change_tracker.hold(earliest)
+
+    async def _put(
+        self, queue: asyncio.Queue, name: str, item: Any, state: _RunState
+    ) -> None:
+        """Queue an item for the next stage, waiting while the queue is full."""
+        await queue.put(item)
+        state.max_queue_depth[name] = max(state.max_queue_depth[name], queue.qsize())
+        self._record_queue_depth(queue, name)
+
+    @staticmethod
+    def _record_stage(
+        stats: StageStats, stage: str, records: int, start_time: float
+    ) -> None:
+        """Count a chunk handled by a stage."""
+        seconds = time.time() - start_time
+        stats.records += records
+        stats.batches += 1
+        stats.seconds += seconds
+        if _metrics_registered:
             try:
-                await self.connector.close()
-            except Exception as close_error:
-                logger.error(f"Error closing connector: {str(close_error)}")
+                increment_counter(
+                    "as400_pipeline_records_total", records, {"stage": stage}
+                )
+                observe_histogram(
+                    "as400_pipeline_stage_seconds", seconds, {"stage": stage}
+                )
+            except Exception as e:
+                logger.debug(f"Could not record AS400 pipeline metrics: {str(e)}")
 
-            total_time = time.time() - start_time
+    @staticmethod
+    def _record_queue_depth(queue: asyncio.Queue, name: str) -> None:
+        """Report the number of chunks waiting in a queue."""
+        if _metrics_registered:
+            try:
+                set_gauge("as400_pipeline_queue_depth", queue.qsize(), {"queue": name})
+            except Exception as e:
+                logger.debug(f"Could not record AS400 pipeline metrics: {str(e)}")
+
+    def _result(self, state: _RunState, total_time: float) -> Dict[str, Any]:
+        """Build the result of a completed run."""
+        stages = state.stages
+        records_extracted = stages["extract"].records
+        total_validated = stages["validate"].records
+        timings = {
+            "extract_time": stages["extract"].seconds,
+            "process_time": stages["process"].seconds,
+            "validate_time": stages["validate"].seconds,
+            "import_time": stages["import"].seconds,
+            "total_time": total_time,
+        }
+        stage_stats = {
+            "stages": {name: stats.as_dict() for name, stats in stages.items()},
+            "max_queue_depth": dict(state.max_queue_depth),
+        }
+
+        if not records_extracted:
+            logger.warning("No data extracted from AS400")
             return {
-                "success": False,
-                "message": f"Pipeline failed: {str(e)}",
+                "success": True,
+                "message": "No data extracted from AS400",
                 "records_extracted": 0,
                 "records_processed": 0,
                 "records_validated": 0,
                 "records_imported": 0,
-                "total_time": total_time,
-                "error": str(e),
-                "sync_timestamp": datetime.now().isoformat(),
+                **timings,
+                **stage_stats,
             }
 
+        if self.dry_run:
+            success, message = True, "Dry run, no data imported"
+        else:
+            success, message = state.errors == 0, "Import completed"
+
+        logger.info(
+            f"AS400 sync completed: "
+            f"extracted={records_extracted}, "
+            f"processed={stages['process'].records}, "
+            f"validated={total_validated}, "
+            f"created={state.created}, "
+            f"updated={state.updated}, "
+            f"unchanged={state.unchanged}, "
+            f"errors={state.errors}, "
+            f"time={total_time:.2f}s"
+        )
+
+        return {
+            "success": success,
+            "message": message,
+            "records_extracted": records_extracted,
+            "records_processed": stages["process"].records,
+            "records_validated": total_validated,
+            "records_imported": state.created + state.updated,
+            "records_created": state.created,
+            "records_updated": state.updated,
+            "records_unchanged": state.unchanged,
+            "records_with_errors": state.errors,
+            "error_details": state.error_details,
+            **timings,
+            **stage_stats,
+            "dry_run": self.dry_run,
+            "sync_timestamp": datetime.now().isoformat(),
+        }
+
 
 class ParallelAS400Pipeline(Generic[T]):
     """
@@ -407,3 +836,38 @@ class ParallelAS400Pipeline(Generic[T]):
             "total_time": total_time,
             "sync_timestamp": datetime.now().isoformat(),
         }
+
+    async def run_partitioned(
+        self, query: str, key_column: str, partitions: int, **params: Any
+    ) -> Dict[str, Any]:
+        """
+        Run the single pipeline over a query split into ranges of a key column.
+
+        Up to max_workers ranges are extracted at once, each on its own
+        connection, and all of them feed the pipeline's process and import
+        stages.
+
+        Args:
+            query: SQL query or table name
+            key_column: Column whose ranges split the query's rows
+            partitions: Number of ranges
+            **params: Additional parameters for query
+
+        Returns:
+            Dictionary with the combined results of all ranges
+
+        Raises:
+            ValueError: If the parallel pipeline doesn't hold exactly one pipeline
+        """
+        if len(self.pipelines) != 1:
+            raise ValueError(
+                "Partitioned runs need exactly one pipeline, "
+                f"got {len(self.pipelines)}"
+            )
+        return await self.pipelines[0].run_partitioned(
+            query,
+            key_column,
+            partitions,
+            max_workers=self.max_workers,
+            **params,
+        )
@@ -10,6 +10,9 @@ from app.logging import get_logger
 from typing import Any, Dict
 from uuid import UUID
 
+from app.core.cache.manager import cache_manager
+from app.core.cache.warming import cache_warmer
+from app.core.config import settings
 from app.core.events import subscribe_to_event
 from app.db.session import get_db
 from app.domains.autocare.fitment.repository import FitmentMappingRepository
@@ -74,6 +77,18 @@ async def handle_autocare_database_updated(payload: Dict[str, Any]) -> None:
     try:
         # Logic to handle database update
         # This could include refreshing caches, updating local copies, etc.
+        if db_type.lower() == "pcdb":
+            from app.fitment.dependencies import invalidate_pcdb_cache
+
+            invalidate_pcdb_cache()
+
+        # Drop cached lookups of the updated database and warm them again
+        source = db_type.lower()
+        count = await cache_manager.invalidate_tags([source], "tiered")
+        logger.info(f"Invalidated {count} cached {db_type} entries")
+        if settings.CACHE_WARMUP_ENABLED:
+            await cache_warmer.start(f"autocare.{source}")
+
         logger.info(f"Successfully processed {db_type} database update")
 
     except Exception as e:
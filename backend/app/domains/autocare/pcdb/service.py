@@ -66,6 +66,11 @@ class PCdbService:
             # Update the version to current date
             version = await self.repository.update_version(datetime.now())
 
+            # Cached PCDB positions and validators are now stale
+            from app.fitment.dependencies import invalidate_pcdb_cache
+
+            invalidate_pcdb_cache()
+
             logger.info(f"PCdb database updated to {version.version_date}")
             return {
                 "status": "success",
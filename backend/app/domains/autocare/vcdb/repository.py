@@ -240,6 +240,26 @@ class VehicleRepository(BaseRepository[Vehicle, uuid.UUID]):
 
         return await self.paginate(query, page, page_size)
 
+    async def get_vehicle_ids_since(self, min_year: int) -> List[int]:
+        """Get the IDs of vehicles from a year onwards, newest first.
+
+        Args:
+            min_year: Earliest vehicle year to include.
+
+        Returns:
+            List of vehicle IDs.
+        """
+        query = (
+            select(Vehicle.vehicle_id)
+            .join(BaseVehicle, Vehicle.base_vehicle_id == BaseVehicle.base_vehicle_id)
+            .join(Year, BaseVehicle.year_id == Year.year_id)
+            .where(Year.year >= min_year)
+            .order_by(desc(Year.year), Vehicle.vehicle_id)
+        )
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
     async def get_submodels_by_base_vehicle(
         self, base_vehicle_id: int
     ) -> List[SubModel]:
@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache.decorators import cached
+from app.core.config import settings
 from app.core.exceptions import ResourceNotFoundException
 from app.domains.autocare.exceptions import VCdbException
 from app.domains.autocare.schemas import AutocareImportParams
@@ -105,6 +107,7 @@ class VCdbService:
             raise VCdbException(f"Failed to import from ACES XML: {str(e)}") from e
 
     # Year operations
+    @cached(prefix="vcdb:years", ttl=86400, backend="tiered", tags=["vcdb"])
     async def get_years(self) -> List[Dict[str, Any]]:
         """Get all available vehicle years.
 
@@ -132,6 +135,7 @@ class VCdbService:
         makes = await self.repository.make_repo.get_all_makes()
         return [{"id": make.make_id, "name": make.name} for make in makes]
 
+    @cached(prefix="vcdb:makes", ttl=86400, backend="tiered", tags=["vcdb"])
     async def get_makes_by_year(self, year: int) -> List[Dict[str, Any]]:
         """Get all makes available for a specific year.
 
@@ -176,6 +180,7 @@ class VCdbService:
         return {"id": make.make_id, "name": make.name}
 
     # Model operations
+    @cached(prefix="vcdb:models", ttl=86400, backend="tiered", tags=["vcdb"])
     async def get_models_by_year_make(
         self, year: int, make_id: int
     ) -> List[Dict[str, Any]]:
@@ -397,6 +402,13 @@ class VCdbService:
             "model_id": base_vehicle.model_id,
         }
 
+    @cached(
+        prefix="vcdb:base_vehicle",
+        ttl=86400,
+        backend="tiered",
+        tags=["vcdb"],
+        negative_ttl=settings.CACHE_NEGATIVE_TTL,
+    )
     async def find_base_vehicle(
         self, year_id: int, make_id: int, model_id: int
     ) -> Optional[Dict[str, Any]]:
@@ -656,6 +668,7 @@ class VCdbService:
             ],
         }
 
+    @cached(prefix="vcdb:configurations", ttl=86400, backend="tiered", tags=["vcdb"])
     async def get_vehicle_configurations(
         self, vehicle_id: int
     ) -> Dict[str, List[Dict[str, Any]]]:
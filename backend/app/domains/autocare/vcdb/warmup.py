@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+"""VCdb cache warmup jobs.
+
+This module registers warmup jobs for the cached VCdb lookups behind the
+year/make/model selectors and vehicle detail pages. They run at startup
+and after a VCdb update, in order: years, makes per year, models per year
+and make, then configurations of recent vehicles. Each job reads the
+values warmed by the previous one from the cache.
+"""
+
+from typing import AsyncIterator, List, Tuple
+
+from app.core.cache.warming import cache_warmer
+from app.core.config import settings
+from app.db.session import get_db_context
+from app.domains.autocare.vcdb.service import VCdbService
+
+TRIGGERS = ("startup", "autocare.vcdb")
+
+
+async def _recent_years() -> List[int]:
+    """Get the most recent CACHE_WARMUP_VCDB_YEARS years, newest first."""
+    async with get_db_context() as db:
+        years = await VCdbService(db).get_years()
+    values = sorted({year["year"] for year in years}, reverse=True)
+    return values[: settings.CACHE_WARMUP_VCDB_YEARS]
+
+
+async def _year_args() -> AsyncIterator[Tuple[int]]:
+    """Yield each recent year."""
+    for year in await _recent_years():
+        yield (year,)
+
+
+async def _year_make_args() -> AsyncIterator[Tuple[int, int]]:
+    """Yield each make of each recent year."""
+    for year in await _recent_years():
+        async with get_db_context() as db:
+            makes = await VCdbService(db).get_makes_by_year(year)
+        for make in makes:
+            yield (year, make["id"])
+
+
+async def _vehicle_args() -> AsyncIterator[Tuple[int]]:
+    """Yield each vehicle of the recent years."""
+    years = await _recent_years()
+    if not years:
+        return
+    async with get_db_context() as db:
+        vehicle_repo = VCdbService(db).repository.vehicle_repo
+        vehicle_ids = await vehicle_repo.get_vehicle_ids_since(years[-1])
+    for vehicle_id in vehicle_ids:
+        yield (vehicle_id,)
+
+
+@cache_warmer.job("vcdb.years", triggers=TRIGGERS)
+async def warm_years() -> None:
+    """Warm the list of years."""
+    async with get_db_context() as db:
+        await VCdbService(db).get_years()
+
+
+@cache_warmer.job("vcdb.makes_by_year", args=_year_args, triggers=TRIGGERS)
+async def warm_makes_by_year(year: int) -> None:
+    """Warm the makes of a year."""
+    async with get_db_context() as db:
+        await VCdbService(db).get_makes_by_year(year)
+
+
+@cache_warmer.job("vcdb.models_by_year_make", args=_year_make_args, triggers=TRIGGERS)
+async def warm_models_by_year_make(year: int, make_id: int) -> None:
+    """Warm the models of a year and make."""
+    async with get_db_context() as db:
+        await VCdbService(db).get_models_by_year_make(year, make_id)
+
+
+@cache_warmer.job("vcdb.vehicle_configurations", args=_vehicle_args, triggers=TRIGGERS)
+async def warm_vehicle_configurations(vehicle_id: int) -> None:
+    """Warm the component configurations of a vehicle."""
+    async with get_db_context() as db:
+        await VCdbService(db).get_vehicle_configurations(vehicle_id)
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String, Text
-from sqlalchemy import UniqueConstraint, func, text
+from sqlalchemy import Index, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import expression
@@ -847,6 +847,17 @@ class ProductStock(Base):
     product: Mapped["Product"] = relationship("Product", back_populates="stock")
     warehouse: Mapped["Warehouse"] = relationship("Warehouse", back_populates="stock")
 
+    # One live stock level per product and warehouse, the bulk upsert key
+    __table_args__ = (
+        Index(
+            "uix_product_stock_product_warehouse",
+            "product_id",
+            "warehouse_id",
+            unique=True,
+            postgresql_where=text("NOT is_deleted"),
+        ),
+    )
+
     def __repr__(self) -> str:
         """Return string representation of ProductStock instance.
 
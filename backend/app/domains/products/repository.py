@@ -12,6 +12,8 @@ from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy import select, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache.decorators import cached
+from app.core.config import settings
 from app.domains.products.models import (
     Product,
     Brand,
@@ -38,9 +40,19 @@ class ProductRepository(BaseRepository[Product, uuid.UUID]):
         """
         super().__init__(model=Product, db=db)
 
+    @cached(
+        prefix="products:part_number",
+        backend="tiered",
+        tags=["products:missing"],
+        negative_ttl=settings.CACHE_NEGATIVE_TTL,
+        negative_only=True,
+    )
     async def find_by_part_number(self, part_number: str) -> Optional[Product]:
         """Find a product by exact part number.
 
+        Only unknown part numbers are cached, since products are bound to
+        the session that loaded them.
+
         Args:
             part_number: The part number to search for.
 
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache.manager import cache_manager
 from app.core.dependency_manager import get_dependency
 from app.domains.products.models import Product
 from app.domains.products.schemas import ProductCreate
@@ -50,4 +51,7 @@ class ProductService:
         await self.db.commit()
         await self.db.refresh(product)
 
+        # Part numbers cached as unknown may include this one
+        await cache_manager.invalidate_tags(["products:missing"], "tiered")
+
         return product
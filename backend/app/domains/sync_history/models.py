@@ -13,6 +13,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
+    BigInteger,
     DateTime,
     Float,
     ForeignKey,
@@ -51,6 +52,13 @@ class SyncStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class SyncMode(str, Enum):
+    """Modes of synchronization operations."""
+
+    FULL = "full"
+    INCREMENTAL = "incremental"
+
+
 class SyncSource(str, Enum):
     """Source systems for synchronization."""
 
@@ -75,6 +83,11 @@ class SyncHistory(Base):
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, index=True, default=SyncStatus.PENDING.value
     )
+    sync_mode: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=SyncMode.FULL.value
+    )
+    # Largest change timestamp seen, where incremental syncs resume from
+    high_water_mark: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     started_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
@@ -204,3 +217,38 @@ class SyncEvent(Base):
             f"event_type={self.event_type}, "
             f"sync_id={self.sync_id})>"
         )
+
+
+class SyncRowHash(Base):
+    """Content hash of a source row as of its last successful sync.
+
+    Incremental syncs skip rows whose hash hasn't changed.
+    """
+
+    __tablename__ = "sync_row_hash"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    source: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=SyncSource.AS400.value
+    )
+    row_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    digest: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "uix_sync_row_hash_entity_source_key",
+            entity_type,
+            source,
+            row_key,
+            unique=True,
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SyncRowHash(entity_type={self.entity_type}, "
+            f"row_key={self.row_key}, digest={self.digest})>"
+        )
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import select, desc, and_, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ResourceNotFoundException
@@ -19,6 +20,8 @@ from app.logging import get_logger
 from app.domains.sync_history.models import (
     SyncHistory,
     SyncEvent,
+    SyncMode,
+    SyncRowHash,
     SyncStatus,
     SyncEntityType,
     SyncSource,
@@ -46,6 +49,7 @@ class SyncHistoryRepository(BaseRepository[SyncHistory, uuid.UUID]):
         source: SyncSource = SyncSource.AS400,
         triggered_by_id: Optional[uuid.UUID] = None,
         details: Optional[Dict[str, Any]] = None,
+        mode: SyncMode = SyncMode.FULL,
     ) -> SyncHistory:
         """
         Create a new sync history record.
@@ -55,6 +59,7 @@ class SyncHistoryRepository(BaseRepository[SyncHistory, uuid.UUID]):
             source: Source system
             triggered_by_id: ID of user who triggered the sync
             details: Additional details
+            mode: Full or incremental sync
 
         Returns:
             Created sync history record
@@ -63,6 +68,7 @@ class SyncHistoryRepository(BaseRepository[SyncHistory, uuid.UUID]):
             entity_type=entity_type.value,
             source=source.value,
             status=SyncStatus.PENDING.value,
+            sync_mode=mode.value,
             triggered_by_id=triggered_by_id,
             details=details or {},
             started_at=datetime.now(),
@@ -86,6 +92,7 @@ class SyncHistoryRepository(BaseRepository[SyncHistory, uuid.UUID]):
         records_failed: int = 0,
         error_message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
+        high_water_mark: Optional[str] = None,
     ) -> SyncHistory:
         """
         Update the status of a sync operation.
@@ -99,6 +106,7 @@ class SyncHistoryRepository(BaseRepository[SyncHistory, uuid.UUID]):
             records_failed: Number of records failed
             error_message: Error message if any
             details: Additional details
+            high_water_mark: Largest change timestamp the sync imported
 
         Returns:
             Updated sync history record
@@ -130,6 +138,9 @@ class SyncHistoryRepository(BaseRepository[SyncHistory, uuid.UUID]):
         if error_message:
             sync.error_message = error_message
 
+        if high_water_mark:
+            sync.high_water_mark = high_water_mark
+
         if details:
             sync.details = (
                 details if sync.details is None else {**sync.details, **details}
@@ -248,6 +259,70 @@ class SyncHistoryRepository(BaseRepository[SyncHistory, uuid.UUID]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_last_completed_sync(
+        self,
+        entity_type: SyncEntityType,
+        source: SyncSource = SyncSource.AS400,
+        mode: Optional[SyncMode] = None,
+    ) -> Optional[SyncHistory]:
+        """
+        Get the latest completed sync of an entity type.
+
+        Args:
+            entity_type: Type of entity synced
+            source: Source system
+            mode: Filter by sync mode
+
+        Returns:
+            The sync history record, or None if there is none
+        """
+        conditions = [
+            SyncHistory.entity_type == entity_type.value,
+            SyncHistory.source == source.value,
+            SyncHistory.status == SyncStatus.COMPLETED.value,
+        ]
+
+        if mode:
+            conditions.append(SyncHistory.sync_mode == mode.value)
+
+        query = (
+            select(SyncHistory)
+            .where(and_(*conditions))
+            .order_by(desc(SyncHistory.started_at))
+            .limit(1)
+        )
+
+        result = await self.db.execute(query)
+        return result.scalars().first()
+
+    async def get_high_water_mark(
+        self, entity_type: SyncEntityType, source: SyncSource = SyncSource.AS400
+    ) -> Optional[str]:
+        """
+        Get the high-water mark incremental syncs of an entity type resume from.
+
+        Args:
+            entity_type: Type of entity synced
+            source: Source system
+
+        Returns:
+            The latest completed sync's high-water mark, or None if there is none
+        """
+        query = (
+            select(SyncHistory.high_water_mark)
+            .where(
+                SyncHistory.entity_type == entity_type.value,
+                SyncHistory.source == source.value,
+                SyncHistory.status == SyncStatus.COMPLETED.value,
+                SyncHistory.high_water_mark.is_not(None),
+            )
+            .order_by(desc(SyncHistory.started_at))
+            .limit(1)
+        )
+
+        result = await self.db.execute(query)
+        return result.scalars().first()
+
     async def get_active_syncs(
         self,
         entity_type: Optional[SyncEntityType] = None,
@@ -478,3 +553,89 @@ class SyncEventRepository(BaseRepository[SyncEvent, uuid.UUID]):
 
         result = await self.db.execute(query)
         return list(result.scalars().all())
+
+
+class SyncRowHashRepository(BaseRepository[SyncRowHash, uuid.UUID]):
+    """Repository for the content hashes of synced source rows."""
+
+    # Rows written per statement, within PostgreSQL's bind parameter limit
+    _SAVE_BATCH_SIZE = 5000
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            db: SQLAlchemy async session
+        """
+        super().__init__(model=SyncRowHash, db=db)
+
+    async def get_digests(
+        self,
+        entity_type: SyncEntityType,
+        row_keys: List[str],
+        source: SyncSource = SyncSource.AS400,
+    ) -> Dict[str, int]:
+        """
+        Get the stored hashes of source rows.
+
+        Args:
+            entity_type: Type of entity synced
+            row_keys: Keys of the rows
+            source: Source system
+
+        Returns:
+            Dictionary mapping row keys to hashes, for rows that have one
+        """
+        if not row_keys:
+            return {}
+
+        query = select(SyncRowHash.row_key, SyncRowHash.digest).where(
+            SyncRowHash.entity_type == entity_type.value,
+            SyncRowHash.source == source.value,
+            SyncRowHash.row_key.in_(row_keys),
+        )
+
+        result = await self.db.execute(query)
+        return {row_key: digest for row_key, digest in result}
+
+    async def save_digests(
+        self,
+        entity_type: SyncEntityType,
+        digests: Dict[str, int],
+        source: SyncSource = SyncSource.AS400,
+    ) -> None:
+        """
+        Store the hashes of source rows, replacing existing ones.
+
+        Args:
+            entity_type: Type of entity synced
+            digests: Dictionary mapping row keys to hashes
+            source: Source system
+        """
+        items = list(digests.items())
+        for start in range(0, len(items), self._SAVE_BATCH_SIZE):
+            statement = insert(SyncRowHash).values(
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "entity_type": entity_type.value,
+                        "source": source.value,
+                        "row_key": row_key,
+                        "digest": digest,
+                        "is_deleted": False,
+                    }
+                    for row_key, digest in items[start : start + self._SAVE_BATCH_SIZE]
+                ]
+            )
+            await self.db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["entity_type", "source", "row_key"],
+                    set_={
+                        "digest": statement.excluded.digest,
+                        "updated_at": func.now(),
+                    },
+                )
+            )
+
+        logger.debug(f"Saved {len(items)} row hashes for {entity_type.value}")
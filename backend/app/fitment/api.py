@@ -7,19 +7,24 @@ This module provides the FastAPI endpoints for the fitment module.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+import tempfile
+import time
+from typing import IO, Any, AsyncIterator, Dict, List, Optional, Set
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Body,
     Depends,
     File,
     HTTPException,
     Path,
     Query,
+    Request,
     UploadFile,
     status,
 )
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.logging import get_logger
@@ -30,10 +35,13 @@ from app.domains.model_mapping.schemas import (
 )
 from .exceptions import ConfigurationError, FitmentError
 from .mapper import FitmentMappingEngine
-from .models import ValidationStatus
+from .models import RevalidationSummary, ValidationStatus
 
 logger = get_logger("app.fitment.api")
 
+# Streamed input larger than this is spooled to disk instead of memory
+_SPOOL_MAX_MEMORY = 1024 * 1024
+
 router = APIRouter(prefix="/api/v1/fitment", tags=["fitment"])
 
 
@@ -63,6 +71,8 @@ class ProcessFitmentResponse(BaseModel):
     valid_count: int
     warning_count: int
     error_count: int
+    chunk_timings: List[Dict[str, Any]] = Field(default_factory=list)
+    processing_seconds: float = 0.0
 
 
 class UploadModelMappingsResponse(BaseModel):
@@ -138,10 +148,11 @@ async def process_fitment(
         HTTPException: If processing fails
     """
     try:
-        # Process the applications
-        results = mapping_engine.batch_process_applications(
+        # Process the applications off the event loop
+        batch = await mapping_engine.batch_process_applications_async(
             request.application_texts, request.part_terminology_id
         )
+        results = batch.results
 
         # Count results by status
         valid_count = 0
@@ -170,13 +181,17 @@ async def process_fitment(
             for app_results in results.values():
                 all_results.extend(app_results)
 
-            await mapping_engine.save_mapping_results(request.product_id, all_results)
+            await mapping_engine.save_mapping_results(
+                request.product_id, all_results, request.part_terminology_id
+            )
 
         return {
             "results": serialized_results,
             "valid_count": valid_count,
             "warning_count": warning_count,
             "error_count": error_count,
+            "chunk_timings": [t.model_dump() for t in batch.chunk_timings],
+            "processing_seconds": batch.total_seconds,
         }
     except FitmentError as e:
         logger.error(f"Fitment error: {str(e)}")
@@ -192,8 +207,165 @@ async def process_fitment(
         ) from e
 
 
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a stream of bytes into stripped, non-empty text lines.
+
+    Args:
+        chunks: Async iterator of raw byte chunks
+
+    Yields:
+        Decoded lines without surrounding whitespace
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            text = line.decode("utf-8").strip()
+            if text:
+                yield text
+
+    text = buffer.decode("utf-8").strip()
+    if text:
+        yield text
+
+
+async def _iter_upload(file: UploadFile, size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """
+    Read an uploaded file in fixed-size chunks.
+
+    Args:
+        file: Uploaded file
+        size: Chunk size in bytes
+
+    Yields:
+        Raw byte chunks
+    """
+    while chunk := await file.read(size):
+        yield chunk
+
+
+async def _spool(chunks: AsyncIterator[bytes]) -> IO[bytes]:
+    """
+    Copy a stream of bytes to a temporary file, rewound for reading.
+
+    Args:
+        chunks: Async iterator of raw byte chunks
+
+    Returns:
+        Temporary file, kept in memory up to _SPOOL_MAX_MEMORY bytes
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY)
+    try:
+        async for chunk in chunks:
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+async def _iter_spool(spool: IO[bytes], size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """
+    Read a spooled file in fixed-size chunks.
+
+    Args:
+        spool: File returned by _spool
+        size: Chunk size in bytes
+
+    Yields:
+        Raw byte chunks
+    """
+    while chunk := spool.read(size):
+        yield chunk
+
+
+@router.post("/process/stream")
+async def process_fitment_stream(
+    request: Request,
+    part_terminology_id: int = Query(...),
+    file: Optional[UploadFile] = File(None),
+    mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
+):
+    """
+    Process fitment application texts and stream the results as NDJSON.
+
+    Application texts are read one per line, either from an uploaded file or
+    from the raw request body. Each processed application is written as one
+    JSON line as soon as it is ready, followed by a final summary line.
+
+    The input is spooled to a temporary file before the response starts:
+    FastAPI closes uploaded files once the endpoint returns, and the request
+    body can't be read while the response is streaming. Processing of the
+    spooled input is paced by how fast the client consumes the output.
+
+    Args:
+        request: Incoming request, used for the raw body stream
+        part_terminology_id: Part terminology ID
+        file: Optional uploaded file with one application text per line
+        mapping_engine: Mapping engine instance
+
+    Returns:
+        Streaming NDJSON response
+
+    Raises:
+        HTTPException: If the mapping engine is not configured
+    """
+    if not mapping_engine.parser:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": "Mapping engine not configured", "details": {}},
+        )
+
+    spool = await _spool(_iter_upload(file) if file is not None else request.stream())
+
+    async def generate() -> AsyncIterator[str]:
+        started = time.perf_counter()
+        counts = {"valid_count": 0, "warning_count": 0, "error_count": 0}
+        applications = 0
+
+        try:
+            async for app_text, results in mapping_engine.stream_process_applications(
+                _iter_lines(_iter_spool(spool)), part_terminology_id
+            ):
+                applications += 1
+                for result in results:
+                    if result.status == ValidationStatus.VALID:
+                        counts["valid_count"] += 1
+                    elif result.status == ValidationStatus.WARNING:
+                        counts["warning_count"] += 1
+                    elif result.status == ValidationStatus.ERROR:
+                        counts["error_count"] += 1
+
+                record = {
+                    "type": "result",
+                    "line": applications,
+                    "application_text": app_text,
+                    "results": mapping_engine.serialize_validation_results(results),
+                }
+                yield json.dumps(record) + "\n"
+        except Exception as e:
+            logger.error(f"Error streaming fitment results: {str(e)}")
+            yield json.dumps({"type": "error", "message": str(e)}) + "\n"
+        finally:
+            spool.close()
+
+        summary = {
+            "type": "summary",
+            "applications": applications,
+            **counts,
+            "processing_seconds": time.perf_counter() - started,
+        }
+        yield json.dumps(summary) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.post("/upload-model-mappings", response_model=UploadModelMappingsResponse)
 async def upload_model_mappings(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
 ):
@@ -201,6 +373,7 @@ async def upload_model_mappings(
     Upload model mappings JSON file.
 
     Args:
+        background_tasks: Background tasks used to re-validate affected fitments
         file: JSON file with model mappings
         mapping_engine: Mapping engine instance
 
@@ -230,8 +403,9 @@ async def upload_model_mappings(
                 json_data
             )
 
-            # Refresh mappings in the engine
-            await mapping_engine.refresh_mappings()
+            # Refresh mappings in the engine and re-validate affected fitments
+            patterns = await mapping_engine.refresh_mappings()
+            _schedule_revalidation(background_tasks, mapping_engine, patterns)
 
             return {
                 "message": "Model mappings uploaded and configured successfully",
@@ -347,6 +521,7 @@ async def list_model_mappings(
 )
 async def create_model_mapping(
     mapping_data: ModelMappingCreate,
+    background_tasks: BackgroundTasks,
     mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
 ):
     """
@@ -354,6 +529,7 @@ async def create_model_mapping(
 
     Args:
         mapping_data: Mapping data
+        background_tasks: Background tasks used to re-validate affected fitments
         mapping_engine: Mapping engine instance
 
     Returns:
@@ -368,8 +544,9 @@ async def create_model_mapping(
             mapping_data.pattern, mapping_data.mapping, mapping_data.priority
         )
 
-        # Refresh mappings in the engine
-        await mapping_engine.refresh_mappings()
+        # Refresh mappings in the engine and re-validate affected fitments
+        patterns = await mapping_engine.refresh_mappings()
+        _schedule_revalidation(background_tasks, mapping_engine, patterns)
 
         # Return the created mapping
         async with mapping_engine.db_service.get_session() as session:
@@ -403,6 +580,7 @@ async def create_model_mapping(
 async def update_model_mapping(
     mapping_id: int,
     mapping_data: ModelMappingUpdate,
+    background_tasks: BackgroundTasks,
     mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
 ):
     """
@@ -411,6 +589,7 @@ async def update_model_mapping(
     Args:
         mapping_id: ID of the mapping to update
         mapping_data: Updated mapping data
+        background_tasks: Background tasks used to re-validate affected fitments
         mapping_engine: Mapping engine instance
 
     Returns:
@@ -438,8 +617,9 @@ async def update_model_mapping(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Mapping not found"
             )
 
-        # Refresh mappings in the engine
-        await mapping_engine.refresh_mappings()
+        # Refresh mappings in the engine and re-validate affected fitments
+        patterns = await mapping_engine.refresh_mappings()
+        _schedule_revalidation(background_tasks, mapping_engine, patterns)
 
         # Return the updated mapping
         async with mapping_engine.db_service.get_session() as session:
@@ -471,13 +651,16 @@ async def update_model_mapping(
 
 @router.delete("/model-mappings/{mapping_id}", status_code=status.HTTP_200_OK)
 async def delete_model_mapping(
-    mapping_id: int, mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine)
+    mapping_id: int,
+    background_tasks: BackgroundTasks,
+    mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
 ):
     """
     Delete a model mapping.
 
     Args:
         mapping_id: ID of the mapping to delete
+        background_tasks: Background tasks used to re-validate affected fitments
         mapping_engine: Mapping engine instance
 
     Returns:
@@ -495,8 +678,9 @@ async def delete_model_mapping(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Mapping not found"
             )
 
-        # Refresh mappings in the engine
-        await mapping_engine.refresh_mappings()
+        # Refresh mappings in the engine and re-validate affected fitments
+        patterns = await mapping_engine.refresh_mappings()
+        _schedule_revalidation(background_tasks, mapping_engine, patterns)
 
         return {"message": "Mapping deleted successfully"}
     except HTTPException:
@@ -517,6 +701,7 @@ async def delete_model_mapping(
 
 @router.post("/refresh-mappings", status_code=status.HTTP_200_OK)
 async def refresh_mappings(
+    background_tasks: BackgroundTasks,
     mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
 ):
     """
@@ -525,6 +710,7 @@ async def refresh_mappings(
     This allows for updating mappings without restarting the server.
 
     Args:
+        background_tasks: Background tasks used to re-validate affected fitments
         mapping_engine: Mapping engine instance
 
     Returns:
@@ -534,8 +720,9 @@ async def refresh_mappings(
         HTTPException: If refresh fails
     """
     try:
-        # Refresh mappings in the engine
-        await mapping_engine.refresh_mappings()
+        # Refresh mappings in the engine and re-validate affected fitments
+        patterns = await mapping_engine.refresh_mappings()
+        _schedule_revalidation(background_tasks, mapping_engine, patterns)
 
         return {"message": "Mappings refreshed successfully"}
     except FitmentError as e:
@@ -552,6 +739,133 @@ async def refresh_mappings(
         ) from e
 
 
+def _schedule_revalidation(
+    background_tasks: BackgroundTasks,
+    mapping_engine: FitmentMappingEngine,
+    patterns: Set[str],
+) -> None:
+    """
+    Re-validate the saved fitments affected by changed patterns after responding.
+
+    Args:
+        background_tasks: Background tasks of the current request
+        mapping_engine: Mapping engine instance
+        patterns: Patterns that were added, changed or removed
+    """
+    if patterns:
+        background_tasks.add_task(_revalidate_patterns, mapping_engine, patterns)
+
+
+async def _revalidate_patterns(
+    mapping_engine: FitmentMappingEngine, patterns: Set[str]
+) -> None:
+    """
+    Background task that re-validates fitments, logging instead of raising.
+
+    Args:
+        mapping_engine: Mapping engine instance
+        patterns: Patterns that were added, changed or removed
+    """
+    try:
+        await mapping_engine.revalidate_patterns(patterns)
+    except Exception as e:
+        logger.error(f"Background re-validation failed: {str(e)}")
+
+
+class RevalidateRequest(BaseModel):
+    """Request body for re-validating fitments affected by patterns."""
+
+    patterns: List[str] = Field(..., min_items=1)
+
+
+@router.post("/revalidate", response_model=RevalidationSummary)
+async def revalidate_fitments(
+    request: RevalidateRequest = Body(...),
+    mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
+):
+    """
+    Re-process the saved applications affected by the given mapping patterns.
+
+    Args:
+        request: Request body with the changed patterns
+        mapping_engine: Mapping engine instance
+
+    Returns:
+        Re-validation summary
+
+    Raises:
+        HTTPException: If re-validation fails
+    """
+    try:
+        return await mapping_engine.revalidate_patterns(request.patterns)
+    except FitmentError as e:
+        logger.error(f"Fitment error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e), "details": e.details},
+        ) from e
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        ) from e
+
+
+@router.get("/vehicle-index", response_model=Dict[str, Any])
+async def get_vehicle_index_stats(
+    mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
+):
+    """
+    Get size and memory usage statistics for the VCDB vehicle index.
+
+    Args:
+        mapping_engine: Mapping engine instance
+
+    Returns:
+        Vehicle index statistics
+    """
+    return mapping_engine.get_vehicle_index_stats()
+
+
+@router.post("/vehicle-index/reload", response_model=Dict[str, Any])
+async def reload_vehicle_index(
+    mapping_engine: FitmentMappingEngine = Depends(get_mapping_engine),
+):
+    """
+    Reload the VCDB vehicle index from the VCDB database.
+
+    Args:
+        mapping_engine: Mapping engine instance
+
+    Returns:
+        Vehicle index statistics after reloading
+
+    Raises:
+        HTTPException: If the index is disabled or reloading fails
+    """
+    if not mapping_engine.use_vehicle_index:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The VCDB vehicle index is disabled in configuration",
+        )
+
+    try:
+        return await mapping_engine.load_vehicle_index()
+    except FitmentError as e:
+        logger.error(f"Fitment error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e), "details": e.details},
+        ) from e
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        ) from e
+
+
 @router.get("/pcdb-positions/{terminology_id}", response_model=List[Dict[str, Any]])
 async def get_pcdb_positions(
     terminology_id: int = Path(...),
@@ -571,7 +885,9 @@ async def get_pcdb_positions(
         HTTPException: If retrieval fails
     """
     try:
-        positions = mapping_engine.get_pcdb_positions(terminology_id)
+        positions = await mapping_engine.db_service.pcdb_client.run_async(
+            mapping_engine.get_pcdb_positions, terminology_id
+        )
 
         # Convert to dictionaries
         serialized = []
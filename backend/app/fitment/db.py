@@ -7,35 +7,107 @@ VCDB and PCDB databases for fitment data.
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
-import pyodbc
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.logging import get_logger
 from .exceptions import DatabaseError
+from .index import VehicleIndex
 from .models import PCDBPosition, PartTerminology, VCDBVehicle
+from .parser import application_key
+from .snapshot import SnapshotDBClient
+
+try:
+    import pyodbc
+except ImportError:  # pragma: no cover - depends on the host's ODBC driver
+    pyodbc = None
 
 logger = get_logger("app.fitment.db")
 
+T = TypeVar("T")
+
 
 class AccessDBClient:
-    """Client for Microsoft Access databases (VCDB and PCDB)."""
+    """
+    Client for Microsoft Access databases (VCDB and PCDB).
 
-    def __init__(self, db_path: str) -> None:
+    Connections are kept in a small thread-safe pool and reused across
+    queries. At most pool_size connections are open at once; further
+    callers wait for one to be returned. Idle connections are closed after
+    max_idle_seconds, and
+    connections that have been idle for a while are health-checked before
+    being handed out again.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        pool_size: int = 4,
+        max_idle_seconds: float = 300.0,
+        health_check_seconds: float = 30.0,
+        fetch_size: int = 1000,
+        acquire_timeout: float = 30.0,
+    ) -> None:
         """
         Initialize the Access DB client.
 
         Args:
             db_path: Path to the MS Access database file
+            pool_size: Maximum number of connections open at once, also the
+                number of threads used for async queries
+            max_idle_seconds: Idle time after which a pooled connection is closed
+            health_check_seconds: Idle time after which a pooled connection is
+                checked before reuse
+            fetch_size: Rows fetched per round trip by iter_query
+            acquire_timeout: Seconds to wait for a connection when pool_size
+                connections are in use
+
+        Raises:
+            DatabaseError: If pyodbc is not available
         """
+        if pyodbc is None:
+            raise DatabaseError(
+                "pyodbc is not available; install an ODBC driver or configure "
+                "a fitment snapshot"
+            )
+
         self.db_path = db_path
         self.connection_string = (
             f"Driver={{Microsoft Access Driver (*.mdb, *.accdb)}};" f"DBQ={db_path};"
         )
+        self.pool_size = max(1, pool_size)
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_seconds = health_check_seconds
+        self.fetch_size = max(1, fetch_size)
+        self.acquire_timeout = acquire_timeout
+
+        # Checked-out connections, bounded by pool_size
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        # Idle connections with the time they were returned, most recent last
+        self._idle: Deque[Tuple[pyodbc.Connection, float]] = deque()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def connect(self) -> pyodbc.Connection:
         """
@@ -52,6 +124,131 @@ class AccessDBClient:
         except pyodbc.Error as e:
             raise DatabaseError(f"Failed to connect to Access DB: {str(e)}") from e
 
+    def _is_healthy(self, conn: pyodbc.Connection) -> bool:
+        """
+        Check whether a pooled connection is still usable.
+
+        Args:
+            conn: Connection to check
+
+        Returns:
+            True if the connection answered a trivial query
+        """
+        try:
+            conn.cursor().tables(tableType="TABLE").fetchone()
+            return True
+        except pyodbc.Error:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: pyodbc.Connection) -> None:
+        """Close a connection, ignoring errors."""
+        try:
+            conn.close()
+        except pyodbc.Error:
+            pass
+
+    def _acquire(self) -> pyodbc.Connection:
+        """
+        Take a healthy connection from the pool, or open a new one.
+
+        Waits while pool_size connections are checked out. Every connection
+        returned must be handed back with _release or _discard.
+
+        Returns:
+            ODBC connection to the database
+
+        Raises:
+            DatabaseError: If no connection is free within acquire_timeout, or
+                connecting fails
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise DatabaseError(
+                f"Timed out waiting for a connection to {self.db_path} "
+                f"({self.pool_size} in use)"
+            )
+        try:
+            return self._take_connection()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _take_connection(self) -> pyodbc.Connection:
+        """Take a healthy idle connection, or open a new one."""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, returned_at = self._idle.pop()
+
+            idle_for = time.monotonic() - returned_at
+            if idle_for > self.max_idle_seconds:
+                self._close_quietly(conn)
+                continue
+            if idle_for > self.health_check_seconds and not self._is_healthy(conn):
+                self._close_quietly(conn)
+                continue
+            return conn
+
+        return self.connect()
+
+    def _release(self, conn: pyodbc.Connection) -> None:
+        """
+        Return a connection to the pool, evicting stale idle connections.
+
+        Args:
+            conn: Connection to return
+        """
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            # Oldest connections sit at the left end of the deque
+            while self._idle and now - self._idle[0][1] > self.max_idle_seconds:
+                evicted.append(self._idle.popleft()[0])
+            if len(self._idle) < self.pool_size:
+                self._idle.append((conn, now))
+            else:
+                evicted.append(conn)
+
+        self._slots.release()
+
+        for stale in evicted:
+            self._close_quietly(stale)
+
+    def _discard(self, conn: pyodbc.Connection) -> None:
+        """
+        Close a checked-out connection instead of returning it to the pool.
+
+        Args:
+            conn: Connection to close
+        """
+        self._slots.release()
+        self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[pyodbc.Connection]:
+        """
+        Borrow a pooled connection for the duration of a block.
+
+        Connections are only returned to the pool when the block completes
+        normally; otherwise they are closed.
+
+        Yields:
+            ODBC connection to the database
+
+        Raises:
+            DatabaseError: If connection fails
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        except BaseException:
+            # Never reuse a connection that failed or has a half-read result set
+            self._discard(conn)
+            raise
+        else:
+            self._release(conn)
+
     def query(self, sql: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
         """
         Execute a SQL query on the Access database.
@@ -67,7 +264,7 @@ class AccessDBClient:
             DatabaseError: If query execution fails
         """
         try:
-            with self.connect() as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 if params:
                     cursor.execute(sql, params)
@@ -82,16 +279,143 @@ class AccessDBClient:
                 for row in cursor.fetchall():
                     rows.append(dict(zip(columns, row)))
 
+                cursor.close()
                 return rows
         except pyodbc.Error as e:
             raise DatabaseError(f"Error executing query: {str(e)}") from e
 
+    def iter_query(
+        self,
+        sql: str,
+        params: Optional[Tuple] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a SQL query and yield rows as they are fetched.
+
+        Rows are read with fetchmany, so only one batch is held in memory at
+        a time. The connection stays checked out until the iterator is
+        exhausted or closed.
+
+        Args:
+            sql: SQL query to execute
+            params: Optional parameters for the query
+            batch_size: Rows per fetch (defaults to the client's fetch_size)
+
+        Yields:
+            Dictionaries representing the query rows
+
+        Raises:
+            DatabaseError: If query execution fails
+        """
+        size = batch_size or self.fetch_size
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                if params:
+                    cursor.execute(sql, params)
+                else:
+                    cursor.execute(sql)
+
+                columns = [column[0] for column in cursor.description]
+
+                while True:
+                    batch = cursor.fetchmany(size)
+                    if not batch:
+                        break
+                    for row in batch:
+                        yield dict(zip(columns, row))
+
+                cursor.close()
+        except pyodbc.Error as e:
+            raise DatabaseError(f"Error executing query: {str(e)}") from e
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the bounded executor used for async queries."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size, thread_name_prefix="access-db"
+                )
+            return self._executor
+
+    async def run_async(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking callable on the client's bounded executor.
+
+        At most pool_size calls run at once, so async endpoints can share
+        the client without blocking the event loop or opening unbounded
+        connections.
+
+        Args:
+            func: Blocking callable to run
+            *args: Positional arguments for the callable
+
+        Returns:
+            The callable's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+
+    async def aquery(
+        self, sql: str, params: Optional[Tuple] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a SQL query without blocking the event loop.
+
+        Args:
+            sql: SQL query to execute
+            params: Optional parameters for the query
+
+        Returns:
+            List of dictionaries representing the query results
+
+        Raises:
+            DatabaseError: If query execution fails
+        """
+        return await self.run_async(self.query, sql, params)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            Dictionary with pool size settings and idle connection count
+        """
+        with self._lock:
+            idle = len(self._idle)
+        return {
+            "db_path": self.db_path,
+            "pool_size": self.pool_size,
+            "idle_connections": idle,
+            "max_idle_seconds": self.max_idle_seconds,
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections and stop the async executor."""
+        with self._lock:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            executor, self._executor = self._executor, None
+
+        for conn in idle:
+            self._close_quietly(conn)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
 
 class FitmentDBService:
     """Service for database operations related to fitment data."""
 
     def __init__(
-        self, vcdb_path: str, pcdb_path: str, sqlalchemy_url: Optional[str] = None
+        self,
+        vcdb_path: str,
+        pcdb_path: str,
+        sqlalchemy_url: Optional[str] = None,
+        pool_size: int = 4,
+        max_idle_seconds: float = 300.0,
+        fetch_size: int = 1000,
+        snapshot_path: Optional[str] = None,
     ) -> None:
         """
         Initialize the fitment database service.
@@ -100,9 +424,29 @@ class FitmentDBService:
             vcdb_path: Path to the VCDB MS Access database
             pcdb_path: Path to the PCDB MS Access database
             sqlalchemy_url: Optional SQLAlchemy URL for async database
+            pool_size: Pooled connections (and async query threads) per Access database
+            max_idle_seconds: Idle time after which pooled connections are closed
+            fetch_size: Rows fetched per round trip when streaming query results
+            snapshot_path: Optional SQLite snapshot to read VCDB and PCDB data
+                from instead of the Access databases
         """
-        self.vcdb_client = AccessDBClient(vcdb_path)
-        self.pcdb_client = AccessDBClient(pcdb_path)
+        self.vcdb_path = vcdb_path
+        self.pcdb_path = pcdb_path
+        self.snapshot_path = snapshot_path
+
+        client_options = {
+            "pool_size": pool_size,
+            "max_idle_seconds": max_idle_seconds,
+            "fetch_size": fetch_size,
+        }
+        if snapshot_path:
+            # Both databases live in the same snapshot file
+            self.vcdb_client = SnapshotDBClient(snapshot_path, **client_options)
+            self.pcdb_client = SnapshotDBClient(snapshot_path, **client_options)
+        else:
+            self.vcdb_client = AccessDBClient(vcdb_path, **client_options)
+            self.pcdb_client = AccessDBClient(pcdb_path, **client_options)
+        self.vehicle_index = VehicleIndex()
 
         # Set up SQLAlchemy async engine if URL provided
         if sqlalchemy_url:
@@ -134,6 +478,85 @@ class FitmentDBService:
         finally:
             await session.close()
 
+    def close(self) -> None:
+        """Close pooled Access connections."""
+        self.vcdb_client.close()
+        self.pcdb_client.close()
+
+    async def aget_vcdb_vehicles(
+        self,
+        year: Optional[int] = None,
+        make: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> List[VCDBVehicle]:
+        """
+        Get vehicles from VCDB without blocking the event loop.
+
+        Args:
+            year: Optional year to filter by
+            make: Optional make to filter by
+            model: Optional model to filter by
+
+        Returns:
+            List of VCDBVehicle objects
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        return await self.vcdb_client.run_async(
+            self.get_vcdb_vehicles, year, make, model
+        )
+
+    async def aget_pcdb_part_terminology(self, terminology_id: int) -> PartTerminology:
+        """
+        Get part terminology information from PCDB without blocking the event loop.
+
+        Args:
+            terminology_id: ID of the part terminology
+
+        Returns:
+            PartTerminology object
+
+        Raises:
+            DatabaseError: If query fails or part terminology not found
+        """
+        return await self.pcdb_client.run_async(
+            self.get_pcdb_part_terminology, terminology_id
+        )
+
+    async def aget_pcdb_positions(
+        self, position_ids: Optional[List[int]] = None
+    ) -> List[PCDBPosition]:
+        """
+        Get position information from PCDB without blocking the event loop.
+
+        Args:
+            position_ids: Optional list of position IDs to filter by
+
+        Returns:
+            List of PCDBPosition objects
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        return await self.pcdb_client.run_async(self.get_pcdb_positions, position_ids)
+
+    def load_vehicle_index(self) -> Dict[str, Any]:
+        """
+        Load (or reload) the in-memory VCDB vehicle index.
+
+        Once loaded, get_vcdb_vehicles answers lookups from memory instead
+        of querying the VCDB database.
+
+        Returns:
+            Index statistics after loading
+
+        Raises:
+            DatabaseError: If loading fails
+        """
+        self.vehicle_index.load(self.vcdb_client)
+        return self.vehicle_index.stats()
+
     def get_vcdb_vehicles(
         self,
         year: Optional[int] = None,
@@ -154,6 +577,10 @@ class FitmentDBService:
         Raises:
             DatabaseError: If query fails
         """
+        # Serve from the in-memory index when it has been loaded
+        if self.vehicle_index.loaded:
+            return self.vehicle_index.find(year, make, model)
+
         # Build the base query
         sql = """
         SELECT
@@ -545,14 +972,30 @@ class FitmentDBService:
                 raise DatabaseError(f"Failed to import mappings: {str(e)}") from e
 
     async def save_fitment_results(
-        self, product_id: str, fitments: List[Dict[str, Any]]
+        self,
+        product_id: str,
+        fitments: List[Dict[str, Any]],
+        applications: Optional[Dict[str, Optional[str]]] = None,
+        part_terminology_id: Optional[int] = None,
+        replace_all: bool = True,
     ) -> bool:
         """
         Save fitment results to the database.
 
+        Each application text is also recorded in the fitment application
+        index together with the model mapping pattern that produced its
+        fitments, so that a mapping change can be traced back to the
+        applications it affects.
+
         Args:
             product_id: ID of the product
             fitments: List of fitment dictionaries
+            applications: Optional mapping of application text to the model
+                mapping pattern used (None if no pattern matched)
+            part_terminology_id: ID of the part terminology the applications
+                were processed for
+            replace_all: Replace all fitments of the product; if False, only
+                the fitments of the given applications are replaced
 
         Returns:
             True if successful
@@ -563,13 +1006,50 @@ class FitmentDBService:
         if not self.engine:
             raise DatabaseError("Async database not configured")
 
+        # Failed applications arrive with their raw text; save them under the
+        # same key as parsed ones so re-validation replaces them
+        normalized: Dict[str, Optional[str]] = {}
+        for application_text, mapping_pattern in (applications or {}).items():
+            key = application_key(application_text)
+            if normalized.get(key) is None:
+                normalized[key] = mapping_pattern
+        applications = normalized
+
         async with self.get_session() as session:
             try:
-                # First delete any existing fitments for this product
-                await session.execute(
-                    text("DELETE FROM product_fitments WHERE product_id = :product_id"),
-                    {"product_id": product_id},
-                )
+                if replace_all:
+                    # First delete any existing fitments for this product
+                    await session.execute(
+                        text(
+                            "DELETE FROM product_fitments WHERE product_id = :product_id"
+                        ),
+                        {"product_id": product_id},
+                    )
+                    await session.execute(
+                        text(
+                            "DELETE FROM fitment_application_index "
+                            "WHERE product_id = :product_id"
+                        ),
+                        {"product_id": product_id},
+                    )
+                else:
+                    # Only replace the re-processed applications, including
+                    # rows saved before their trailing semicolon was dropped
+                    for table in ("product_fitments", "fitment_application_index"):
+                        for application_text in applications:
+                            await session.execute(
+                                text(
+                                    f"DELETE FROM {table} "
+                                    "WHERE product_id = :product_id "
+                                    "AND application_text IN "
+                                    "(:application_text, :raw_application_text)"
+                                ),
+                                {
+                                    "product_id": product_id,
+                                    "application_text": application_text,
+                                    "raw_application_text": f"{application_text};",
+                                },
+                            )
 
                 # Then insert the new fitments
                 for fitment in fitments:
@@ -578,10 +1058,12 @@ class FitmentDBService:
                             """
                         INSERT INTO product_fitments (
                             product_id, vcdb_vehicle_id, pcdb_position_ids,
-                            year, make, model, submodel, notes
+                            year, make, model, submodel, notes,
+                            application_text, mapping_pattern
                         ) VALUES (
                             :product_id, :vcdb_vehicle_id, :pcdb_position_ids,
-                            :year, :make, :model, :submodel, :notes
+                            :year, :make, :model, :submodel, :notes,
+                            :application_text, :mapping_pattern
                         )
                         """
                         ),
@@ -596,6 +1078,30 @@ class FitmentDBService:
                             "model": fitment.get("model"),
                             "submodel": fitment.get("submodel"),
                             "notes": fitment.get("notes"),
+                            "application_text": fitment.get("application_text"),
+                            "mapping_pattern": fitment.get("mapping_pattern"),
+                        },
+                    )
+
+                # Record which pattern each application was mapped with
+                for application_text, mapping_pattern in applications.items():
+                    await session.execute(
+                        text(
+                            """
+                        INSERT INTO fitment_application_index (
+                            product_id, part_terminology_id,
+                            application_text, mapping_pattern
+                        ) VALUES (
+                            :product_id, :part_terminology_id,
+                            :application_text, :mapping_pattern
+                        )
+                        """
+                        ),
+                        {
+                            "product_id": product_id,
+                            "part_terminology_id": part_terminology_id,
+                            "application_text": application_text,
+                            "mapping_pattern": mapping_pattern,
                         },
                     )
 
@@ -605,3 +1111,58 @@ class FitmentDBService:
                 await session.rollback()
                 logger.error(f"Error saving fitment results: {str(e)}")
                 raise DatabaseError(f"Failed to save fitment results: {str(e)}") from e
+
+    async def get_applications_for_patterns(
+        self, patterns: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the saved applications that a change to the given patterns affects.
+
+        An application is affected if it was mapped with one of the patterns,
+        or if its text contains one of them (a new or changed pattern may
+        now be the best match, including for applications that previously
+        had no mapping).
+
+        Args:
+            patterns: Model mapping patterns that were added, changed or removed
+
+        Returns:
+            List of dictionaries with product_id, part_terminology_id and
+            application_text
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        if not self.engine:
+            raise DatabaseError("Async database not configured")
+        if not patterns:
+            return []
+
+        conditions = []
+        params: Dict[str, Any] = {}
+        for i, pattern in enumerate(patterns):
+            escaped = (
+                pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            conditions.append(
+                f"mapping_pattern = :pattern_{i} "
+                f"OR application_text LIKE :like_{i} ESCAPE '\\'"
+            )
+            params[f"pattern_{i}"] = pattern
+            params[f"like_{i}"] = f"%{escaped}%"
+
+        sql = f"""
+        SELECT DISTINCT product_id, part_terminology_id, application_text
+        FROM fitment_application_index
+        WHERE {" OR ".join(f"({condition})" for condition in conditions)}
+        """
+
+        async with self.get_session() as session:
+            try:
+                result = await session.execute(text(sql), params)
+                return [dict(row) for row in result.mappings()]
+            except Exception as e:
+                logger.error(f"Error getting applications for patterns: {str(e)}")
+                raise DatabaseError(
+                    f"Failed to get applications for patterns: {str(e)}"
+                ) from e
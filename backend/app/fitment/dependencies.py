@@ -36,17 +36,30 @@ def get_fitment_db_service() -> FitmentDBService:
         app_settings.SQLALCHEMY_DATABASE_URI
     )
 
-    if not vcdb_path or not pcdb_path:
-        raise ConfigurationError(
-            "VCDB_PATH and PCDB_PATH environment variables must be set"
-        )
+    # A snapshot replaces both Access databases, so their paths are not resolved
+    snapshot_path = getattr(app_settings, "FITMENT_SNAPSHOT_PATH", None)
+    if snapshot_path:
+        snapshot_path = _resolve_file_path(snapshot_path)
+    else:
+        if not vcdb_path or not pcdb_path:
+            raise ConfigurationError(
+                "VCDB_PATH and PCDB_PATH environment variables must be set"
+            )
 
-    # Try to resolve file paths if they don't exist
-    vcdb_path = _resolve_file_path(vcdb_path)
-    pcdb_path = _resolve_file_path(pcdb_path)
+        # Try to resolve file paths if they don't exist
+        vcdb_path = _resolve_file_path(vcdb_path)
+        pcdb_path = _resolve_file_path(pcdb_path)
 
     # Create and return the service
-    return FitmentDBService(vcdb_path, pcdb_path, sqlalchemy_url)
+    return FitmentDBService(
+        vcdb_path,
+        pcdb_path,
+        sqlalchemy_url,
+        pool_size=getattr(app_settings, "FITMENT_ACCESS_POOL_SIZE", 4),
+        max_idle_seconds=getattr(app_settings, "FITMENT_ACCESS_MAX_IDLE_SECONDS", 300),
+        fetch_size=getattr(app_settings, "FITMENT_ACCESS_FETCH_SIZE", 1000),
+        snapshot_path=snapshot_path,
+    )
 
 
 def _resolve_file_path(file_path: str) -> str:
@@ -99,7 +112,14 @@ def get_fitment_mapping_engine() -> FitmentMappingEngine:
     db_service = get_fitment_db_service()
 
     # Create the mapping engine
-    engine = FitmentMappingEngine(db_service)
+    engine = FitmentMappingEngine(
+        db_service,
+        use_vehicle_index=getattr(app_settings, "FITMENT_VEHICLE_INDEX_ENABLED", False),
+        parallel_workers=getattr(app_settings, "FITMENT_PARALLEL_WORKERS", 0),
+        parallel_chunk_size=getattr(app_settings, "FITMENT_PARALLEL_CHUNK_SIZE", 200),
+        parallel_min_batch=getattr(app_settings, "FITMENT_PARALLEL_MIN_BATCH", 500),
+        validator_cache_size=getattr(app_settings, "FITMENT_CACHE_SIZE", 100),
+    )
 
     return engine
 
@@ -115,6 +135,7 @@ async def initialize_mapping_engine() -> None:
     # Try to configure from database
     try:
         await engine.configure_from_database()
+        await _load_vehicle_index(engine)
         return
     except Exception as e:
         # Log the error but continue to try file-based configuration
@@ -150,3 +171,50 @@ async def initialize_mapping_engine() -> None:
             raise ConfigurationError(
                 f"Failed to configure mapping engine: {str(e)}"
             ) from e
+
+        await _load_vehicle_index(engine)
+
+
+async def _load_vehicle_index(engine: FitmentMappingEngine) -> None:
+    """
+    Load the VCDB vehicle index at startup if it is enabled.
+
+    Failures are logged and lookups fall back to querying the VCDB database.
+
+    Args:
+        engine: The mapping engine to load the index for
+    """
+    if not engine.use_vehicle_index:
+        return
+
+    from app.logging import get_logger
+
+    logger = get_logger("app.fitment.dependencies")
+    try:
+        stats = await engine.load_vehicle_index()
+        logger.info(
+            f"Loaded VCDB vehicle index: {stats['vehicles']} vehicles, "
+            f"{stats['memory_bytes']} bytes"
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load VCDB vehicle index: {str(e)}")
+
+
+def shutdown_mapping_engine() -> None:
+    """
+    Release resources held by the mapping engine.
+
+    This should be called during application shutdown.
+    """
+    if get_fitment_mapping_engine.cache_info().currsize:
+        get_fitment_mapping_engine().shutdown()
+
+
+def invalidate_pcdb_cache() -> None:
+    """
+    Invalidate the mapping engine's PCDB caches after a PCDB update.
+
+    Does nothing if the mapping engine has not been created yet.
+    """
+    if get_fitment_mapping_engine.cache_info().currsize:
+        get_fitment_mapping_engine().invalidate_pcdb_cache()
@@ -0,0 +1,356 @@
+"""
+In-memory VCDB vehicle index.
+
+This module provides a compact, array-backed copy of the VCDB vehicle
+table so that year/make/model lookups can be answered without a round
+trip to the Access database for every expanded fitment.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.logging import get_logger
+from .exceptions import DatabaseError
+from .models import VCDBVehicle
+
+logger = get_logger("app.fitment.index")
+
+# Sentinel stored in the integer columns for NULL submodel/region IDs
+NULL_ID = -1
+
+VEHICLE_ROWS_SQL = """
+SELECT
+    v.VehicleID as id,
+    v.BaseVehicleID as base_vehicle_id,
+    bv.YearID as year,
+    bv.MakeID as make_id,
+    bv.ModelID as model_id,
+    v.SubmodelID as submodel_id,
+    v.RegionID as region_id
+FROM
+    Vehicle v
+    JOIN BaseVehicle bv ON v.BaseVehicleID = bv.BaseVehicleID
+"""
+
+MAKES_SQL = "SELECT MakeID as id, MakeName as name FROM Make"
+MODELS_SQL = "SELECT ModelID as id, ModelName as name FROM Model"
+SUBMODELS_SQL = "SELECT SubModelID as id, SubModelName as name FROM SubModel"
+
+
+class _VehicleTable:
+    """Immutable columnar snapshot of the VCDB vehicle table."""
+
+    __slots__ = (
+        "vehicle_id",
+        "base_vehicle_id",
+        "year",
+        "make_id",
+        "model_id",
+        "submodel_id",
+        "region_id",
+        "makes",
+        "models",
+        "submodels",
+        "slices",
+        "year_keys",
+        "loaded_at",
+        "load_seconds",
+    )
+
+    def __init__(
+        self,
+        rows: List[Tuple[int, int, int, int, int, int, int]],
+        makes: Dict[int, str],
+        models: Dict[int, str],
+        submodels: Dict[int, str],
+        load_seconds: float,
+    ) -> None:
+        """
+        Build the column arrays and group slices from raw rows.
+
+        Args:
+            rows: Vehicle tuples of (vehicle_id, base_vehicle_id, year,
+                make_id, model_id, submodel_id, region_id)
+            makes: Make names keyed by MakeID
+            models: Model names keyed by ModelID
+            submodels: Submodel names keyed by SubModelID
+            load_seconds: Time taken to read the source data
+        """
+        # Sort by (year, make, model) so each combination is a contiguous slice
+        rows.sort(key=lambda r: (r[2], r[3], r[4], r[0]))
+
+        self.vehicle_id = array("l", (r[0] for r in rows))
+        self.base_vehicle_id = array("l", (r[1] for r in rows))
+        self.year = array("h", (r[2] for r in rows))
+        self.make_id = array("l", (r[3] for r in rows))
+        self.model_id = array("l", (r[4] for r in rows))
+        self.submodel_id = array("l", (r[5] for r in rows))
+        self.region_id = array("l", (r[6] for r in rows))
+
+        self.makes = {k: sys.intern(v) for k, v in makes.items()}
+        self.models = {k: sys.intern(v) for k, v in models.items()}
+        self.submodels = {k: sys.intern(v) for k, v in submodels.items()}
+
+        self.slices: Dict[Tuple[int, int, int], Tuple[int, int]] = {}
+        self.year_keys: Dict[int, List[Tuple[int, int]]] = {}
+
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i][2:5] != rows[start][2:5]:
+                year, make_id, model_id = rows[start][2:5]
+                self.slices[(year, make_id, model_id)] = (start, i)
+                self.year_keys.setdefault(year, []).append((make_id, model_id))
+                start = i
+
+        self.loaded_at = time.time()
+        self.load_seconds = load_seconds
+
+    def __len__(self) -> int:
+        """Return the number of vehicle rows."""
+        return len(self.vehicle_id)
+
+
+class VehicleIndex:
+    """
+    Array-backed in-memory index of VCDB vehicles.
+
+    Answers the same year/make/model queries as
+    FitmentDBService.get_vcdb_vehicles: the year is matched exactly and
+    make/model are matched as case-insensitive substrings, mirroring the
+    ``LIKE '%value%'`` filters of the SQL query.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty vehicle index."""
+        self._table: Optional[_VehicleTable] = None
+        self._reload_lock = threading.Lock()
+        self._make_matches: Dict[str, frozenset] = {}
+        self._model_matches: Dict[str, frozenset] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been populated."""
+        return self._table is not None
+
+    def load(self, client: Any) -> None:
+        """
+        Load (or reload) the index from a VCDB client.
+
+        The new table is built completely before being swapped in, so
+        concurrent lookups keep using the previous snapshot until the
+        reload finishes.
+
+        Args:
+            client: AccessDBClient connected to the VCDB database; the vehicle
+                rows are streamed with iter_query
+
+        Raises:
+            DatabaseError: If reading the VCDB tables fails
+        """
+        with self._reload_lock:
+            started = time.perf_counter()
+            try:
+                makes = {r["id"]: r["name"] for r in client.query(MAKES_SQL)}
+                models = {r["id"]: r["name"] for r in client.query(MODELS_SQL)}
+                submodels = {r["id"]: r["name"] for r in client.query(SUBMODELS_SQL)}
+                rows = [
+                    (
+                        r["id"],
+                        r["base_vehicle_id"],
+                        r["year"],
+                        r["make_id"],
+                        r["model_id"],
+                        NULL_ID if r["submodel_id"] is None else r["submodel_id"],
+                        NULL_ID if r["region_id"] is None else r["region_id"],
+                    )
+                    for r in client.iter_query(VEHICLE_ROWS_SQL)
+                ]
+            except Exception as e:
+                logger.error(f"Error loading VCDB vehicle index: {str(e)}")
+                raise DatabaseError(
+                    f"Failed to load VCDB vehicle index: {str(e)}"
+                ) from e
+
+            table = _VehicleTable(
+                rows, makes, models, submodels, time.perf_counter() - started
+            )
+            self._table = table
+            self._make_matches = {}
+            self._model_matches = {}
+
+            logger.info(
+                f"Loaded VCDB vehicle index with {len(table)} vehicles "
+                f"in {table.load_seconds:.2f}s"
+            )
+
+    def clear(self) -> None:
+        """Drop the loaded data so lookups fall back to the database."""
+        with self._reload_lock:
+            self._table = None
+            self._make_matches = {}
+            self._model_matches = {}
+
+    def _matching_ids(
+        self, names: Dict[int, str], cache: Dict[str, frozenset], text: str
+    ) -> frozenset:
+        """
+        Get the IDs whose name contains the given text, case-insensitively.
+
+        Args:
+            names: Names keyed by ID
+            cache: Memo of previous lookups for this name table
+            text: Text to search for
+
+        Returns:
+            Set of matching IDs
+        """
+        needle = text.casefold()
+        ids = cache.get(needle)
+        if ids is None:
+            ids = frozenset(k for k, v in names.items() if needle in v.casefold())
+            cache[needle] = ids
+        return ids
+
+    def find(
+        self,
+        year: Optional[int] = None,
+        make: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> List[VCDBVehicle]:
+        """
+        Find vehicles matching the specified criteria.
+
+        Args:
+            year: Optional year to filter by
+            make: Optional make to filter by
+            model: Optional model to filter by
+
+        Returns:
+            List of VCDBVehicle objects
+
+        Raises:
+            DatabaseError: If the index has not been loaded
+        """
+        table = self._table
+        if table is None:
+            raise DatabaseError("VCDB vehicle index not loaded")
+
+        make_ids = (
+            self._matching_ids(table.makes, self._make_matches, make) if make else None
+        )
+        model_ids = (
+            self._matching_ids(table.models, self._model_matches, model)
+            if model
+            else None
+        )
+        if (make_ids is not None and not make_ids) or (
+            model_ids is not None and not model_ids
+        ):
+            return []
+
+        keys: List[Tuple[int, int, int]]
+        if year:
+            pairs = table.year_keys.get(year, [])
+            if (
+                make_ids is not None
+                and model_ids is not None
+                and len(make_ids) * len(model_ids) < len(pairs)
+            ):
+                # Direct probes are cheaper than scanning the year's groups
+                keys = [
+                    (year, mk, md)
+                    for mk in make_ids
+                    for md in model_ids
+                    if (year, mk, md) in table.slices
+                ]
+            else:
+                keys = [
+                    (year, mk, md)
+                    for mk, md in pairs
+                    if (make_ids is None or mk in make_ids)
+                    and (model_ids is None or md in model_ids)
+                ]
+        else:
+            keys = [
+                key
+                for key in table.slices
+                if (make_ids is None or key[1] in make_ids)
+                and (model_ids is None or key[2] in model_ids)
+            ]
+
+        vehicles: List[VCDBVehicle] = []
+        for key in keys:
+            start, end = table.slices[key]
+            make_name = table.makes.get(key[1], "")
+            model_name = table.models.get(key[2], "")
+            for i in range(start, end):
+                submodel_id = table.submodel_id[i]
+                region_id = table.region_id[i]
+                vehicles.append(
+                    VCDBVehicle.model_construct(
+                        id=table.vehicle_id[i],
+                        base_vehicle_id=table.base_vehicle_id[i],
+                        submodel_id=None if submodel_id == NULL_ID else submodel_id,
+                        region_id=None if region_id == NULL_ID else region_id,
+                        year=key[0],
+                        make=make_name,
+                        model=model_name,
+                        submodel=table.submodels.get(submodel_id),
+                    )
+                )
+
+        return vehicles
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get size and memory usage statistics for the index.
+
+        Returns:
+            Dictionary with row counts and approximate memory usage in bytes
+        """
+        table = self._table
+        if table is None:
+            return {"loaded": False, "vehicles": 0, "memory_bytes": 0}
+
+        columns = {
+            name: getattr(table, name).buffer_info()[1] * getattr(table, name).itemsize
+            for name in (
+                "vehicle_id",
+                "base_vehicle_id",
+                "year",
+                "make_id",
+                "model_id",
+                "submodel_id",
+                "region_id",
+            )
+        }
+        strings = sum(
+            sys.getsizeof(v)
+            for names in (table.makes, table.models, table.submodels)
+            for v in names.values()
+        ) + sum(
+            sys.getsizeof(names)
+            for names in (table.makes, table.models, table.submodels)
+        )
+        groups = sys.getsizeof(table.slices) + sys.getsizeof(table.year_keys)
+        groups += sum(sys.getsizeof(v) for v in table.year_keys.values())
+
+        return {
+            "loaded": True,
+            "vehicles": len(table),
+            "makes": len(table.makes),
+            "models": len(table.models),
+            "submodels": len(table.submodels),
+            "groups": len(table.slices),
+            "column_bytes": columns,
+            "string_bytes": strings,
+            "group_bytes": groups,
+            "memory_bytes": sum(columns.values()) + strings + groups,
+            "loaded_at": table.loaded_at,
+            "load_seconds": table.load_seconds,
+        }
@@ -7,20 +7,39 @@ fitment data with VCDB and PCDB records.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from app.logging import get_logger
 from .db import FitmentDBService
 from .exceptions import MappingError
+from .matcher import changed_patterns
 from .models import (
+    ChunkTiming,
+    ParallelBatchResult,
     PartTerminology,
     PCDBPosition,
+    RevalidationSummary,
     ValidationResult,
     ValidationStatus,
     VCDBVehicle,
 )
-from .parser import FitmentParser
+from .parallel import ParallelBatchProcessor
+from .parser import FitmentParser, application_key
 from .validator import FitmentValidator
 
 logger = get_logger("app.fitment.mapper")
@@ -29,16 +48,41 @@ logger = get_logger("app.fitment.mapper")
 class FitmentMappingEngine:
     """Engine for mapping fitment data to VCDB and PCDB records."""
 
-    def __init__(self, db_service: FitmentDBService) -> None:
+    def __init__(
+        self,
+        db_service: FitmentDBService,
+        use_vehicle_index: bool = False,
+        parallel_workers: int = 0,
+        parallel_chunk_size: int = 200,
+        parallel_min_batch: int = 500,
+        validator_cache_size: int = 100,
+    ) -> None:
         """
         Initialize the mapping engine.
 
         Args:
             db_service: Database service for fitment data
+            use_vehicle_index: Whether to answer VCDB vehicle lookups from
+                an in-memory index instead of querying per fitment
+            parallel_workers: Worker processes for parallel batches (0 uses
+                the CPU count)
+            parallel_chunk_size: Application texts per worker chunk
+            parallel_min_batch: Smallest batch sent to the process pool by the
+                async batch API; smaller batches run on a worker thread
+            validator_cache_size: Maximum number of part terminologies whose
+                validators (and PCDB positions) are kept in memory
         """
         self.db_service = db_service
+        self.use_vehicle_index = use_vehicle_index
         self.model_mappings: Dict[str, List[str]] = {}
+        self.mappings_version = 0
+        self.pcdb_version = 0
         self.parser: Optional[FitmentParser] = None
+        self.validator_cache_size = max(1, validator_cache_size)
+        self._validators: OrderedDict[int, FitmentValidator] = OrderedDict()
+        self._validators_lock = threading.Lock()
+        self.parallel_min_batch = parallel_min_batch
+        self.parallel = ParallelBatchProcessor(parallel_workers, parallel_chunk_size)
 
     def configure(self, model_mappings_path: str) -> None:
         """
@@ -50,6 +94,7 @@ class FitmentMappingEngine:
         self.model_mappings = self.db_service.load_model_mappings_from_excel(
             model_mappings_path
         )
+        self.mappings_version += 1
         self.parser = FitmentParser(self.model_mappings)
 
     @lru_cache(maxsize=100)
@@ -71,7 +116,6 @@ class FitmentMappingEngine:
         except Exception as e:
             raise MappingError(f"Failed to get part terminology: {str(e)}") from e
 
-    @lru_cache(maxsize=100)
     def get_pcdb_positions(self, terminology_id: int) -> List[PCDBPosition]:
         """
         Get PCDB positions for a part terminology.
@@ -85,12 +129,64 @@ class FitmentMappingEngine:
         Raises:
             MappingError: If positions not found
         """
+        return list(self.get_validator(terminology_id).pcdb_positions)
+
+    def get_validator(self, terminology_id: int) -> FitmentValidator:
+        """
+        Get the shared validator for a part terminology.
+
+        Validators, including their PCDB positions and position index, are
+        built once per terminology and kept in a bounded LRU cache until
+        PCDB data changes.
+
+        Args:
+            terminology_id: ID of the part terminology
+
+        Returns:
+            FitmentValidator for the part terminology
+
+        Raises:
+            MappingError: If PCDB positions cannot be loaded
+        """
+        with self._validators_lock:
+            validator = self._validators.get(terminology_id)
+            if validator is not None:
+                self._validators.move_to_end(terminology_id)
+                return validator
+            pcdb_version = self.pcdb_version
+
         try:
             terminology = self.get_part_terminology(terminology_id)
-            return self.db_service.get_pcdb_positions(terminology.valid_positions)
+            positions = self.db_service.get_pcdb_positions(terminology.valid_positions)
         except Exception as e:
             raise MappingError(f"Failed to get PCDB positions: {str(e)}") from e
 
+        validator = FitmentValidator(terminology_id, positions)
+
+        with self._validators_lock:
+            if self.pcdb_version != pcdb_version:
+                # PCDB data changed while building; don't cache stale positions
+                return validator
+            self._validators[terminology_id] = validator
+            self._validators.move_to_end(terminology_id)
+            while len(self._validators) > self.validator_cache_size:
+                self._validators.popitem(last=False)
+
+        return validator
+
+    def invalidate_pcdb_cache(self) -> None:
+        """
+        Drop cached part terminologies, PCDB positions and validators.
+
+        This should be called whenever PCDB data is updated. Parallel batch
+        workers are restarted on their next use so they reload as well.
+        """
+        with self._validators_lock:
+            self._validators.clear()
+            self.pcdb_version += 1
+        self.get_part_terminology.cache_clear()
+        logger.info("Invalidated PCDB position and validator caches")
+
     def get_vcdb_vehicles(
         self,
         year: Optional[int] = None,
@@ -117,7 +213,10 @@ class FitmentMappingEngine:
             raise MappingError(f"Failed to get VCDB vehicles: {str(e)}") from e
 
     def process_application(
-        self, application_text: str, terminology_id: int
+        self,
+        application_text: str,
+        terminology_id: int,
+        validator: Optional[FitmentValidator] = None,
     ) -> List[ValidationResult]:
         """
         Process a part application string and validate against databases.
@@ -125,6 +224,7 @@ class FitmentMappingEngine:
         Args:
             application_text: Raw part application text
             terminology_id: ID of the part terminology
+            validator: Optional prebuilt validator for the part terminology
 
         Returns:
             List of ValidationResult objects
@@ -142,11 +242,12 @@ class FitmentMappingEngine:
             # Process into fitments
             fitments = self.parser.process_application(part_app)
 
-            # Get PCDB positions for validation
-            pcdb_positions = self.get_pcdb_positions(terminology_id)
+            if validator is None:
+                # Shared validator with preloaded PCDB positions
+                validator = self.get_validator(terminology_id)
 
-            # Create validator
-            validator = FitmentValidator(terminology_id, pcdb_positions)
+            # Check the positions of all fitments in one pass
+            validator.check_positions(fitment.positions for fitment in fitments)
 
             # Validate each fitment
             validation_results = []
@@ -187,21 +288,187 @@ class FitmentMappingEngine:
         results = {}
 
         for text in application_texts:
-            try:
-                results[text] = self.process_application(text, terminology_id)
-            except Exception as e:
-                logger.error(f"Error processing application '{text}': {str(e)}")
-                results[text] = [
-                    ValidationResult(
-                        status=ValidationStatus.ERROR,
-                        message=f"Processing error: {str(e)}",
-                        original_text=text,
-                        fitment=None,
-                    )
-                ]
+            results[text] = self.process_application_safe(text, terminology_id)
 
         return results
 
+    def process_application_safe(
+        self,
+        application_text: str,
+        terminology_id: int,
+        validator: Optional[FitmentValidator] = None,
+    ) -> List[ValidationResult]:
+        """
+        Process a part application string, reporting failures as results.
+
+        Args:
+            application_text: Raw part application text
+            terminology_id: ID of the part terminology
+            validator: Optional prebuilt validator for the part terminology
+
+        Returns:
+            List of ValidationResult objects, or a single ERROR result if
+            processing failed
+        """
+        try:
+            return self.process_application(application_text, terminology_id, validator)
+        except Exception as e:
+            logger.error(f"Error processing application '{application_text}': {str(e)}")
+            return [
+                ValidationResult(
+                    status=ValidationStatus.ERROR,
+                    message=f"Processing error: {str(e)}",
+                    original_text=application_text,
+                    fitment=None,
+                )
+            ]
+
+    def batch_process_applications_parallel(
+        self, application_texts: List[str], terminology_id: int
+    ) -> ParallelBatchResult:
+        """
+        Process a batch of part application strings in worker processes.
+
+        The batch is split into chunks that run on a process pool; results
+        keep the order of the input texts.
+
+        Args:
+            application_texts: List of raw part application texts
+            terminology_id: ID of the part terminology
+
+        Returns:
+            ParallelBatchResult with results and per-chunk timings
+
+        Raises:
+            MappingError: If the engine is not configured or the pool fails
+        """
+        if not self.parser:
+            raise MappingError("Mapping engine not configured")
+
+        try:
+            return self.parallel.process(self, application_texts, terminology_id)
+        except Exception as e:
+            logger.error(f"Error in parallel batch processing: {str(e)}")
+            raise MappingError(f"Failed to process batch: {str(e)}") from e
+
+    async def batch_process_applications_async(
+        self, application_texts: List[str], terminology_id: int
+    ) -> ParallelBatchResult:
+        """
+        Process a batch of part application strings without blocking the loop.
+
+        Batches of at least parallel_min_batch texts run on the process pool;
+        smaller ones run sequentially on a worker thread.
+
+        Args:
+            application_texts: List of raw part application texts
+            terminology_id: ID of the part terminology
+
+        Returns:
+            ParallelBatchResult with results and per-chunk timings
+
+        Raises:
+            MappingError: If the engine is not configured or the pool fails
+        """
+        if not self.parser:
+            raise MappingError("Mapping engine not configured")
+
+        if len(application_texts) < self.parallel_min_batch:
+            started = time.perf_counter()
+            results = await asyncio.to_thread(
+                self.batch_process_applications, application_texts, terminology_id
+            )
+            seconds = time.perf_counter() - started
+            return ParallelBatchResult(
+                results=results,
+                chunk_timings=[
+                    ChunkTiming(
+                        chunk_index=0, size=len(application_texts), seconds=seconds
+                    )
+                ],
+                total_seconds=seconds,
+            )
+
+        try:
+            return await self.parallel.process_async(
+                self, application_texts, terminology_id
+            )
+        except Exception as e:
+            logger.error(f"Error in parallel batch processing: {str(e)}")
+            raise MappingError(f"Failed to process batch: {str(e)}") from e
+
+    async def stream_process_applications(
+        self,
+        application_texts: AsyncIterable[str],
+        terminology_id: int,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, List[ValidationResult]]]:
+        """
+        Process a stream of part application strings, yielding as they finish.
+
+        Texts are read and processed in chunks on a worker thread. While one
+        chunk's results are being consumed, at most one further chunk is
+        read and processed, so memory stays bounded by two chunks and a slow
+        consumer slows down reading of the input.
+
+        Args:
+            application_texts: Async iterable of raw part application texts
+            terminology_id: ID of the part terminology
+            chunk_size: Texts per chunk (defaults to the parallel chunk size)
+
+        Yields:
+            Tuples of (application text, validation results) in input order
+
+        Raises:
+            MappingError: If the engine is not configured
+        """
+        if not self.parser:
+            raise MappingError("Mapping engine not configured")
+
+        size = chunk_size or self.parallel.chunk_size
+        pending: Optional[asyncio.Task] = None
+
+        def process_chunk(chunk: List[str]) -> List[Tuple[str, List[ValidationResult]]]:
+            return [
+                (text, self.process_application_safe(text, terminology_id))
+                for text in chunk
+            ]
+
+        try:
+            chunk: List[str] = []
+            async for text in application_texts:
+                chunk.append(text)
+                if len(chunk) < size:
+                    continue
+
+                task = asyncio.create_task(asyncio.to_thread(process_chunk, chunk))
+                chunk = []
+                if pending is not None:
+                    for item in await pending:
+                        yield item
+                pending = task
+
+            if chunk:
+                task = asyncio.create_task(asyncio.to_thread(process_chunk, chunk))
+                if pending is not None:
+                    for item in await pending:
+                        yield item
+                pending = task
+
+            if pending is not None:
+                for item in await pending:
+                    yield item
+                pending = None
+        finally:
+            # The consumer went away before the stream finished
+            if pending is not None:
+                pending.cancel()
+
+    def shutdown(self) -> None:
+        """Release worker processes and pooled database connections."""
+        self.parallel.shutdown()
+        self.db_service.close()
+
     def serialize_validation_results(
         self, results: List[ValidationResult]
     ) -> List[Dict[str, Any]]:
@@ -241,6 +508,7 @@ class FitmentMappingEngine:
                     },
                     "vcdb_vehicle_id": result.fitment.vcdb_vehicle_id,
                     "pcdb_position_ids": result.fitment.pcdb_position_ids,
+                    "mapping_pattern": result.fitment.mapping_pattern,
                 }
 
             # Create serialized result
@@ -257,7 +525,11 @@ class FitmentMappingEngine:
         return serialized
 
     async def save_mapping_results(
-        self, product_id: str, results: List[ValidationResult]
+        self,
+        product_id: str,
+        results: List[ValidationResult],
+        part_terminology_id: Optional[int] = None,
+        replace_all: bool = True,
     ) -> bool:
         """
         Save mapping results to the database.
@@ -265,6 +537,10 @@ class FitmentMappingEngine:
         Args:
             product_id: ID of the product
             results: List of ValidationResult objects
+            part_terminology_id: ID of the part terminology the results were
+                processed for, recorded in the fitment application index
+            replace_all: Replace all fitments of the product; if False, only
+                the fitments of the applications in results are replaced
 
         Returns:
             True if successful
@@ -273,6 +549,17 @@ class FitmentMappingEngine:
             MappingError: If saving fails
         """
         try:
+            # Pattern used by each application, including failed ones, keyed
+            # by the text parsed applications are saved under
+            applications: Dict[str, Optional[str]] = {}
+            for result in results:
+                if result.fitment is not None and result.fitment.application_text:
+                    key = application_key(result.fitment.application_text)
+                    if applications.get(key) is None:
+                        applications[key] = result.fitment.mapping_pattern
+                elif result.fitment is None:
+                    applications.setdefault(application_key(result.original_text), None)
+
             # Filter for valid and warning results only
             valid_results = [
                 r
@@ -298,16 +585,81 @@ class FitmentMappingEngine:
                         if result.status == ValidationStatus.WARNING
                         else None
                     ),
+                    "application_text": result.fitment.application_text,
+                    "mapping_pattern": result.fitment.mapping_pattern,
                 }
 
                 fitments.append(fitment_dict)
 
             # Save to database
-            return await self.db_service.save_fitment_results(product_id, fitments)
+            return await self.db_service.save_fitment_results(
+                product_id,
+                fitments,
+                applications=applications,
+                part_terminology_id=part_terminology_id,
+                replace_all=replace_all,
+            )
         except Exception as e:
             logger.error(f"Error saving mapping results: {str(e)}")
             raise MappingError(f"Failed to save mapping results: {str(e)}") from e
 
+    async def revalidate_patterns(self, patterns: Iterable[str]) -> RevalidationSummary:
+        """
+        Re-process the saved applications affected by model mapping changes.
+
+        Only applications that were mapped with one of the patterns, or whose
+        text contains one of them, are processed again; their saved fitments
+        are replaced and the rest of each product's fitments are left alone.
+
+        Args:
+            patterns: Model mapping patterns that were added, changed or removed
+
+        Returns:
+            Summary of the re-validated applications
+
+        Raises:
+            MappingError: If re-validation fails
+        """
+        started = time.perf_counter()
+        patterns = sorted(set(patterns))
+        summary = RevalidationSummary(patterns=patterns)
+        if not patterns:
+            return summary
+
+        try:
+            rows = await self.db_service.get_applications_for_patterns(patterns)
+
+            # Group the affected applications by product and terminology
+            groups: Dict[Tuple[str, int], List[str]] = {}
+            for row in rows:
+                key = (row["product_id"], row["part_terminology_id"])
+                groups.setdefault(key, []).append(row["application_text"])
+
+            for (product_id, terminology_id), texts in groups.items():
+                batch = await self.batch_process_applications_async(
+                    texts, terminology_id
+                )
+                results = [
+                    r for app_results in batch.results.values() for r in app_results
+                ]
+                await self.save_mapping_results(
+                    product_id, results, terminology_id, replace_all=False
+                )
+                summary.applications += len(texts)
+                summary.fitments += len(results)
+
+            summary.products = len({product_id for product_id, _ in groups})
+        except Exception as e:
+            logger.error(f"Error re-validating applications: {str(e)}")
+            raise MappingError(f"Failed to re-validate applications: {str(e)}") from e
+
+        summary.seconds = time.perf_counter() - started
+        logger.info(
+            f"Re-validated {summary.applications} applications for "
+            f"{summary.products} products after changes to {len(patterns)} patterns"
+        )
+        return summary
+
     def configure_from_file(self, model_mappings_path: str) -> None:
         """
         Configure the mapping engine with model mappings from a file.
@@ -318,21 +670,76 @@ class FitmentMappingEngine:
         self.model_mappings = self.db_service.load_model_mappings_from_json(
             model_mappings_path
         )
+        self.mappings_version += 1
         self.parser = FitmentParser(self.model_mappings)
 
-    async def configure_from_database(self) -> None:
+    async def configure_from_database(self) -> Set[str]:
         """
         Configure the mapping engine with model mappings from the database.
 
         This allows for dynamic updates to mappings without server restarts.
+
+        Returns:
+            Patterns that were added, changed or removed by this reload
         """
+        previous = self.model_mappings
         self.model_mappings = await self.db_service.get_model_mappings()
-        self.parser = FitmentParser(self.model_mappings)
+        self.mappings_version += 1
+
+        if self.parser is None:
+            self.parser = FitmentParser(self.model_mappings)
+        else:
+            # Only recompile the parts of the matcher that changed
+            changes = self.parser.update_model_mappings(self.model_mappings)
+            logger.debug(f"Updated model mapping matcher: {changes}")
 
-    async def refresh_mappings(self) -> None:
+        return changed_patterns(previous, self.model_mappings)
+
+    async def refresh_mappings(self) -> Set[str]:
         """
         Refresh model mappings from the database.
 
         This allows for reloading mappings without restarting the server.
+        The VCDB vehicle index is loaded here as well if it is enabled and
+        not yet loaded.
+
+        Returns:
+            Patterns that were added, changed or removed by this refresh,
+            for use with revalidate_patterns
+        """
+        patterns = await self.configure_from_database()
+
+        if self.use_vehicle_index and not self.db_service.vehicle_index.loaded:
+            await self.load_vehicle_index()
+
+        return patterns
+
+    async def load_vehicle_index(self) -> Dict[str, Any]:
+        """
+        Load or reload the in-memory VCDB vehicle index.
+
+        The load runs in a worker thread so the event loop is not blocked
+        while the VCDB tables are read.
+
+        Returns:
+            Index statistics after loading
+
+        Raises:
+            MappingError: If loading fails
+        """
+        try:
+            return await asyncio.to_thread(self.db_service.load_vehicle_index)
+        except Exception as e:
+            logger.error(f"Error loading vehicle index: {str(e)}")
+            raise MappingError(f"Failed to load vehicle index: {str(e)}") from e
+
+    def get_vehicle_index_stats(self) -> Dict[str, Any]:
+        """
+        Get size and memory usage statistics for the VCDB vehicle index.
+
+        Returns:
+            Dictionary of index statistics
         """
-        await self.configure_from_database()
+        stats = self.db_service.vehicle_index.stats()
+        stats["enabled"] = self.use_vehicle_index
+        return stats
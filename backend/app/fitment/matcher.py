@@ -0,0 +1,324 @@
+"""
+Compiled model mapping matcher.
+
+This module provides an Aho-Corasick automaton over the model mapping
+patterns so that the best pattern for a vehicle text can be found in a
+single pass over the text, instead of testing every pattern in turn.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+# Pre-parsed (make, model) pairs for a single pattern
+MappingTuples = Tuple[Tuple[str, str], ...]
+
+
+def parse_mapping_string(mapping: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse a "Make|VehicleCode|Model" mapping string into a (make, model) pair.
+
+    Args:
+        mapping: Mapping string
+
+    Returns:
+        Tuple of (make, model), or None if the mapping is invalid or empty
+    """
+    parts = mapping.split("|")
+    if len(parts) != 3:
+        # Skip invalid format
+        return None
+
+    make, vehicle_code, model = parts
+
+    # Case 1: Standard "Make|VehicleCode|Model"
+    if make and model:
+        return (make, model)
+
+    # Case 2: "Make|VehicleCode|" (missing model) - use vehicle code as model
+    if make and vehicle_code and not model:
+        return (make, vehicle_code)
+
+    # Case 3: "Make||" (only make, like "Universal||")
+    if make and not vehicle_code and not model:
+        return (make, make)
+
+    # Case 4: "||Model" (only model)
+    if not make and not vehicle_code and model:
+        return (model, model)
+
+    # Case 5: "|VehicleCode|" (only vehicle code)
+    if not make and vehicle_code and not model:
+        return (vehicle_code, vehicle_code)
+
+    return None
+
+
+def parse_mappings(mappings: List[str]) -> MappingTuples:
+    """
+    Parse all mapping strings for a pattern, dropping invalid ones.
+
+    Args:
+        mappings: Mapping strings for a single pattern
+
+    Returns:
+        Tuple of (make, model) pairs
+    """
+    parsed = (parse_mapping_string(mapping) for mapping in mappings)
+    return tuple(pair for pair in parsed if pair is not None)
+
+
+def changed_patterns(
+    old_mappings: Dict[str, List[str]], new_mappings: Dict[str, List[str]]
+) -> Set[str]:
+    """
+    Get the patterns that were added, removed or changed between two mapping sets.
+
+    Args:
+        old_mappings: Previous model mappings
+        new_mappings: Current model mappings
+
+    Returns:
+        Set of affected patterns
+    """
+    changed = set(old_mappings.keys() ^ new_mappings.keys())
+    for pattern in old_mappings.keys() & new_mappings.keys():
+        if list(old_mappings[pattern]) != list(new_mappings[pattern]):
+            changed.add(pattern)
+    return changed
+
+
+class _Automaton:
+    """
+    Immutable Aho-Corasick automaton over a fixed set of patterns.
+
+    Built once and never modified, so it can be searched from several
+    threads while a replacement is being built.
+    """
+
+    def __init__(self, mappings: Dict[str, MappingTuples], rank: Dict[str, int]):
+        """
+        Build the automaton.
+
+        Args:
+            mappings: Parsed mappings of the patterns that can win a match
+            rank: Position of every pattern in the mapping dictionary
+        """
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Optional[str]] = [None]
+        self.output_link: List[int] = [0]
+        self.mappings = mappings
+        self.rank = rank
+
+        for pattern in mappings:
+            self._insert(pattern)
+        self._build_links()
+
+    def _insert(self, pattern: str) -> None:
+        """
+        Insert a pattern into the trie and mark its terminal node.
+
+        Args:
+            pattern: Pattern to insert
+        """
+        node = 0
+        for char in pattern:
+            next_node = self.goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(None)
+                self.output_link.append(0)
+                self.goto[node][char] = next_node
+            node = next_node
+        self.output[node] = pattern
+
+    def _build_links(self) -> None:
+        """Compute failure and output links with a breadth-first walk."""
+        queue: deque[int] = deque()
+        for child in self.goto[0].values():
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+
+                # Nearest suffix node that terminates a pattern
+                suffix = self.fail[child]
+                self.output_link[child] = (
+                    suffix
+                    if self.output[suffix] is not None
+                    else self.output_link[suffix]
+                )
+                queue.append(child)
+
+    def match(self, text: str) -> Optional[str]:
+        """
+        Find the best pattern contained in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            The winning pattern, or None if no pattern matches
+        """
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        output_link = self.output_link
+        rank = self.rank
+
+        best: Optional[str] = None
+        best_key = (0, 0)
+        node = 0
+
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            hit = node if output[node] is not None else output_link[node]
+            while hit:
+                pattern = output[hit]
+                if pattern is not None:
+                    key = (len(pattern), -rank[pattern])
+                    if best is None or key > best_key:
+                        best = pattern
+                        best_key = key
+                hit = output_link[hit]
+
+        if best is None and "" in self.mappings:
+            # The empty pattern is contained in every text
+            return ""
+
+        return best
+
+
+class ModelMappingMatcher:
+    """
+    Aho-Corasick automaton over model mapping patterns.
+
+    Matching follows the same rules as the original linear scan: among the
+    patterns contained in the text, the longest one with at least one valid
+    mapping wins, and ties go to the pattern that comes first in the
+    mapping dictionary.
+
+    Updates build a new automaton and swap it in with a single assignment,
+    so threads and worker tasks matching concurrently always see either the
+    old or the new automaton, never one that is half rebuilt.
+    """
+
+    def __init__(self, model_mappings: Dict[str, List[str]]) -> None:
+        """
+        Build the automaton for a set of model mappings.
+
+        Args:
+            model_mappings: Dictionary mapping patterns to mapping strings
+        """
+        self._source: Dict[str, List[str]] = {}
+        self._parsed: Dict[str, MappingTuples] = {}
+        self._automaton = _Automaton({}, {})
+
+        self.update(model_mappings)
+
+    def __len__(self) -> int:
+        """Return the number of patterns with at least one valid mapping."""
+        return len(self._automaton.mappings)
+
+    @property
+    def node_count(self) -> int:
+        """Number of trie nodes in the automaton."""
+        return len(self._automaton.goto)
+
+    def update(self, model_mappings: Dict[str, List[str]]) -> Dict[str, int]:
+        """
+        Bring the automaton in line with a new set of model mappings.
+
+        Only patterns that were added or whose mappings changed are parsed
+        again. The automaton itself is rebuilt off to the side and replaces
+        the current one once complete.
+
+        Args:
+            model_mappings: Dictionary mapping patterns to mapping strings
+
+        Returns:
+            Counts of added, removed and changed patterns
+        """
+        added = changed = 0
+        removed = len(self._source.keys() - model_mappings.keys())
+
+        source: Dict[str, List[str]] = {}
+        parsed: Dict[str, MappingTuples] = {}
+        for pattern, mappings in model_mappings.items():
+            previous = self._source.get(pattern)
+            if previous is not None and previous == mappings:
+                parsed[pattern] = self._parsed[pattern]
+            else:
+                if previous is None:
+                    added += 1
+                else:
+                    changed += 1
+                parsed[pattern] = parse_mappings(mappings)
+            source[pattern] = list(mappings)
+
+        # Patterns without valid mappings never win a match; ties between
+        # equal-length patterns follow dictionary order
+        automaton = _Automaton(
+            {pattern: pairs for pattern, pairs in parsed.items() if pairs},
+            {pattern: i for i, pattern in enumerate(model_mappings)},
+        )
+
+        self._source = source
+        self._parsed = parsed
+        self._automaton = automaton
+
+        return {"added": added, "removed": removed, "changed": changed}
+
+    def match(self, text: str) -> Optional[str]:
+        """
+        Find the best pattern contained in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            The winning pattern, or None if no pattern matches
+        """
+        return self._automaton.match(text)
+
+    def find(self, text: str) -> MappingTuples:
+        """
+        Get the pre-parsed mappings for the best pattern in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Tuple of (make, model) pairs, empty if nothing matches
+        """
+        return self.find_with_pattern(text)[1]
+
+    def find_with_pattern(self, text: str) -> Tuple[Optional[str], MappingTuples]:
+        """
+        Get the best pattern in the text together with its parsed mappings.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Tuple of (pattern, (make, model) pairs); (None, ()) if nothing matches
+        """
+        # Match and look up on the same automaton, even if it is swapped
+        automaton = self._automaton
+        pattern = automaton.match(text)
+        if pattern is None:
+            return None, ()
+        return pattern, automaton.mappings[pattern]
@@ -71,6 +71,8 @@ class PartFitment(BaseModel):
     vcdb_vehicle_id: Optional[int] = None
     pcdb_position_ids: List[int] = Field(default_factory=list)
     notes: Optional[str] = None
+    application_text: Optional[str] = None
+    mapping_pattern: Optional[str] = None
 
 
 class PartApplication(BaseModel):
@@ -202,3 +204,30 @@ class VCDBVehicle(BaseModel):
     make: str
     model: str
     submodel: Optional[str] = None
+
+
+class ChunkTiming(BaseModel):
+    """Timing for one chunk of a parallel batch run."""
+
+    chunk_index: int
+    size: int
+    seconds: float
+    worker_pid: Optional[int] = None
+
+
+class ParallelBatchResult(BaseModel):
+    """Combined result of a parallel batch run."""
+
+    results: Dict[str, List[ValidationResult]]
+    chunk_timings: List[ChunkTiming] = Field(default_factory=list)
+    total_seconds: float = 0.0
+
+
+class RevalidationSummary(BaseModel):
+    """Summary of re-validating applications after model mapping changes."""
+
+    patterns: List[str] = Field(default_factory=list)
+    products: int = 0
+    applications: int = 0
+    fitments: int = 0
+    seconds: float = 0.0
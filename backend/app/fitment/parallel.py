@@ -0,0 +1,273 @@
+"""
+Parallel batch processing for fitment applications.
+
+This module runs FitmentMappingEngine.process_application over chunks of
+application texts in a pool of worker processes. Each worker builds its
+own mapping engine from the same VCDB/PCDB paths and model mappings, and
+keeps its parser, validators and PCDB positions loaded between chunks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.logging import get_logger
+from .exceptions import MappingError
+from .models import ChunkTiming, ParallelBatchResult, ValidationResult
+
+logger = get_logger("app.fitment.parallel")
+
+# Per-process engine state, populated by _init_worker
+_worker_engine: Optional[Any] = None
+
+ChunkOutput = Tuple[int, List[Tuple[str, List[ValidationResult]]], ChunkTiming]
+
+
+def _init_worker(
+    vcdb_path: str,
+    pcdb_path: str,
+    snapshot_path: Optional[str],
+    model_mappings: Dict[str, List[str]],
+    use_vehicle_index: bool,
+) -> None:
+    """
+    Build the mapping engine for a worker process.
+
+    Args:
+        vcdb_path: Path to the VCDB MS Access database
+        pcdb_path: Path to the PCDB MS Access database
+        snapshot_path: Optional SQLite snapshot used instead of the Access databases
+        model_mappings: Model mappings to compile into the worker's parser
+        use_vehicle_index: Whether to load the VCDB vehicle index in the worker
+    """
+    global _worker_engine
+
+    from .db import FitmentDBService
+    from .mapper import FitmentMappingEngine
+    from .parser import FitmentParser
+
+    engine = FitmentMappingEngine(
+        FitmentDBService(vcdb_path, pcdb_path, snapshot_path=snapshot_path),
+        use_vehicle_index=use_vehicle_index,
+    )
+    engine.model_mappings = model_mappings
+    engine.parser = FitmentParser(model_mappings)
+
+    if use_vehicle_index:
+        try:
+            engine.db_service.load_vehicle_index()
+        except Exception as e:
+            logger.warning(f"Worker {os.getpid()} could not load vehicle index: {e}")
+
+    _worker_engine = engine
+
+
+def _process_chunk(
+    chunk_index: int, application_texts: List[str], terminology_id: int
+) -> ChunkOutput:
+    """
+    Process one chunk of application texts in a worker process.
+
+    Args:
+        chunk_index: Position of the chunk in the batch
+        application_texts: Application texts in this chunk
+        terminology_id: ID of the part terminology
+
+    Returns:
+        Tuple of (chunk_index, ordered (text, results) pairs, timing)
+    """
+    engine = _worker_engine
+    if engine is None:
+        raise MappingError("Worker mapping engine not initialized")
+
+    started = time.perf_counter()
+
+    validator = engine.get_validator(terminology_id)
+
+    results = [
+        (text, engine.process_application_safe(text, terminology_id, validator))
+        for text in application_texts
+    ]
+
+    timing = ChunkTiming(
+        chunk_index=chunk_index,
+        size=len(application_texts),
+        seconds=time.perf_counter() - started,
+        worker_pid=os.getpid(),
+    )
+    return chunk_index, results, timing
+
+
+class ParallelBatchProcessor:
+    """Process pool that runs fitment application chunks in parallel."""
+
+    def __init__(self, max_workers: int = 0, chunk_size: int = 200) -> None:
+        """
+        Initialize the parallel batch processor.
+
+        Args:
+            max_workers: Number of worker processes (0 uses the CPU count)
+            chunk_size: Number of application texts sent to a worker at once
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_key: Optional[Tuple[Any, ...]] = None
+
+    def _get_pool(
+        self,
+        vcdb_path: str,
+        pcdb_path: str,
+        snapshot_path: Optional[str],
+        model_mappings: Dict[str, List[str]],
+        mappings_version: int,
+        pcdb_version: int,
+        use_vehicle_index: bool,
+    ) -> ProcessPoolExecutor:
+        """
+        Get a pool whose workers hold the current model mappings.
+
+        The pool is recreated when the mappings or PCDB version changes,
+        since each worker compiles its own copy of the mappings and caches
+        its own validators.
+
+        Returns:
+            Process pool executor
+        """
+        key = (
+            vcdb_path,
+            pcdb_path,
+            snapshot_path,
+            mappings_version,
+            pcdb_version,
+            use_vehicle_index,
+        )
+        if self._pool is None or self._pool_key != key:
+            self.shutdown()
+            # Spawn rather than fork: the parent runs threads and an event loop
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    vcdb_path,
+                    pcdb_path,
+                    snapshot_path,
+                    model_mappings,
+                    use_vehicle_index,
+                ),
+            )
+            self._pool_key = key
+        return self._pool
+
+    def _chunks(self, application_texts: List[str]) -> List[List[str]]:
+        """Split application texts into chunks of at most chunk_size."""
+        return [
+            application_texts[i : i + self.chunk_size]
+            for i in range(0, len(application_texts), self.chunk_size)
+        ]
+
+    def _submit(
+        self, engine: Any, application_texts: List[str], terminology_id: int
+    ) -> List[Future]:
+        """
+        Submit all chunks of a batch to the pool.
+
+        Args:
+            engine: Mapping engine providing paths and model mappings
+            application_texts: Application texts to process
+            terminology_id: ID of the part terminology
+
+        Returns:
+            List of futures, one per chunk
+        """
+        pool = self._get_pool(
+            engine.db_service.vcdb_path,
+            engine.db_service.pcdb_path,
+            engine.db_service.snapshot_path,
+            engine.model_mappings,
+            engine.mappings_version,
+            engine.pcdb_version,
+            engine.use_vehicle_index,
+        )
+        return [
+            pool.submit(_process_chunk, i, chunk, terminology_id)
+            for i, chunk in enumerate(self._chunks(application_texts))
+        ]
+
+    @staticmethod
+    def _combine(outputs: List[ChunkOutput], started: float) -> ParallelBatchResult:
+        """
+        Combine chunk outputs into a single result in submission order.
+
+        Args:
+            outputs: Chunk outputs in any order
+            started: perf_counter value when the batch started
+
+        Returns:
+            Combined batch result
+        """
+        outputs = sorted(outputs, key=lambda output: output[0])
+
+        results: Dict[str, List[ValidationResult]] = {}
+        timings = []
+        for _, chunk_results, timing in outputs:
+            for text, validation_results in chunk_results:
+                results[text] = validation_results
+            timings.append(timing)
+
+        return ParallelBatchResult(
+            results=results,
+            chunk_timings=timings,
+            total_seconds=time.perf_counter() - started,
+        )
+
+    def process(
+        self, engine: Any, application_texts: List[str], terminology_id: int
+    ) -> ParallelBatchResult:
+        """
+        Process a batch of application texts, blocking until done.
+
+        Args:
+            engine: Mapping engine providing paths and model mappings
+            application_texts: Application texts to process
+            terminology_id: ID of the part terminology
+
+        Returns:
+            Combined batch result with per-chunk timings
+        """
+        started = time.perf_counter()
+        futures = self._submit(engine, application_texts, terminology_id)
+        outputs = [future.result() for future in futures]
+        return self._combine(outputs, started)
+
+    async def process_async(
+        self, engine: Any, application_texts: List[str], terminology_id: int
+    ) -> ParallelBatchResult:
+        """
+        Process a batch of application texts without blocking the event loop.
+
+        Args:
+            engine: Mapping engine providing paths and model mappings
+            application_texts: Application texts to process
+            terminology_id: ID of the part terminology
+
+        Returns:
+            Combined batch result with per-chunk timings
+        """
+        started = time.perf_counter()
+        futures = self._submit(engine, application_texts, terminology_id)
+        outputs = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+        return self._combine(list(outputs), started)
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool if it is running."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._pool_key = None
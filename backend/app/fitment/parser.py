@@ -8,16 +8,33 @@ fitment application strings into structured data.
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .exceptions import ParsingError
+from .matcher import ModelMappingMatcher
 from .models import (
     PartApplication,
     PartFitment,
-    Position,
     PositionGroup,
     Vehicle,
 )
+from .positions import decode_position_mask, expand_position_masks
+from .tokenizer import scan_position_text
+
+
+def application_key(application_text: str) -> str:
+    """
+    Get the text an application is saved and looked up under.
+
+    Args:
+        application_text: Raw application text
+
+    Returns:
+        The text without its trailing semicolon, as parse_application keeps it
+    """
+    if application_text.endswith(";"):
+        return application_text[:-1]
+    return application_text
 
 
 class FitmentParser:
@@ -32,55 +49,23 @@ class FitmentParser:
         """
         self.model_mappings = model_mappings
 
-        # Common position patterns
-        self.position_patterns = {
-            "left_right": {
-                re.compile(
-                    r"\b(?:left|driver[\'s]* side)\b", re.IGNORECASE
-                ): Position.LEFT,
-                re.compile(
-                    r"\b(?:right|passenger[\'s]* side)\b", re.IGNORECASE
-                ): Position.RIGHT,
-                re.compile(
-                    r"\b(?:left|driver[\'s]* side).+(?:right|passenger[\'s]* side)\b",
-                    re.IGNORECASE,
-                ): "BOTH",
-                re.compile(
-                    r"\b(?:right|passenger[\'s]* side).+(?:left|driver[\'s]* side)\b",
-                    re.IGNORECASE,
-                ): "BOTH",
-                re.compile(r"\b(?:left|right)\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:left or right)\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:left and right)\b", re.IGNORECASE): "BOTH",
-            },
-            "front_rear": {
-                re.compile(r"\bfront\b", re.IGNORECASE): Position.FRONT,
-                re.compile(r"\brear\b", re.IGNORECASE): Position.REAR,
-                re.compile(r"\bfront.+rear\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\brear.+front\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:front|rear)\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:front or rear)\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:front and rear)\b", re.IGNORECASE): "BOTH",
-            },
-            "upper_lower": {
-                re.compile(r"\bupper\b", re.IGNORECASE): Position.UPPER,
-                re.compile(r"\blower\b", re.IGNORECASE): Position.LOWER,
-                re.compile(r"\bupper.+lower\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\blower.+upper\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:upper|lower)\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:upper or lower)\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:upper and lower)\b", re.IGNORECASE): "BOTH",
-            },
-            "inner_outer": {
-                re.compile(r"\binner\b", re.IGNORECASE): Position.INNER,
-                re.compile(r"\bouter\b", re.IGNORECASE): Position.OUTER,
-                re.compile(r"\binner.+outer\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\bouter.+inner\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:inner|outer)\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:inner or outer)\b", re.IGNORECASE): "BOTH",
-                re.compile(r"\b(?:inner and outer)\b", re.IGNORECASE): "BOTH",
-            },
-        }
+        # Compiled multi-pattern matcher for vehicle model text
+        self.matcher = ModelMappingMatcher(model_mappings)
+
+    def update_model_mappings(
+        self, model_mappings: Dict[str, List[str]]
+    ) -> Dict[str, int]:
+        """
+        Replace the model mappings, updating the compiled matcher in place.
+
+        Args:
+            model_mappings: Dictionary mapping vehicle model text to structured make/model data
+
+        Returns:
+            Counts of added, removed and changed patterns
+        """
+        self.model_mappings = model_mappings
+        return self.matcher.update(model_mappings)
 
     def parse_application(self, application_text: str) -> PartApplication:
         """
@@ -96,8 +81,7 @@ class FitmentParser:
             ParsingError: If the application text cannot be parsed
         """
         # Remove trailing semicolon if present
-        if application_text.endswith(";"):
-            application_text = application_text[:-1]
+        application_text = application_key(application_text)
 
         try:
             return PartApplication(raw_text=application_text)
@@ -157,53 +141,32 @@ class FitmentParser:
         Raises:
             ParsingError: If no mapping is found
         """
-        # Sort patterns by length (descending) to prioritize longer matches
-        patterns = sorted(self.model_mappings.keys(), key=len, reverse=True)
-
-        for pattern in patterns:
-            if pattern in vehicle_text:
-                mappings = self.model_mappings[pattern]
-                result = []
-
-                for mapping in mappings:
-                    parts = mapping.split("|")
-                    if len(parts) != 3:
-                        # Skip invalid format
-                        continue
-
-                    # Handle various cases flexibly
-                    make = parts[0]
-                    vehicle_code = parts[1]
-                    model = parts[2]
-
-                    # Case 1: Standard "Make|VehicleCode|Model"
-                    if make and model:
-                        result.append({"make": make, "model": model})
-
-                    # Case 2: "Make|VehicleCode|" (missing model)
-                    elif make and vehicle_code and not model:
-                        # Use vehicle code as model if available, otherwise use make
-                        model_value = vehicle_code if vehicle_code else make
-                        result.append({"make": make, "model": model_value})
-
-                    # Case 3: "Make||" (only make, like "Universal||")
-                    elif make and not vehicle_code and not model:
-                        result.append({"make": make, "model": make})
-
-                    # Case 4: "||Model" (only model)
-                    elif not make and not vehicle_code and model:
-                        result.append({"make": model, "model": model})
-
-                    # Case 5: "|VehicleCode|" (only vehicle code)
-                    elif not make and vehicle_code and not model:
-                        result.append({"make": vehicle_code, "model": vehicle_code})
-
-                if result:
-                    return result
+        return self.match_model_mapping(vehicle_text)[1]
+
+    def match_model_mapping(
+        self, vehicle_text: str
+    ) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """
+        Find the model mapping for the vehicle text and the pattern that matched.
+
+        Args:
+            vehicle_text: Text describing the vehicle model
+
+        Returns:
+            Tuple of (pattern, make/model mappings); the pattern is None for
+            the Universal fallback
+
+        Raises:
+            ParsingError: If no mapping is found
+        """
+        # Longest matching pattern with valid mappings, via the compiled matcher
+        pattern, mappings = self.matcher.find_with_pattern(vehicle_text)
+        if mappings:
+            return pattern, [{"make": make, "model": model} for make, model in mappings]
 
         # Special fallback for Universal parts
         if "universal" in vehicle_text.lower():
-            return [{"make": "Universal", "model": "Universal"}]
+            return None, [{"make": "Universal", "model": "Universal"}]
 
         raise ParsingError(f"No model mapping found for: {vehicle_text}")
 
@@ -217,119 +180,14 @@ class FitmentParser:
         Returns:
             List of PositionGroup objects representing all position combinations
         """
-        # Initialize with default N/A
-        position_values = {
-            "left_right": Position.NA,
-            "front_rear": Position.NA,
-            "upper_lower": Position.NA,
-            "inner_outer": Position.NA,
-        }
-
-        multiple_positions = []
-
-        # Check each position pattern
-        for position_type, patterns in self.position_patterns.items():
-            for pattern, value in patterns.items():
-                if pattern.search(position_text):
-                    if value == "BOTH":
-                        if position_type == "left_right":
-                            multiple_positions.append(
-                                ("left_right", [Position.LEFT, Position.RIGHT])
-                            )
-                        elif position_type == "front_rear":
-                            multiple_positions.append(
-                                ("front_rear", [Position.FRONT, Position.REAR])
-                            )
-                        elif position_type == "upper_lower":
-                            multiple_positions.append(
-                                ("upper_lower", [Position.UPPER, Position.LOWER])
-                            )
-                        elif position_type == "inner_outer":
-                            multiple_positions.append(
-                                ("inner_outer", [Position.INNER, Position.OUTER])
-                            )
-                    else:
-                        position_values[position_type] = value
-                    break
-
-        # If no multiple positions, return a single PositionGroup
-        if not multiple_positions:
-            return [
-                PositionGroup(
-                    front_rear=position_values["front_rear"],
-                    left_right=position_values["left_right"],
-                    upper_lower=position_values["upper_lower"],
-                    inner_outer=position_values["inner_outer"],
-                )
-            ]
-
-        # Handle multiple positions by generating all combinations
-        position_groups = []
-        current_group = PositionGroup(
-            front_rear=position_values["front_rear"],
-            left_right=position_values["left_right"],
-            upper_lower=position_values["upper_lower"],
-            inner_outer=position_values["inner_outer"],
-        )
-
-        self._expand_position_combinations(
-            position_groups, current_group, multiple_positions, 0
-        )
-        return position_groups
-
-    def _expand_position_combinations(
-        self,
-        result: List[PositionGroup],
-        current_group: PositionGroup,
-        multiple_positions: List[Tuple[str, List[Position]]],
-        index: int,
-    ) -> None:
-        """
-        Recursively expand all position combinations.
+        # Classify the position words in a single scan
+        base_mask, multiple_positions = scan_position_text(position_text)
 
-        Args:
-            result: List to collect the results
-            current_group: Current position group being built
-            multiple_positions: List of position types with multiple values
-            index: Current index in multiple_positions
-        """
-        if index >= len(multiple_positions):
-            # Add a copy of the current group to results
-            result.append(
-                PositionGroup(
-                    front_rear=current_group.front_rear,
-                    left_right=current_group.left_right,
-                    upper_lower=current_group.upper_lower,
-                    inner_outer=current_group.inner_outer,
-                )
-            )
-            return
-
-        position_type, values = multiple_positions[index]
-
-        for value in values:
-            # Create a copy of the current group and set the position
-            new_group = PositionGroup(
-                front_rear=current_group.front_rear,
-                left_right=current_group.left_right,
-                upper_lower=current_group.upper_lower,
-                inner_outer=current_group.inner_outer,
-            )
-
-            # Update the specific position
-            if position_type == "left_right":
-                new_group.left_right = value
-            elif position_type == "front_rear":
-                new_group.front_rear = value
-            elif position_type == "upper_lower":
-                new_group.upper_lower = value
-            elif position_type == "inner_outer":
-                new_group.inner_outer = value
-
-            # Recursive call to handle the next position type
-            self._expand_position_combinations(
-                result, new_group, multiple_positions, index + 1
-            )
+        # Expand multi-valued axes into every combination as bitmasks
+        return [
+            decode_position_mask(mask)
+            for mask in expand_position_masks(base_mask, multiple_positions)
+        ]
 
     def process_application(self, part_app: PartApplication) -> List[PartFitment]:
         """
@@ -350,8 +208,8 @@ class FitmentParser:
         # Extract years
         years = self.expand_year_range(part_app.year_range[0], part_app.year_range[1])
 
-        # Find model mappings
-        model_mappings = self.find_model_mapping(part_app.vehicle_text)
+        # Find model mappings, remembering the pattern that produced them
+        pattern, model_mappings = self.match_model_mapping(part_app.vehicle_text)
 
         # Extract positions
         position_groups = []
@@ -371,7 +229,12 @@ class FitmentParser:
                         year=year, make=model_map["make"], model=model_map["model"]
                     )
 
-                    fitment = PartFitment(vehicle=vehicle, positions=position_group)
+                    fitment = PartFitment(
+                        vehicle=vehicle,
+                        positions=position_group,
+                        application_text=part_app.raw_text,
+                        mapping_pattern=pattern,
+                    )
 
                     fitments.append(fitment)
 
@@ -0,0 +1,238 @@
+"""
+Bitmask encoding of part positions.
+
+A PositionGroup is encoded as a small int with one bit per (axis, value)
+pair: each of the four axes (front/rear, left/right, upper/lower and
+inner/outer) owns a field of len(Position) bits, and a set bit marks the
+axis value. N/A is encoded as no bit, so an all-N/A group is 0.
+
+PCDB positions for a part terminology are folded into a single mask of
+allowed bits, so a fitment's positions are compatible when
+``mask & ~allowed == 0``.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import PCDBPosition, Position, PositionGroup
+
+# Axis order matches the order in which the validator reports problems
+AXES: Tuple[str, ...] = ("front_rear", "left_right", "upper_lower", "inner_outer")
+
+_VALUES: Tuple[Position, ...] = tuple(Position)
+_VALUE_INDEX: Dict[Position, int] = {value: i for i, value in enumerate(_VALUES)}
+_AXIS_INDEX: Dict[str, int] = {axis: i for i, axis in enumerate(AXES)}
+_STRIDE = len(_VALUES)
+_AXIS_MASK = (1 << _STRIDE) - 1
+
+# Masks of the value combinations seen so far (at most len(Position) ** 4)
+_encoded: Dict[Tuple[Position, ...], int] = {}
+
+
+def position_bit(axis: str, value: Position) -> int:
+    """
+    Get the bit for a value on one axis.
+
+    Args:
+        axis: Axis name (e.g. "front_rear")
+        value: Position value
+
+    Returns:
+        Bit for the value, or 0 for N/A
+    """
+    if value == Position.NA:
+        return 0
+    return 1 << (_AXIS_INDEX[axis] * _STRIDE + _VALUE_INDEX[value])
+
+
+def axis_mask(axis: str) -> int:
+    """
+    Get the mask covering all bits of one axis.
+
+    Args:
+        axis: Axis name
+
+    Returns:
+        Mask of the axis' bit field
+    """
+    return _AXIS_MASK << (_AXIS_INDEX[axis] * _STRIDE)
+
+
+def encode_position_group(group: PositionGroup) -> int:
+    """
+    Encode a PositionGroup as a bitmask.
+
+    Args:
+        group: Position group to encode
+
+    Returns:
+        Bitmask with one bit per non-N/A axis
+    """
+    key = (group.front_rear, group.left_right, group.upper_lower, group.inner_outer)
+    mask = _encoded.get(key)
+    if mask is None:
+        mask = 0
+        for axis, value in zip(AXES, key):
+            mask |= position_bit(axis, value)
+        _encoded[key] = mask
+    return mask
+
+
+def axis_value(mask: int, axis: str) -> Position:
+    """
+    Get the value of one axis from a position group mask.
+
+    Args:
+        mask: Position group bitmask
+        axis: Axis name
+
+    Returns:
+        The axis value, or Position.NA if the axis has no bit set
+    """
+    field = (mask >> (_AXIS_INDEX[axis] * _STRIDE)) & _AXIS_MASK
+    if not field:
+        return Position.NA
+    return _VALUES[field.bit_length() - 1]
+
+
+@lru_cache(maxsize=None)
+def decode_position_mask(mask: int) -> PositionGroup:
+    """
+    Decode a position group mask into a PositionGroup.
+
+    Decoded groups are shared between callers and must not be modified.
+
+    Args:
+        mask: Position group bitmask
+
+    Returns:
+        PositionGroup with the encoded axis values
+    """
+    return PositionGroup(**{axis: axis_value(mask, axis) for axis in AXES})
+
+
+def expand_position_masks(
+    base_mask: int, multiple_positions: List[Tuple[str, List[Position]]]
+) -> List[int]:
+    """
+    Expand a base mask with every combination of multi-valued axes.
+
+    Combinations are produced in the order of nested loops over
+    multiple_positions, with the first axis varying slowest.
+
+    Args:
+        base_mask: Mask with the single-valued axes set
+        multiple_positions: (axis, values) pairs for multi-valued axes
+
+    Returns:
+        List of position group masks
+    """
+    if not multiple_positions:
+        return [base_mask]
+
+    choices = []
+    for axis, values in multiple_positions:
+        clear = ~axis_mask(axis)
+        choices.append([(clear, position_bit(axis, value)) for value in values])
+
+    masks = []
+    for combination in product(*choices):
+        mask = base_mask
+        for clear, bit in combination:
+            mask = (mask & clear) | bit
+        masks.append(mask)
+    return masks
+
+
+class PositionMaskSet:
+    """Allowed position bits and the PCDB positions behind each bit."""
+
+    def __init__(self, pcdb_positions: Iterable[PCDBPosition]) -> None:
+        """
+        Build the mask set for a part terminology's PCDB positions.
+
+        Args:
+            pcdb_positions: Valid PCDB positions for the part terminology
+        """
+        self.allowed = 0
+        self._bit_ids: Dict[int, Set[int]] = {}
+
+        for position in pcdb_positions:
+            for axis in AXES:
+                value = getattr(position, axis)
+                if not value:
+                    continue
+                bit = position_bit(axis, value)
+                if bit:
+                    self.allowed |= bit
+                    self._bit_ids.setdefault(bit, set()).add(position.id)
+
+        self._ids_by_mask: Dict[int, Tuple[int, ...]] = {}
+
+    def missing(self, mask: int) -> int:
+        """
+        Get the bits of a position group mask that no PCDB position allows.
+
+        Args:
+            mask: Position group bitmask
+
+        Returns:
+            Disallowed bits (0 if the positions are compatible)
+        """
+        return mask & ~self.allowed
+
+    def missing_many(self, masks: Iterable[int]) -> Dict[int, int]:
+        """
+        Check many position group masks at once.
+
+        Args:
+            masks: Position group bitmasks, possibly repeated
+
+        Returns:
+            Dictionary mapping each distinct mask to its disallowed bits
+        """
+        disallowed = ~self.allowed
+        return {mask: mask & disallowed for mask in set(masks)}
+
+    def first_missing_axis(self, mask: int) -> Optional[Tuple[str, Position]]:
+        """
+        Get the first axis (in AXES order) whose value is not allowed.
+
+        Args:
+            mask: Position group bitmask
+
+        Returns:
+            (axis, value) tuple, or None if the positions are compatible
+        """
+        missing = self.missing(mask)
+        if not missing:
+            return None
+        for axis in AXES:
+            if missing & axis_mask(axis):
+                return axis, axis_value(missing, axis)
+        return None
+
+    def position_ids(self, mask: int) -> Tuple[int, ...]:
+        """
+        Get the IDs of the PCDB positions matching any axis of a mask.
+
+        Args:
+            mask: Position group bitmask
+
+        Returns:
+            Tuple of PCDB position IDs
+        """
+        ids = self._ids_by_mask.get(mask)
+        if ids is None:
+            matched: Set[int] = set()
+            bits = mask & self.allowed
+            while bits:
+                bit = bits & -bits
+                matched.update(self._bit_ids[bit])
+                bits ^= bit
+            ids = tuple(matched)
+            self._ids_by_mask[mask] = ids
+        return ids
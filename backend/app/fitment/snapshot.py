@@ -0,0 +1,411 @@
+"""
+Local snapshot of VCDB and PCDB data.
+
+This module exports the VCDB and PCDB tables used by the fitment module
+from MS Access into a single SQLite file with covering indexes, and
+provides a read-only client for that file with the same query interface
+as AccessDBClient. Hosts without the MS Access ODBC driver can then run
+fitment lookups from the snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from app.logging import get_logger
+from .exceptions import DatabaseError
+
+logger = get_logger("app.fitment.snapshot")
+
+T = TypeVar("T")
+
+# Table name -> (column, SQLite type) pairs copied from the VCDB database
+VCDB_TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "Vehicle": [
+        ("VehicleID", "INTEGER PRIMARY KEY"),
+        ("BaseVehicleID", "INTEGER"),
+        ("SubmodelID", "INTEGER"),
+        ("RegionID", "INTEGER"),
+    ],
+    "BaseVehicle": [
+        ("BaseVehicleID", "INTEGER PRIMARY KEY"),
+        ("YearID", "INTEGER"),
+        ("MakeID", "INTEGER"),
+        ("ModelID", "INTEGER"),
+    ],
+    "Year": [("YearID", "INTEGER PRIMARY KEY")],
+    "Make": [("MakeID", "INTEGER PRIMARY KEY"), ("MakeName", "TEXT")],
+    "Model": [("ModelID", "INTEGER PRIMARY KEY"), ("ModelName", "TEXT")],
+    "SubModel": [("SubModelID", "INTEGER PRIMARY KEY"), ("SubModelName", "TEXT")],
+}
+
+# Table name -> (column, SQLite type) pairs copied from the PCDB database
+PCDB_TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "PartTerminology": [
+        ("PartTerminologyID", "INTEGER PRIMARY KEY"),
+        ("PartTerminologyName", "TEXT"),
+        ("CategoryID", "INTEGER"),
+        ("SubCategoryID", "INTEGER"),
+    ],
+    "PCDBMapping": [("PartTerminologyID", "INTEGER"), ("PositionID", "INTEGER")],
+    "Position": [
+        ("PositionID", "INTEGER PRIMARY KEY"),
+        ("PositionName", "TEXT"),
+        ("FrontRearID", "INTEGER"),
+        ("LeftRightID", "INTEGER"),
+        ("UpperLowerID", "INTEGER"),
+        ("InnerOuterID", "INTEGER"),
+    ],
+    "PositionFrontRear": [
+        ("FrontRearID", "INTEGER PRIMARY KEY"),
+        ("FrontRearValue", "TEXT"),
+    ],
+    "PositionLeftRight": [
+        ("LeftRightID", "INTEGER PRIMARY KEY"),
+        ("LeftRightValue", "TEXT"),
+    ],
+    "PositionUpperLower": [
+        ("UpperLowerID", "INTEGER PRIMARY KEY"),
+        ("UpperLowerValue", "TEXT"),
+    ],
+    "PositionInnerOuter": [
+        ("InnerOuterID", "INTEGER PRIMARY KEY"),
+        ("InnerOuterValue", "TEXT"),
+    ],
+}
+
+# Covering indexes for the joins and filters used by FitmentDBService
+SNAPSHOT_INDEXES: List[str] = [
+    "CREATE INDEX ix_basevehicle_ymm ON BaseVehicle "
+    "(YearID, MakeID, ModelID, BaseVehicleID)",
+    "CREATE INDEX ix_vehicle_basevehicle ON Vehicle "
+    "(BaseVehicleID, VehicleID, SubmodelID, RegionID)",
+    "CREATE INDEX ix_pcdbmapping_terminology ON PCDBMapping "
+    "(PartTerminologyID, PositionID)",
+]
+
+
+def export_snapshot(
+    vcdb_client: Any,
+    pcdb_client: Any,
+    output_path: str,
+    batch_size: int = 5000,
+) -> Dict[str, Any]:
+    """
+    Export the VCDB and PCDB tables into a SQLite snapshot file.
+
+    The snapshot is written to a temporary file and moved into place once
+    complete, so readers never see a partially written snapshot.
+
+    Args:
+        vcdb_client: AccessDBClient connected to the VCDB database
+        pcdb_client: AccessDBClient connected to the PCDB database
+        output_path: Path of the snapshot file to create
+        batch_size: Rows inserted per batch
+
+    Returns:
+        Dictionary with row counts per table, file size and export time
+
+    Raises:
+        DatabaseError: If reading the source or writing the snapshot fails
+    """
+    started = time.perf_counter()
+    tmp_path = f"{output_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    row_counts: Dict[str, int] = {}
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+
+        for client, tables in ((vcdb_client, VCDB_TABLES), (pcdb_client, PCDB_TABLES)):
+            for table, columns in tables.items():
+                row_counts[table] = _copy_table(
+                    conn, client, table, columns, batch_size
+                )
+
+        for statement in SNAPSHOT_INDEXES:
+            conn.execute(statement)
+
+        conn.execute("CREATE TABLE snapshot_meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.executemany(
+            "INSERT INTO snapshot_meta (key, value) VALUES (?, ?)",
+            [
+                ("created_at", datetime.now(timezone.utc).isoformat()),
+                ("vcdb_path", str(getattr(vcdb_client, "db_path", ""))),
+                ("pcdb_path", str(getattr(pcdb_client, "db_path", ""))),
+            ],
+        )
+        conn.execute("ANALYZE")
+        conn.commit()
+    except Exception as e:
+        conn.close()
+        os.remove(tmp_path)
+        logger.error(f"Error exporting fitment snapshot: {str(e)}")
+        raise DatabaseError(f"Failed to export fitment snapshot: {str(e)}") from e
+
+    conn.close()
+    os.replace(tmp_path, output_path)
+
+    stats = {
+        "path": output_path,
+        "tables": row_counts,
+        "size_bytes": os.path.getsize(output_path),
+        "seconds": time.perf_counter() - started,
+    }
+    logger.info(
+        f"Exported fitment snapshot to {output_path}: "
+        f"{sum(row_counts.values())} rows in {stats['seconds']:.1f}s"
+    )
+    return stats
+
+
+def _copy_table(
+    conn: sqlite3.Connection,
+    client: Any,
+    table: str,
+    columns: List[Tuple[str, str]],
+    batch_size: int,
+) -> int:
+    """
+    Copy one table from an Access client into the snapshot.
+
+    Args:
+        conn: SQLite connection to the snapshot being built
+        client: Source AccessDBClient
+        table: Table name
+        columns: (column, SQLite type) pairs to copy
+        batch_size: Rows inserted per batch
+
+    Returns:
+        Number of rows copied
+    """
+    names = [name for name, _ in columns]
+    column_defs = ", ".join(f"{name} {sql_type}" for name, sql_type in columns)
+    conn.execute(f"CREATE TABLE {table} ({column_defs})")
+
+    insert_sql = (
+        f"INSERT INTO {table} ({', '.join(names)}) "
+        f"VALUES ({', '.join('?' for _ in names)})"
+    )
+    select_sql = f"SELECT {', '.join(names)} FROM {table}"
+
+    count = 0
+    batch: List[Tuple[Any, ...]] = []
+    for row in client.iter_query(select_sql, batch_size=batch_size):
+        batch.append(tuple(row[name] for name in names))
+        if len(batch) >= batch_size:
+            conn.executemany(insert_sql, batch)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        conn.executemany(insert_sql, batch)
+        count += len(batch)
+
+    logger.debug(f"Copied {count} rows from {table}")
+    return count
+
+
+class SnapshotDBClient:
+    """
+    Read-only client for a fitment snapshot file.
+
+    Provides the query interface of AccessDBClient over the SQLite
+    snapshot. Each thread gets its own memory-mapped, read-only connection.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        pool_size: int = 4,
+        fetch_size: int = 1000,
+        mmap_size: int = 256 * 1024 * 1024,
+        **_: Any,
+    ) -> None:
+        """
+        Initialize the snapshot client.
+
+        Args:
+            db_path: Path to the snapshot file
+            pool_size: Threads used for async queries
+            fetch_size: Rows fetched per batch by iter_query
+            mmap_size: Bytes of the snapshot file to memory-map
+        """
+        if not os.path.isfile(db_path):
+            raise DatabaseError(f"Fitment snapshot not found: {db_path}")
+
+        self.db_path = db_path
+        self.pool_size = max(1, pool_size)
+        self.fetch_size = max(1, fetch_size)
+        self.mmap_size = mmap_size
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Get this thread's read-only connection to the snapshot.
+
+        Returns:
+            SQLite connection
+
+        Raises:
+            DatabaseError: If the snapshot cannot be opened
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        try:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to open fitment snapshot: {str(e)}") from e
+
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def query(self, sql: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a SQL query on the snapshot.
+
+        Args:
+            sql: SQL query to execute
+            params: Optional parameters for the query
+
+        Returns:
+            List of dictionaries representing the query results
+
+        Raises:
+            DatabaseError: If query execution fails
+        """
+        return list(self.iter_query(sql, params))
+
+    def iter_query(
+        self,
+        sql: str,
+        params: Optional[Tuple] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a SQL query and yield rows as they are fetched.
+
+        Args:
+            sql: SQL query to execute
+            params: Optional parameters for the query
+            batch_size: Rows per fetch (defaults to the client's fetch_size)
+
+        Yields:
+            Dictionaries representing the query rows
+
+        Raises:
+            DatabaseError: If query execution fails
+        """
+        size = batch_size or self.fetch_size
+        try:
+            cursor = self.connect().execute(sql, params or ())
+            columns = [column[0] for column in cursor.description]
+            while True:
+                batch = cursor.fetchmany(size)
+                if not batch:
+                    break
+                for row in batch:
+                    yield dict(zip(columns, row))
+            cursor.close()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Error executing query: {str(e)}") from e
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the bounded executor used for async queries."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size, thread_name_prefix="fitment-snapshot"
+                )
+            return self._executor
+
+    async def run_async(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking callable on the client's bounded executor.
+
+        Args:
+            func: Blocking callable to run
+            *args: Positional arguments for the callable
+
+        Returns:
+            The callable's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+
+    async def aquery(
+        self, sql: str, params: Optional[Tuple] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a SQL query without blocking the event loop.
+
+        Args:
+            sql: SQL query to execute
+            params: Optional parameters for the query
+
+        Returns:
+            List of dictionaries representing the query results
+        """
+        return await self.run_async(self.query, sql, params)
+
+    def metadata(self) -> Dict[str, str]:
+        """
+        Get the snapshot's metadata (creation time and source paths).
+
+        Returns:
+            Dictionary of metadata values
+        """
+        return {
+            row["key"]: row["value"]
+            for row in self.query("SELECT key, value FROM snapshot_meta")
+        }
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection statistics.
+
+        Returns:
+            Dictionary with the snapshot path and open connection count
+        """
+        with self._lock:
+            open_connections = len(self._connections)
+        return {
+            "db_path": self.db_path,
+            "pool_size": self.pool_size,
+            "open_connections": open_connections,
+            "snapshot": True,
+        }
+
+    def close(self) -> None:
+        """Close all connections and stop the async executor."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            executor, self._executor = self._executor, None
+        self._local = threading.local()
+
+        for conn in connections:
+            conn.close()
+        if executor is not None:
+            executor.shutdown(wait=False)
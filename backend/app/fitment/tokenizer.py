@@ -0,0 +1,235 @@
+"""
+Tokenizer for position text.
+
+This module classifies the position words in a position string (e.g.
+"Left or Right Front Upper") in a single scan over its words, without
+regular expressions. For each axis it reproduces the rules of the regex
+patterns the parser used previously, in the same order:
+
+1. A whole-word first value ("left", "driver's side", "front", ...) sets
+   the axis to that value.
+2. Otherwise a whole-word second value ("right", "passenger side", ...)
+   sets the axis to the second value.
+3. Otherwise, if a first value starting at a word boundary is followed on
+   the same line by a second value ending at a word boundary (or the other
+   way round), the axis takes both values.
+
+"driver"/"passenger" are followed by any run of apostrophes and "s"
+characters and then " side", as in "driver's side" or "passengers side".
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from .models import Position
+from .positions import position_bit
+
+# Axes in the order the parser reports multi-valued positions, with the
+# words for the first and second value of each
+_AXIS_WORDS: Tuple[
+    Tuple[str, Position, Tuple[str, ...], Position, Tuple[str, ...]], ...
+] = (
+    (
+        "left_right",
+        Position.LEFT,
+        ("left", "driver"),
+        Position.RIGHT,
+        ("right", "passenger"),
+    ),
+    ("front_rear", Position.FRONT, ("front",), Position.REAR, ("rear",)),
+    ("upper_lower", Position.UPPER, ("upper",), Position.LOWER, ("lower",)),
+    ("inner_outer", Position.INNER, ("inner",), Position.OUTER, ("outer",)),
+)
+
+# Words that only count when followed by an ['s]* run and " side"
+_SIDE_WORDS = ("driver", "passenger")
+
+AxisBits = Tuple[str, Position, int, Tuple[str, ...], Position, int, Tuple[str, ...]]
+
+
+def _build_tables() -> Tuple[Dict[str, int], Dict[str, int], Tuple[AxisBits, ...]]:
+    """
+    Resolve the position bits of the axis words.
+
+    Returns:
+        Tuple of (bits of whole words, bits of side words, _AXIS_WORDS with
+        the bits of both values added)
+    """
+    whole_words: Dict[str, int] = {}
+    side_words: Dict[str, int] = {}
+    axes: List[AxisBits] = []
+
+    for axis, first, first_words, second, second_words in _AXIS_WORDS:
+        first_bit = position_bit(axis, first)
+        second_bit = position_bit(axis, second)
+        for words, bit in ((first_words, first_bit), (second_words, second_bit)):
+            for word in words:
+                if word in _SIDE_WORDS:
+                    side_words[word] = bit
+                else:
+                    whole_words[word] = bit
+        axes.append(
+            (axis, first, first_bit, first_words, second, second_bit, second_words)
+        )
+
+    return whole_words, side_words, tuple(axes)
+
+
+_WHOLE_WORDS, _SIDE_WORD_BITS, _AXIS_BITS = _build_tables()
+
+# Translation table turning every non-word ASCII character into a space
+_ASCII_BREAKS: Dict[int, str] = {
+    i: " " for i in range(128) if not (chr(i).isalnum() or chr(i) == "_")
+}
+
+
+def _is_word(char: str) -> bool:
+    """Return whether a character is a word character (like regex \\w)."""
+    return char.isalnum() or char == "_"
+
+
+def _lower(text: str) -> str:
+    """Lowercase text without changing its length (or character offsets)."""
+    if text.isascii():
+        return text.lower()
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+def _word_breaks(lower: str) -> Dict[int, str]:
+    """Get the translation table that turns non-word characters into spaces."""
+    if lower.isascii():
+        return _ASCII_BREAKS
+    breaks = dict(_ASCII_BREAKS)
+    for char in set(lower):
+        if ord(char) > 127 and not _is_word(char):
+            breaks[ord(char)] = " "
+    return breaks
+
+
+def _match_end(lower: str, word: str, start: int) -> Optional[int]:
+    """
+    Get the end of a position word match starting at start.
+
+    Args:
+        lower: Lowercased position text
+        word: Position word found at start
+        start: Offset of the word
+
+    Returns:
+        End offset of the match, or None if a side word is not followed by
+        an ['s]* run and " side"
+    """
+    end = start + len(word)
+    if word not in _SIDE_WORDS:
+        return end
+
+    while end < len(lower) and lower[end] in "'s":
+        end += 1
+    if lower.startswith(" side", end):
+        return end + 5
+    return None
+
+
+def _spans_both(
+    lower: str, first_words: Tuple[str, ...], second_words: Tuple[str, ...]
+) -> bool:
+    """
+    Check for a first word followed on the same line by a second word.
+
+    The first word must start at a word boundary and the second must end at
+    one; at least one character separates them.
+
+    Args:
+        lower: Lowercased position text
+        first_words: Words for the value that comes first
+        second_words: Words for the value that comes second
+
+    Returns:
+        True if both values appear in that order
+    """
+    first_ends: List[int] = []
+    for word in first_words:
+        start = lower.find(word)
+        while start != -1:
+            if start == 0 or not _is_word(lower[start - 1]):
+                end = _match_end(lower, word, start)
+                if end is not None:
+                    first_ends.append(end)
+            start = lower.find(word, start + 1)
+
+    if not first_ends:
+        return False
+
+    second_starts: List[int] = []
+    for word in second_words:
+        start = lower.find(word)
+        while start != -1:
+            end = _match_end(lower, word, start)
+            if end is not None and (end == len(lower) or not _is_word(lower[end])):
+                second_starts.append(start)
+            start = lower.find(word, start + 1)
+
+    return any(
+        start > end and "\n" not in lower[end:start]
+        for end in first_ends
+        for start in second_starts
+    )
+
+
+def scan_position_text(
+    position_text: str,
+) -> Tuple[int, List[Tuple[str, List[Position]]]]:
+    """
+    Classify the position words in a position text.
+
+    Args:
+        position_text: Text describing position (e.g., "Left or Right Front Upper")
+
+    Returns:
+        Tuple of (bitmask of single-valued axes, list of (axis, values) for
+        axes that take both values)
+    """
+    lower = _lower(position_text)
+
+    # One pass over the words, collecting whole-word position bits
+    found = 0
+    offset = 0
+    for token in lower.translate(_word_breaks(lower)).split(" "):
+        if token:
+            bit = _WHOLE_WORDS.get(token)
+            if bit is not None:
+                found |= bit
+            elif token.rstrip("s") in _SIDE_WORD_BITS:
+                word = token.rstrip("s")
+                end = _match_end(lower, word, offset)
+                if end is not None and (end == len(lower) or not _is_word(lower[end])):
+                    found |= _SIDE_WORD_BITS[word]
+        offset += len(token) + 1
+
+    base_mask = 0
+    multiple_positions: List[Tuple[str, List[Position]]] = []
+    for (
+        axis,
+        first,
+        first_bit,
+        first_words,
+        second,
+        second_bit,
+        second_words,
+    ) in _AXIS_BITS:
+        if found & first_bit:
+            base_mask |= first_bit
+        elif found & second_bit:
+            base_mask |= second_bit
+        elif (
+            any(word in lower for word in first_words)
+            and any(word in lower for word in second_words)
+            and (
+                _spans_both(lower, first_words, second_words)
+                or _spans_both(lower, second_words, first_words)
+            )
+        ):
+            multiple_positions.append((axis, [first, second]))
+
+    return base_mask, multiple_positions
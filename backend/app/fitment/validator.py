@@ -8,19 +8,28 @@ VCDB and PCDB databases.
 from __future__ import annotations
 
 from app.logging import get_logger
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Set, Tuple
 
 from .models import (
     PartFitment,
     PCDBPosition,
     Position,
+    PositionGroup,
     ValidationResult,
     ValidationStatus,
     VCDBVehicle,
 )
+from .positions import PositionMaskSet, encode_position_group
 
 logger = get_logger("app.fitment.validator")
 
+_AXIS_LABELS = {
+    "front_rear": "Front/Rear",
+    "left_right": "Left/Right",
+    "upper_lower": "Upper/Lower",
+    "inner_outer": "Inner/Outer",
+}
+
 
 class FitmentValidator:
     """Validator for fitment data against VCDB and PCDB databases."""
@@ -49,6 +58,10 @@ class FitmentValidator:
         for pos in pcdb_positions:
             self._index_position(pos)
 
+        # Allowed position bits, and cached (status, message) per position mask
+        self.position_masks = PositionMaskSet(pcdb_positions)
+        self._position_outcomes: Dict[int, Tuple[ValidationStatus, str]] = {}
+
     def _index_position(self, position: PCDBPosition) -> None:
         """
         Index a PCDB position by its components.
@@ -196,136 +209,79 @@ class FitmentValidator:
             original_text=fitment.vehicle.full_name,
         )
 
-    def _validate_positions(self, fitment: PartFitment) -> ValidationResult:
+    def check_positions(self, position_groups: Iterable[PositionGroup]) -> None:
         """
-        Validate positions against PCDB data.
+        Check many position groups at once and cache the outcomes.
 
         Args:
-            fitment: The fitment to validate
-
-        Returns:
-            ValidationResult with status and messages
+            position_groups: Position groups of the fitments about to be validated
         """
-        # Check if all positions are valid for this part terminology
-        positions = fitment.positions
-
-        # Track valid position IDs
-        valid_position_ids = set()
-
-        # Check front_rear
-        if positions.front_rear != Position.NA:
-            if positions.front_rear not in self.position_index["front_rear"]:
-                if positions.front_rear == Position.VARIES:
-                    # Varies is a special case - need manual review
-                    return ValidationResult(
-                        status=ValidationStatus.WARNING,
-                        message="Front/Rear position varies with application - manual review needed",
-                        fitment=fitment,
-                        original_text=fitment.vehicle.full_name,
-                    )
-                else:
-                    return ValidationResult(
-                        status=ValidationStatus.ERROR,
-                        message=f"Invalid Front/Rear position: {positions.front_rear}",
-                        fitment=fitment,
-                        original_text=fitment.vehicle.full_name,
-                    )
-            else:
-                valid_position_ids.update(
-                    self.position_index["front_rear"][positions.front_rear]
-                )
+        masks = [encode_position_group(group) for group in position_groups]
+        unchecked = [mask for mask in masks if mask not in self._position_outcomes]
+        if not unchecked:
+            return
 
-        # Check left_right
-        if positions.left_right != Position.NA:
-            if positions.left_right not in self.position_index["left_right"]:
-                if positions.left_right == Position.VARIES:
-                    # Varies is a special case - need manual review
-                    return ValidationResult(
-                        status=ValidationStatus.WARNING,
-                        message="Left/Right position varies with application - manual review needed",
-                        fitment=fitment,
-                        original_text=fitment.vehicle.full_name,
-                    )
-                else:
-                    return ValidationResult(
-                        status=ValidationStatus.ERROR,
-                        message=f"Invalid Left/Right position: {positions.left_right}",
-                        fitment=fitment,
-                        original_text=fitment.vehicle.full_name,
-                    )
-            else:
-                valid_position_ids.update(
-                    self.position_index["left_right"][positions.left_right]
-                )
+        for mask, missing in self.position_masks.missing_many(unchecked).items():
+            self._position_outcomes[mask] = self._position_outcome(mask, missing)
 
-        # Check upper_lower
-        if positions.upper_lower != Position.NA:
-            if positions.upper_lower not in self.position_index["upper_lower"]:
-                if positions.upper_lower == Position.VARIES:
-                    # Varies is a special case - need manual review
-                    return ValidationResult(
-                        status=ValidationStatus.WARNING,
-                        message="Upper/Lower position varies with application - manual review needed",
-                        fitment=fitment,
-                        original_text=fitment.vehicle.full_name,
-                    )
-                else:
-                    return ValidationResult(
-                        status=ValidationStatus.ERROR,
-                        message=f"Invalid Upper/Lower position: {positions.upper_lower}",
-                        fitment=fitment,
-                        original_text=fitment.vehicle.full_name,
-                    )
-            else:
-                valid_position_ids.update(
-                    self.position_index["upper_lower"][positions.upper_lower]
-                )
+    def _position_outcome(
+        self, mask: int, missing: int
+    ) -> Tuple[ValidationStatus, str]:
+        """
+        Work out the validation status for a position group mask.
+
+        Args:
+            mask: Position group bitmask
+            missing: Bits of the mask that no PCDB position allows
 
-        # Check inner_outer
-        if positions.inner_outer != Position.NA:
-            if positions.inner_outer not in self.position_index["inner_outer"]:
-                if positions.inner_outer == Position.VARIES:
-                    # Varies is a special case - need manual review
-                    return ValidationResult(
-                        status=ValidationStatus.WARNING,
-                        message="Inner/Outer position varies with application - manual review needed",
-                        fitment=fitment,
-                        original_text=fitment.vehicle.full_name,
-                    )
-                else:
-                    return ValidationResult(
-                        status=ValidationStatus.ERROR,
-                        message=f"Invalid Inner/Outer position: {positions.inner_outer}",
-                        fitment=fitment,
-                        original_text=fitment.vehicle.full_name,
-                    )
-            else:
-                valid_position_ids.update(
-                    self.position_index["inner_outer"][positions.inner_outer]
+        Returns:
+            Tuple of (status, message)
+        """
+        if missing:
+            axis, value = self.position_masks.first_missing_axis(mask)
+            label = _AXIS_LABELS[axis]
+            if value == Position.VARIES:
+                # Varies is a special case - need manual review
+                return (
+                    ValidationStatus.WARNING,
+                    f"{label} position varies with application - manual review needed",
                 )
+            return ValidationStatus.ERROR, f"Invalid {label} position: {value}"
 
         # If no valid position IDs found and we have non-N/A positions
-        if not valid_position_ids and any(
-            [
-                positions.front_rear != Position.NA,
-                positions.left_right != Position.NA,
-                positions.upper_lower != Position.NA,
-                positions.inner_outer != Position.NA,
-            ]
-        ):
-            return ValidationResult(
-                status=ValidationStatus.ERROR,
-                message="No valid positions found for this part terminology",
-                fitment=fitment,
-                original_text=fitment.vehicle.full_name,
+        if mask and not self.position_masks.position_ids(mask):
+            return (
+                ValidationStatus.ERROR,
+                "No valid positions found for this part terminology",
             )
 
-        # Set the valid position IDs on the fitment
-        fitment.pcdb_position_ids = list(valid_position_ids)
+        return ValidationStatus.VALID, "Positions are valid"
+
+    def _validate_positions(self, fitment: PartFitment) -> ValidationResult:
+        """
+        Validate positions against PCDB data.
+
+        Args:
+            fitment: The fitment to validate
+
+        Returns:
+            ValidationResult with status and messages
+        """
+        mask = encode_position_group(fitment.positions)
+
+        outcome = self._position_outcomes.get(mask)
+        if outcome is None:
+            outcome = self._position_outcome(mask, self.position_masks.missing(mask))
+            self._position_outcomes[mask] = outcome
+
+        status, message = outcome
+        if status == ValidationStatus.VALID:
+            # Set the valid position IDs on the fitment
+            fitment.pcdb_position_ids = list(self.position_masks.position_ids(mask))
 
         return ValidationResult(
-            status=ValidationStatus.VALID,
-            message="Positions are valid",
+            status=status,
+            message=message,
             fitment=fitment,
             original_text=fitment.vehicle.full_name,
         )
@@ -66,11 +66,17 @@ from app.core.rate_limiting import (
     RateLimitStrategy,
 )
 from app.core.startup.as400_sync import initialize_as400_sync, shutdown_as400_sync
+from app.core.startup.cache_warmup import (
+    initialize_cache_warmup,
+    shutdown_cache_warmup,
+)
+from app.core.startup.fitment import initialize_fitment, shutdown_fitment
 from app.core.validation import (
     initialize as initialize_validation_system,
     shutdown as shutdown_validation_system,
 )
 from app.domains.users.models import User
+from app.middleware.cache_batching import CacheBatchingMiddleware
 from app.middleware.error_handler import ErrorHandlerMiddleware
 from app.middleware.metrics import MetricsMiddleware
 from app.middleware.rate_limiting import RateLimitMiddleware
@@ -127,6 +133,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Initialize external integrations
     await initialize_as400_sync()
+    await initialize_fitment()
 
     # Initialize media service
     media_service = get_service("media_service")
@@ -143,6 +150,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"Failed to initialize event system: {str(e)}", exc_info=e)
 
+    # Warm caches within the startup budget
+    await initialize_cache_warmup()
+
     logger.info(f"Application started in {settings.ENVIRONMENT.value} environment")
 
     # Include API router
@@ -155,6 +165,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown sequence - in reverse order of initialization
     logger.info("Beginning application shutdown sequence")
 
+    await shutdown_cache_warmup()
+    await shutdown_fitment()
     await shutdown_as400_sync()
     await shutdown_services()
     await shutdown_ratelimiting_system()
@@ -202,6 +214,9 @@ add_typed_middleware(
 )
 add_typed_middleware(app, SecureRequestMiddleware, block_suspicious_requests=True)
 
+if settings.CACHE_REQUEST_BATCHING:
+    add_typed_middleware(app, CacheBatchingMiddleware)
+
 # Add rate limiting middleware in non-development environments
 if settings.ENVIRONMENT != Environment.DEVELOPMENT or settings.RATE_LIMIT_ENABLED:
     add_typed_middleware(
@@ -0,0 +1,33 @@
+# /app/middleware/cache_batching.py
+from __future__ import annotations
+
+from typing import Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.cache.batching import batch_cache_reads
+from app.logging import get_logger
+
+logger = get_logger("app.middleware.cache_batching")
+
+
+class CacheBatchingMiddleware(BaseHTTPMiddleware):
+    """Middleware batching the cache reads made while handling a request.
+
+    Cache gets issued concurrently during the request are sent to each
+    backend as one get_many call (a single MGET for Redis).
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Handle the request inside a cache read batch.
+
+        Args:
+            request: The incoming request
+            call_next: The next middleware in the chain
+
+        Returns:
+            The response from downstream middleware
+        """
+        async with batch_cache_reads():
+            return await call_next(request)
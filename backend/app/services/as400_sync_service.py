@@ -9,9 +9,9 @@ operations, ensuring secure and consistent data flow.
 
 import asyncio
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,7 +27,10 @@ from app.data_import.connectors.as400_connector import (
     AS400ConnectionConfig,
 )
 from app.data_import.pipeline.as400_pipeline import AS400Pipeline
+from app.data_import.pipeline.change_tracking import ChangeTracker
 from app.db.session import get_db_context
+from app.domains.sync_history.models import SyncMode
+from app.domains.sync_history.repository import SyncHistoryRepository
 from app.domains.products.models import Product
 from app.domains.reference.models import Warehouse
 from app.domains.products.schemas import (
@@ -158,6 +161,13 @@ class AS400SyncService:
     _last_sync_times: Dict[SyncEntityType, datetime] = {}
     _scheduled_tasks: Dict[SyncEntityType, asyncio.Task] = {}
 
+    # Source columns identifying a row, for entity types with change tracking
+    _row_keys: Dict[SyncEntityType, Tuple[str, ...]] = {
+        SyncEntityType.PRODUCT: ("PRDNUM",),
+        SyncEntityType.MEASUREMENT: ("PRDNUM",),
+        SyncEntityType.STOCK: ("PRDNUM", "WRHSNUM"),
+    }
+
     @classmethod
     def get_instance(cls) -> AS400SyncService:
         """
@@ -274,14 +284,22 @@ class AS400SyncService:
         )
 
     async def run_sync(
-        self, entity_type: SyncEntityType, force: bool = False
+        self,
+        entity_type: SyncEntityType,
+        force: bool = False,
+        full: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Run a synchronization operation.
 
+        Syncs are incremental, importing only rows changed since the last
+        sync, unless incremental syncs are disabled or the last full sync is
+        older than AS400_FULL_SYNC_INTERVAL.
+
         Args:
             entity_type: Type of entity to sync
             force: Whether to force sync regardless of schedule
+            full: Force a full (True) or incremental (False) sync
 
         Returns:
             Dictionary with sync results
@@ -302,14 +320,22 @@ class AS400SyncService:
         # Create sync log
         sync_log = SyncLog(entity_type=entity_type, status=SyncStatus.RUNNING)
         self._sync_history.append(sync_log)
+        sync_id: Optional[uuid.UUID] = None
 
         try:
-            logger.info(f"Starting sync for {entity_type.value}")
+            tracker = await self._create_change_tracker(entity_type, full)
+            mode = (
+                SyncMode.INCREMENTAL
+                if tracker is not None and tracker.incremental
+                else SyncMode.FULL
+            )
+            sync_id = await self._start_sync_history(entity_type, mode)
+            logger.info(f"Starting {mode.value} sync for {entity_type.value}")
 
             # Create database session
             async with get_db_context() as db:
                 # Run the appropriate sync method
-                result = await self._run_entity_sync(entity_type, db)
+                result = await self._run_entity_sync(entity_type, db, tracker)
 
                 # Record sync time
                 self._last_sync_times[entity_type] = datetime.now()
@@ -329,16 +355,29 @@ class AS400SyncService:
                     error_message=result.get("error", None),
                 )
 
+                # Only a sync that imported every row may move the mark on
+                await self._complete_sync_history(
+                    sync_id,
+                    status,
+                    result,
+                    high_water_mark=(
+                        tracker.high_water_mark
+                        if tracker is not None and status == SyncStatus.COMPLETED
+                        else None
+                    ),
+                )
+
                 # Log audit record
                 await self._log_sync_audit(
                     db=db, entity_type=entity_type, result=result
                 )
 
                 logger.info(
-                    f"Completed sync for {entity_type.value} - "
+                    f"Completed {mode.value} sync for {entity_type.value} - "
                     f"processed: {result.get('records_processed', 0)}, "
                     f"created: {result.get('records_created', 0)}, "
                     f"updated: {result.get('records_updated', 0)}, "
+                    f"unchanged: {result.get('records_unchanged', 0)}, "
                     f"errors: {result.get('records_with_errors', 0)}"
                 )
 
@@ -350,9 +389,11 @@ class AS400SyncService:
                     "message": result.get("message", "Sync completed"),
                     "entity_type": entity_type.value,
                     "status": status.value,
+                    "sync_mode": mode.value,
                     "records_processed": result.get("records_processed", 0),
                     "records_created": result.get("records_created", 0),
                     "records_updated": result.get("records_updated", 0),
+                    "records_unchanged": result.get("records_unchanged", 0),
                     "records_failed": result.get("records_with_errors", 0),
                     "sync_time": result.get("total_time", 0),
                     "sync_timestamp": datetime.now().isoformat(),
@@ -369,6 +410,16 @@ class AS400SyncService:
                 records_failed=0,
                 error_message=str(e),
             )
+            if sync_id is not None:
+                try:
+                    await self._complete_sync_history(
+                        sync_id, SyncStatus.FAILED, {"error": str(e)}
+                    )
+                except Exception as history_error:
+                    logger.error(
+                        f"Error recording failed sync for {entity_type.value}: "
+                        f"{str(history_error)}"
+                    )
 
             return {
                 "success": False,
@@ -459,7 +510,10 @@ class AS400SyncService:
             await self.schedule_sync(entity_type, delay_seconds=300)
 
     async def _run_entity_sync(
-        self, entity_type: SyncEntityType, db: AsyncSession
+        self,
+        entity_type: SyncEntityType,
+        db: AsyncSession,
+        tracker: Optional[ChangeTracker] = None,
     ) -> Dict[str, Any]:
         """
         Run sync for a specific entity type.
@@ -467,6 +521,7 @@ class AS400SyncService:
         Args:
             entity_type: Type of entity to sync
             db: Database session
+            tracker: Tracker limiting the sync to changed rows
 
         Returns:
             Dictionary with sync results
@@ -477,18 +532,21 @@ class AS400SyncService:
 
         # Run the appropriate sync method
         if entity_type == SyncEntityType.PRODUCT:
-            return await self._sync_products(connector, db)
+            return await self._sync_products(connector, db, tracker)
         elif entity_type == SyncEntityType.MEASUREMENT:
-            return await self._sync_measurements(connector, db)
+            return await self._sync_measurements(connector, db, tracker)
         elif entity_type == SyncEntityType.STOCK:
-            return await self._sync_inventory(connector, db)
+            return await self._sync_inventory(connector, db, tracker)
         elif entity_type == SyncEntityType.PRICING:
             return await self._sync_pricing(connector, db)
         else:
             raise ValueError(f"Unsupported entity type: {entity_type.value}")
 
     async def _sync_products(
-        self, connector: AS400Connector, db: AsyncSession
+        self,
+        connector: AS400Connector,
+        db: AsyncSession,
+        tracker: Optional[ChangeTracker] = None,
     ) -> Dict[str, Any]:
         """
         Synchronize product data from AS400.
@@ -496,6 +554,7 @@ class AS400SyncService:
         Args:
             connector: AS400 connector
             db: Database session
+            tracker: Tracker limiting the sync to changed rows
 
         Returns:
             Dictionary with sync results
@@ -527,6 +586,8 @@ class AS400SyncService:
             processor=processor,
             importer=importer,
             chunk_size=as400_settings.AS400_BATCH_SIZE,
+            queue_size=as400_settings.AS400_QUEUE_SIZE,
+            change_tracker=tracker,
         )
 
         # Run sync with appropriate query
@@ -534,7 +595,10 @@ class AS400SyncService:
         return await pipeline.run("SELECT * FROM PRODUCTLIB.PRODUCTS")
 
     async def _sync_measurements(
-        self, connector: AS400Connector, db: AsyncSession
+        self,
+        connector: AS400Connector,
+        db: AsyncSession,
+        tracker: Optional[ChangeTracker] = None,
     ) -> Dict[str, Any]:
         """
         Synchronize product measurement data from AS400.
@@ -542,6 +606,7 @@ class AS400SyncService:
         Args:
             connector: AS400 connector
             db: Database session
+            tracker: Tracker limiting the sync to changed rows
 
         Returns:
             Dictionary with sync results
@@ -595,6 +660,8 @@ class AS400SyncService:
             processor=processor,
             importer=importer,
             chunk_size=as400_settings.AS400_BATCH_SIZE,
+            queue_size=as400_settings.AS400_QUEUE_SIZE,
+            change_tracker=tracker,
         )
 
         # Run sync with appropriate query
@@ -602,7 +669,10 @@ class AS400SyncService:
         return await pipeline.run("SELECT * FROM PRODUCTLIB.MEASUREMENTS")
 
     async def _sync_inventory(
-        self, connector: AS400Connector, db: AsyncSession
+        self,
+        connector: AS400Connector,
+        db: AsyncSession,
+        tracker: Optional[ChangeTracker] = None,
     ) -> Dict[str, Any]:
         """
         Synchronize product inventory/stock data from AS400.
@@ -610,6 +680,7 @@ class AS400SyncService:
         Args:
             connector: AS400 connector
             db: Database session
+            tracker: Tracker limiting the sync to changed rows
 
         Returns:
             Dictionary with sync results
@@ -676,6 +747,8 @@ class AS400SyncService:
             processor=processor,
             importer=importer,
             chunk_size=as400_settings.AS400_BATCH_SIZE,
+            queue_size=as400_settings.AS400_QUEUE_SIZE,
+            change_tracker=tracker,
         )
 
         # Run sync with appropriate query
@@ -707,6 +780,113 @@ class AS400SyncService:
             "total_time": 0,
         }
 
+    async def _create_change_tracker(
+        self, entity_type: SyncEntityType, full: Optional[bool]
+    ) -> Optional[ChangeTracker]:
+        """
+        Create the change tracker of a sync.
+
+        Args:
+            entity_type: Type of entity to sync
+            full: Force a full (True) or incremental (False) sync
+
+        Returns:
+            The tracker, or None if the entity type has no change tracking
+        """
+        key_fields = self._row_keys.get(entity_type)
+        if key_fields is None:
+            return None
+
+        async with get_db_context() as db:
+            repository = SyncHistoryRepository(db)
+            if full is None:
+                full = await self._is_full_sync_due(repository, entity_type)
+            high_water_mark = (
+                None if full else await repository.get_high_water_mark(entity_type)
+            )
+
+        return ChangeTracker(
+            entity_type,
+            key_fields,
+            timestamp_field=as400_settings.AS400_CHANGE_COLUMNS.get(entity_type.value),
+            high_water_mark=high_water_mark,
+            incremental=not full,
+        )
+
+    async def _is_full_sync_due(
+        self, repository: SyncHistoryRepository, entity_type: SyncEntityType
+    ) -> bool:
+        """
+        Check whether the next sync of an entity type should be a full sync.
+
+        Args:
+            repository: Sync history repository
+            entity_type: Type of entity to sync
+
+        Returns:
+            True if incremental syncs are disabled or the last full sync is
+            older than AS400_FULL_SYNC_INTERVAL
+        """
+        if not as400_settings.AS400_INCREMENTAL_SYNC:
+            return True
+
+        last_full = await repository.get_last_completed_sync(
+            entity_type, mode=SyncMode.FULL
+        )
+        if last_full is None:
+            return True
+
+        age = datetime.now(timezone.utc) - last_full.started_at.astimezone(timezone.utc)
+        return age >= timedelta(seconds=as400_settings.AS400_FULL_SYNC_INTERVAL)
+
+    async def _start_sync_history(
+        self, entity_type: SyncEntityType, mode: SyncMode
+    ) -> uuid.UUID:
+        """
+        Record the start of a sync in the sync history.
+
+        Args:
+            entity_type: Type of entity to sync
+            mode: Full or incremental sync
+
+        Returns:
+            ID of the sync history record
+        """
+        async with get_db_context() as db:
+            repository = SyncHistoryRepository(db)
+            sync = await repository.create_sync(entity_type, mode=mode)
+            await repository.update_sync_status(sync.id, SyncStatus.RUNNING)
+            return sync.id
+
+    async def _complete_sync_history(
+        self,
+        sync_id: uuid.UUID,
+        status: SyncStatus,
+        result: Dict[str, Any],
+        high_water_mark: Optional[str] = None,
+    ) -> None:
+        """
+        Record the outcome of a sync in the sync history.
+
+        Args:
+            sync_id: ID of the sync history record
+            status: Final status
+            result: Sync result
+            high_water_mark: Mark the next incremental sync resumes from
+        """
+        async with get_db_context() as db:
+            await SyncHistoryRepository(db).update_sync_status(
+                sync_id,
+                status,
+                records_processed=result.get("records_processed", 0),
+                records_created=result.get("records_created", 0),
+                records_updated=result.get("records_updated", 0),
+                records_failed=result.get("records_with_errors", 0),
+                error_message=result.get("error"),
+                details={"records_unchanged": result.get("records_unchanged", 0)},
+                high_water_mark=high_water_mark,
+            )
+
     async def _get_product_id_map(self, db: AsyncSession) -> Dict[str, uuid.UUID]:
         """
         Get a mapping of product part numbers to IDs.
@@ -35,7 +35,7 @@ class VehicleDataService:
         """
         self.db = db
 
-    @cached(prefix="vehicle:years", ttl=3600, backend="redis")
+    @cached(prefix="vehicle:years", ttl=3600, backend="tiered")
     async def get_years(self) -> List[int]:
         """Get all available vehicle years.
 
@@ -62,7 +62,7 @@ class VehicleDataService:
                 original_exception=e,
             ) from e
 
-    @cached(ttl=3600, backend="redis", prefix="vehicle:makes")
+    @cached(ttl=3600, backend="tiered", prefix="vehicle:makes")
     async def get_makes(self, year: Optional[int] = None) -> List[str]:
         """Get vehicle makes, optionally filtered by year.
 
@@ -96,7 +96,7 @@ class VehicleDataService:
                 original_exception=e,
             ) from e
 
-    @cached(prefix="vehicle:models", ttl=3600, backend="redis")
+    @cached(prefix="vehicle:models", ttl=3600, backend="tiered")
     async def get_models(
         self, make: Optional[str] = None, year: Optional[int] = None
     ) -> List[str]:
@@ -138,7 +138,7 @@ class VehicleDataService:
                 original_exception=e,
             ) from e
 
-    @cached(prefix="vehicle:engines", ttl=3600, backend="redis")
+    @cached(prefix="vehicle:engines", ttl=3600, backend="tiered")
     async def get_engines(
         self,
         make: Optional[str] = None,
@@ -195,7 +195,7 @@ class VehicleDataService:
                 original_exception=e,
             ) from e
 
-    @cached(prefix="vehicle:transmissions", ttl=3600, backend="redis")
+    @cached(prefix="vehicle:transmissions", ttl=3600, backend="tiered")
     async def get_transmissions(
         self,
         make: Optional[str] = None,
@@ -258,7 +258,7 @@ class VehicleDataService:
                 original_exception=e,
             ) from e
 
-    @cached(ttl=3600, backend="redis")
+    @cached(ttl=3600, backend="tiered")
     async def validate_fitment(
         self,
         year: int,
@@ -321,7 +321,7 @@ class VehicleDataService:
                 original_exception=e,
             ) from e
 
-    @cached(ttl=86400, backend="redis")
+    @cached(ttl=86400, backend="tiered", lock_timeout=5)
     async def decode_vin(self, vin: str) -> Optional[Dict[str, Any]]:
         """Decode a Vehicle Identification Number (VIN).
 
@@ -365,7 +365,7 @@ class VehicleDataService:
                 original_exception=e,
             ) from e
 
-    @cached(ttl=3600, backend="redis")
+    @cached(ttl=3600, backend="tiered")
     async def standardize_make(self, make: str) -> str:
         """Standardize a vehicle make name.
 
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""
+Benchmark cache value codecs.
+
+Encodes representative cached values (a page of products, VCDB vehicle
+details and a short lookup list) with every installed serializer and
+compressor, and reports the encoded size and encode/decode time of each
+combination. The legacy format (plain pickle) is included for reference.
+
+Usage:
+    python scripts/benchmark_cache_codecs.py [--rounds 2000]
+"""
+
+import argparse
+import pickle
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add the backend directory to sys.path
+script_path = Path(__file__).resolve()
+backend_dir = script_path.parent.parent  # Go up two levels: from scripts/ to backend/
+sys.path.insert(0, str(backend_dir))
+
+from app.core.cache.codecs import CacheCodec, available_codecs
+
+
+def product_page(size: int = 50) -> Dict[str, Any]:
+    """Build a page of product search results."""
+    items = []
+    for i in range(size):
+        items.append(
+            {
+                "id": str(uuid.UUID(int=i)),
+                "part_number": f"CP{1000 + i:06d}",
+                "part_number_stripped": f"CP{1000 + i:06d}",
+                "application": "Front brake pad set, ceramic, with hardware",
+                "vintage": False,
+                "late_model": True,
+                "soft": False,
+                "universal": False,
+                "is_active": True,
+                "created_at": "2024-03-01T12:00:00",
+                "updated_at": "2024-03-01T12:00:00",
+                "descriptions": [
+                    {
+                        "description_type": "Short",
+                        "description": "Ceramic brake pad set",
+                    },
+                    {
+                        "description_type": "Long",
+                        "description": "Premium ceramic brake pads for quiet, "
+                        "low-dust stopping. Includes hardware kit.",
+                    },
+                ],
+                "attributes": [
+                    {"name": "Position", "value": "Front"},
+                    {"name": "Material", "value": "Ceramic"},
+                ],
+            }
+        )
+    return {"items": items, "total": 1200, "page": 1, "page_size": size, "pages": 24}
+
+
+def vehicle_details() -> Dict[str, Any]:
+    """Build VCDB details for one base vehicle."""
+    return {
+        "base_vehicle_id": 5911,
+        "year": 2005,
+        "make": "Jeep",
+        "model": "Grand Cherokee",
+        "submodels": ["Laredo", "Limited", "Overland", "SRT8"],
+        "engines": [
+            {
+                "engine_config_id": 1000 + i,
+                "liters": liters,
+                "cylinders": cylinders,
+                "fuel_type": "GAS",
+                "aspiration": "Naturally Aspirated",
+                "cylinder_head_type": "SOHC",
+            }
+            for i, (liters, cylinders) in enumerate(
+                [("3.7", 6), ("4.7", 8), ("5.7", 8), ("6.1", 8)]
+            )
+        ],
+        "transmissions": ["5-speed automatic", "6-speed manual"],
+        "drive_types": ["4WD", "RWD"],
+        "body_types": ["4-door SUV"],
+    }
+
+
+def timed(func: Callable[[], Any], rounds: int) -> float:
+    """Get the mean time of a call in microseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print a table per value."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    print(f"serializers: {', '.join(codecs['serializers'])}")
+    print(f"compressors: {', '.join(codecs['compressors'])}")
+
+    values = {
+        "product page (50)": product_page(),
+        "vehicle details": vehicle_details(),
+        "year list": list(range(1990, 2026)),
+    }
+    for label, value in values.items():
+        print(f"\n{label}")
+        print(f"  {'codec':<18}{'bytes':>9}{'encode us':>12}{'decode us':>12}")
+
+        legacy = pickle.dumps(value)
+        rows: List[tuple] = [
+            (
+                "legacy pickle",
+                len(legacy),
+                timed(lambda value=value: pickle.dumps(value), args.rounds),
+                timed(lambda legacy=legacy: pickle.loads(legacy), args.rounds),
+            )
+        ]
+        for serializer in codecs["serializers"]:
+            for compression in codecs["compressors"]:
+                codec = CacheCodec(serializer, compression)
+                encoded = codec.encode(value)
+                rows.append(
+                    (
+                        f"{serializer}+{compression}",
+                        len(encoded),
+                        timed(
+                            lambda codec=codec, value=value: codec.encode(value),
+                            args.rounds,
+                        ),
+                        timed(
+                            lambda codec=codec, encoded=encoded: codec.decode(encoded),
+                            args.rounds,
+                        ),
+                    )
+                )
+
+        for name, size, encode_us, decode_us in rows:
+            print(f"  {name:<18}{size:>9}{encode_us:>12.1f}{decode_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Benchmark cache key generation.
+
+Times building keys for typical cached calls (a method taking a VIN, a
+function taking filters) with the per-function CacheKeyBuilder against the
+per-call signature inspection, JSON encoding and MD5 hashing it replaced,
+and reports how many distinct keys each produces across service instances.
+
+Usage:
+    python scripts/benchmark_cache_keys.py [--calls 200000]
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add the backend directory to sys.path
+script_path = Path(__file__).resolve()
+backend_dir = script_path.parent.parent  # Go up two levels: from scripts/ to backend/
+sys.path.insert(0, str(backend_dir))
+
+from app.core.cache.keys import CacheKeyBuilder
+
+
+class VehicleService:
+    """Stand-in for VehicleDataService."""
+
+    async def decode_vin(self, vin: str) -> Dict[str, Any]:
+        return {"vin": vin}
+
+
+async def search_products(
+    query: str, filters: Optional[Dict[str, Any]] = None, page: int = 1
+) -> List[Any]:
+    return []
+
+
+def legacy_key(
+    prefix: str,
+    func: Callable,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """Original implementation of generate_cache_key."""
+    func_name = f"{func.__module__}.{func.__qualname__}"
+    inspect.signature(func)
+    args_str = json.dumps(list(args), sort_keys=True, default=str)
+    kwargs_str = json.dumps(kwargs, sort_keys=True, default=str)
+    key_parts = [prefix, func_name, args_str, kwargs_str]
+    key_hash = hashlib.md5(
+        json.dumps(key_parts, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"{prefix}:{func_name}:{key_hash}"
+
+
+def report(label: str, seconds: float, count: int) -> None:
+    """Print a timing with its per-call cost."""
+    print(f"{label:<34}{seconds:8.3f} s ({seconds / count * 1_000_000:.2f} us/call)")
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+
+    services = [VehicleService() for _ in range(100)]
+    vin_calls = [
+        ((services[(i // 500) % len(services)], f"1J4GZ58S{i % 500:09d}"), {})
+        for i in range(args.calls)
+    ]
+    search_calls = [
+        (("brake pad",), {"filters": {"year": 2005 + i % 10}, "page": i % 5})
+        for i in range(args.calls)
+    ]
+
+    for label, func, calls in (
+        ("decode_vin", VehicleService.decode_vin, vin_calls),
+        ("search_products", search_products, search_calls),
+    ):
+        start = time.perf_counter()
+        legacy = {legacy_key("bench", func, a, k) for a, k in calls}
+        report(f"{label} legacy:", time.perf_counter() - start, len(calls))
+
+        build_key = CacheKeyBuilder("bench", func)
+        start = time.perf_counter()
+        compiled = {build_key(a, k) for a, k in calls}
+        report(f"{label} compiled:", time.perf_counter() - start, len(calls))
+
+        print(f"  distinct keys: legacy {len(legacy)}, compiled {len(compiled)}")
+
+
+if __name__ == "__main__":
+    main()
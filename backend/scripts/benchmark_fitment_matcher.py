@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Benchmark the compiled model mapping matcher against the original linear scan.
+
+Generates a synthetic set of model mapping patterns and vehicle texts and
+times FitmentParser.find_model_mapping's matcher against the sorted
+substring scan it replaced.
+
+Usage:
+    python scripts/benchmark_fitment_matcher.py [--patterns 20000] [--texts 5000]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add the backend directory to sys.path
+script_path = Path(__file__).resolve()
+backend_dir = script_path.parent.parent  # Go up two levels: from scripts/ to backend/
+sys.path.insert(0, str(backend_dir))
+
+from app.fitment.matcher import ModelMappingMatcher, parse_mappings
+
+
+def legacy_find(model_mappings: Dict[str, List[str]], text: str) -> Optional[str]:
+    """Original implementation: sort on every call, then scan every pattern."""
+    patterns = sorted(model_mappings.keys(), key=len, reverse=True)
+    for pattern in patterns:
+        if pattern in text and parse_mappings(model_mappings[pattern]):
+            return pattern
+    return None
+
+
+def build_corpus(
+    pattern_count: int, text_count: int, seed: int
+) -> tuple[Dict[str, List[str]], List[str]]:
+    """Generate mapping patterns and vehicle texts that partly contain them."""
+    rng = random.Random(seed)
+
+    def word() -> str:
+        return "".join(
+            rng.choice(string.ascii_letters) for _ in range(rng.randint(2, 8))
+        )
+
+    mappings: Dict[str, List[str]] = {}
+    while len(mappings) < pattern_count:
+        pattern = " ".join(word() for _ in range(rng.randint(1, 3)))
+        mappings[pattern] = [f"Make{rng.randint(1, 50)}|{word()}|{pattern}"]
+
+    patterns = list(mappings)
+    texts = []
+    for _ in range(text_count):
+        if rng.random() < 0.8:
+            texts.append(f"{word()} {rng.choice(patterns)} {word()}")
+        else:
+            texts.append(" ".join(word() for _ in range(4)))
+
+    return mappings, texts
+
+
+def main() -> None:
+    """Run the benchmark and print per-lookup timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--patterns", type=int, default=20000)
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--legacy-texts", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    mappings, texts = build_corpus(args.patterns, args.texts, args.seed)
+
+    start = time.perf_counter()
+    matcher = ModelMappingMatcher(mappings)
+    build_seconds = time.perf_counter() - start
+    print(
+        f"Built matcher for {len(mappings)} patterns "
+        f"({matcher.node_count} nodes) in {build_seconds * 1000:.1f} ms"
+    )
+
+    start = time.perf_counter()
+    for text in texts:
+        matcher.match(text)
+    compiled_seconds = time.perf_counter() - start
+
+    # The legacy scan is slow, so only time a sample of texts
+    sample = texts[: args.legacy_texts]
+    start = time.perf_counter()
+    for text in sample:
+        expected = legacy_find(mappings, text)
+        if matcher.match(text) != expected:
+            print(f"MISMATCH for {text!r}: expected {expected!r}")
+    legacy_seconds = time.perf_counter() - start
+
+    compiled_us = compiled_seconds / len(texts) * 1_000_000
+    legacy_us = legacy_seconds / len(sample) * 1_000_000
+    print(f"Compiled matcher: {compiled_us:10.1f} us/lookup ({len(texts)} texts)")
+    print(f"Legacy scan:      {legacy_us:10.1f} us/lookup ({len(sample)} texts)")
+    print(f"Speedup:          {legacy_us / compiled_us:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+Benchmark bitmask position expansion and validation.
+
+Generates a synthetic application file (50k lines by default), expands each
+line into fitments with FitmentParser, and times position validation with
+FitmentValidator's bitmask checks against the per-axis dictionary lookups
+and recursive PositionGroup expansion they replaced.
+
+Usage:
+    python scripts/benchmark_fitment_positions.py [--lines 50000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# Add the backend directory to sys.path
+script_path = Path(__file__).resolve()
+backend_dir = script_path.parent.parent  # Go up two levels: from scripts/ to backend/
+sys.path.insert(0, str(backend_dir))
+
+from app.fitment.models import (
+    PCDBPosition,
+    PartFitment,
+    Position,
+    PositionGroup,
+    ValidationResult,
+    ValidationStatus,
+)
+from app.fitment.parser import FitmentParser
+from app.fitment.positions import (
+    AXES,
+    decode_position_mask,
+    encode_position_group,
+    expand_position_masks,
+)
+from app.fitment.validator import FitmentValidator
+
+MODELS = {
+    "Grand Cherokee": ["Jeep|WK|Grand Cherokee"],
+    "Cherokee": ["Jeep|XJ|Cherokee"],
+    "F-150": ["Ford|P415|F-150"],
+    "Silverado 1500": ["Chevrolet|GMT900|Silverado 1500"],
+    "Civic": ["Honda|FG|Civic"],
+}
+
+POSITION_TEXTS = [
+    "Front Left",
+    "Front Right",
+    "Rear Left Lower",
+    "Front Upper",
+    "Front Lower Inner",
+    "Rear",
+    "Left",
+    "Front Left or Right",
+    "Upper and Lower",
+    "Rear Outer",
+]
+
+PCDB_POSITIONS = [
+    PCDBPosition(id=1, name="Front Left", front_rear="Front", left_right="Left"),
+    PCDBPosition(id=2, name="Front Right", front_rear="Front", left_right="Right"),
+    PCDBPosition(id=3, name="Rear Left", front_rear="Rear", left_right="Left"),
+    PCDBPosition(id=4, name="Rear Right", front_rear="Rear", left_right="Right"),
+    PCDBPosition(id=5, name="Front Upper", front_rear="Front", upper_lower="Upper"),
+    PCDBPosition(id=6, name="Front Lower", front_rear="Front", upper_lower="Lower"),
+]
+
+
+def build_lines(line_count: int, seed: int) -> List[str]:
+    """Generate application lines like "2005-2010 Jeep Cherokee (Front Left)"."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(line_count):
+        start = rng.randint(1995, 2020)
+        end = start + rng.randint(0, 5)
+        model = rng.choice(list(MODELS))
+        lines.append(f"{start}-{end} {model} ({rng.choice(POSITION_TEXTS)})")
+    return lines
+
+
+def legacy_expand(
+    current: Dict[str, Position],
+    multiple_positions: List[Tuple[str, List[Position]]],
+    index: int,
+    result: List[PositionGroup],
+) -> None:
+    """Original implementation: recursive expansion into PositionGroup copies."""
+    if index >= len(multiple_positions):
+        result.append(PositionGroup(**current))
+        return
+    position_type, values = multiple_positions[index]
+    for value in values:
+        legacy_expand(
+            {**current, position_type: value}, multiple_positions, index + 1, result
+        )
+
+
+def legacy_check(
+    position_index: Dict[str, Dict[Position, Set[int]]], positions: PositionGroup
+) -> Optional[Set[int]]:
+    """Original implementation: per-axis dictionary lookups and set unions."""
+    ids: Set[int] = set()
+    for axis in AXES:
+        value = getattr(positions, axis)
+        if value == Position.NA:
+            continue
+        if value not in position_index[axis]:
+            return None
+        ids.update(position_index[axis][value])
+    return ids
+
+
+def legacy_validate(
+    position_index: Dict[str, Dict[Position, Set[int]]], fitment: PartFitment
+) -> ValidationResult:
+    """Original implementation, including building the validation result."""
+    ids = legacy_check(position_index, fitment.positions)
+    if ids is None:
+        return ValidationResult(
+            status=ValidationStatus.ERROR,
+            message="Invalid position",
+            fitment=fitment,
+            original_text=fitment.vehicle.full_name,
+        )
+    fitment.pcdb_position_ids = list(ids)
+    return ValidationResult(
+        status=ValidationStatus.VALID,
+        message="Positions are valid",
+        fitment=fitment,
+        original_text=fitment.vehicle.full_name,
+    )
+
+
+def report(label: str, seconds: float, count: int, unit: str = "fitment") -> None:
+    """Print a timing with its per-item cost."""
+    print(f"{label:<28}{seconds:8.2f} s ({seconds / count * 1_000_000:.2f} us/{unit})")
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    fitment_parser = FitmentParser(MODELS)
+    lines = build_lines(args.lines, args.seed)
+
+    start = time.perf_counter()
+    fitments = []
+    for line in lines:
+        part_app = fitment_parser.parse_application(line)
+        fitments.extend(fitment_parser.process_application(part_app))
+    parse_seconds = time.perf_counter() - start
+    print(f"Expanded {len(lines)} lines into {len(fitments)} fitments")
+    report("Parse + expand:", parse_seconds, len(fitments))
+
+    # Position expansion alone, for a mix of single and multi-valued axes
+    multiple = [
+        ("left_right", [Position.LEFT, Position.RIGHT]),
+        ("upper_lower", [Position.UPPER, Position.LOWER]),
+    ]
+    base = {axis: Position.NA for axis in AXES}
+    base["front_rear"] = Position.FRONT
+    base_mask = encode_position_group(PositionGroup(**base))
+
+    start = time.perf_counter()
+    for _ in lines:
+        legacy_expand(base, multiple, 0, [])
+    legacy_expand_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in lines:
+        [decode_position_mask(m) for m in expand_position_masks(base_mask, multiple)]
+    mask_expand_seconds = time.perf_counter() - start
+
+    report("Legacy expansion:", legacy_expand_seconds, len(lines), "line")
+    report("Bitmask expansion:", mask_expand_seconds, len(lines), "line")
+
+    validator = FitmentValidator(1896, PCDB_POSITIONS)
+    masks = validator.position_masks
+    groups = [fitment.positions for fitment in fitments]
+
+    # Compatibility check alone: per-axis lookups vs one AND per fitment
+    start = time.perf_counter()
+    for group in groups:
+        legacy_check(validator.position_index, group)
+    report("Legacy position check:", time.perf_counter() - start, len(groups))
+
+    start = time.perf_counter()
+    for group in groups:
+        mask = encode_position_group(group)
+        if not masks.missing(mask):
+            masks.position_ids(mask)
+    report("Bitmask position check:", time.perf_counter() - start, len(groups))
+
+    start = time.perf_counter()
+    masks.missing_many(encode_position_group(group) for group in groups)
+    report("Bitmask batch check:", time.perf_counter() - start, len(groups))
+
+    # End to end, including building a ValidationResult per fitment
+    start = time.perf_counter()
+    for fitment in fitments:
+        legacy_validate(validator.position_index, fitment)
+    report("Legacy validation:", time.perf_counter() - start, len(fitments))
+
+    start = time.perf_counter()
+    validator.check_positions(groups)
+    for fitment in fitments:
+        validator._validate_positions(fitment)
+    report("Bitmask validation:", time.perf_counter() - start, len(fitments))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+"""
+Benchmark the position tokenizer.
+
+Generates a synthetic set of application lines (50k by default) and times the
+position extraction of each with the single-pass tokenizer against the 28
+regex patterns FitmentParser.extract_positions evaluated previously, plus the
+full parse cost per application.
+
+Usage:
+    python scripts/benchmark_fitment_tokenizer.py [--lines 50000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add the backend directory to sys.path
+script_path = Path(__file__).resolve()
+backend_dir = script_path.parent.parent  # Go up two levels: from scripts/ to backend/
+sys.path.insert(0, str(backend_dir))
+
+from app.fitment.models import Position
+from app.fitment.parser import FitmentParser
+from app.fitment.positions import decode_position_mask, expand_position_masks
+from app.fitment.tokenizer import scan_position_text
+
+MODELS = {
+    "Grand Cherokee": ["Jeep|WK|Grand Cherokee"],
+    "Cherokee": ["Jeep|XJ|Cherokee"],
+    "F-150": ["Ford|P415|F-150"],
+    "Silverado 1500": ["Chevrolet|GMT900|Silverado 1500"],
+    "Civic": ["Honda|FG|Civic"],
+}
+
+POSITION_TEXTS = [
+    "Front Left",
+    "Front Right",
+    "Rear Left Lower",
+    "Front Upper",
+    "Front Lower Inner",
+    "Rear",
+    "Driver's Side",
+    "Passenger Side Front",
+    "Front Left or Right",
+    "Upper and Lower",
+    "Rear Outer",
+    "Varies with Trim",
+]
+
+AXIS_VALUES = {
+    "left_right": ("left|driver[\\'s]* side", "right|passenger[\\'s]* side"),
+    "front_rear": ("front", "rear"),
+    "upper_lower": ("upper", "lower"),
+    "inner_outer": ("inner", "outer"),
+}
+
+BOTH_VALUES = {
+    "left_right": [Position.LEFT, Position.RIGHT],
+    "front_rear": [Position.FRONT, Position.REAR],
+    "upper_lower": [Position.UPPER, Position.LOWER],
+    "inner_outer": [Position.INNER, Position.OUTER],
+}
+
+FIRST_VALUES = {
+    "left_right": (Position.LEFT, Position.RIGHT),
+    "front_rear": (Position.FRONT, Position.REAR),
+    "upper_lower": (Position.UPPER, Position.LOWER),
+    "inner_outer": (Position.INNER, Position.OUTER),
+}
+
+
+def build_legacy_patterns() -> Dict[str, List[Tuple[re.Pattern, object]]]:
+    """Compile the regex patterns the parser evaluated per application."""
+    patterns = {}
+    for axis, (first, second) in AXIS_VALUES.items():
+        first_value, second_value = FIRST_VALUES[axis]
+        first_words = first.split("|")[0]
+        second_words = second.split("|")[0]
+        patterns[axis] = [
+            (re.compile(rf"\b(?:{first})\b", re.IGNORECASE), first_value),
+            (re.compile(rf"\b(?:{second})\b", re.IGNORECASE), second_value),
+            (re.compile(rf"\b(?:{first}).+(?:{second})\b", re.IGNORECASE), "BOTH"),
+            (re.compile(rf"\b(?:{second}).+(?:{first})\b", re.IGNORECASE), "BOTH"),
+            (
+                re.compile(rf"\b(?:{first_words}|{second_words})\b", re.IGNORECASE),
+                "BOTH",
+            ),
+            (
+                re.compile(rf"\b(?:{first_words} or {second_words})\b", re.IGNORECASE),
+                "BOTH",
+            ),
+            (
+                re.compile(rf"\b(?:{first_words} and {second_words})\b", re.IGNORECASE),
+                "BOTH",
+            ),
+        ]
+    return patterns
+
+
+def legacy_scan(
+    patterns: Dict[str, List[Tuple[re.Pattern, object]]], text: str
+) -> Tuple[Dict[str, Position], List[Tuple[str, List[Position]]]]:
+    """Original implementation: search each axis's patterns in order."""
+    values = {axis: Position.NA for axis in patterns}
+    multiple = []
+    for axis, axis_patterns in patterns.items():
+        for pattern, value in axis_patterns:
+            if pattern.search(text):
+                if value == "BOTH":
+                    multiple.append((axis, BOTH_VALUES[axis]))
+                else:
+                    values[axis] = value
+                break
+    return values, multiple
+
+
+def build_lines(line_count: int, seed: int) -> List[str]:
+    """Generate application lines like "2005-2010 Jeep Cherokee (Front Left)"."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(line_count):
+        start = rng.randint(1995, 2020)
+        end = start + rng.randint(0, 5)
+        model = rng.choice(list(MODELS))
+        lines.append(f"{start}-{end} {model} ({rng.choice(POSITION_TEXTS)})")
+    return lines
+
+
+def report(label: str, seconds: float, count: int) -> None:
+    """Print a timing with its per-application cost."""
+    print(f"{label:<28}{seconds:8.2f} s ({seconds / count * 1_000_000:.2f} us/line)")
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    fitment_parser = FitmentParser(MODELS)
+    lines = build_lines(args.lines, args.seed)
+    position_texts = [
+        fitment_parser.parse_application(line).position_text for line in lines
+    ]
+
+    patterns = build_legacy_patterns()
+    mismatches = 0
+    for text in set(position_texts):
+        values, multiple = legacy_scan(patterns, text)
+        base_mask, scanned_multiple = scan_position_text(text)
+        group = decode_position_mask(base_mask)
+        if multiple != scanned_multiple or any(
+            getattr(group, axis) != value for axis, value in values.items()
+        ):
+            mismatches += 1
+    print(f"Checked {len(set(position_texts))} position texts, {mismatches} mismatches")
+
+    start = time.perf_counter()
+    for text in position_texts:
+        legacy_scan(patterns, text)
+    report("Regex scan:", time.perf_counter() - start, len(lines))
+
+    start = time.perf_counter()
+    for text in position_texts:
+        scan_position_text(text)
+    report("Tokenizer scan:", time.perf_counter() - start, len(lines))
+
+    start = time.perf_counter()
+    for text in position_texts:
+        base_mask, multiple = scan_position_text(text)
+        [decode_position_mask(m) for m in expand_position_masks(base_mask, multiple)]
+    report("Tokenizer + expand:", time.perf_counter() - start, len(lines))
+
+    start = time.perf_counter()
+    for line in lines:
+        part_app = fitment_parser.parse_application(line)
+        fitment_parser.process_application(part_app)
+    report("Full parse per line:", time.perf_counter() - start, len(lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# /backend/tests/unit/conftest.py
+from __future__ import annotations
+
+from typing import Callable, Iterator
+
+import pytest
+
+from app.core.cache.backends.memory import MemoryCacheBackend
+from app.core.cache.manager import cache_manager
+from app.core.cache.stats import reset_function_stats
+
+
+@pytest.fixture
+def cache_backend_class() -> Callable[[], MemoryCacheBackend]:
+    """Backend class the memory_cache fixture builds; override per module."""
+    return MemoryCacheBackend
+
+
+@pytest.fixture
+def memory_cache(
+    cache_backend_class: Callable[[], MemoryCacheBackend]
+) -> Iterator[MemoryCacheBackend]:
+    """
+    Point the cache manager at a fresh in-process backend.
+
+    The backend serves both the "memory" and "redis" names, and function
+    statistics and hot key samplers start empty.
+    """
+    backends, initialized = cache_manager.backends, cache_manager._initialized
+    hot_keys = cache_manager.hot_keys
+    backend = cache_backend_class()
+    cache_manager.backends = {"memory": backend, "redis": backend}
+    cache_manager.hot_keys = {}
+    cache_manager._initialized = True
+    reset_function_stats()
+    yield backend
+    cache_manager.backends, cache_manager._initialized = backends, initialized
+    cache_manager.hot_keys = hot_keys
@@ -0,0 +1,367 @@
+# /backend/tests/unit/test_as400_pipeline.py
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import sys
+import types
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+# The connector imports pyodbc at module level; stub it only while importing
+# if the host has no ODBC driver, so other tests still see it missing
+try:
+    import pyodbc
+except ImportError:
+    pyodbc = types.ModuleType("pyodbc")
+    pyodbc.Error = type("Error", (Exception,), {})
+    pyodbc.SQL_CHAR = 1
+    pyodbc.SQL_WCHAR = -8
+    pyodbc.connect = None
+    sys.modules["pyodbc"] = pyodbc
+    try:
+        from app.data_import.connectors import as400_connector
+    finally:
+        del sys.modules["pyodbc"]
+else:
+    from app.data_import.connectors import as400_connector
+
+from app.core.exceptions import DatabaseException, SecurityException
+from app.data_import.connectors.as400_connector import (
+    AS400ConnectionConfig,
+    AS400Connector,
+)
+from app.data_import.pipeline.as400_pipeline import AS400Pipeline, _range_predicates
+from app.data_import.pipeline.change_tracking import ChangeTracker
+from app.domains.sync_history.models import SyncEntityType
+
+Row = Tuple[Any, ...]
+
+
+class FakeCursor:
+    """Cursor serving canned rows, optionally failing after some fetches."""
+
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection = connection
+        self.description = [(column,) for column in connection.columns]
+        self.rows: List[Row] = []
+        self.fetches = 0
+
+    def execute(self, query: str, params: Optional[Tuple] = None) -> None:
+        self.connection.executed.append((query, params))
+        self.rows = list(self.connection.rows)
+
+    def fetchmany(self, size: int) -> List[Row]:
+        self.fetches += 1
+        if self.connection.fail_on_fetch == self.fetches:
+            raise as400_connector.pyodbc.Error("connection reset")
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    def fetchall(self) -> List[Row]:
+        rows, self.rows = self.rows, []
+        return rows
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    """Connection returned by the patched pyodbc.connect."""
+
+    def __init__(
+        self,
+        rows: List[Row],
+        fail_on_fetch: Optional[int] = None,
+        columns: Tuple[str, ...] = ("PRDNUM", "NAME"),
+    ):
+        self.rows = rows
+        self.columns = columns
+        self.fail_on_fetch = fail_on_fetch
+        self.executed: List[Tuple[str, Optional[Tuple]]] = []
+        self.closed = False
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeProcessor:
+    """Passes rows through, dropping those whose name is "bad" on validation."""
+
+    async def process(self, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [dict(record) for record in chunk]
+
+    async def validate(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [record for record in records if record["NAME"] != "bad"]
+
+
+class FakeImporter:
+    """Records imported chunks, reporting the first record of each as failed."""
+
+    def __init__(self, fail_first: bool = False) -> None:
+        self.fail_first = fail_first
+        self.chunks: List[List[Dict[str, Any]]] = []
+        self.blocked = False
+        self.cancelled = False
+
+    async def import_data(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if self.blocked:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        self.chunks.append(records)
+        if not self.fail_first:
+            return {"created": len(records), "updated": 0, "errors": 0}
+        return {
+            "created": len(records) - 1,
+            "updated": 0,
+            "errors": 1,
+            "error_details": [{"index": 0, "error": "duplicate"}],
+        }
+
+
+def connect_to(monkeypatch, connection: FakeConnection) -> None:
+    monkeypatch.setattr(as400_connector.pyodbc, "connect", lambda *args: connection)
+
+
+def make_pipeline(
+    importer: FakeImporter,
+    chunk_size: int = 2,
+    change_tracker: Optional[ChangeTracker] = None,
+) -> AS400Pipeline:
+    config = AS400ConnectionConfig(
+        dsn="AS400",
+        username="reader",
+        password="secret",
+        database="PRODLIB",
+        encrypt_connection=False,
+    )
+    return AS400Pipeline(
+        AS400Connector(config),
+        FakeProcessor(),
+        importer,
+        chunk_size=chunk_size,
+        change_tracker=change_tracker,
+    )
+
+
+ROWS = [(f"P{i}", f"Part {i}") for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_run_reports_counts_per_stage(monkeypatch) -> None:
+    """Every row flows through the stages in chunks and is counted once."""
+    connection = FakeConnection(ROWS[:3] + [("P3", "bad")] + ROWS[4:])
+    connect_to(monkeypatch, connection)
+    importer = FakeImporter()
+
+    result = await make_pipeline(importer).run("PRODUCTS", limit=10)
+
+    assert connection.executed == [
+        ('SELECT * FROM "PRODUCTS" FETCH FIRST 10 ROWS ONLY', None)
+    ]
+    assert connection.closed
+    assert result["success"] is True
+    assert (
+        result["records_extracted"],
+        result["records_processed"],
+        result["records_validated"],
+        result["records_imported"],
+        result["records_created"],
+        result["records_with_errors"],
+    ) == (5, 5, 4, 4, 4, 0)
+    assert [len(chunk) for chunk in importer.chunks] == [2, 1, 1]
+    assert result["stages"]["extract"]["batches"] == 3
+    assert set(result["stages"]) == {"extract", "process", "validate", "import"}
+    assert set(result["max_queue_depth"]) == {"extracted", "validated"}
+    for key in ("extract_time", "import_time", "total_time", "sync_timestamp"):
+        assert key in result
+
+
+@pytest.mark.asyncio
+async def test_import_errors_are_offset_by_chunk(monkeypatch) -> None:
+    """Error indices from the importer are positions in the whole extract."""
+    connect_to(monkeypatch, FakeConnection(ROWS))
+
+    result = await make_pipeline(FakeImporter(fail_first=True)).run("PRODUCTS")
+
+    assert result["success"] is False
+    assert result["records_with_errors"] == 3
+    assert [error["index"] for error in result["error_details"]] == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_extract_error_cancels_other_stages(monkeypatch) -> None:
+    """A failed fetch stops the run instead of leaving the import stage waiting."""
+    connection = FakeConnection(ROWS, fail_on_fetch=2)
+    connect_to(monkeypatch, connection)
+    importer = FakeImporter()
+    importer.blocked = True
+
+    with pytest.raises(DatabaseException):
+        await asyncio.wait_for(make_pipeline(importer).run("PRODUCTS"), timeout=5)
+
+    assert importer.cancelled
+    assert connection.closed
+
+
+@pytest.mark.asyncio
+async def test_high_water_mark_is_held_before_rows_not_imported(monkeypatch) -> None:
+    """The mark stays at the earliest chunk that lost rows, so they are retried."""
+    rows = [
+        ("P0", "Part 0", 10),
+        ("P1", "Part 1", 11),
+        ("P2", "bad", 12),
+        ("P3", "Part 3", 13),
+        ("P4", "Part 4", 14),
+    ]
+    connect_to(monkeypatch, FakeConnection(rows, columns=("PRDNUM", "NAME", "UPD")))
+    tracker = ChangeTracker(
+        SyncEntityType.PRODUCT, ["PRDNUM"], timestamp_field="UPD", incremental=False
+    )
+    accepted: List[Dict[str, int]] = []
+
+    async def accept(digests: Dict[str, int]) -> None:
+        accepted.append(digests)
+
+    monkeypatch.setattr(tracker, "accept", accept)
+
+    result = await make_pipeline(FakeImporter(), change_tracker=tracker).run("PRODUCTS")
+
+    assert result["success"] is True
+    assert tracker.high_water_mark == "12"
+    assert [sorted(digests) for digests in accepted] == [["P0", "P1"], ["P4"]]
+
+
+@pytest.mark.asyncio
+async def test_changed_rows_of_a_table_are_extracted(monkeypatch) -> None:
+    """Table names are checked and expanded before limiting them to changed rows."""
+    connection = FakeConnection([], columns=("PRDNUM", "NAME", "UPD"))
+    connect_to(monkeypatch, connection)
+    tracker = ChangeTracker(
+        SyncEntityType.PRODUCT, ["PRDNUM"], timestamp_field="UPD", high_water_mark="12"
+    )
+    pipeline = make_pipeline(FakeImporter(), change_tracker=tracker)
+
+    await pipeline.run("PRODUCTS", limit=10)
+
+    assert connection.executed == [
+        (
+            'SELECT * FROM (SELECT * FROM "PRODUCTS") AS CHANGED_ROWS '
+            "WHERE UPD >= ? FETCH FIRST 10 ROWS ONLY",
+            (12,),
+        )
+    ]
+
+    pipeline.connector.config.allowed_tables = ["STOCK"]
+    with pytest.raises(SecurityException):
+        await pipeline.run("PRODUCTS")
+
+
+@pytest.mark.parametrize("bounds", [[], [3], [2, 5, 8]], ids=["one", "two", "four"])
+def test_range_predicates_cover_every_row_once(bounds: List[Any]) -> None:
+    """Each key, NULL included, falls in exactly one range."""
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE PRODUCTS (ID INTEGER)")
+    keys = [None, 1, 2, 2, 3, 5, 6, 8, 9]
+    db.executemany("INSERT INTO PRODUCTS VALUES (?)", [(key,) for key in keys])
+
+    ranges = [
+        [
+            key
+            for (key,) in db.execute(
+                f"SELECT ID FROM PRODUCTS WHERE {predicate}", tuple(params.values())
+            )
+        ]
+        for predicate, params in _range_predicates("ID", bounds)
+    ]
+
+    assert len(ranges) == len(bounds) + 1
+    assert None in ranges[0]
+    assert sorted(sum(ranges, []), key=str) == sorted(keys, key=str)
+
+
+@pytest.mark.asyncio
+async def test_partition_bounds_skip_repeated_keys(monkeypatch) -> None:
+    """Tiles ending at the same key don't make empty ranges."""
+    pipeline = make_pipeline(FakeImporter())
+    extracted: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def extract(query: str, **params: Any) -> List[Dict[str, Any]]:
+        extracted.append((query, params))
+        return [{"UPPER_BOUND": bound} for bound in ["A", "A", "B", "B", "C", "D"]]
+
+    monkeypatch.setattr(pipeline.connector, "extract", extract)
+
+    bounds = await pipeline._partition_bounds(
+        "SELECT * FROM PRODUCTS WHERE PLANT = ?", "PRDNUM", 6, {"plant": 1}
+    )
+
+    # The last tile's bound isn't needed: the last range has no upper end
+    assert bounds == ["A", "B", "C"]
+    query, params = extracted[0]
+    assert "NTILE(6) OVER (ORDER BY PRDNUM)" in query
+    assert "FROM (SELECT * FROM PRODUCTS WHERE PLANT = ?) AS PARTITION_SOURCE" in query
+    assert params == {"plant": 1}
+
+
+@pytest.mark.asyncio
+async def test_partitioned_parameters_follow_their_placeholders(monkeypatch) -> None:
+    """Query, changed rows and range parameters bind in placeholder order."""
+    connection = FakeConnection([], columns=("PRDNUM", "NAME", "UPD"))
+    connect_to(monkeypatch, connection)
+    tracker = ChangeTracker(
+        SyncEntityType.PRODUCT, ["PRDNUM"], timestamp_field="UPD", high_water_mark="12"
+    )
+    pipeline = make_pipeline(FakeImporter(), change_tracker=tracker)
+    bound_params: List[Dict[str, Any]] = []
+
+    async def partition_bounds(
+        query: str, key_column: str, partitions: int, params: Dict[str, Any]
+    ) -> List[Any]:
+        bound_params.append(params)
+        return ["P3", "P7"]
+
+    monkeypatch.setattr(pipeline, "_partition_bounds", partition_bounds)
+
+    result = await pipeline.run_partitioned(
+        "SELECT * FROM PRODUCTS WHERE PLANT = ?", "PRDNUM", 3, plant=1
+    )
+
+    assert result["success"] is True
+    assert bound_params == [{"plant": 1, "changed_after": 12}]
+    source = (
+        "SELECT * FROM (SELECT * FROM (SELECT * FROM PRODUCTS WHERE PLANT = ?) "
+        "AS CHANGED_ROWS WHERE UPD >= ?) AS RANGE_SOURCE WHERE "
+    )
+    assert sorted(connection.executed) == [
+        (source + "(PRDNUM <= ? OR PRDNUM IS NULL)", (1, 12, "P3")),
+        (source + "PRDNUM > ?", (1, 12, "P7")),
+        (source + "PRDNUM > ? AND PRDNUM <= ?", (1, 12, "P3", "P7")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_change_columns_may_contain_write_keywords(monkeypatch) -> None:
+    """A column such as LAST_UPDATED passes the read-only check; UPDATE doesn't."""
+    connection = FakeConnection([], columns=("PRDNUM", "NAME", "LAST_UPDATED"))
+    connect_to(monkeypatch, connection)
+    tracker = ChangeTracker(
+        SyncEntityType.PRODUCT,
+        ["PRDNUM"],
+        timestamp_field="LAST_UPDATED",
+        high_water_mark="12",
+    )
+    pipeline = make_pipeline(FakeImporter(), change_tracker=tracker)
+
+    await pipeline.run("SELECT * FROM PRODUCTS WHERE IS_DELETED = 0")
+
+    assert connection.executed[0][0].endswith("WHERE LAST_UPDATED >= ?")
+    with pytest.raises(SecurityException):
+        await pipeline.run("UPDATE PRODUCTS SET NAME = 'x'")
@@ -0,0 +1,73 @@
+# /backend/tests/unit/test_cache_batching.py
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+from app.core.cache.backends.memory import MemoryCacheBackend
+from app.core.cache.batching import batch_cache_reads
+from app.core.cache.decorators import cached
+from app.core.cache.manager import cache_manager
+
+
+class CountingMemoryBackend(MemoryCacheBackend):
+    """Memory backend recording every read it serves."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: List[List[str]] = []
+
+    async def get(self, key: str):
+        self.reads.append([key])
+        return await super().get(key)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Optional[object]]:
+        self.reads.append(list(keys))
+        return await super().get_many(keys)
+
+
+@pytest.fixture
+def cache_backend_class() -> type[CountingMemoryBackend]:
+    return CountingMemoryBackend
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_round_trip(memory_cache) -> None:
+    """Gets gathered inside a batch are loaded with one get_many call."""
+    await memory_cache.set_many({"year:2005": 2005, "year:2006": 2006})
+
+    async with batch_cache_reads(max_keys=2) as batch:
+        values = await asyncio.gather(
+            cache_manager.get("year:2005", backend="memory"),
+            cache_manager.get("year:2006", backend="memory"),
+            cache_manager.get("year:2005", backend="memory"),
+            cache_manager.get("year:2007", default=0, backend="memory"),
+        )
+
+    assert values == [2005, 2006, 2005, 0]
+    assert memory_cache.reads == [["year:2005", "year:2006"], ["year:2007"]]
+    assert (batch.round_trips, batch.keys_loaded) == (2, 3)
+
+    memory_cache.reads.clear()
+    assert await cache_manager.get("year:2005", backend="memory") == 2005
+    assert memory_cache.reads == [["year:2005"]]
+
+
+@pytest.mark.asyncio
+async def test_cached_functions_batch_lookups(memory_cache) -> None:
+    """Cached calls gathered in a request share the cache round trip."""
+
+    @cached(prefix="test:batch", ttl=60, backend="memory")
+    async def decode(vin: str) -> dict:
+        return {"vin": vin}
+
+    vins = ["1J4GZ58S", "1FTRX18W", "2G1WF52E"]
+    async with batch_cache_reads():
+        await asyncio.gather(*(decode(vin) for vin in vins))
+        memory_cache.reads.clear()
+        results = await asyncio.gather(*(decode(vin) for vin in vins))
+
+    assert results == [{"vin": vin} for vin in vins]
+    assert len(memory_cache.reads) == 1 and len(memory_cache.reads[0]) == 3
@@ -0,0 +1,100 @@
+# /backend/tests/unit/test_cache_codecs.py
+from __future__ import annotations
+
+import functools
+import json
+import pickle
+from typing import Any, List, Optional
+
+import pytest
+
+from app.core.cache.backends.memory import MemoryCacheBackend
+from app.core.cache.codecs import CacheCodec, available_codecs
+from app.core.cache.decorators import cached
+from app.core.cache.exceptions import CacheConfigurationException
+
+VALUE = {"items": [{"part_number": f"CP{i:06d}", "active": True} for i in range(100)]}
+
+
+def test_values_from_every_codec_are_readable() -> None:
+    """Any codec decodes what any other codec wrote, headers included."""
+    codecs = available_codecs()
+    writers = [
+        CacheCodec(serializer, compression, threshold=64)
+        for serializer in codecs["serializers"]
+        for compression in codecs["compressors"]
+    ]
+    reader = CacheCodec("pickle")
+    for writer in writers:
+        encoded = writer.encode(VALUE)
+        assert encoded[0] >= 0xC0
+        assert reader.decode(encoded) == VALUE
+
+
+def test_compression_threshold() -> None:
+    """Only values at least threshold bytes long are compressed."""
+    codec = CacheCodec("json", "zlib", threshold=1024)
+
+    small = codec.encode([1, 2, 3])
+    assert small == bytes([0xC2]) + b"[1,2,3]"
+
+    large = codec.encode(VALUE)
+    assert large[0] == 0xC0 | 1 << 3 | 2
+    assert len(large) < len(json.dumps(VALUE))
+    assert codec.decode(large) == VALUE
+
+
+def test_legacy_values() -> None:
+    """Values written before codec headers are still decoded."""
+    codec = CacheCodec("json", "zlib")
+
+    assert codec.decode(pickle.dumps(VALUE)) == VALUE
+    assert codec.decode(json.dumps(VALUE).encode("utf-8")) == VALUE
+    assert codec.decode(b"42") == 42
+
+
+def test_unknown_codec() -> None:
+    """Unknown codec names are rejected when the codec is built."""
+    with pytest.raises(CacheConfigurationException):
+        CacheCodec("yaml")
+    with pytest.raises(CacheConfigurationException):
+        CacheCodec("pickle", "brotli")
+
+
+class EncodingMemoryBackend(MemoryCacheBackend):
+    """Memory backend storing values encoded, as the Redis backend does."""
+
+    def __init__(self, serializer: str) -> None:
+        super().__init__()
+        self.codec = CacheCodec(serializer)
+
+    async def get(self, key: str) -> Any:
+        value = await super().get(key)
+        return None if value is None else self.codec.decode(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        return await super().set(key, self.codec.encode(value), ttl)
+
+
+SERIALIZERS = available_codecs()["serializers"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cache_backend_class",
+    [functools.partial(EncodingMemoryBackend, name) for name in SERIALIZERS],
+    ids=SERIALIZERS,
+)
+async def test_cached_values_round_trip_every_serializer(memory_cache) -> None:
+    """Early refresh entries and negative results survive every serializer."""
+    calls: List[str] = []
+
+    @cached(backend="memory", ttl=300, negative_ttl=60)
+    async def find(part_number: str) -> Optional[dict]:
+        calls.append(part_number)
+        return None if part_number == "missing" else {"part_number": part_number}
+
+    for _ in range(2):
+        assert await find("CP100") == {"part_number": "CP100"}
+        assert await find("missing") is None
+    assert calls == ["CP100", "missing"]
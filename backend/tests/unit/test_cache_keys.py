@@ -0,0 +1,65 @@
+# /backend/tests/unit/test_cache_keys.py
+from __future__ import annotations
+
+from app.core.cache.keys import CacheKeyBuilder, generate_cache_key
+
+
+class VehicleService:
+    """Stand-in for a service whose cached methods take self."""
+
+    def __init__(self, db: object) -> None:
+        self.db = db
+
+    async def decode_vin(self, vin: str) -> dict:
+        return {"vin": vin}
+
+
+class TenantService(VehicleService):
+    """Service whose results depend on instance state."""
+
+    def __init__(self, db: object, tenant: str) -> None:
+        super().__init__(db)
+        self.tenant = tenant
+
+    def cache_identity(self) -> str:
+        return self.tenant
+
+
+def test_method_keys_repeat_across_instances() -> None:
+    """The bound instance is not part of the key."""
+    build_key = CacheKeyBuilder("vehicle", VehicleService.decode_vin)
+    first = build_key((VehicleService(object()), "1J4GZ58S"), {})
+    second = build_key((VehicleService(object()), "1J4GZ58S"), {})
+
+    assert first == second
+    assert first.startswith("vehicle:test_cache_keys.VehicleService.decode_vin:")
+    assert first != build_key((VehicleService(object()), "1FTRX18W"), {})
+
+
+def test_cache_identity_hook() -> None:
+    """Instances with cache_identity() get keys per identity."""
+    build_key = CacheKeyBuilder("vehicle", TenantService.decode_vin)
+    acme = build_key((TenantService(object(), "acme"), "1J4GZ58S"), {})
+
+    assert acme == build_key((TenantService(object(), "acme"), "1J4GZ58S"), {})
+    assert acme != build_key((TenantService(object(), "zenith"), "1J4GZ58S"), {})
+
+
+def test_arguments_and_skips() -> None:
+    """Argument types, keyword order and skipped arguments are handled."""
+
+    def search(query, page=1, session=None):
+        return query
+
+    build_key = CacheKeyBuilder("search", search, skip_kwargs=["session"])
+
+    assert build_key(("brake",), {"page": 1}) != build_key(("brake",), {"page": "1"})
+    assert build_key((), {"query": "brake", "page": 2}) == build_key(
+        (), {"page": 2, "query": "brake"}
+    )
+    assert build_key(("brake",), {"session": object()}) == build_key(("brake",), {})
+    assert build_key(({"year": 2005},), {}) == build_key(({"year": 2005},), {})
+
+    assert generate_cache_key("search", search, ("brake",), {}) == build_key(
+        ("brake",), {}
+    )
@@ -0,0 +1,124 @@
+# /backend/tests/unit/test_cache_memory.py
+from __future__ import annotations
+
+import pytest
+
+from app.core.cache.backends import memory
+from app.core.cache.backends.memory import MemoryCacheBackend, estimate_size
+
+
+class Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(memory.time, "monotonic", clock)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_by_count() -> None:
+    """The least recently used key is evicted once max_size is exceeded."""
+    cache = MemoryCacheBackend(max_size=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_eviction_by_bytes() -> None:
+    """Entries are evicted to keep the estimated size under max_bytes."""
+    value = "x" * 1000
+    cache = MemoryCacheBackend(max_size=100, max_bytes=3 * estimate_size(value))
+    for i in range(5):
+        await cache.set(f"k{i}", value)
+
+    assert list(cache.cache) == ["k2", "k3", "k4"]
+    assert cache.bytes == 3 * estimate_size(value)
+    assert not await cache.set("huge", "x" * 10000)
+    assert await cache.get("huge") is None
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry(clock: Clock) -> None:
+    """Expired entries are dropped on read and purged from the heap on write."""
+    cache = MemoryCacheBackend()
+    await cache.set("short", 1, ttl=10)
+    await cache.set("long", 2, ttl=100)
+    await cache.set("forever", 3)
+    await cache.set("short", 4, ttl=50)
+
+    clock.now += 20
+    assert await cache.get("short") == 4
+
+    clock.now += 40
+    assert await cache.exists("short") is False
+    await cache.set("other", 5)
+    assert set(cache.cache) == {"long", "forever", "other"}
+
+    clock.now += 1000
+    await cache.set("other", 6)
+    assert set(cache.cache) == {"forever", "other"}
+    assert cache.get_stats()["expirations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_pattern() -> None:
+    """Prefix patterns use the key trie; other globs still match."""
+    cache = MemoryCacheBackend()
+    for key in (
+        "vehicle:years:abc",
+        "vehicle:makes:def",
+        "vehicle:makes2:ghi",
+        "vehicles:jkl",
+        "search:products:mno",
+    ):
+        await cache.set(key, key)
+
+    assert await cache.invalidate_pattern("vehicle:makes*") == 2
+    assert await cache.invalidate_pattern("vehicle*") == 2
+    assert list(cache.cache) == ["search:products:mno"]
+
+    await cache.set("search:fitments:pqr", 1)
+    assert await cache.invalidate_pattern("search:*:mno") == 1
+    assert await cache.invalidate_pattern("search:fitments:pqr") == 1
+    assert await cache.invalidate_pattern("*") == 0
+    assert cache._keys.root.children == {} and not cache._keys.root.keys
+
+
+@pytest.mark.asyncio
+async def test_sample_stats_by_prefix() -> None:
+    """Entries are counted per key prefix and sized from a sample."""
+    cache = MemoryCacheBackend()
+    for i in range(30):
+        await cache.set(f"vcdb:makes:{i}", "x" * 100)
+    for i in range(10):
+        await cache.set(f"products:part_number:{i}", "x" * 1000)
+    await cache.set("plain", 1)
+    await cache.get("vcdb:makes:1")
+    await cache.get("vcdb:makes:missing")
+
+    stats = await cache.sample_stats(sample_size=8)
+
+    assert (stats["items"], stats["hits"], stats["misses"]) == (41, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert list(stats["prefixes"]) == ["vcdb:makes", "products:part_number", ""]
+    makes = stats["prefixes"]["vcdb:makes"]
+    parts = stats["prefixes"]["products:part_number"]
+    assert makes["items"] == 30 and parts["items"] == 10
+    assert makes["bytes"] == 30 * estimate_size("x" * 100)
+    assert parts["bytes"] == 10 * estimate_size("x" * 1000)
@@ -0,0 +1,73 @@
+# /backend/tests/unit/test_cache_negative.py
+from __future__ import annotations
+
+from typing import List, Optional
+
+import pytest
+
+from app.core.cache.codecs import CacheCodec
+from app.core.cache.decorators import cached
+from app.core.cache.negative import NEGATIVE_RESULT
+from app.core.cache.stats import get_function_stats
+
+
+def test_sentinel_survives_pickling() -> None:
+    """The sentinel is the same object after a round trip through a codec."""
+    codec = CacheCodec("pickle", "zlib", threshold=1)
+    assert codec.decode(codec.encode(NEGATIVE_RESULT)) is NEGATIVE_RESULT
+
+
+@pytest.mark.asyncio
+async def test_none_results_are_cached_with_negative_ttl(memory_cache) -> None:
+    """Missing results are served from the cache and counted as negative hits."""
+    calls: List[str] = []
+
+    @cached(backend="memory", ttl=300, negative_ttl=5)
+    async def find(part_number: str) -> Optional[str]:
+        calls.append(part_number)
+        return part_number if part_number.startswith("CP") else None
+
+    assert [await find("XX1") for _ in range(3)] == [None] * 3
+    assert [await find("CP1") for _ in range(2)] == ["CP1"] * 2
+    assert calls == ["XX1", "CP1"]
+
+    soonest = min(memory_cache.cache.values(), key=lambda entry: entry.expires_at)
+    assert soonest.value is NEGATIVE_RESULT
+
+    function = f"{find.__module__}.{find.__qualname__}"
+    assert get_function_stats()[function] == {
+        "hit": 1,
+        "negative_hit": 2,
+        "miss": 2,
+        "hit_rate": 0.6,
+    }
+
+
+@pytest.mark.asyncio
+async def test_negative_only_caches_just_none(memory_cache) -> None:
+    """With negative_only, found values are returned but never stored."""
+    calls: List[str] = []
+
+    @cached(backend="memory", negative_ttl=5, negative_only=True)
+    async def find(part_number: str) -> Optional[str]:
+        calls.append(part_number)
+        return part_number if part_number.startswith("CP") else None
+
+    for _ in range(2):
+        assert await find("XX1") is None
+        assert await find("CP1") == "CP1"
+    assert calls == ["XX1", "CP1", "CP1"]
+
+
+@pytest.mark.asyncio
+async def test_none_is_not_cached_by_default(memory_cache) -> None:
+    """Without a negative TTL, None results keep reaching the function."""
+    calls: List[int] = []
+
+    @cached(backend="memory")
+    async def find(vehicle_id: int) -> None:
+        calls.append(vehicle_id)
+
+    await find(1)
+    await find(1)
+    assert calls == [1, 1]
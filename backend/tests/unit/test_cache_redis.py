@@ -0,0 +1,174 @@
+# /backend/tests/unit/test_cache_redis.py
+from __future__ import annotations
+
+import fnmatch
+import itertools
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from app.core.cache.backends.redis import RedisCacheBackend
+from app.core.cache.exceptions import CacheOperationException
+
+
+class FakePipeline:
+    """Queues commands and runs them against a FakeRedisClient."""
+
+    def __init__(self, client: FakeRedisClient) -> None:
+        self.client = client
+        self.commands: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args: Any, **kwargs: Any) -> FakePipeline:
+            self.commands.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self) -> List[Any]:
+        self.client.pipelines.append([name for name, _ in self.commands])
+        return [getattr(self.client, name)(*args) for name, args in self.commands]
+
+
+class FakeRedisClient:
+    """Just enough of redis.asyncio.Redis for key invalidation."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+        self.pipelines: List[List[str]] = []
+        self._random_keys = None
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def scan_iter(self, match: str, count: int):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key.encode("utf-8")
+
+    async def keys(self, pattern: str) -> List[bytes]:
+        raise AssertionError("KEYS must not be used")
+
+    def unlink(self, *keys: Any) -> int:
+        removed = 0
+        for key in keys:
+            key = key.decode("utf-8") if isinstance(key, bytes) else key
+            removed += self.data.pop(key, None) is not None
+        return removed
+
+    def smembers(self, key: str) -> Set[bytes]:
+        return {member.encode("utf-8") for member in self.data.get(key, set())}
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> bool:
+        self.data[key] = value
+        return True
+
+    def dbsize(self) -> int:
+        return len(self.data)
+
+    def info(self, section: str) -> Dict[str, int]:
+        return {"used_memory": 4096, "evicted_keys": 3}
+
+    def randomkey(self) -> bytes:
+        # Deterministic stand-in: cycles through the keys in order
+        if self._random_keys is None:
+            self._random_keys = itertools.cycle(list(self.data))
+        return next(self._random_keys).encode("utf-8")
+
+    def memory_usage(self, key: bytes) -> int:
+        return len(self.data[key.decode("utf-8")]) + 50
+
+    def eval(self, script: str, numkeys: int, key: str, member: str, ttl: int) -> int:
+        self.data.setdefault(key, set()).add(member)
+        return 1
+
+
+@pytest.fixture
+def backend() -> RedisCacheBackend:
+    backend = RedisCacheBackend(prefix="cache:")
+    backend.client = FakeRedisClient()
+    backend.scan_count = 4
+    backend.unlink_batch_size = 3
+    return backend
+
+
+@pytest.mark.asyncio
+async def test_invalidate_pattern_scans_and_unlinks_in_batches(
+    backend: RedisCacheBackend,
+) -> None:
+    """Matching keys are removed in SCAN-sized batches of pipelined UNLINKs."""
+    client = backend.client
+    for i in range(10):
+        client.data[f"cache:search:{i}"] = b"x"
+    client.data["cache:vehicle:1"] = b"x"
+    client.data["ratelimit:1"] = b"x"
+
+    assert await backend.invalidate_pattern("search:*") == 10
+    assert client.pipelines == [["unlink", "unlink"]] * 2 + [["unlink"]]
+    assert sorted(client.data) == ["cache:vehicle:1", "ratelimit:1"]
+
+    assert await backend.clear()
+    assert list(client.data) == ["ratelimit:1"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags(backend: RedisCacheBackend) -> None:
+    """Only keys recorded under the tags are removed, along with the tags."""
+    client = backend.client
+    for key in ("products:1", "products:2", "vehicles:1"):
+        client.data[f"cache:{key}"] = b"x"
+    await backend.add_tags("products:1", ["products", "catalog"], ttl=60)
+    await backend.add_tags("products:2", ["products"], ttl=60)
+    await backend.add_tags("vehicles:1", ["vehicles"])
+
+    assert await backend.invalidate_tags(["products", "catalog"]) == 2
+    assert sorted(client.data) == ["cache:tag:vehicles", "cache:vehicles:1"]
+    assert await backend.invalidate_tags(["products"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_set_with_tags_is_one_transaction(backend: RedisCacheBackend) -> None:
+    """The value and its tags are written in a single pipeline."""
+    client = backend.client
+    await backend.set_with_tags("products:1", {"id": 1}, 60, ["products", "catalog"])
+
+    assert client.pipelines == [["set", "eval", "eval"]]
+    assert await backend.invalidate_tags(["catalog"]) == 1
+    assert "cache:products:1" not in client.data
+
+
+@pytest.mark.asyncio
+async def test_sample_stats(backend: RedisCacheBackend) -> None:
+    """Prefix counts are scaled from sampled keys; other keys are ignored."""
+    client = backend.client
+    for i in range(6):
+        client.data[f"cache:search:{i}"] = b"x" * 10
+    for i in range(2):
+        client.data[f"cache:vcdb:years:{i}"] = b"x" * 30
+    client.data["ratelimit:1"] = b"x"
+    client.data["ratelimit:2"] = b"x"
+
+    stats = await backend.sample_stats(sample_size=20)
+
+    assert client.pipelines[0] == ["dbsize", "info", "info"] + ["randomkey"] * 20
+    assert client.pipelines[1] == ["memory_usage"] * 8
+    assert stats["prefixes"] == {
+        "search": {"items": 6, "bytes": 6 * 60},
+        "vcdb:years": {"items": 2, "bytes": 2 * 80},
+    }
+    assert (stats["items"], stats["bytes"]) == (8, 520)
+    assert (stats["server_items"], stats["evictions"]) == (10, 3)
+
+
+@pytest.mark.asyncio
+async def test_lock_errors_are_raised(backend: RedisCacheBackend) -> None:
+    """An unreachable Redis isn't reported as a lock held by someone else."""
+
+    class DownClient:
+        async def set(self, *args: Any, **kwargs: Any) -> bool:
+            raise ConnectionError("Connection refused")
+
+    backend.client = DownClient()
+
+    with pytest.raises(CacheOperationException):
+        await backend.acquire_lock("vin:1J4GZ58S", "token", timeout=5)
@@ -0,0 +1,113 @@
+# /backend/tests/unit/test_cache_stampede.py
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.cache.backends.memory import MemoryCacheBackend
+from app.core.cache.decorators import cache_aside, cached
+from app.core.cache.exceptions import CacheOperationException
+from app.core.cache.stampede import CacheEntry, should_refresh_early
+
+
+class LockedMemoryBackend(MemoryCacheBackend):
+    """Memory backend whose lock is always held by another process."""
+
+    async def acquire_lock(self, name: str, token: str, timeout: float) -> bool:
+        return False
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        return False
+
+
+class UnreachableMemoryBackend(MemoryCacheBackend):
+    """Memory backend whose lock store can't be reached."""
+
+    async def acquire_lock(self, name: str, token: str, timeout: float) -> bool:
+        raise CacheOperationException(
+            "Connection refused", operation="acquire_lock", key=name
+        )
+
+
+@pytest.fixture
+def cache_backend_class() -> type[LockedMemoryBackend]:
+    return LockedMemoryBackend
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_call(memory_cache) -> None:
+    """Concurrent callers of a missing key run the function once."""
+    calls = []
+
+    @cached(prefix="test:coalesce", ttl=60, backend="memory")
+    async def lookup(vin: str) -> dict:
+        calls.append(vin)
+        await asyncio.sleep(0.05)
+        return {"vin": vin}
+
+    results = await asyncio.gather(*(lookup("1J4GZ58S") for _ in range(10)))
+
+    assert calls == ["1J4GZ58S"]
+    assert all(result == {"vin": "1J4GZ58S"} for result in results)
+    assert await lookup("1J4GZ58S") == {"vin": "1J4GZ58S"}
+    assert calls == ["1J4GZ58S"]
+
+
+@pytest.mark.asyncio
+async def test_function_errors_are_not_retried(memory_cache) -> None:
+    """A failing function is called once and its exception propagates."""
+    calls = []
+
+    @cached(prefix="test:errors", ttl=60, backend="memory")
+    async def lookup(make: str) -> str:
+        calls.append(make)
+        raise ValueError("upstream down")
+
+    with pytest.raises(ValueError):
+        await lookup("jeep")
+    assert calls == ["jeep"]
+
+
+@pytest.mark.asyncio
+async def test_waits_for_lock_holder(memory_cache) -> None:
+    """With the lock held elsewhere, a miss waits for the holder's value."""
+    calls = []
+
+    @cache_aside(key_func=lambda make: f"make:{make}", backend="memory", lock_timeout=2)
+    async def standardize(make: str) -> str:
+        calls.append(make)
+        return make.upper()
+
+    async def lock_holder() -> None:
+        await asyncio.sleep(0.1)
+        await memory_cache.set("make:jeep", CacheEntry("JEEP", 0.1, 0.0), 60)
+
+    result, _ = await asyncio.gather(standardize("jeep"), lock_holder())
+
+    assert result == "JEEP"
+    assert calls == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_backend_class", [UnreachableMemoryBackend])
+async def test_lock_errors_compute_without_waiting(memory_cache) -> None:
+    """If the lock can't be taken, a miss computes instead of polling the cache."""
+    calls = []
+
+    @cached(prefix="test:lock", ttl=60, backend="memory", lock_timeout=5)
+    async def decode(vin: str) -> str:
+        calls.append(vin)
+        return vin.lower()
+
+    assert await asyncio.wait_for(decode("1J4GZ58S"), timeout=1) == "1j4gz58s"
+    assert calls == ["1J4GZ58S"]
+
+
+def test_early_refresh_probability() -> None:
+    """Entries refresh at expiry and essentially never when far from it."""
+    entry = CacheEntry("value", delta=0.01, expires_at=1000.0)
+
+    assert should_refresh_early(entry, now=1000.0)
+    assert not should_refresh_early(entry, now=0.0)
+    assert not should_refresh_early(entry, beta=0, now=1000.0)
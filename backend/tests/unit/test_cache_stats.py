@@ -0,0 +1,38 @@
+# /backend/tests/unit/test_cache_stats.py
+from __future__ import annotations
+
+import pytest
+
+from app.core.cache.manager import cache_manager
+from app.core.cache.stats import HotKeySampler
+
+
+def test_hot_key_sampler_keeps_heavy_hitters() -> None:
+    """Frequently read keys survive a stream of one-off keys."""
+    sampler = HotKeySampler(sample_rate=1.0, capacity=4)
+    for i in range(200):
+        sampler.record("vcdb:years")
+        sampler.record(f"products:{i}")
+        if i % 2:
+            sampler.record("vcdb:makes:2005")
+
+    top = sampler.top(2)
+    assert [entry["key"] for entry in top] == ["vcdb:years", "vcdb:makes:2005"]
+    assert top[0]["reads"] >= 200
+    assert len(sampler.counts) == 4
+
+
+@pytest.mark.asyncio
+async def test_manager_stats(memory_cache) -> None:
+    """Shared backends are reported once, with the hot keys read through them."""
+    cache_manager.hot_keys["memory"] = HotKeySampler(sample_rate=1.0)
+    await cache_manager.set("vcdb:years:all", [2005, 2006], backend="memory")
+    for _ in range(3):
+        await cache_manager.get("vcdb:years:all", backend="memory")
+
+    stats = await cache_manager.get_stats(sample_size=10, top=5)
+
+    memory_stats = stats["backends"]["memory"]
+    assert memory_stats["prefixes"]["vcdb:years"]["items"] == 1
+    assert memory_stats["hot_keys"] == [{"key": "vcdb:years:all", "reads": 3}]
+    assert stats["backends"]["redis"] == {"alias_of": "memory"}
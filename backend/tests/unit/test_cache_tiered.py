@@ -0,0 +1,129 @@
+# /backend/tests/unit/test_cache_tiered.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from app.core.cache.backends.memory import MemoryCacheBackend
+from app.core.cache.backends.tiered import TieredCacheBackend
+from app.core.cache.manager import cache_manager
+
+
+class FakeRedisClient:
+    """Records published messages instead of sending them."""
+
+    def __init__(self) -> None:
+        self.published: List[Tuple[str, str]] = []
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 1
+
+
+class FakeRedisBackend(MemoryCacheBackend):
+    """Memory backend standing in for the shared Redis tier."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.client = FakeRedisClient()
+        self.reads = 0
+        self.tags: Dict[str, Set[str]] = {}
+
+    async def _get_client(self) -> FakeRedisClient:
+        return self.client
+
+    async def get(self, key: str):
+        self.reads += 1
+        return await super().get(key)
+
+    async def set_with_tags(
+        self, key: str, value: Any, ttl: Optional[int], tags: List[str]
+    ) -> bool:
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(key)
+        return await self.set(key, value, ttl)
+
+    async def pop_tagged_keys(self, tags: List[str]) -> List[str]:
+        return sorted(set().union(*(self.tags.pop(tag, set()) for tag in tags)))
+
+
+async def deliver(l2: FakeRedisBackend, *workers: TieredCacheBackend) -> None:
+    """Deliver every published invalidation to each worker."""
+    for _, message in l2.client.published:
+        for worker in workers:
+            await worker.handle_invalidation(message)
+    l2.client.published.clear()
+
+
+@pytest.mark.asyncio
+async def test_read_through_promotes_to_l1() -> None:
+    """An L2 hit is promoted, so the next read is served from L1."""
+    l2 = FakeRedisBackend()
+    tiered = TieredCacheBackend(l1=MemoryCacheBackend(), l2=l2, l1_ttl=30)
+    await l2.set("vin:1", {"make": "Jeep"})
+
+    assert await tiered.get("vin:1") == {"make": "Jeep"}
+    assert await tiered.get("vin:1") == {"make": "Jeep"}
+    assert await tiered.get("missing") is None
+
+    assert l2.reads == 2
+    stats = tiered.get_stats()
+    assert (stats["l1_hits"], stats["l1_misses"]) == (1, 2)
+    assert (stats["l2_hits"], stats["l2_misses"]) == (1, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_other_workers() -> None:
+    """A write in one worker drops the key from every other worker's L1."""
+    l2 = FakeRedisBackend()
+    worker_a = TieredCacheBackend(l1=MemoryCacheBackend(), l2=l2, l1_ttl=30)
+    worker_b = TieredCacheBackend(l1=MemoryCacheBackend(), l2=l2, l1_ttl=30)
+
+    await worker_a.set("make:1", "Jeep", ttl=300)
+    await deliver(l2, worker_a, worker_b)
+    assert await worker_b.get("make:1") == "Jeep"
+
+    await worker_a.set("make:1", "Ford", ttl=300)
+    assert await worker_b.l1.get("make:1") == "Jeep"
+    await deliver(l2, worker_a, worker_b)
+
+    assert await worker_a.l1.get("make:1") == "Ford"
+    assert await worker_b.l1.get("make:1") is None
+    assert await worker_b.get("make:1") == "Ford"
+    assert worker_a.stats["invalidations_received"] == 0
+
+    await worker_b.invalidate_pattern("make:*")
+    await deliver(l2, worker_a, worker_b)
+    assert await worker_a.l1.get("make:1") is None
+
+
+@pytest.mark.asyncio
+async def test_tag_invalidation_reaches_other_workers(monkeypatch) -> None:
+    """Tags invalidated through the manager's tiered backend leave every L1."""
+    l2 = FakeRedisBackend()
+    worker_a = TieredCacheBackend(l1=MemoryCacheBackend(), l2=l2, l1_ttl=30)
+    worker_b = TieredCacheBackend(l1=MemoryCacheBackend(), l2=l2, l1_ttl=30)
+    await worker_a.set_with_tags("vcdb:years", [2024, 2025], 3600, ["vcdb"])
+    await deliver(l2, worker_a, worker_b)
+    assert await worker_b.get("vcdb:years") == [2024, 2025]
+    monkeypatch.setattr(cache_manager, "backends", {"tiered": worker_a, "redis": l2})
+    monkeypatch.setattr(cache_manager, "_initialized", True)
+
+    assert await cache_manager.invalidate_tags(["vcdb"], "tiered") == 1
+    await deliver(l2, worker_a, worker_b)
+
+    assert await worker_b.l1.get("vcdb:years") is None
+    assert await worker_b.get("vcdb:years") is None
+
+
+@pytest.mark.asyncio
+async def test_l1_ttl_is_capped() -> None:
+    """L1 entries never outlive l1_ttl, nor the TTL they were written with."""
+    tiered = TieredCacheBackend(
+        l1=MemoryCacheBackend(), l2=FakeRedisBackend(), l1_ttl=30
+    )
+    assert tiered._l1_ttl(None) == 30
+    assert tiered._l1_ttl(300) == 30
+    assert tiered._l1_ttl(5) == 5
@@ -0,0 +1,65 @@
+# /backend/tests/unit/test_cache_warming.py
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, List, Tuple
+
+import pytest
+
+from app.core.cache.warming import CacheWarmer
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_order_with_concurrency_limit() -> None:
+    """Jobs run one after another, each within its concurrency limit."""
+    warmer = CacheWarmer()
+    calls: List[Tuple] = []
+    running = peak = 0
+
+    async def years() -> AsyncIterator[Tuple[int]]:
+        for year in range(2000, 2010):
+            yield (year,)
+
+    @warmer.job("years", triggers=("startup", "autocare.vcdb"))
+    async def warm_years() -> None:
+        calls.append(("years",))
+
+    @warmer.job("makes", args=years, concurrency=3, triggers=("startup",))
+    async def warm_makes(year: int) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if year == 2005:
+            raise RuntimeError("database unavailable")
+        calls.append(("makes", year))
+
+    report = await warmer.run("startup")
+
+    assert calls[0] == ("years",)
+    assert sorted(calls[1:]) == [("makes", y) for y in range(2000, 2010) if y != 2005]
+    assert peak == 3
+    assert (report.jobs["makes"].warmed, report.jobs["makes"].failed) == (9, 1)
+    assert report.warmed == 10 and not report.timed_out
+
+    calls.clear()
+    report = await warmer.run("autocare.vcdb")
+    assert calls == [("years",)] and list(report.jobs) == ["years"]
+
+
+@pytest.mark.asyncio
+async def test_time_budget() -> None:
+    """A run stops at its timeout, and start() returns within its wait."""
+    warmer = CacheWarmer()
+
+    @warmer.job("slow")
+    async def warm_slow() -> None:
+        await asyncio.sleep(10)
+
+    report = await warmer.run("startup", timeout=0.05)
+    assert report.timed_out and not report.jobs["slow"].completed
+
+    assert await warmer.start("startup", wait=0.05) is None
+    await warmer.shutdown()
+    assert not warmer._tasks
@@ -0,0 +1,196 @@
+# /backend/tests/unit/test_change_tracking.py
+from __future__ import annotations
+
+import sys
+import types
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+from pydantic import ValidationError
+
+# The data import package loads the ODBC connectors; stub pyodbc only while
+# importing if the host has no ODBC driver, so other tests still see it missing
+try:
+    import pyodbc  # noqa: F401
+except ImportError:
+    pyodbc = types.ModuleType("pyodbc")
+    pyodbc.Error = type("Error", (Exception,), {})
+    pyodbc.SQL_CHAR = 1
+    pyodbc.SQL_WCHAR = -8
+    pyodbc.connect = None
+    sys.modules["pyodbc"] = pyodbc
+    try:
+        from app.data_import.pipeline import change_tracking
+    finally:
+        del sys.modules["pyodbc"]
+else:
+    from app.data_import.pipeline import change_tracking
+
+from app.core.exceptions import SecurityException
+from app.data_import.pipeline.change_tracking import ChangeTracker, row_digest
+from app.domains.sync_history.models import SyncEntityType
+
+
+class FakeRowHashRepository:
+    """Serves stored hashes from a dict, recording the keys looked up."""
+
+    stored: Dict[str, int] = {}
+    requested: List[List[str]] = []
+
+    def __init__(self, db: Any) -> None:
+        pass
+
+    async def get_digests(
+        self, entity_type: SyncEntityType, row_keys: List[str]
+    ) -> Dict[str, int]:
+        self.requested.append(row_keys)
+        return {key: self.stored[key] for key in row_keys if key in self.stored}
+
+
+@pytest.fixture
+def repository(monkeypatch) -> type[FakeRowHashRepository]:
+    @asynccontextmanager
+    async def get_db_context() -> AsyncIterator[None]:
+        yield None
+
+    monkeypatch.setattr(change_tracking, "get_db_context", get_db_context)
+    monkeypatch.setattr(change_tracking, "SyncRowHashRepository", FakeRowHashRepository)
+    FakeRowHashRepository.stored = {}
+    FakeRowHashRepository.requested = []
+    return FakeRowHashRepository
+
+
+def tracker(**options: Any) -> ChangeTracker:
+    return ChangeTracker(
+        SyncEntityType.PRODUCT,
+        ["PRDNUM", "PLANT"],
+        **{
+            "timestamp_field": "UPD",
+            "high_water_mark": "2024-05-01T08:00:00",
+            **options,
+        },
+    )
+
+
+def test_row_digest_ignores_column_order() -> None:
+    """Rows hash by their values, whatever order their columns come in."""
+    row = {"PRDNUM": "P1", "NAME": "Seal", "PRICE": 1.5}
+
+    assert row_digest(row) == row_digest(dict(reversed(list(row.items()))))
+    assert row_digest(row) != row_digest({**row, "PRICE": 1.25})
+    assert row_digest({"NAME": "1"}) != row_digest({"NAME": 1})
+    assert -(2**63) <= row_digest(row) < 2**63
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM PRODUCTS WHERE PLANT = ? OR PLANT = ?",
+        "SELECT * FROM PRODUCTS ORDER BY PRDNUM FETCH FIRST 10 ROWS ONLY",
+        "SELECT PRDNUM FROM PRODUCTS UNION SELECT PRDNUM FROM ARCHIVE",
+    ],
+)
+def test_source_query_wraps_the_query(query: str) -> None:
+    """The query's own clauses are kept inside a subquery."""
+    limited, params = tracker().source_query(f"{query};")
+
+    assert limited == f"SELECT * FROM ({query}) AS CHANGED_ROWS WHERE UPD >= ?"
+    assert params == {"changed_after": datetime(2024, 5, 1, 8)}
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"incremental": False},
+        {"timestamp_field": None},
+        {"high_water_mark": None},
+    ],
+    ids=["full", "no-timestamp", "first-sync"],
+)
+def test_source_query_is_unchanged_without_a_mark(options: Dict[str, Any]) -> None:
+    """Every row is extracted unless an incremental sync has a mark to start at."""
+    changes = tracker(**options)
+
+    assert not changes.limits_source
+    assert changes.source_query("SELECT * FROM PRODUCTS") == (
+        "SELECT * FROM PRODUCTS",
+        {},
+    )
+
+
+@pytest.mark.parametrize("column", ["UPD; DROP TABLE X", "UPD) OR (1 = 1", ""])
+def test_timestamp_field_must_be_a_column_name(column: str) -> None:
+    """Change columns are put into SQL, so only plain names are accepted."""
+    with pytest.raises(SecurityException):
+        tracker(timestamp_field=column)
+
+
+def test_change_columns_are_checked_when_settings_load(monkeypatch) -> None:
+    """Columns named after write statements load; anything else but a name fails."""
+    for name in ("AS400_DSN", "AS400_USERNAME", "AS400_PASSWORD", "AS400_DATABASE"):
+        monkeypatch.setenv(name, "test")
+    from app.core.config.integrations.as400 import AS400Settings
+
+    monkeypatch.setenv("AS400_CHANGE_COLUMNS", '{"stock": "LAST_UPDATED"}')
+    assert AS400Settings().AS400_CHANGE_COLUMNS == {"stock": "LAST_UPDATED"}
+
+    monkeypatch.setenv("AS400_CHANGE_COLUMNS", '{"stock": "CHGTS DESC"}')
+    with pytest.raises(ValidationError):
+        AS400Settings()
+
+
+def test_numeric_marks_are_query_parameters() -> None:
+    """Marks stored from numeric timestamps are compared as numbers."""
+    _, params = tracker(high_water_mark="20240501").source_query("SELECT 1 FROM X")
+
+    assert params == {"changed_after": 20240501}
+
+
+@pytest.mark.asyncio
+async def test_filter_drops_unchanged_rows(repository) -> None:
+    """Only rows whose hash differs from the stored one are kept."""
+    unchanged = {"PRDNUM": "P1", "PLANT": 1, "UPD": 5}
+    changed = {"PRDNUM": "P2 ", "PLANT": 1, "UPD": 7}
+    repository.stored = {"P1|1": row_digest(unchanged), "P2|1": 0}
+    changes = tracker()
+
+    rows, digests = await changes.filter([unchanged, changed])
+
+    assert rows == [changed]
+    assert digests == {"P2|1": row_digest(changed)}
+    assert repository.requested == [["P1|1", "P2|1"]]
+    assert changes.high_water_mark == "7"
+
+
+@pytest.mark.asyncio
+async def test_full_sync_keeps_every_row(repository) -> None:
+    """Full syncs hash every row without reading stored hashes."""
+    chunk = [{"PRDNUM": "P1", "PLANT": 1, "UPD": 5}]
+
+    rows, digests = await tracker(incremental=False).filter(chunk)
+
+    assert rows == chunk
+    assert list(digests) == ["P1|1"]
+    assert repository.requested == []
+
+
+@pytest.mark.asyncio
+async def test_held_mark_stays_before_rows_not_imported(repository) -> None:
+    """The mark doesn't pass the earliest row of a chunk that wasn't imported."""
+    changes = tracker()
+    first = [{"PRDNUM": "P1", "PLANT": 1, "UPD": datetime(2024, 5, 2)}]
+    second = [
+        {"PRDNUM": "P2", "PLANT": 1, "UPD": datetime(2024, 5, 4)},
+        {"PRDNUM": "P3", "PLANT": 1, "UPD": datetime(2024, 5, 3)},
+        {"PRDNUM": "P4", "PLANT": 1, "UPD": None},
+    ]
+    await changes.filter(first)
+    await changes.filter(second)
+    assert changes.high_water_mark == "2024-05-04T00:00:00"
+
+    changes.hold(changes.earliest_timestamp(second))
+    changes.hold(None)
+
+    assert changes.high_water_mark == "2024-05-03T00:00:00"
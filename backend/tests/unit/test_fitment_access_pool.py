@@ -0,0 +1,188 @@
+# /backend/tests/unit/test_fitment_access_pool.py
+from __future__ import annotations
+
+import threading
+import time
+import types
+from typing import Any, List, Optional, Tuple
+
+import pytest
+
+from app.fitment import db
+from app.fitment.db import AccessDBClient
+from app.fitment.exceptions import DatabaseError
+
+ROWS = [(i, f"name-{i}") for i in range(5)]
+
+
+class FakeError(Exception):
+    pass
+
+
+class FakeCursor:
+    description = (("id",), ("name",))
+
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection = connection
+        self.rows: List[Tuple[Any, ...]] = []
+
+    def execute(self, sql: str, params: Optional[Tuple] = None) -> None:
+        self.rows = list(ROWS)
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        rows, self.rows = self.rows, []
+        return rows
+
+    def fetchmany(self, size: int) -> List[Tuple[Any, ...]]:
+        self.connection.fetch_sizes.append(size)
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    def tables(self, tableType: str) -> FakeCursor:
+        return self
+
+    def fetchone(self) -> None:
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    def __init__(self, pool: FakePyodbc) -> None:
+        self.pool = pool
+        self.closed = False
+        self.fetch_sizes: List[int] = []
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def close(self) -> None:
+        self.closed = True
+        with self.pool.lock:
+            self.pool.open -= 1
+
+
+class FakePyodbc(types.SimpleNamespace):
+    """Replacement for the pyodbc module tracking open connections."""
+
+    def __init__(self) -> None:
+        super().__init__(Error=FakeError, Connection=FakeConnection)
+        self.lock = threading.Lock()
+        self.connections: List[FakeConnection] = []
+        self.open = 0
+        self.max_open = 0
+
+    def connect(self, connection_string: str) -> FakeConnection:
+        with self.lock:
+            self.open += 1
+            self.max_open = max(self.max_open, self.open)
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+        return connection
+
+
+class Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def pyodbc(monkeypatch) -> FakePyodbc:
+    fake = FakePyodbc()
+    monkeypatch.setattr(db, "pyodbc", fake)
+    return fake
+
+
+def test_connections_are_reused(pyodbc: FakePyodbc) -> None:
+    """A released connection is handed out again instead of opening another."""
+    client = AccessDBClient("vcdb.accdb")
+
+    assert client.query("SELECT * FROM Make") == [
+        {"id": i, "name": name} for i, name in ROWS
+    ]
+    client.query("SELECT * FROM Make")
+
+    assert len(pyodbc.connections) == 1
+    assert client.pool_stats()["idle_connections"] == 1
+
+
+def test_failed_block_closes_its_connection(pyodbc: FakePyodbc) -> None:
+    """A connection whose block raised is closed, not returned to the pool."""
+    client = AccessDBClient("vcdb.accdb")
+
+    with pytest.raises(RuntimeError):
+        with client.connection():
+            raise RuntimeError("query failed")
+
+    assert pyodbc.connections[0].closed
+    assert client.pool_stats()["idle_connections"] == 0
+    with client.connection() as conn:
+        assert conn is pyodbc.connections[1]
+
+
+def test_open_connections_are_bounded(pyodbc: FakePyodbc) -> None:
+    """No more than pool_size connections are open, however many callers."""
+    client = AccessDBClient("vcdb.accdb", pool_size=2)
+
+    def borrow() -> None:
+        with client.connection():
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=borrow) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pyodbc.max_open == 2
+    assert len(pyodbc.connections) == 2
+
+
+def test_acquire_times_out_when_pool_is_exhausted(pyodbc: FakePyodbc) -> None:
+    """Waiting for a connection gives up after acquire_timeout."""
+    client = AccessDBClient("vcdb.accdb", pool_size=1, acquire_timeout=0.01)
+
+    with client.connection():
+        with pytest.raises(DatabaseError):
+            with client.connection():
+                pass
+
+    with client.connection() as conn:
+        assert conn is pyodbc.connections[0]
+
+
+def test_idle_connections_are_evicted(pyodbc: FakePyodbc, monkeypatch) -> None:
+    """Connections idle longer than max_idle_seconds are closed, not reused."""
+    clock = Clock()
+    monkeypatch.setattr(db.time, "monotonic", clock)
+    client = AccessDBClient("vcdb.accdb", max_idle_seconds=60)
+
+    with client.connection() as first:
+        pass
+    clock.now += 61
+    with client.connection() as second:
+        pass
+
+    assert second is not first
+    assert first.closed
+    assert pyodbc.open == 1
+
+
+def test_iter_query_fetches_in_batches(pyodbc: FakePyodbc) -> None:
+    """Rows are fetched fetch_size at a time and the connection is then released."""
+    client = AccessDBClient("vcdb.accdb", fetch_size=2)
+
+    rows = list(client.iter_query("SELECT * FROM Vehicle"))
+
+    assert [row["id"] for row in rows] == [0, 1, 2, 3, 4]
+    assert pyodbc.connections[0].fetch_sizes == [2, 2, 2, 2]
+    assert client.pool_stats()["idle_connections"] == 1
+    batched = client.iter_query("SELECT * FROM Vehicle", batch_size=4)
+    assert len(list(batched)) == 5
+    assert pyodbc.connections[0].fetch_sizes[4:] == [4, 4, 4]
@@ -0,0 +1,103 @@
+# /backend/tests/unit/test_fitment_api.py
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Tuple
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.fitment.api import get_mapping_engine, router
+from app.fitment.models import ValidationResult, ValidationStatus
+
+
+class FakeMappingEngine:
+    """Stand-in for FitmentMappingEngine with canned validation results."""
+
+    def __init__(self, use_vehicle_index: bool = True) -> None:
+        self.use_vehicle_index = use_vehicle_index
+        self.parser = object()
+        self.loads = 0
+
+    async def stream_process_applications(
+        self, application_texts: AsyncIterable[str], terminology_id: int
+    ) -> AsyncIterator[Tuple[str, List[ValidationResult]]]:
+        async for text in application_texts:
+            status = ValidationStatus.ERROR if "bad" in text else ValidationStatus.VALID
+            yield text, [
+                ValidationResult(status=status, message="", original_text=text)
+            ]
+
+    def serialize_validation_results(
+        self, results: List[ValidationResult]
+    ) -> List[Dict[str, Any]]:
+        return [result.model_dump(mode="json") for result in results]
+
+    async def load_vehicle_index(self) -> Dict[str, Any]:
+        self.loads += 1
+        return {"vehicles": 3, "memory_bytes": 1024}
+
+
+@pytest.fixture
+def engine() -> FakeMappingEngine:
+    return FakeMappingEngine()
+
+
+@pytest.fixture
+def client(engine: FakeMappingEngine) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_mapping_engine] = lambda: engine
+    return TestClient(app)
+
+
+def test_reload_vehicle_index(client: TestClient, engine: FakeMappingEngine) -> None:
+    """An enabled index is reloaded and its statistics returned."""
+    response = client.post("/api/v1/fitment/vehicle-index/reload")
+
+    assert response.status_code == 200
+    assert response.json()["vehicles"] == 3
+    assert engine.loads == 1
+
+
+def test_reload_disabled_vehicle_index(
+    client: TestClient, engine: FakeMappingEngine
+) -> None:
+    """Reloading does not enable an index turned off in configuration."""
+    engine.use_vehicle_index = False
+
+    response = client.post("/api/v1/fitment/vehicle-index/reload")
+
+    assert response.status_code == 409
+    assert engine.loads == 0
+
+
+def read_ndjson(body: str) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in body.splitlines()]
+
+
+@pytest.mark.parametrize("upload", [True, False], ids=["file", "raw-body"])
+def test_process_stream(client: TestClient, upload: bool) -> None:
+    """Texts from a file or the raw body stream back as NDJSON records."""
+    body = b"2010 Jeep Wrangler\n\n  bad text  \r\n2012 Ford F-150"
+    url = "/api/v1/fitment/process/stream?part_terminology_id=1"
+    if upload:
+        response = client.post(url, files={"file": ("texts.txt", body)})
+    else:
+        response = client.post(
+            url, content=body, headers={"Content-Type": "text/plain"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    *results, summary = read_ndjson(response.text)
+    assert [(r["type"], r["line"], r["application_text"]) for r in results] == [
+        ("result", 1, "2010 Jeep Wrangler"),
+        ("result", 2, "bad text"),
+        ("result", 3, "2012 Ford F-150"),
+    ]
+    assert results[1]["results"][0]["status"] == ValidationStatus.ERROR.value
+    assert summary["type"] == "summary"
+    assert summary["applications"] == 3
+    assert (summary["valid_count"], summary["error_count"]) == (2, 1)
@@ -0,0 +1,122 @@
+# /backend/tests/unit/test_fitment_index.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from app.fitment.exceptions import DatabaseError
+from app.fitment.index import (
+    MAKES_SQL,
+    MODELS_SQL,
+    SUBMODELS_SQL,
+    VEHICLE_ROWS_SQL,
+    VehicleIndex,
+)
+
+
+class FakeVCDBClient:
+    """Minimal stand-in for AccessDBClient returning canned VCDB rows."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.results: Dict[str, List[Dict[str, Any]]] = {
+            MAKES_SQL: [{"id": 1, "name": "Jeep"}, {"id": 2, "name": "Ford"}],
+            MODELS_SQL: [
+                {"id": 10, "name": "Grand Cherokee"},
+                {"id": 11, "name": "Cherokee"},
+                {"id": 20, "name": "F-150"},
+            ],
+            SUBMODELS_SQL: [{"id": 100, "name": "Laredo"}],
+            VEHICLE_ROWS_SQL: [
+                _row(1, 500, 2005, 1, 10, 100, 1),
+                _row(2, 500, 2005, 1, 10, None, 1),
+                _row(3, 501, 2006, 1, 10, None, None),
+                _row(4, 502, 2005, 1, 11, None, 1),
+                _row(5, 503, 2005, 2, 20, None, 1),
+            ],
+        }
+
+    def query(self, sql: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
+        self.calls += 1
+        return self.results[sql]
+
+    def iter_query(
+        self, sql: str, params: Optional[Tuple] = None
+    ) -> Iterator[Dict[str, Any]]:
+        self.calls += 1
+        yield from self.results[sql]
+
+
+def _row(
+    vehicle_id: int,
+    base_vehicle_id: int,
+    year: int,
+    make_id: int,
+    model_id: int,
+    submodel_id: Optional[int],
+    region_id: Optional[int],
+) -> Dict[str, Any]:
+    return {
+        "id": vehicle_id,
+        "base_vehicle_id": base_vehicle_id,
+        "year": year,
+        "make_id": make_id,
+        "model_id": model_id,
+        "submodel_id": submodel_id,
+        "region_id": region_id,
+    }
+
+
+@pytest.fixture
+def index() -> VehicleIndex:
+    """Provide a vehicle index loaded from the fake client."""
+    vehicle_index = VehicleIndex()
+    vehicle_index.load(FakeVCDBClient())
+    return vehicle_index
+
+
+def test_find_matches_like_semantics(index: VehicleIndex) -> None:
+    """Make and model are matched as case-insensitive substrings."""
+    vehicles = index.find(year=2005, make="jeep", model="cherokee")
+    assert sorted(v.id for v in vehicles) == [1, 2, 4]
+
+    vehicles = index.find(year=2005, make="Jeep", model="Grand Cherokee")
+    assert sorted(v.id for v in vehicles) == [1, 2]
+
+
+def test_find_populates_vehicle_fields(index: VehicleIndex) -> None:
+    """Returned vehicles carry names and NULL-able IDs from the source rows."""
+    by_id = {v.id: v for v in index.find(year=2005, make="Jeep", model="Grand")}
+    assert by_id[1].submodel == "Laredo"
+    assert by_id[1].submodel_id == 100
+    assert by_id[2].submodel is None
+    assert by_id[2].submodel_id is None
+    assert by_id[1].make == "Jeep"
+    assert by_id[1].model == "Grand Cherokee"
+
+    assert index.find(year=2006)[0].region_id is None
+
+
+def test_find_without_year_and_no_match(index: VehicleIndex) -> None:
+    """Lookups without a year scan all groups; unknown names return nothing."""
+    assert sorted(v.id for v in index.find(make="Jeep")) == [1, 2, 3, 4]
+    assert index.find(year=2005, make="Toyota") == []
+    assert index.find(year=1999) == []
+
+
+def test_reload_and_stats() -> None:
+    """Stats reflect the loaded data and clearing disables lookups."""
+    vehicle_index = VehicleIndex()
+    assert vehicle_index.stats()["loaded"] is False
+
+    vehicle_index.load(FakeVCDBClient())
+    stats = vehicle_index.stats()
+    assert stats["vehicles"] == 5
+    assert stats["groups"] == 4
+    assert stats["memory_bytes"] > 0
+
+    vehicle_index.clear()
+    assert not vehicle_index.loaded
+    with pytest.raises(DatabaseError):
+        vehicle_index.find(year=2005)
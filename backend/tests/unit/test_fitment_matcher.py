@@ -0,0 +1,117 @@
+# /backend/tests/unit/test_fitment_matcher.py
+from __future__ import annotations
+
+import random
+import threading
+from typing import Dict, List, Optional
+
+from app.fitment.matcher import ModelMappingMatcher, parse_mappings
+
+
+def legacy_match(model_mappings: Dict[str, List[str]], text: str) -> Optional[str]:
+    """Reference implementation: the original sorted linear scan."""
+    for pattern in sorted(model_mappings.keys(), key=len, reverse=True):
+        if pattern in text and parse_mappings(model_mappings[pattern]):
+            return pattern
+    return None
+
+
+def test_longest_match_wins() -> None:
+    """The longest contained pattern is preferred over shorter ones."""
+    matcher = ModelMappingMatcher(
+        {
+            "Cherokee": ["Jeep|XJ|Cherokee"],
+            "Grand Cherokee": ["Jeep|WK|Grand Cherokee"],
+            "WK Grand Cherokee": ["Jeep|WK|Grand Cherokee", "Jeep|WK2|"],
+        }
+    )
+
+    assert matcher.match("WK Grand Cherokee") == "WK Grand Cherokee"
+    assert matcher.find("WK Grand Cherokee") == (
+        ("Jeep", "Grand Cherokee"),
+        ("Jeep", "WK2"),
+    )
+    assert matcher.match("XJ Cherokee Sport") == "Cherokee"
+    assert matcher.match("Wrangler") is None
+
+
+def test_invalid_mappings_fall_through() -> None:
+    """Patterns whose mappings are all invalid do not win a match."""
+    matcher = ModelMappingMatcher({"Grand Cherokee": ["bad"], "Cherokee": ["||X"]})
+    assert matcher.match("Grand Cherokee") == "Cherokee"
+
+
+def test_matches_legacy_scan_on_random_corpus() -> None:
+    """The automaton agrees with the original scan on random inputs."""
+    rng = random.Random(1234)
+    alphabet = "abc "
+    mappings: Dict[str, List[str]] = {}
+    for _ in range(300):
+        pattern = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+        mappings[pattern] = [rng.choice(["M|C|X", "M||", "bad", "||"])]
+
+    matcher = ModelMappingMatcher(mappings)
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        assert matcher.match(text) == legacy_match(mappings, text)
+
+
+def test_incremental_update() -> None:
+    """Updating the matcher gives the same results as rebuilding it."""
+    matcher = ModelMappingMatcher(
+        {"Cherokee": ["Jeep|XJ|Cherokee"], "F-150": ["Ford||F-150"]}
+    )
+    updated = {
+        "Cherokee": ["Jeep|KL|Cherokee"],
+        "Grand Cherokee": ["Jeep|WK|Grand Cherokee"],
+    }
+
+    changes = matcher.update(updated)
+
+    assert changes == {"added": 1, "removed": 1, "changed": 1}
+    assert matcher.match("F-150") is None
+    assert matcher.find("XJ Cherokee") == (("Jeep", "Cherokee"),)
+    assert matcher.match("WK Grand Cherokee") == "Grand Cherokee"
+    for text in ("Cherokee", "Grand Cherokee", "F-150 Cherokee", "Grand"):
+        assert matcher.match(text) == ModelMappingMatcher(updated).match(text)
+
+
+def test_update_swaps_in_a_new_automaton() -> None:
+    """Readers holding the previous automaton are not affected by an update."""
+    old_mappings = {"Cherokee": ["Jeep|XJ|Cherokee"], "F-150": ["Ford||F-150"]}
+    matcher = ModelMappingMatcher(old_mappings)
+    previous = matcher._automaton
+    nodes_before = len(previous.goto)
+
+    matcher.update({"Grand Cherokee": ["Jeep|WK|Grand Cherokee"]})
+
+    assert matcher._automaton is not previous
+    assert len(previous.goto) == nodes_before
+    assert previous.match("F-150 XLT") == "F-150"
+    assert matcher.match("F-150 XLT") is None
+    assert matcher.find("WK Grand Cherokee") == (("Jeep", "Grand Cherokee"),)
+
+
+def test_match_during_concurrent_updates() -> None:
+    """Matching while another thread updates sees only complete automatons."""
+    first = {"Cherokee": ["Jeep|XJ|Cherokee"]}
+    second = {"Grand Cherokee": ["Jeep|WK|Grand Cherokee"], "Wrangler": ["Jeep||"]}
+    matcher = ModelMappingMatcher(first)
+    stop = threading.Event()
+
+    def update() -> None:
+        while not stop.is_set():
+            matcher.update(second)
+            matcher.update(first)
+
+    updater = threading.Thread(target=update)
+    updater.start()
+    try:
+        for _ in range(2000):
+            assert matcher.find_with_pattern("Grand Cherokee Laredo") in (
+                ("Cherokee", (("Jeep", "Cherokee"),)),
+                ("Grand Cherokee", (("Jeep", "Grand Cherokee"),)),
+            )
+    finally:
+        stop.set()
+        updater.join()
@@ -0,0 +1,99 @@
+# /backend/tests/unit/test_fitment_parallel.py
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+import pytest
+
+from app.fitment import parallel
+from app.fitment.mapper import FitmentMappingEngine
+from app.fitment.models import ValidationResult, ValidationStatus
+from app.fitment.parallel import ParallelBatchProcessor
+
+
+def result_for(text: str) -> List[ValidationResult]:
+    return [
+        ValidationResult(
+            status=ValidationStatus.VALID, message="ok", original_text=text
+        )
+    ]
+
+
+class FakeWorkerEngine:
+    """Worker engine whose early texts finish last."""
+
+    def get_validator(self, terminology_id: int) -> None:
+        return None
+
+    def process_application_safe(
+        self, text: str, terminology_id: int, validator: Optional[Any] = None
+    ) -> List[ValidationResult]:
+        time.sleep(0.02 if text.endswith("-0") else 0)
+        return result_for(text)
+
+
+class FakeDBService:
+    vcdb_path = "vcdb.accdb"
+    pcdb_path = "pcdb.accdb"
+    snapshot_path = None
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def engine(monkeypatch) -> FitmentMappingEngine:
+    """Mapping engine whose process pool runs chunks on threads in-process."""
+    monkeypatch.setattr(parallel, "_worker_engine", FakeWorkerEngine())
+    monkeypatch.setattr(
+        ParallelBatchProcessor,
+        "_get_pool",
+        lambda self, *args: ThreadPoolExecutor(max_workers=4),
+    )
+
+    engine = FitmentMappingEngine(
+        FakeDBService(), parallel_chunk_size=3, parallel_min_batch=10
+    )
+    engine.parser = object()
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_chunked_results_keep_input_order(engine: FitmentMappingEngine) -> None:
+    """Results and chunk timings follow the input, whatever order chunks finish."""
+    texts = [f"text-{i}" for i in range(10)]
+
+    result = await engine.batch_process_applications_async(texts, 1)
+
+    assert list(result.results) == texts
+    assert result.results["text-4"] == result_for("text-4")
+    assert [timing.chunk_index for timing in result.chunk_timings] == [0, 1, 2, 3]
+    assert [timing.size for timing in result.chunk_timings] == [3, 3, 3, 1]
+    assert list(engine.batch_process_applications_parallel(texts, 1).results) == texts
+
+
+@pytest.mark.asyncio
+async def test_small_batches_run_on_a_thread(
+    engine: FitmentMappingEngine, monkeypatch
+) -> None:
+    """Batches below parallel_min_batch don't go to the process pool."""
+
+    async def no_pool(*args: Any) -> None:
+        raise AssertionError("small batch sent to the process pool")
+
+    monkeypatch.setattr(engine.parallel, "process_async", no_pool)
+    monkeypatch.setattr(
+        engine,
+        "process_application_safe",
+        lambda text, terminology_id: result_for(text),
+    )
+    texts = [f"text-{i}" for i in range(9)]
+
+    result = await engine.batch_process_applications_async(texts, 1)
+
+    assert list(result.results) == texts
+    assert len(result.chunk_timings) == 1
+    assert result.chunk_timings[0].size == 9
+    assert result.chunk_timings[0].worker_pid is None
@@ -0,0 +1,105 @@
+# /backend/tests/unit/test_fitment_positions.py
+from __future__ import annotations
+
+import itertools
+from typing import List, Optional, Set, Tuple
+
+from app.fitment.models import (
+    PartFitment,
+    PCDBPosition,
+    Position,
+    PositionGroup,
+    ValidationStatus,
+    Vehicle,
+)
+from app.fitment.positions import (
+    AXES,
+    decode_position_mask,
+    encode_position_group,
+    expand_position_masks,
+    position_bit,
+)
+from app.fitment.validator import FitmentValidator
+
+PCDB_POSITIONS = [
+    PCDBPosition(id=1, name="Front Left", front_rear="Front", left_right="Left"),
+    PCDBPosition(id=2, name="Front Right", front_rear="Front", left_right="Right"),
+    PCDBPosition(id=3, name="Front Upper", front_rear="Front", upper_lower="Upper"),
+    PCDBPosition(id=4, name="Front", front_rear="Front", inner_outer="N/A"),
+]
+
+
+def legacy_validate(
+    positions: PositionGroup,
+) -> Tuple[ValidationStatus, Optional[Set[int]]]:
+    """Reference implementation: the per-axis dictionary lookups."""
+    index = {axis: {} for axis in AXES}
+    for pos in PCDB_POSITIONS:
+        for axis in AXES:
+            value = getattr(pos, axis)
+            if value:
+                index[axis].setdefault(Position(value), set()).add(pos.id)
+
+    ids: Set[int] = set()
+    for axis in AXES:
+        value = getattr(positions, axis)
+        if value == Position.NA:
+            continue
+        if value not in index[axis]:
+            if value == Position.VARIES:
+                return ValidationStatus.WARNING, None
+            return ValidationStatus.ERROR, None
+        ids.update(index[axis][value])
+    return ValidationStatus.VALID, ids
+
+
+def test_encode_decode_round_trip() -> None:
+    """Every position group survives encoding and N/A encodes as no bits."""
+    assert encode_position_group(PositionGroup()) == 0
+
+    for values in itertools.product(list(Position), repeat=2):
+        group = PositionGroup(front_rear=values[0], inner_outer=values[1])
+        assert decode_position_mask(encode_position_group(group)) == group
+
+
+def test_expand_matches_nested_loop_order() -> None:
+    """Multi-valued axes expand with the first axis varying slowest."""
+    base = position_bit("upper_lower", Position.UPPER)
+    masks = expand_position_masks(
+        base,
+        [
+            ("left_right", [Position.LEFT, Position.RIGHT]),
+            ("front_rear", [Position.FRONT, Position.REAR]),
+        ],
+    )
+    groups = [decode_position_mask(mask) for mask in masks]
+    assert [(g.left_right, g.front_rear) for g in groups] == [
+        (Position.LEFT, Position.FRONT),
+        (Position.LEFT, Position.REAR),
+        (Position.RIGHT, Position.FRONT),
+        (Position.RIGHT, Position.REAR),
+    ]
+    assert all(g.upper_lower == Position.UPPER for g in groups)
+
+
+def test_validator_matches_legacy_lookup() -> None:
+    """Bitmask validation agrees with the dictionary lookups for all groups."""
+    validator = FitmentValidator(1896, PCDB_POSITIONS)
+    vehicle = Vehicle(year=2005, make="Jeep", model="Cherokee")
+
+    groups: List[PositionGroup] = [
+        PositionGroup(
+            front_rear=fr, left_right=lr, upper_lower=ul, inner_outer=Position.NA
+        )
+        for fr, lr, ul in itertools.product(list(Position), repeat=3)
+    ]
+    validator.check_positions(groups)
+
+    for group in groups:
+        fitment = PartFitment(vehicle=vehicle, positions=group)
+        result = validator._validate_positions(fitment)
+        status, ids = legacy_validate(group)
+
+        assert result.status == status, group
+        if status == ValidationStatus.VALID:
+            assert set(fitment.pcdb_position_ids) == ids
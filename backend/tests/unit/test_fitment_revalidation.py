@@ -0,0 +1,211 @@
+# /backend/tests/unit/test_fitment_revalidation.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from app.fitment.db import FitmentDBService
+from app.fitment.mapper import FitmentMappingEngine
+from app.fitment.matcher import changed_patterns
+from app.fitment.models import (
+    ParallelBatchResult,
+    ValidationResult,
+    ValidationStatus,
+)
+from app.fitment.parser import FitmentParser
+
+
+class FakeDBService:
+    """Records saved fitments and serves a canned application index."""
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = rows
+        self.queried: List[List[str]] = []
+        self.saved: List[Dict[str, Any]] = []
+
+    async def get_applications_for_patterns(
+        self, patterns: List[str]
+    ) -> List[Dict[str, Any]]:
+        self.queried.append(patterns)
+        return self.rows
+
+    async def save_fitment_results(
+        self,
+        product_id: str,
+        fitments: List[Dict[str, Any]],
+        applications: Optional[Dict[str, Optional[str]]] = None,
+        part_terminology_id: Optional[int] = None,
+        replace_all: bool = True,
+    ) -> bool:
+        self.saved.append(
+            {
+                "product_id": product_id,
+                "fitments": fitments,
+                "applications": applications,
+                "part_terminology_id": part_terminology_id,
+                "replace_all": replace_all,
+            }
+        )
+        return True
+
+
+def test_changed_patterns() -> None:
+    """Added, removed and edited patterns are reported; unchanged ones are not."""
+    old = {"Cherokee": ["Jeep|XJ|Cherokee"], "F-150": ["Ford|P415|F-150"]}
+    new = {
+        "Cherokee": ["Jeep|XJ|Cherokee", "Jeep|KJ|Liberty"],
+        "Civic": ["Honda|FG|Civic"],
+    }
+    assert changed_patterns(old, new) == {"Cherokee", "F-150", "Civic"}
+    assert changed_patterns(new, new) == set()
+
+
+def test_fitments_record_mapping_pattern() -> None:
+    """Parsed fitments carry the application text and the pattern that matched."""
+    parser = FitmentParser(
+        {"Cherokee": ["Jeep|XJ|Cherokee"], "Grand Cherokee": ["Jeep|WK|Grand Cherokee"]}
+    )
+    part_app = parser.parse_application("2005-2006 Jeep Grand Cherokee (Front);")
+    fitments = parser.process_application(part_app)
+
+    assert len(fitments) == 2
+    assert {f.mapping_pattern for f in fitments} == {"Grand Cherokee"}
+    assert {f.application_text for f in fitments} == {
+        "2005-2006 Jeep Grand Cherokee (Front)"
+    }
+
+    part_app = parser.parse_application("2005-2005 Universal Fit")
+    assert parser.process_application(part_app)[0].mapping_pattern is None
+
+
+@pytest.mark.asyncio
+async def test_revalidate_only_affected_applications() -> None:
+    """Affected applications are re-processed and replaced per product."""
+    db = FakeDBService(
+        [
+            {
+                "product_id": "P1",
+                "part_terminology_id": 1896,
+                "application_text": "2005-2005 Jeep Cherokee",
+            },
+            {
+                "product_id": "P2",
+                "part_terminology_id": 1896,
+                "application_text": "2005-2005 Jeep Cherokee",
+            },
+        ]
+    )
+    engine = FitmentMappingEngine(db)
+    engine.parser = FitmentParser({"Cherokee": ["Jeep|XJ|Cherokee"]})
+    engine.model_mappings = engine.parser.model_mappings
+
+    processed: List[List[str]] = []
+
+    async def fake_batch(texts: List[str], terminology_id: int) -> ParallelBatchResult:
+        processed.append(texts)
+        results = {}
+        for text in texts:
+            part_app = engine.parser.parse_application(text)
+            results[text] = [
+                ValidationResult(
+                    status=ValidationStatus.VALID,
+                    message="ok",
+                    fitment=fitment,
+                    original_text=fitment.vehicle.full_name,
+                )
+                for fitment in engine.parser.process_application(part_app)
+            ]
+        return ParallelBatchResult(results=results)
+
+    engine.batch_process_applications_async = fake_batch
+
+    summary = await engine.revalidate_patterns({"Cherokee"})
+
+    assert db.queried == [["Cherokee"]]
+    assert processed == [["2005-2005 Jeep Cherokee"], ["2005-2005 Jeep Cherokee"]]
+    assert summary.products == 2
+    assert summary.applications == 2
+    assert [save["product_id"] for save in db.saved] == ["P1", "P2"]
+    assert all(not save["replace_all"] for save in db.saved)
+    assert db.saved[0]["applications"] == {"2005-2005 Jeep Cherokee": "Cherokee"}
+    assert db.saved[0]["fitments"][0]["mapping_pattern"] == "Cherokee"
+
+    assert (await engine.revalidate_patterns([])).applications == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_applications_are_saved_without_semicolon() -> None:
+    """Failed and parsed applications share the key re-validation deletes by."""
+    db = FakeDBService([])
+    engine = FitmentMappingEngine(db)
+    engine.parser = FitmentParser({"Cherokee": ["Jeep|XJ|Cherokee"]})
+    part_app = engine.parser.parse_application("2005-2005 Jeep Cherokee;")
+    fitment = engine.parser.process_application(part_app)[0]
+
+    await engine.save_mapping_results(
+        "P1",
+        [
+            ValidationResult(
+                status=ValidationStatus.ERROR,
+                message="no match",
+                original_text="2005-2005 Jeep Wagoneer;",
+            ),
+            ValidationResult(
+                status=ValidationStatus.VALID,
+                message="ok",
+                fitment=fitment,
+                original_text="2005-2005 Jeep Cherokee;",
+            ),
+        ],
+        1896,
+    )
+
+    assert db.saved[0]["applications"] == {
+        "2005-2005 Jeep Wagoneer": None,
+        "2005-2005 Jeep Cherokee": "Cherokee",
+    }
+
+
+class FakeSession:
+    """Records the statements a session executes."""
+
+    def __init__(self) -> None:
+        self.executed: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def execute(self, statement: Any, params: Dict[str, Any]) -> None:
+        self.executed.append((" ".join(str(statement).split()), params))
+
+    async def commit(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_index_rows_are_replaced_by_normalized_text(tmp_path) -> None:
+    """Re-validation deletes index rows saved with or without a semicolon."""
+    # Access databases need an ODBC driver; an empty snapshot stands in
+    snapshot = tmp_path / "snapshot.db"
+    snapshot.touch()
+    service = FitmentDBService("vcdb.accdb", "pcdb.accdb", snapshot_path=str(snapshot))
+    session = FakeSession()
+    service.engine = object()
+    service.async_session = lambda: session
+
+    await service.save_fitment_results(
+        "P1",
+        [],
+        applications={"2005-2005 Jeep Wagoneer;": None},
+        part_terminology_id=1896,
+        replace_all=False,
+    )
+
+    deletes = [params for sql, params in session.executed if sql.startswith("DELETE")]
+    assert [params["application_text"] for params in deletes] == [
+        "2005-2005 Jeep Wagoneer"
+    ] * 2
+    assert deletes[0]["raw_application_text"] == "2005-2005 Jeep Wagoneer;"
+    _, insert = session.executed[-1]
+    assert insert["application_text"] == "2005-2005 Jeep Wagoneer"
@@ -0,0 +1,130 @@
+# /backend/tests/unit/test_fitment_snapshot.py
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from app.fitment.db import FitmentDBService
+from app.fitment.exceptions import DatabaseError
+from app.fitment.snapshot import SnapshotDBClient, export_snapshot
+
+
+class FakeAccessClient:
+    """Minimal stand-in for AccessDBClient serving whole tables."""
+
+    def __init__(self, tables: Dict[str, List[Dict[str, Any]]]) -> None:
+        self.db_path = "fake.accdb"
+        self.tables = tables
+
+    def iter_query(
+        self,
+        sql: str,
+        params: Optional[Tuple] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        table = re.search(r"FROM (\w+)", sql).group(1)
+        yield from self.tables.get(table, [])
+
+
+VCDB = {
+    "Vehicle": [
+        {"VehicleID": 1, "BaseVehicleID": 500, "SubmodelID": 100, "RegionID": 1},
+        {"VehicleID": 2, "BaseVehicleID": 501, "SubmodelID": None, "RegionID": 1},
+    ],
+    "BaseVehicle": [
+        {"BaseVehicleID": 500, "YearID": 2005, "MakeID": 1, "ModelID": 10},
+        {"BaseVehicleID": 501, "YearID": 2006, "MakeID": 1, "ModelID": 10},
+    ],
+    "Year": [{"YearID": 2005}, {"YearID": 2006}],
+    "Make": [{"MakeID": 1, "MakeName": "Jeep"}],
+    "Model": [{"ModelID": 10, "ModelName": "Grand Cherokee"}],
+    "SubModel": [{"SubModelID": 100, "SubModelName": "Laredo"}],
+}
+
+PCDB = {
+    "PartTerminology": [
+        {
+            "PartTerminologyID": 1896,
+            "PartTerminologyName": "Control Arm",
+            "CategoryID": 1,
+            "SubCategoryID": 2,
+        }
+    ],
+    "PCDBMapping": [
+        {"PartTerminologyID": 1896, "PositionID": 1},
+        {"PartTerminologyID": 1896, "PositionID": 2},
+    ],
+    "Position": [
+        {
+            "PositionID": 1,
+            "PositionName": "Front Left",
+            "FrontRearID": 1,
+            "LeftRightID": 1,
+            "UpperLowerID": None,
+            "InnerOuterID": None,
+        },
+        {
+            "PositionID": 2,
+            "PositionName": "Front Right",
+            "FrontRearID": 1,
+            "LeftRightID": 2,
+            "UpperLowerID": None,
+            "InnerOuterID": None,
+        },
+    ],
+    "PositionFrontRear": [{"FrontRearID": 1, "FrontRearValue": "Front"}],
+    "PositionLeftRight": [
+        {"LeftRightID": 1, "LeftRightValue": "Left"},
+        {"LeftRightID": 2, "LeftRightValue": "Right"},
+    ],
+}
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path) -> str:
+    """Export the fake VCDB/PCDB tables into a snapshot file."""
+    path = str(tmp_path / "snapshot.sqlite")
+    stats = export_snapshot(
+        FakeAccessClient(VCDB), FakeAccessClient(PCDB), path, batch_size=1
+    )
+    assert stats["tables"]["Vehicle"] == 2
+    assert stats["tables"]["PositionInnerOuter"] == 0
+    return path
+
+
+def test_service_reads_from_snapshot(snapshot_path: str) -> None:
+    """FitmentDBService answers the Access queries from the snapshot."""
+    service = FitmentDBService("", "", snapshot_path=snapshot_path)
+    try:
+        vehicles = service.get_vcdb_vehicles(year=2005, make="jeep", model="grand")
+        assert [(v.id, v.submodel) for v in vehicles] == [(1, "Laredo")]
+
+        terminology = service.get_pcdb_part_terminology(1896)
+        assert terminology.name == "Control Arm"
+        assert sorted(terminology.valid_positions) == [1, 2]
+
+        positions = {p.id: p for p in service.get_pcdb_positions([1, 2])}
+        assert positions[2].left_right == "Right"
+        assert positions[2].upper_lower is None
+
+        stats = service.load_vehicle_index()
+        assert stats["vehicles"] == 2
+    finally:
+        service.close()
+
+
+def test_snapshot_client_is_read_only(snapshot_path: str) -> None:
+    """The snapshot client exposes metadata and rejects writes."""
+    client = SnapshotDBClient(snapshot_path)
+    try:
+        assert client.metadata()["vcdb_path"] == "fake.accdb"
+        with pytest.raises(DatabaseError):
+            client.query("DELETE FROM Vehicle")
+    finally:
+        client.close()
+
+    with pytest.raises(DatabaseError):
+        SnapshotDBClient(snapshot_path + ".missing")
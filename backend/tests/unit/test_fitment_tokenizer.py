@@ -0,0 +1,179 @@
+# /backend/tests/unit/test_fitment_tokenizer.py
+from __future__ import annotations
+
+import random
+import re
+from typing import List, Tuple
+
+import pytest
+
+from app.fitment.models import Position
+from app.fitment.parser import FitmentParser
+from app.fitment.positions import decode_position_mask, expand_position_masks
+from app.fitment.tokenizer import scan_position_text
+
+# The regex patterns FitmentParser.extract_positions used before the tokenizer
+LEGACY_PATTERNS = {
+    "left_right": {
+        re.compile(r"\b(?:left|driver[\'s]* side)\b", re.IGNORECASE): Position.LEFT,
+        re.compile(
+            r"\b(?:right|passenger[\'s]* side)\b", re.IGNORECASE
+        ): Position.RIGHT,
+        re.compile(
+            r"\b(?:left|driver[\'s]* side).+(?:right|passenger[\'s]* side)\b",
+            re.IGNORECASE,
+        ): "BOTH",
+        re.compile(
+            r"\b(?:right|passenger[\'s]* side).+(?:left|driver[\'s]* side)\b",
+            re.IGNORECASE,
+        ): "BOTH",
+        re.compile(r"\b(?:left|right)\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:left or right)\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:left and right)\b", re.IGNORECASE): "BOTH",
+    },
+    "front_rear": {
+        re.compile(r"\bfront\b", re.IGNORECASE): Position.FRONT,
+        re.compile(r"\brear\b", re.IGNORECASE): Position.REAR,
+        re.compile(r"\bfront.+rear\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\brear.+front\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:front|rear)\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:front or rear)\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:front and rear)\b", re.IGNORECASE): "BOTH",
+    },
+    "upper_lower": {
+        re.compile(r"\bupper\b", re.IGNORECASE): Position.UPPER,
+        re.compile(r"\blower\b", re.IGNORECASE): Position.LOWER,
+        re.compile(r"\bupper.+lower\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\blower.+upper\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:upper|lower)\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:upper or lower)\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:upper and lower)\b", re.IGNORECASE): "BOTH",
+    },
+    "inner_outer": {
+        re.compile(r"\binner\b", re.IGNORECASE): Position.INNER,
+        re.compile(r"\bouter\b", re.IGNORECASE): Position.OUTER,
+        re.compile(r"\binner.+outer\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\bouter.+inner\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:inner|outer)\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:inner or outer)\b", re.IGNORECASE): "BOTH",
+        re.compile(r"\b(?:inner and outer)\b", re.IGNORECASE): "BOTH",
+    },
+}
+
+BOTH_VALUES = {
+    "left_right": [Position.LEFT, Position.RIGHT],
+    "front_rear": [Position.FRONT, Position.REAR],
+    "upper_lower": [Position.UPPER, Position.LOWER],
+    "inner_outer": [Position.INNER, Position.OUTER],
+}
+
+CORPUS = [
+    "Front Left",
+    "Front Right Upper",
+    "Rear Left Lower Inner",
+    "Left or Right",
+    "Left and Right Front",
+    "Front or Rear",
+    "Upper and Lower",
+    "Inner/Outer",
+    "Driver Side",
+    "Driver's Side Front",
+    "Drivers Side Rear",
+    "Passenger's Side",
+    "passengers' side upper",
+    "driver side or passenger side",
+    "DRIVER''S SIDE",
+    "driver  side",
+    "driver's sidewalk",
+    "leftover bright",
+    "frontal xrear",
+    "rearward front",
+    "upperlower",
+    "front\nrear",
+    "front-rear",
+    "front_rear",
+    "left2 right",
+    "Left, Right & Rear (Outer)",
+    "Lefté right",
+    "Varies with application",
+    "",
+    "N/A",
+]
+
+WORDS = [
+    "left",
+    "right",
+    "front",
+    "rear",
+    "upper",
+    "lower",
+    "inner",
+    "outer",
+    "driver",
+    "passenger",
+    "driver's side",
+    "passengers side",
+    "side",
+    "or",
+    "and",
+    "x",
+    "al",
+    "s",
+    "'",
+]
+SEPARATORS = [" ", "", "/", "-", "_", ", ", "\n", "'", "é"]
+
+
+def legacy_scan(text: str) -> Tuple[dict, List[Tuple[str, List[Position]]]]:
+    """Reference implementation: the regex loop extract_positions used."""
+    values = {axis: Position.NA for axis in LEGACY_PATTERNS}
+    multiple = []
+    for axis, patterns in LEGACY_PATTERNS.items():
+        for pattern, value in patterns.items():
+            if pattern.search(text):
+                if value == "BOTH":
+                    multiple.append((axis, BOTH_VALUES[axis]))
+                else:
+                    values[axis] = value
+                break
+    return values, multiple
+
+
+def random_corpus(count: int, seed: int) -> List[str]:
+    """Random position texts mixing position words, fragments and separators."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 5)):
+            word = rng.choice(WORDS)
+            parts.append(word.upper() if rng.random() < 0.2 else word.title())
+            parts.append(rng.choice(SEPARATORS))
+        texts.append("".join(parts))
+    return texts
+
+
+@pytest.mark.parametrize("text", CORPUS + random_corpus(3000, seed=7))
+def test_scan_matches_legacy_regexes(text: str) -> None:
+    """The tokenizer classifies every corpus entry like the old regexes."""
+    values, multiple = legacy_scan(text)
+    base_mask, scanned_multiple = scan_position_text(text)
+
+    group = decode_position_mask(base_mask)
+    assert {axis: getattr(group, axis) for axis in values} == values
+    assert scanned_multiple == multiple
+
+
+def test_extract_positions_expands_both_values() -> None:
+    """Both-valued axes expand into every combination of position groups."""
+    parser = FitmentParser({})
+    groups = parser.extract_positions("frontal xrear upper")
+    assert [(g.front_rear, g.upper_lower) for g in groups] == [
+        (Position.FRONT, Position.UPPER),
+        (Position.REAR, Position.UPPER),
+    ]
+
+    base_mask, multiple = scan_position_text("Driver's Side Front")
+    assert expand_position_masks(base_mask, multiple) == [base_mask]
+    group = decode_position_mask(base_mask)
+    assert (group.left_right, group.front_rear) == (Position.LEFT, Position.FRONT)
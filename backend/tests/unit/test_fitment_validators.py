@@ -0,0 +1,75 @@
+# /backend/tests/unit/test_fitment_validators.py
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+
+from app.fitment.mapper import FitmentMappingEngine
+from app.fitment.models import PartTerminology, PCDBPosition
+
+
+class FakeDBService:
+    """Serves one PCDB position per terminology and counts position loads."""
+
+    def __init__(self) -> None:
+        self.loads: List[int] = []
+        self.on_load: Optional[Callable[[], None]] = None
+
+    def get_pcdb_part_terminology(self, terminology_id: int) -> PartTerminology:
+        return PartTerminology(
+            id=terminology_id,
+            name=f"Part {terminology_id}",
+            category_id=1,
+            subcategory_id=1,
+            valid_positions=[terminology_id],
+        )
+
+    def get_pcdb_positions(self, position_ids: List[int]) -> List[PCDBPosition]:
+        self.loads.extend(position_ids)
+        if self.on_load is not None:
+            self.on_load()
+        return [
+            PCDBPosition(id=i, name="Front", front_rear="Front") for i in position_ids
+        ]
+
+
+def test_validators_are_shared_and_evicted_least_recently_used() -> None:
+    """Validators are built once and the least recently used one is evicted."""
+    db = FakeDBService()
+    engine = FitmentMappingEngine(db, validator_cache_size=2)
+
+    first = engine.get_validator(1)
+    assert engine.get_validator(1) is first
+    engine.get_validator(2)
+    engine.get_validator(1)
+    engine.get_validator(3)
+
+    assert list(engine._validators) == [1, 3]
+    assert engine.get_validator(1) is first
+    engine.get_validator(2)
+    assert db.loads == [1, 2, 3, 2]
+
+
+def test_invalidation_drops_validators() -> None:
+    """Validators are rebuilt from PCDB after the cache is invalidated."""
+    db = FakeDBService()
+    engine = FitmentMappingEngine(db)
+    first = engine.get_validator(1)
+
+    engine.invalidate_pcdb_cache()
+
+    assert engine.get_validator(1) is not first
+    assert db.loads == [1, 1]
+
+
+def test_validator_built_across_invalidation_is_not_cached() -> None:
+    """A validator built from positions read before an invalidation is not kept."""
+    db = FakeDBService()
+    engine = FitmentMappingEngine(db)
+    db.on_load = engine.invalidate_pcdb_cache
+
+    stale = engine.get_validator(1)
+
+    assert stale.part_terminology_id == 1
+    assert 1 not in engine._validators
+    db.on_load = None
+    assert engine.get_validator(1) is not stale
@@ -0,0 +1,258 @@
+# /backend/tests/unit/test_import_bulk.py
+from __future__ import annotations
+
+import re
+import uuid
+from collections import namedtuple
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from sqlalchemy import Boolean, Column, DateTime, MetaData, String, Table, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql.elements import TextClause
+
+from app.data_import.importers import bulk
+from app.data_import.importers.bulk import BulkUpserter
+
+items = Table(
+    "items",
+    MetaData(),
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("sku", String),
+    Column("name", String),
+    Column("is_deleted", Boolean),
+    Column("updated_at", DateTime),
+)
+
+
+class Item:
+    __table__ = items
+
+
+Returned = namedtuple("Returned", ["id", "sku", "created"])
+
+
+class FakeResult:
+    def __init__(self, rows: List[Returned]) -> None:
+        self.rows = rows
+
+    def all(self) -> List[Returned]:
+        return self.rows
+
+
+class FakeSavepoint:
+    def __init__(self, session: FakeSession) -> None:
+        self.session = session
+
+    async def __aenter__(self) -> None:
+        self.session.savepoints += 1
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class FakeSession:
+    """
+    Async session applying upserts to an in-memory table.
+
+    Statements are compiled for PostgreSQL, and their rows are read back
+    from the bind parameters, or from the records copied to the staging
+    table if the driver supports COPY.
+    """
+
+    def __init__(
+        self, deleted: Optional[List[str]] = None, supports_copy: bool = False
+    ) -> None:
+        self.supports_copy = supports_copy
+        self.copied: List[Dict[str, Any]] = []
+        # Stored rows by SKU, with whether they are soft deleted
+        self.stored: Dict[str, bool] = {sku: True for sku in deleted or []}
+        self.statements: List[str] = []
+        self.statement_rows: List[int] = []
+        self.written: List[Dict[str, Any]] = []
+        self.fails: Callable[[List[Dict[str, Any]]], bool] = lambda rows: False
+        self.commits = 0
+        self.rollbacks = 0
+        self.savepoints = 0
+
+    async def execute(self, statement: Any) -> FakeResult:
+        compiled = statement.compile(dialect=postgresql.dialect())
+        self.statements.append(str(compiled))
+        if isinstance(statement, TextClause):
+            return FakeResult([])
+        rows = self._rows(compiled.params) if compiled.params else self.copied
+        self.statement_rows.append(len(rows))
+        self.written.extend(rows)
+        if self.fails(rows):
+            raise ValueError("value too long for type character varying(8)")
+
+        returned = []
+        for row in rows:
+            if self.stored.get(row["sku"]):
+                continue
+            returned.append(
+                Returned(row["id"], row["sku"], row["sku"] not in self.stored)
+            )
+            self.stored[row["sku"]] = False
+        return FakeResult(returned)
+
+    async def connection(self) -> Any:
+        async def copy_records_to_table(
+            name: str, records: List[tuple], columns: List[str]
+        ) -> None:
+            self.copied = [
+                dict(zip(columns, record, strict=True)) for record in records
+            ]
+
+        driver = (
+            SimpleNamespace(copy_records_to_table=copy_records_to_table)
+            if self.supports_copy
+            else object()
+        )
+
+        async def get_raw_connection() -> Any:
+            return SimpleNamespace(driver_connection=driver)
+
+        return SimpleNamespace(get_raw_connection=get_raw_connection)
+
+    def begin_nested(self) -> FakeSavepoint:
+        return FakeSavepoint(self)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    @staticmethod
+    def _rows(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        rows: Dict[int, Dict[str, Any]] = {}
+        for name, value in params.items():
+            match = re.fullmatch(r"(\w+?)(?:_m(\d+))?", name)
+            rows.setdefault(int(match.group(2) or 0), {})[match.group(1)] = value
+        return [rows[index] for index in sorted(rows)]
+
+
+def item(sku: str, name: str = "Seal") -> Dict[str, Any]:
+    return {"id": uuid.uuid4(), "sku": sku, "name": name}
+
+
+def upserter(session: FakeSession, **options: Any) -> BulkUpserter:
+    return BulkUpserter(
+        session,
+        Item,
+        key_columns=["sku"],
+        update_columns=["name"],
+        index_where=text("NOT is_deleted"),
+        **{"copy_threshold": 1000, **options},
+    )
+
+
+@pytest.mark.asyncio
+async def test_upsert_statement_compiles_for_postgresql() -> None:
+    """The upsert skips soft deleted rows and reports created rows via xmax."""
+    session = FakeSession()
+
+    result = await upserter(session).upsert([item("CP100"), item("CP200")])
+
+    assert result.created == 2
+    assert session.statements[0].endswith(
+        "ON CONFLICT (sku) WHERE NOT is_deleted DO UPDATE SET name = excluded.name, "
+        "updated_at = now() WHERE items.is_deleted = false "
+        "RETURNING items.id, items.sku, xmax = 0 AS created"
+    )
+
+
+@pytest.mark.asyncio
+async def test_large_chunks_are_copied_to_a_staging_table() -> None:
+    """Chunks above copy_threshold are upserted from a COPY staging table."""
+    session = FakeSession(supports_copy=True)
+
+    result = await upserter(session, copy_threshold=2).upsert(
+        [item("CP100"), item("CP200")]
+    )
+
+    assert result.created == 2
+    create, upsert = session.statements
+    assert create == (
+        "CREATE TEMPORARY TABLE items_staging ON COMMIT DROP AS "
+        "SELECT id, sku, name FROM items WITH NO DATA"
+    )
+    assert upsert.startswith(
+        "INSERT INTO items (id, sku, name) SELECT items_staging.id, "
+        "items_staging.sku, items_staging.name \nFROM items_staging "
+        "ON CONFLICT (sku) WHERE NOT is_deleted DO UPDATE"
+    )
+    assert upsert.endswith("RETURNING items.id, items.sku, xmax = 0 AS created")
+
+
+@pytest.mark.asyncio
+async def test_duplicate_keys_collapse_to_the_last_row() -> None:
+    """Rows sharing a key are written once, with the last row's values."""
+    session = FakeSession()
+    session.stored["CP100"] = False
+
+    result = await upserter(session).upsert(
+        [item("CP100", "Old"), item("CP200"), item("CP100", "New")]
+    )
+
+    assert (result.created, result.updated, result.errors) == (1, 1, 0)
+    assert session.statement_rows == [2]
+    assert [(row["sku"], row["name"]) for row in session.written] == [
+        ("CP100", "New"),
+        ("CP200", "Seal"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_conflicts_with_deleted_rows_are_errors() -> None:
+    """Rows whose key belongs to a soft deleted row are reported, not written."""
+    session = FakeSession(deleted=["CP100"])
+
+    result = await upserter(session).upsert([item("CP100"), item("CP200")])
+
+    assert (result.created, result.updated) == (1, 0)
+    assert result.error_details == [
+        {"sku": "CP100", "error": "Conflicts with a deleted row"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_statements_stay_under_the_bind_parameter_limit(monkeypatch) -> None:
+    """Chunks are split so no statement has more than MAX_BIND_PARAMS values."""
+    monkeypatch.setattr(bulk, "MAX_BIND_PARAMS", 7)
+    session = FakeSession()
+
+    result = await upserter(session, chunk_size=4).upsert(
+        [item(f"CP{i}") for i in range(7)]
+    )
+
+    # Three columns per row: two rows per statement, four rows per chunk
+    assert session.statement_rows == [2, 2, 2, 1]
+    assert session.commits == 2
+    assert result.created == 7
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_is_retried_row_by_row() -> None:
+    """Only the rows at fault fail when a chunk's statement is rejected."""
+    session = FakeSession()
+    session.fails = lambda rows: any(len(row["name"]) > 8 for row in rows)
+    called: List[Dict[Any, Any]] = []
+
+    async def after_upsert(ids: Dict[Any, Any]) -> None:
+        called.append(ids)
+
+    result = await upserter(session, copy_threshold=1).upsert(
+        [item("CP100"), item("CP200", "Much too long"), item("CP300")],
+        after_upsert=after_upsert,
+    )
+
+    assert (result.created, result.updated) == (2, 0)
+    assert [error["sku"] for error in result.error_details] == ["CP200"]
+    assert "character varying" in result.error_details[0]["error"]
+    assert session.rollbacks == 1
+    assert session.savepoints == 3
+    assert [list(ids) for ids in called] == [[("CP100",)], [("CP300",)]]
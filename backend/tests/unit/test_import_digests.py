@@ -0,0 +1,30 @@
+# /backend/tests/unit/test_import_digests.py
+from __future__ import annotations
+
+import uuid
+from decimal import Decimal
+
+from app.data_import.importers.digests import DigestIndex, digest
+
+
+def test_stored_and_imported_values_have_the_same_digest() -> None:
+    """Values read back from the database match the values as imported."""
+    product_id = uuid.uuid4()
+    stored = [product_id, Decimal("12.500"), "Door seal", True, None]
+    imported = [product_id, 12.5, "Door seal  ", True, None]
+    assert digest(stored) == digest(imported)
+    assert digest(stored) != digest([product_id, 12.5, "Door seal", False, None])
+
+
+def test_index_reports_only_identical_records_as_unchanged() -> None:
+    """A record is unchanged only if its key is stored with the same values."""
+    index = DigestIndex()
+    index.add(["CP100"], ["Door seal", True])
+
+    assert index.is_unchanged(["CP100"], ["Door seal", True])
+    assert not index.is_unchanged(["CP100"], ["Door seal", False])
+    assert not index.is_unchanged(["CP200"], ["Door seal", True])
+
+    index.discard(["CP100"])
+    assert not index.is_unchanged(["CP100"], ["Door seal", True])
+    assert len(index) == 0